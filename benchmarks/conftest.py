@@ -0,0 +1,170 @@
+"""Scenario generation and fixtures for the Stone Soup benchmarks.
+
+Scenarios are simulated with :class:`~.MultiTargetGroundTruthSimulator` and
+:class:`~.SimpleDetectionSimulator` using fixed seeds, such that the same
+inputs are used on every run and every machine, and so results can be compared
+between runs (e.g. before and after an upgrade).
+"""
+import datetime
+import platform
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+import pytest
+
+from stonesoup.models.measurement.linear import LinearGaussian
+from stonesoup.models.transition.linear import (
+    CombinedLinearGaussianTransitionModel, ConstantVelocity)
+from stonesoup.simulator.simple import (
+    MultiTargetGroundTruthSimulator, SimpleDetectionSimulator)
+from stonesoup.types.array import CovarianceMatrix, StateVector
+from stonesoup.types.state import GaussianState
+from stonesoup.types.track import Track
+
+#: Seed used for all scenarios, unless overridden with ``--scenario-seed``
+SEED = 1990
+#: Number of time steps simulated in each scenario
+NUMBER_STEPS = 10
+START_TIME = datetime.datetime(2020, 1, 1)
+#: Number of rounds each benchmark is run, with fresh inputs each round
+ROUNDS = 20
+
+
+class Scenario(NamedTuple):
+    """Simulated scenario, with a snapshot of ground truth and detections at each step."""
+    transition_model: CombinedLinearGaussianTransitionModel
+    measurement_model: LinearGaussian
+    clutter_spatial_density: float
+    truths: list
+    scans: list
+
+    @property
+    def timestamps(self):
+        return [time for time, _ in self.scans]
+
+    def tracks(self, step=-2):
+        """Tracks initialised on the ground truth at time `step`, with a single Gaussian state.
+
+        Tracks are created anew each call, as components may modify them."""
+        time = self.timestamps[step]
+        ndim_state = self.transition_model.ndim_state
+        covar = CovarianceMatrix(np.eye(ndim_state))
+        return {
+            Track([GaussianState(state.state_vector, covar, timestamp=time)])
+            for truth in self.truths
+            for state in truth
+            if state.timestamp == time}
+
+    def detections(self, step=-1):
+        """Detections at time `step`."""
+        return self.scans[step][1]
+
+
+@lru_cache(maxsize=None)
+def generate_scenario(num_targets=10, clutter_rate=10., ndim=2, seed=SEED,
+                      number_steps=NUMBER_STEPS):
+    """Generate a scenario, with fixed seed, of `num_targets` constant velocity targets in
+    `ndim` spatial dimensions (so state dimension is ``2*ndim``), and a position measurement
+    with an expected `clutter_rate` clutter detections per step.
+
+    Results are cached, so scenarios must not be modified.
+    """
+    # Transition model noise is drawn from the global random state
+    np.random.seed(seed)
+    transition_model = CombinedLinearGaussianTransitionModel(
+        [ConstantVelocity(0.05)] * ndim)
+    measurement_model = LinearGaussian(
+        ndim_state=2*ndim, mapping=tuple(range(0, 2*ndim, 2)),
+        noise_covar=np.eye(ndim) * 0.5)
+
+    # Targets spread over area which grows with number of targets, keeping density constant
+    extent = 20. * max(num_targets, 1) ** (1 / ndim)
+    initial_state = GaussianState(
+        StateVector([0., 0.] * ndim),
+        CovarianceMatrix(np.diag([extent / 4, 1.] * ndim)),
+        timestamp=START_TIME)
+    groundtruth_sim = MultiTargetGroundTruthSimulator(
+        transition_model=transition_model,
+        initial_state=initial_state,
+        timestep=datetime.timedelta(seconds=1),
+        number_steps=number_steps,
+        birth_rate=0,
+        death_probability=0,
+        initial_number_targets=num_targets,
+        seed=seed)
+    meas_range = np.array([[-extent, extent]] * ndim)
+    detection_sim = SimpleDetectionSimulator(
+        groundtruth=groundtruth_sim,
+        measurement_model=measurement_model,
+        meas_range=meas_range,
+        detection_probability=0.9,
+        clutter_rate=clutter_rate,
+        seed=seed)
+
+    scans = [(time, frozenset(detections)) for time, detections in detection_sim]
+    return Scenario(
+        transition_model, measurement_model, detection_sim.clutter_spatial_density,
+        list(groundtruth_sim.groundtruth_paths), scans)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--scenario-seed", type=int, default=SEED,
+        help=f"Seed used to generate benchmark scenarios. Default {SEED}.")
+
+
+@pytest.fixture
+def seed(request):
+    """Scenario seed, which also seeds the global random state before each benchmark."""
+    seed = request.config.getoption("--scenario-seed")
+    np.random.seed(seed)
+    return seed
+
+
+@pytest.fixture
+def scenario_factory(seed):
+    """Function generating scenario (see :func:`generate_scenario`) with configured seed."""
+    def factory(**kwargs):
+        return generate_scenario(seed=seed, **kwargs)
+    return factory
+
+
+@pytest.fixture
+def run_benchmark(benchmark):
+    """Run `function` with inputs from `setup` each round, such that results aren't cached.
+
+    `setup` should return a tuple of positional arguments for `function`. Details of the
+    scenario (e.g. number of detections) can be added to results via `extra_info`."""
+    def run(function, setup, rounds=ROUNDS, **extra_info):
+        benchmark.extra_info.update(extra_info)
+        return benchmark.pedantic(
+            function, setup=lambda: (setup(), {}), rounds=rounds, warmup_rounds=1)
+    return run
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    """Add versions of key dependencies to results, to help identify cause of slowdowns."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python 3.7
+        packages = {}
+    else:
+        packages = {}
+        for package in ('stonesoup', 'numpy', 'scipy'):
+            try:
+                packages[package] = version(package)
+            except PackageNotFoundError:
+                packages[package] = None
+    machine_info['packages'] = packages
+    machine_info['blas'] = _blas_info()
+    machine_info['python_implementation'] = platform.python_implementation()
+    machine_info['scenario_seed'] = config.getoption("--scenario-seed")
+
+
+def _blas_info():
+    try:
+        config = np.show_config(mode='dicts')
+    except TypeError:  # Older numpy without mode
+        return None
+    return config.get('Build Dependencies', {}).get('blas', {}).get('name')
@@ -0,0 +1,72 @@
+"""Benchmarks of hypothesis generation and data association."""
+import pytest
+
+from stonesoup.dataassociator.neighbour import GNNWith2DAssignment
+from stonesoup.dataassociator.probability import JPDA
+from stonesoup.gater.distance import DistanceGater
+from stonesoup.hypothesiser.distance import DistanceHypothesiser
+from stonesoup.hypothesiser.probability import PDAHypothesiser
+from stonesoup.measures import Mahalanobis
+from stonesoup.predictor.kalman import KalmanPredictor
+from stonesoup.updater.kalman import KalmanUpdater
+
+
+def distance_hypothesiser(scenario):
+    return DistanceHypothesiser(
+        KalmanPredictor(scenario.transition_model),
+        KalmanUpdater(scenario.measurement_model),
+        Mahalanobis(), missed_distance=3)
+
+
+@pytest.mark.parametrize('clutter_rate', [10, 100])
+@pytest.mark.parametrize('num_targets', [10, 100])
+def test_distance_hypothesise(run_benchmark, scenario_factory, num_targets, clutter_rate):
+    scenario = scenario_factory(num_targets=num_targets, clutter_rate=clutter_rate)
+    hypothesiser = distance_hypothesiser(scenario)
+    detections = scenario.detections()
+    timestamp = scenario.timestamps[-1]
+
+    def hypothesise(tracks):
+        return [hypothesiser.hypothesise(track, detections, timestamp) for track in tracks]
+
+    hypotheses = run_benchmark(
+        hypothesise, lambda: (scenario.tracks(), ),
+        tracks=len(scenario.truths), detections=len(detections))
+    assert len(hypotheses) == len(scenario.truths)
+
+
+@pytest.mark.parametrize('clutter_rate', [10, 100])
+@pytest.mark.parametrize('num_targets', [10, 100])
+def test_gnn_associate(run_benchmark, scenario_factory, num_targets, clutter_rate):
+    scenario = scenario_factory(num_targets=num_targets, clutter_rate=clutter_rate)
+    associator = GNNWith2DAssignment(distance_hypothesiser(scenario))
+    detections = scenario.detections()
+    timestamp = scenario.timestamps[-1]
+
+    associations = run_benchmark(
+        lambda tracks: associator.associate(tracks, detections, timestamp),
+        lambda: (scenario.tracks(), ),
+        tracks=len(scenario.truths), detections=len(detections))
+    assert len(associations) == len(scenario.truths)
+
+
+@pytest.mark.parametrize('clutter_rate', [2, 10])
+@pytest.mark.parametrize('num_targets', [5, 10])
+def test_jpda_associate(run_benchmark, scenario_factory, num_targets, clutter_rate):
+    scenario = scenario_factory(num_targets=num_targets, clutter_rate=clutter_rate)
+    hypothesiser = DistanceGater(
+        PDAHypothesiser(
+            KalmanPredictor(scenario.transition_model),
+            KalmanUpdater(scenario.measurement_model),
+            clutter_spatial_density=scenario.clutter_spatial_density,
+            prob_detect=0.9),
+        Mahalanobis(), gate_threshold=9)
+    associator = JPDA(hypothesiser)
+    detections = scenario.detections()
+    timestamp = scenario.timestamps[-1]
+
+    associations = run_benchmark(
+        lambda tracks: associator.associate(tracks, detections, timestamp),
+        lambda: (scenario.tracks(), ),
+        tracks=len(scenario.truths), detections=len(detections))
+    assert len(associations) == len(scenario.truths)
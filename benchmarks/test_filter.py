@@ -0,0 +1,75 @@
+"""Benchmarks of prediction and update steps."""
+import numpy as np
+import pytest
+
+from stonesoup.predictor.kalman import KalmanPredictor
+from stonesoup.types.array import StateVectors
+from stonesoup.types.hypothesis import SingleHypothesis
+from stonesoup.types.prediction import GaussianStatePrediction, ParticleStatePrediction
+from stonesoup.updater.kalman import KalmanUpdater
+from stonesoup.updater.particle import ParticleUpdater
+
+
+@pytest.mark.parametrize('ndim', [1, 2, 3])
+@pytest.mark.parametrize('num_targets', [10, 100])
+def test_kalman_predict(run_benchmark, scenario_factory, num_targets, ndim):
+    scenario = scenario_factory(num_targets=num_targets, ndim=ndim)
+    predictor = KalmanPredictor(scenario.transition_model)
+    timestamp = scenario.timestamps[-1]
+
+    def setup():
+        return [track.state for track in scenario.tracks()],
+
+    def predict(priors):
+        return [predictor.predict(prior, timestamp=timestamp) for prior in priors]
+
+    predictions = run_benchmark(predict, setup, tracks=len(scenario.truths))
+    assert len(predictions) == len(scenario.truths)
+
+
+@pytest.mark.parametrize('ndim', [1, 2, 3])
+@pytest.mark.parametrize('num_targets', [10, 100])
+def test_kalman_update(run_benchmark, scenario_factory, num_targets, ndim):
+    scenario = scenario_factory(num_targets=num_targets, ndim=ndim)
+    updater = KalmanUpdater(scenario.measurement_model)
+    detections = [detection for detection in scenario.detections()
+                  if hasattr(detection, 'groundtruth_path')]
+    truth_states = {detection.groundtruth_path: detection.groundtruth_path[-2]
+                    for detection in detections}
+    covar = np.eye(scenario.transition_model.ndim_state)
+
+    def setup():
+        return [SingleHypothesis(
+            GaussianStatePrediction(
+                truth_states[detection.groundtruth_path].state_vector, covar,
+                timestamp=detection.timestamp),
+            detection)
+            for detection in detections],
+
+    def update(hypotheses):
+        return [updater.update(hypothesis) for hypothesis in hypotheses]
+
+    updates = run_benchmark(update, setup, detections=len(detections))
+    assert len(updates) == len(detections)
+
+
+@pytest.mark.parametrize('num_particles', [100, 1000, 10000])
+def test_particle_update(run_benchmark, scenario_factory, num_particles):
+    scenario = scenario_factory(num_targets=10, ndim=2)
+    updater = ParticleUpdater(scenario.measurement_model)
+    detection = next(detection for detection in scenario.detections()
+                     if hasattr(detection, 'groundtruth_path'))
+    truth_state = detection.groundtruth_path[-1]
+    ndim_state = scenario.transition_model.ndim_state
+    rng = np.random.RandomState(1990)
+
+    def setup():
+        state_vectors = StateVectors(
+            truth_state.state_vector + rng.randn(ndim_state, num_particles))
+        prediction = ParticleStatePrediction(
+            state_vectors, weight=np.full(num_particles, 1 / num_particles),
+            timestamp=detection.timestamp)
+        return SingleHypothesis(prediction, detection),
+
+    update = run_benchmark(updater.update, setup)
+    assert len(update) == num_particles
@@ -0,0 +1,43 @@
+"""Benchmarks of start-up time, importing Stone Soup in a new interpreter."""
+import subprocess
+import sys
+from functools import partial
+
+import pytest
+
+#: Number of slowest imports (by cumulative time) added to results
+NUM_SLOWEST = 10
+
+
+def _import_command(modules, importtime=False):
+    return [sys.executable, *(['-X', 'importtime'] if importtime else []),
+            '-c', "".join(f"import {module}\n" for module in modules)]
+
+
+def _slowest_imports(modules):
+    """Slowest imports (in microseconds) of top level packages, via ``-X importtime``."""
+    result = subprocess.run(
+        _import_command(modules, importtime=True), check=True,
+        stderr=subprocess.PIPE, universal_newlines=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return dict(sorted(times.items(), key=lambda item: item[1], reverse=True)[:NUM_SLOWEST])
+
+
+@pytest.mark.parametrize('modules', [
+    ['stonesoup'],
+    ['stonesoup.types.track', 'stonesoup.types.detection'],
+    ['stonesoup.tracker.simple', 'stonesoup.predictor.kalman', 'stonesoup.updater.kalman',
+     'stonesoup.hypothesiser.distance', 'stonesoup.dataassociator.neighbour',
+     'stonesoup.initiator.simple', 'stonesoup.deleter.time'],
+    ['stonesoup.serialise'],
+], ids=['package', 'types', 'tracker', 'serialise'])
+def test_import(run_benchmark, modules):
+    command = _import_command(modules)
+    run_benchmark(
+        partial(subprocess.run, check=True), lambda: (command, ), rounds=5,
+        modules=modules, slowest_imports=_slowest_imports(modules))
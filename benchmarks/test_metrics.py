@@ -0,0 +1,52 @@
+"""Benchmarks of metric generators."""
+import numpy as np
+import pytest
+
+from stonesoup.dataassociator.tracktotrack import TrackToTruth
+from stonesoup.measures import Euclidean
+from stonesoup.metricgenerator.manager import SimpleManager
+from stonesoup.metricgenerator.ospametric import GOSPAMetric
+from stonesoup.metricgenerator.tracktotruthmetrics import SIAPMetrics
+from stonesoup.types.state import GaussianState
+from stonesoup.types.track import Track
+
+
+def noisy_tracks(scenario, seed=1990):
+    """Tracks following each ground truth path, with added noise."""
+    rng = np.random.RandomState(seed)
+    covar = np.eye(scenario.transition_model.ndim_state)
+    return {
+        Track([GaussianState(
+            state.state_vector + rng.randn(*state.state_vector.shape) * 0.5, covar,
+            timestamp=state.timestamp)
+            for state in truth])
+        for truth in scenario.truths}
+
+
+@pytest.mark.parametrize('num_targets', [10, 100])
+def test_gospa(run_benchmark, scenario_factory, num_targets):
+    scenario = scenario_factory(num_targets=num_targets)
+    generator = GOSPAMetric(c=10, p=1, measure=Euclidean((0, 2)))
+    manager = SimpleManager([generator])
+    manager.add_data(scenario.truths, noisy_tracks(scenario))
+
+    metric = run_benchmark(
+        generator.compute_metric, lambda: (manager, ),
+        tracks=len(manager.tracks), timestamps=len(scenario.timestamps))
+    assert len(metric.value) == len(scenario.timestamps)
+
+
+@pytest.mark.parametrize('num_targets', [10, 100])
+def test_siap(run_benchmark, scenario_factory, num_targets):
+    scenario = scenario_factory(num_targets=num_targets)
+    generator = SIAPMetrics(position_measure=Euclidean((0, 2)),
+                            velocity_measure=Euclidean((1, 3)))
+    manager = SimpleManager(
+        [generator], associator=TrackToTruth(association_threshold=5))
+    manager.add_data(scenario.truths, noisy_tracks(scenario))
+    manager.associate_tracks()
+
+    metrics = run_benchmark(
+        generator.compute_metric, lambda: (manager, ),
+        tracks=len(manager.tracks), timestamps=len(scenario.timestamps))
+    assert metrics
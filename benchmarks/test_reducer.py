@@ -0,0 +1,36 @@
+"""Benchmarks of Gaussian mixture reduction."""
+import numpy as np
+import pytest
+
+from stonesoup.mixturereducer.gaussianmixture import GaussianMixtureReducer
+from stonesoup.types.state import TaggedWeightedGaussianState
+
+
+@pytest.mark.parametrize('kdtree_max_distance', [None, 10])
+@pytest.mark.parametrize('num_targets', [10, 50])
+def test_gaussian_mixture_reduce(
+        run_benchmark, scenario_factory, num_targets, kdtree_max_distance):
+    components_per_target = 10
+    scenario = scenario_factory(num_targets=num_targets)
+    reducer = GaussianMixtureReducer(
+        prune_threshold=1e-3, merge_threshold=4, max_number_components=10*num_targets,
+        kdtree_max_distance=kdtree_max_distance)
+    timestamp = scenario.timestamps[-1]
+    truth_states = [truth[-1] for truth in scenario.truths]
+    ndim_state = scenario.transition_model.ndim_state
+    covar = np.eye(ndim_state)
+    rng = np.random.RandomState(1990)
+
+    # Components spread around each target, with some of low weight to be pruned
+    def setup():
+        return [
+            TaggedWeightedGaussianState(
+                state.state_vector + rng.randn(ndim_state, 1) * 2, covar,
+                weight=rng.choice([1e-4, 0.1, 1.]), timestamp=timestamp)
+            for state in truth_states
+            for _ in range(components_per_target)],
+
+    # Merging without kd-tree is quadratic in number of components, so fewer rounds
+    reduced_components = run_benchmark(
+        reducer.reduce, setup, rounds=5, components=len(truth_states)*components_per_target)
+    assert len(reduced_components) <= 10*num_targets
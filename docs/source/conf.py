@@ -117,9 +117,9 @@ author = 'Dstl'
 # |version| and |release|, also used in various other places throughout the
 # built documents.
 #
-from pkg_resources import get_distribution
+from importlib.metadata import version as get_version
 # The full version, including alpha/beta/rc tags.
-version = release = get_distribution('stonesoup').version
+version = release = get_version('stonesoup')
 
 # The language for content autogenerated by Sphinx. Refer to documentation
 # for a list of supported languages.
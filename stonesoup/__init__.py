@@ -2,14 +2,6 @@
 
 """Stone Soup framework: development and assessment of tracking algorithms."""
 
-from pkg_resources import get_distribution, DistributionNotFound
-
-try:
-    __version__ = get_distribution("stonesoup").version
-except DistributionNotFound:
-    # package is not installed
-    pass
-
 __copyright__ = '''\
 © Crown Copyright 2017-2023 Defence Science and Technology Laboratory UK
 © Crown Copyright 2018-2023 Defence Research and Development Canada / Recherche et développement pour la défense Canada
@@ -19,3 +11,15 @@ __copyright__ = '''\
 © Copyright 2021-2023 Roke Manor Research Ltd UK
 '''  # noqa: E501
 __license__ = 'MIT'
+
+
+def __getattr__(name):
+    # Version looked up on first access, as reading package metadata is slow relative to
+    # the rest of the import
+    if name == '__version__':
+        from ._metadata import version
+        package_version = version("stonesoup")
+        if package_version is not None:  # else package is not installed
+            globals()["__version__"] = package_version
+            return package_version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
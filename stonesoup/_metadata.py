@@ -0,0 +1,28 @@
+"""Access to installed package metadata, without the import cost of :mod:`pkg_resources`."""
+from functools import lru_cache
+
+try:
+    from importlib import metadata
+except ImportError:  # Python 3.7
+    import importlib_metadata as metadata
+
+
+def version(distribution_name="stonesoup"):
+    """Version of installed distribution, or `None` if not installed."""
+    try:
+        return metadata.version(distribution_name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+@lru_cache(None)
+def entry_points(group):
+    """Entry points registered under `group`, in a tuple.
+
+    Results are cached, as finding these requires reading metadata of all installed packages.
+    """
+    eps = metadata.entry_points()
+    if hasattr(eps, 'select'):  # Python 3.10+ (or backport)
+        return tuple(eps.select(group=group))
+    else:
+        return tuple(eps.get(group, ()))
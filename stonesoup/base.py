@@ -54,6 +54,7 @@ This is equivalent to the following:
 
 """
 import inspect
+import keyword
 import textwrap
 from reprlib import Repr
 from abc import ABCMeta
@@ -298,6 +299,10 @@ class BaseMeta(ABCMeta):
                     raise ValueError(f'Invalid type specification ({str(value.cls)}) '
                                      f'for property {key} of class {name}')
 
+                if key in properties:
+                    # Redefined property must still clear base class cached properties
+                    value._clear_cached = value._clear_cached | properties[key]._clear_cached
+
                 # Finally set property.
                 properties[key] = value
 
@@ -327,6 +332,7 @@ class BaseMeta(ABCMeta):
 
         namespace['_properties'] = properties
         namespace['_subclasses'] = set()
+        namespace['_initialiser'] = None
 
         cls = super().__new__(mcls, name, bases, namespace)
 
@@ -393,6 +399,47 @@ class BaseMeta(ABCMeta):
         cls.__init__.__signature__ = init_signature.replace(
             parameters=parameters)
 
+    _initialiser_reserved_names = frozenset({'_base_self', '_base_dict', '_base_setattr'})
+
+    def _generate_initialiser(cls):
+        """Generates function which populates declared properties on a new instance.
+
+        The generated function's signature matches the declared properties, so
+        arguments are bound natively, and properties which don't require the
+        :class:`Property` descriptor logic (i.e. no custom setter) are written
+        directly to the instance dictionary. This is only valid for instances
+        with an empty dictionary, as then no cached properties need clearing and
+        no read only properties have been set.
+
+        Returns `False` if an initialiser can't be generated for the class.
+        """
+        names = list(cls._properties)
+        if any(not name.isidentifier() or keyword.iskeyword(name)
+               or name in cls._initialiser_reserved_names
+               for name in names):
+            return False
+
+        lines = []
+        for name, property_ in cls._properties.items():
+            if getattr(cls, name, None) is property_ \
+                    and property_._setter is None \
+                    and not hasattr(cls, property_._property_name):
+                lines.append(f"    _base_dict[{property_._property_name!r}] = {name}")
+            else:
+                lines.append(f"    _base_setattr(_base_self, {name!r}, {name})")
+
+        source = "def initialiser(_base_self, {}):\n    _base_dict = _base_self.__dict__\n{}\n"\
+            .format(", ".join(names), "\n".join(lines) or "    pass")
+        namespace = {'_base_setattr': setattr}
+        exec(compile(source, f"<{cls.__qualname__} initialiser>", 'exec'), namespace)
+        initialiser = namespace['initialiser']
+
+        defaults = tuple(
+            property_.default for property_ in cls._properties.values()
+            if property_.default is not Property.empty)
+        initialiser.__defaults__ = defaults or None
+        return initialiser
+
     def register(cls, subclass):
         cls._subclasses.add(subclass)
         return super().register(subclass)
@@ -417,10 +464,27 @@ class Base(metaclass=BaseMeta):
 
     Subclasses can override this method, but they should either call this via
     :func:`super()` or ensure they manually populated the properties as
-    declared."""
+    declared.
+
+    To reduce the overhead of construction, a function to populate the
+    properties is generated for each class on first use (see
+    :meth:`BaseMeta._generate_initialiser`)."""
 
     def __init__(self, *args, **kwargs):
         cls = type(self)
+        initialiser = cls._initialiser
+        if initialiser is None:
+            initialiser = cls._initialiser = cls._generate_initialiser()
+        if initialiser and not self.__dict__:
+            try:
+                initialiser(self, *args, **kwargs)
+            except TypeError as err:
+                if err.__traceback__.tb_next is not None:
+                    raise  # Raised from within a setter, rather than binding arguments
+            else:
+                return
+            # Otherwise, fall through for consistent error messages
+
         prop_iter = iter(cls.properties.items())
 
         for arg in args:
@@ -38,11 +38,25 @@ class BufferedGenerator:
         method.is_generator = True
         return method
 
+    @classmethod
+    def _generator_method_name(cls):
+        """Name of the generator method, resolved once per class."""
+        try:
+            return cls.__dict__['_generator_method']
+        except KeyError:
+            pass
+        for name, function in inspect.getmembers(cls, predicate=inspect.isfunction):
+            if getattr(function, 'is_generator', False):
+                break
+        else:
+            name = None
+        cls._generator_method = name
+        return name
+
     def __iter__(self):
-        for _, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if getattr(method, 'is_generator', False):
-                for data in method():
-                    self.current = data
-                    yield self.current
-                return
-        raise AttributeError('Generator method undefined!')
+        name = self._generator_method_name()
+        if name is None:
+            raise AttributeError('Generator method undefined!')
+        for data in getattr(self, name)():
+            self.current = data
+            yield self.current
@@ -4,6 +4,7 @@ from typing import Set, Mapping
 
 from ..base import Base, Property
 from ..hypothesiser import Hypothesiser
+from ..instrumentation import profile_hypotheses
 from ..types.detection import Detection
 from ..types.hypothesis import Hypothesis
 from ..types.track import Track
@@ -21,6 +22,7 @@ class DataAssociator(Base):
     hypothesiser: Hypothesiser = Property(
         doc="Generate a set of hypotheses for each track-detection pair")
 
+    @profile_hypotheses
     def generate_hypotheses(self, tracks, detections, timestamp, **kwargs):
         return {track: self.hypothesiser.hypothesise(
                     track, detections, timestamp, **kwargs)
@@ -6,16 +6,10 @@ from typing import Sequence
 import numpy as np
 import scipy as sp
 from scipy.spatial import KDTree
-try:
-    import rtree
-except (ImportError, AttributeError, OSError) as err:  # pragma: no cover
-    # AttributeError or OSError raised when libspatialindex missing or unable to load.
-    import warnings
-    warnings.warn(f"Failed to import 'rtree': {err!r}")
-    rtree = None
 
 from ..base import Base, Property
 from ..hypothesiser import Hypothesiser
+from ..instrumentation import profile_hypotheses
 from ..models.base import LinearModel
 from ..models.measurement import MeasurementModel
 from ..predictor import Predictor
@@ -57,6 +51,7 @@ class DetectionKDTreeMixIn(Base):
             "only :attr:`max_distance` is used."
     )
 
+    @profile_hypotheses
     def generate_hypotheses(self, tracks, detections, timestamp, **kwargs):
         # No need for tree here.
         if not tracks:
@@ -151,7 +146,12 @@ class TPRTreeMixIn(Base):
         if self.vel_mapping is None:
             self.vel_mapping = [i + 1 for i in self.pos_mapping]
 
-        # Create tree
+        # Create tree, with rtree imported only when required
+        try:
+            import rtree
+        except (ImportError, AttributeError, OSError) as err:  # pragma: no cover
+            # AttributeError or OSError raised when libspatialindex missing or unable to load.
+            raise ImportError(f"Failed to import 'rtree': {err!r}") from err
         tree_property = rtree.index.Property(
             type=rtree.index.RT_TPRTree,
             tpr_horizon=self.horizon_time.total_seconds(),
@@ -175,6 +175,7 @@ class TPRTreeMixIn(Base):
         return ((*min_pos, *max_pos), (*min_vel, *max_vel),
                 track.timestamp.astimezone(datetime.timezone.utc).timestamp())
 
+    @profile_hypotheses
     def generate_hypotheses(self, tracks, detections, timestamp, **kwargs):
         # No need for tree here.
         if not tracks:
@@ -1,7 +1,9 @@
 import heapq
+from operator import itemgetter
 from typing import Collection
 
 from .base import DetectionFeeder, GroundTruthFeeder
+from .prefetch import PrefetchFeeder
 from ..base import Property
 from ..buffered_generator import BufferedGenerator
 from ..reader import Reader
@@ -11,11 +13,29 @@ class MultiDataFeeder(DetectionFeeder, GroundTruthFeeder):
     """Multi-data Feeder
 
     This returns states from multiple data readers as a single stream,
-    yielding from the reader yielding the lowest timestamp first.
+    yielding from the reader yielding the lowest timestamp first. This is a
+    k-way merge, keyed only on time, which assumes each reader yields data in
+    time order (the :class:`~.TimeBufferedFeeder` can be used after this to
+    reorder any out of sequence data, within a bounded buffer).
+
+    Optionally, each reader can be run in its own background thread (see
+    :attr:`max_queue_size` and :class:`~.PrefetchFeeder`), such that readers
+    parsing data (e.g. from files or network) can run concurrently with each
+    other and with the consumer.
     """
     reader = None
     readers: Collection[Reader] = Property(doc='Readers to yield from')
+    max_queue_size: int = Property(
+        default=None,
+        doc="If set, each reader is run in a background thread, reading ahead up to this "
+            "number of items into a bounded queue. Default `None`, where readers are run "
+            "on demand in the consumer's thread.")
 
     @BufferedGenerator.generator_method
     def data_gen(self):
-        yield from heapq.merge(*self.readers)
+        if self.max_queue_size is None:
+            readers = self.readers
+        else:
+            readers = [PrefetchFeeder(reader, max_queue_size=self.max_queue_size)
+                       for reader in self.readers]
+        yield from heapq.merge(*readers, key=itemgetter(0))
@@ -0,0 +1,93 @@
+import queue
+import threading
+import time
+
+from ..base import Property
+from ..buffered_generator import BufferedGenerator
+from .base import DetectionFeeder, GroundTruthFeeder
+
+
+class PrefetchFeeder(DetectionFeeder, GroundTruthFeeder):
+    """Prefetch data from a reader in a background thread.
+
+    The :attr:`reader` is iterated in a background thread, reading ahead up to
+    :attr:`max_queue_size` items into a bounded queue, such that parsing of
+    data (e.g. from files or network) overlaps with processing by the consumer
+    (e.g. tracker). Any exception raised by the reader is re-raised in the
+    consumer's thread.
+
+    Counters are available to diagnose whether the consumer is waiting on the
+    reader (:attr:`stall_time`), or vice versa (:attr:`blocked_time`).
+    """
+    max_queue_size: int = Property(
+        default=1, doc="Maximum number of items to read ahead. Default 1.")
+
+    _end = object()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.max_queue_size < 1:
+            raise ValueError("max_queue_size must be positive")
+        self._queue = None
+        self.stall_count = 0
+        self.stall_time = 0.
+        self.blocked_time = 0.
+
+    @property
+    def queue_depth(self):
+        """Number of items currently prefetched and waiting to be consumed."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @BufferedGenerator.generator_method
+    def data_gen(self):
+        items = self._queue = queue.Queue(maxsize=self.max_queue_size)
+        stop = threading.Event()
+        self.stall_count = 0
+        self.stall_time = 0.
+        self.blocked_time = 0.
+
+        thread = threading.Thread(target=self._run, args=(items, stop), daemon=True)
+        thread.start()
+        try:
+            while True:
+                try:
+                    item, err = items.get_nowait()
+                except queue.Empty:
+                    start = time.perf_counter()
+                    item, err = items.get()
+                    self.stall_time += time.perf_counter() - start
+                    self.stall_count += 1
+                if item is self._end:
+                    if err is not None:
+                        raise err
+                    return
+                yield item
+        finally:
+            stop.set()
+
+    def _run(self, items, stop):
+        try:
+            for item in self.reader:
+                if not self._put(items, stop, item):
+                    return
+            self._put(items, stop, self._end)
+        except Exception as err:
+            self._put(items, stop, self._end, err)
+
+    def _put(self, items, stop, item, err=None):
+        try:
+            items.put_nowait((item, err))
+            return True
+        except queue.Full:
+            pass
+        start = time.perf_counter()
+        try:
+            while not stop.is_set():
+                try:
+                    items.put((item, err), timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        finally:
+            self.blocked_time += time.perf_counter() - start
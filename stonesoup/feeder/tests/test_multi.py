@@ -1,6 +1,11 @@
+import datetime
+
 import pytest
 
 from ..multi import MultiDataFeeder
+from ...buffered_generator import BufferedGenerator
+from ...reader import DetectionReader
+from ...types.detection import Detection
 
 
 @pytest.mark.parametrize('n', [1, 2, 3])
@@ -18,3 +23,38 @@ def test_multi_detections(n, reader):
     # measurements coming from detector.
     assert multi_time_list[:-n:n] == single_time_list[:-1]
     assert multi_time_list[-1] == single_time_list[-1]
+
+
+@pytest.mark.parametrize('max_queue_size', [1, 5])
+def test_multi_detections_threaded(reader, max_queue_size):
+    multi_detector = MultiDataFeeder([reader] * 3)
+    threaded_multi_detector = MultiDataFeeder([reader] * 3, max_queue_size=max_queue_size)
+
+    times = [time for time, _ in multi_detector]
+    threaded_times = [time for time, _ in threaded_multi_detector]
+    assert threaded_times == times
+
+
+def test_multi_equal_times():
+    # Data with equal times from different readers shouldn't be compared
+    class SameTimeReader(DetectionReader):
+        @BufferedGenerator.generator_method
+        def detections_gen(self):
+            time = datetime.datetime(2019, 4, 1, 14)
+            for _ in range(3):
+                yield time, {Detection([[0]], timestamp=time)}
+
+    multi_detector = MultiDataFeeder([SameTimeReader(), SameTimeReader()])
+    assert sum(len(detections) for _, detections in multi_detector) == 6
+
+
+def test_multi_threaded_error():
+    class ErrorReader(DetectionReader):
+        @BufferedGenerator.generator_method
+        def detections_gen(self):
+            yield datetime.datetime(2019, 4, 1, 14), set()
+            raise ValueError("Reader error")
+
+    multi_detector = MultiDataFeeder([ErrorReader()], max_queue_size=1)
+    with pytest.raises(ValueError, match="Reader error"):
+        list(multi_detector)
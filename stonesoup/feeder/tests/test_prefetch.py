@@ -0,0 +1,70 @@
+import datetime
+import time
+
+import pytest
+
+from ..prefetch import PrefetchFeeder
+from ...buffered_generator import BufferedGenerator
+from ...reader import DetectionReader
+
+
+@pytest.mark.parametrize('max_queue_size', [1, 3, 100])
+def test_prefetch(reader, max_queue_size):
+    feeder = PrefetchFeeder(reader, max_queue_size=max_queue_size)
+
+    expected = [(timestamp, len(data)) for timestamp, data in reader]
+    assert [(timestamp, len(data)) for timestamp, data in feeder] == expected
+    assert feeder.queue_depth == 0
+
+    # Can be iterated again
+    assert len(list(feeder)) == len(expected)
+
+
+def test_prefetch_detections(detector):
+    feeder = PrefetchFeeder(detector)
+    for timestamp, detections in feeder:
+        assert feeder.detections == detections
+        assert all(detection.timestamp <= timestamp for detection in detections)
+
+
+def test_prefetch_counters():
+    class SlowReader(DetectionReader):
+        @BufferedGenerator.generator_method
+        def detections_gen(self):
+            timestamp = datetime.datetime(2019, 4, 1, 14)
+            for _ in range(3):
+                time.sleep(0.05)
+                yield timestamp, set()
+
+    feeder = PrefetchFeeder(SlowReader(), max_queue_size=2)
+    assert feeder.queue_depth == 0
+    assert len(list(feeder)) == 3
+    assert feeder.stall_count > 0
+    assert feeder.stall_time > 0
+
+    feeder = PrefetchFeeder(SlowReader(), max_queue_size=1)
+    feeder_iter = iter(feeder)
+    next(feeder_iter)
+    time.sleep(0.2)  # Reader should fill queue and then be blocked
+    assert feeder.queue_depth == 1
+    assert len(list(feeder_iter)) == 2
+    assert feeder.blocked_time > 0
+
+
+def test_prefetch_error():
+    class ErrorReader(DetectionReader):
+        @BufferedGenerator.generator_method
+        def detections_gen(self):
+            yield datetime.datetime(2019, 4, 1, 14), set()
+            raise ValueError("Reader error")
+
+    feeder = PrefetchFeeder(ErrorReader())
+    feeder_iter = iter(feeder)
+    next(feeder_iter)
+    with pytest.raises(ValueError, match="Reader error"):
+        next(feeder_iter)
+
+
+def test_prefetch_bad_queue_size(detector):
+    with pytest.raises(ValueError, match="must be positive"):
+        PrefetchFeeder(detector, max_queue_size=0)
@@ -72,3 +72,11 @@ def test_time_sync_feeder_groundtruth(groundtruth):
         prev_time = time
 
     assert steps == 2
+
+
+def test_time_buffered_feeder_equal_times():
+    # Data with equal times shouldn't be compared, and order maintained
+    time = datetime.datetime(2019, 4, 1, 14)
+    data = [(time, {i}) for i in range(5)]
+    feeder = TimeBufferedFeeder(data, buffer_size=2)
+    assert list(feeder) == data
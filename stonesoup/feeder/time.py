@@ -1,5 +1,6 @@
 import datetime
 import heapq
+from itertools import count
 from warnings import warn
 
 from ..base import Property
@@ -12,30 +13,36 @@ class TimeBufferedFeeder(DetectionFeeder, GroundTruthFeeder):
 
     Any "old" data (where the time is earlier than the head of the
     buffer) shall be dropped, producing a :class:`UserWarning`.
+
+    Data is ordered by time only, with data of equal time yielded in the order
+    it was received.
     """
     buffer_size: int = Property(default=1000, doc="Max size of buffer")
 
     @BufferedGenerator.generator_method
     def data_gen(self):
         time_data_buffer = []
+        # Counter used as tie breaker, such that data itself is never compared
+        counter = count()
 
         for time_data in self.reader:
+            entry = (time_data[0], next(counter), time_data)
             # Drop "old" detections
             if len(time_data_buffer) >= self.buffer_size and \
-                    time_data < time_data_buffer[0]:
+                    entry[0] < time_data_buffer[0][0]:
                 warn('"Old" detection dropped')
                 continue
 
             # Yield oldest when buffer full
             if len(time_data_buffer) >= self.buffer_size:
-                yield heapq.heappushpop(time_data_buffer, time_data)
+                yield heapq.heappushpop(time_data_buffer, entry)[-1]
             else:
                 # Else just insert
-                heapq.heappush(time_data_buffer, time_data)
+                heapq.heappush(time_data_buffer, entry)
 
         # No more new data: yield remaining buffer
         while time_data_buffer:
-            yield heapq.heappop(time_data_buffer)
+            yield heapq.heappop(time_data_buffer)[-1]
 
 
 class TimeSyncFeeder(DetectionFeeder, GroundTruthFeeder):
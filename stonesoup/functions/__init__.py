@@ -2,10 +2,14 @@
 import copy
 
 import numpy as np
+from scipy.linalg import solve_triangular
 
 from ..types.numeric import Probability
 from ..types.array import StateVector, StateVectors, CovarianceMatrix
 
+# Stacked QR decomposition requires NumPy 1.22 or later
+_STACKED_QR = np.lib.NumpyVersion(np.__version__) >= '1.22.0'
+
 
 def tria(matrix):
     """Square Root Matrix Triangularization
@@ -13,6 +17,10 @@ def tria(matrix):
     Given a rectangular square root matrix obtain a square lower-triangular
     square root matrix
 
+    A stack of matrices, with shape (..., `n`, `m`), may also be provided, in
+    which case all are triangularised with a single stacked QR decomposition
+    (or one at a time, with NumPy versions before 1.22).
+
     Parameters
     ==========
     matrix : numpy.ndarray
@@ -23,14 +31,20 @@ def tria(matrix):
     numpy.ndarray
         A square lower-triangular matrix.
     """
-    _, upper_triangular = np.linalg.qr(matrix.T)
-    lower_triangular = upper_triangular.T
-
-    index = [col
-             for col, val in enumerate(np.diag(lower_triangular))
-             if val < 0]
+    matrix = np.asarray(matrix)
+    if _STACKED_QR or matrix.ndim == 2:
+        upper_triangular = np.linalg.qr(np.swapaxes(matrix, -1, -2), mode='r')
+    else:
+        upper_triangular = np.stack([
+            np.linalg.qr(submatrix.T, mode='r')
+            for submatrix in matrix.reshape(-1, *matrix.shape[-2:])])
+        upper_triangular = upper_triangular.reshape(
+            *matrix.shape[:-2], *upper_triangular.shape[-2:])
+    lower_triangular = np.swapaxes(upper_triangular, -1, -2)
 
-    lower_triangular[:, index] *= -1
+    # Flip sign of columns with negative diagonal, such that the result is unique
+    signs = np.where(np.diagonal(lower_triangular, axis1=-2, axis2=-1) < 0, -1, 1)
+    lower_triangular = lower_triangular * signs[..., np.newaxis, :]
 
     return lower_triangular
 
@@ -106,6 +120,208 @@ def jacobian(fun, x,  **kwargs):
     return jac.astype(np.float_)
 
 
+def jacobian_batch(fun, x, **kwargs):
+    """Compute Jacobians of many states through finite difference calculation
+
+    As :func:`jacobian`, but for each of the `N` state vectors in `x`, with
+    `fun` evaluated once for all states.
+
+    Parameters
+    ----------
+    fun : function handle
+        A (non-linear) transition function
+        Must be of the form "y = fun(x)", where y is a
+        :class:`numpy.ndarray` of shape `(Nd, M)` for `M` input state vectors
+    x : :class:`State`
+        A state with state vectors of shape `(Ns, N)`
+
+    Returns
+    -------
+    jac: :class:`numpy.ndarray` of shape `(N, Nd, Ns)`
+        The computed Jacobians
+    """
+
+    ndim, nstates = np.shape(x.state_vector)
+    state_vectors = x.state_vector.astype(np.float_)
+
+    # For numerical reasons the step size needs to large enough. Aim for 1e-8
+    # relative to spacing between floating point numbers for each dimension
+    delta = 1e8*np.spacing(state_vectors)
+    # But at least 1e-8
+    delta[delta < 1e-8] = 1e-8
+
+    # For each state, each dimension perturbed in turn, followed by unperturbed state
+    points = np.repeat(state_vectors[:, :, np.newaxis], ndim+1, axis=2)
+    points[np.arange(ndim), :, np.arange(ndim)] += delta
+
+    x2 = copy.copy(x)  # Create a clone of the input
+    x2.state_vector = points.reshape(ndim, nstates*(ndim+1)).view(StateVectors)
+
+    F = np.asarray(fun(x2, **kwargs))
+    F = F.reshape(F.shape[0], nstates, ndim+1)
+
+    jac = np.divide(F[:, :, :ndim] - F[:, :, -1:], delta.T)
+    return np.moveaxis(jac, 0, 1).astype(np.float_)
+
+
+def _sigma_point_weights(ndim_state, alpha, beta, kappa):
+    """Sigma point mean and covariance weights, and scaling factor for off-center points"""
+    if kappa is None:
+        kappa = 3.0 - ndim_state
+
+    # Calculate scaling factor for all off-center points
+    alpha2 = np.power(alpha, 2)
+    lamda = alpha2 * (ndim_state + kappa) - ndim_state
+    c = ndim_state + lamda
+
+    # Calculate weights
+    mean_weights = np.ones(2 * ndim_state + 1)
+    mean_weights[0] = lamda / c
+    mean_weights[1:] = 0.5 / c
+    covar_weights = np.copy(mean_weights)
+    covar_weights[0] = lamda / c + (1 - alpha2 + beta)
+
+    return mean_weights, covar_weights, c
+
+
+def gauss2sigma_batch(means, covars, alpha=1.0, beta=2.0, kappa=None):
+    """
+    Approximate many Gaussian distributions, using a deterministically
+    selected set of sigma points for each.
+
+    This is the array equivalent of :func:`gauss2sigma`, for `N` states of
+    the same dimension.
+
+    Parameters
+    ----------
+    means : :class:`numpy.ndarray` of shape `(N, Ns, 1)` or `(N, Ns)`
+        The Gaussian means
+    covars : :class:`numpy.ndarray` of shape `(N, Ns, Ns)`
+        The Gaussian covariances
+    alpha : float, optional
+        Spread of the sigma points. Typically `1e-3`.
+        (default is 1)
+    beta : float, optional
+        Used to incorporate prior knowledge of the distribution
+        2 is optimal if the state is normally distributed.
+        (default is 2)
+    kappa : float, optional
+        Secondary spread scaling parameter
+        (default is calculated as `3-Ns`)
+
+    Returns
+    -------
+    : :class:`numpy.ndarray` of shape `(N, Ns, 2*Ns+1)`
+        The locations of the sigma points, for each distribution
+    : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
+        An array containing the sigma point mean weights
+    : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
+        An array containing the sigma point covariance weights
+    """
+    means = np.asarray(means)
+    if means.ndim == 2:
+        means = means[..., np.newaxis]
+    # Cast dtype from int to float to avoid rounding errors
+    if np.issubdtype(means.dtype, np.integer):
+        means = means.astype(float)
+    ndim_state = means.shape[1]
+
+    mean_weights, covar_weights, c = _sigma_point_weights(ndim_state, alpha, beta, kappa)
+
+    # Compute Square Root matrices via Cholesky decomp.
+    sqrt_sigmas = np.linalg.cholesky(np.asarray(covars, dtype=np.float_)) * np.sqrt(c)
+
+    # Calculate sigma point locations. Can't use in place addition/subtraction as casting
+    # issues may arise when mixing float/int or angle types.
+    sigma_points = np.concatenate(
+        (means, means + sqrt_sigmas, means - sqrt_sigmas), axis=2)
+
+    return sigma_points, mean_weights, covar_weights
+
+
+def sigma2gauss_batch(sigma_points, mean_weights, covar_weights, covar_noise=None):
+    """Calculate estimated means and covariances from many sets of sigma points
+
+    This is the array equivalent of :func:`sigma2gauss`, for `N` sets of sigma
+    points. Unlike :func:`sigma2gauss`, angular quantities receive no special
+    handling.
+
+    Parameters
+    ----------
+    sigma_points : :class:`numpy.ndarray` of shape `(N, Ns, 2*Ns+1)`
+        An array containing the locations of the sigma points
+    mean_weights : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
+        An array containing the sigma point mean weights
+    covar_weights : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
+        An array containing the sigma point covariance weights
+    covar_noise : :class:`numpy.ndarray` of shape `(Ns, Ns)` or `(N, Ns, Ns)`, optional
+        Additive noise covariance matrix
+        (default is `None`)
+
+    Returns
+    -------
+    : :class:`numpy.ndarray` of shape `(N, Ns, 1)`
+        Calculated means
+    : :class:`numpy.ndarray` of shape `(N, Ns, Ns)`
+        Calculated covariances
+    """
+    sigma_points = np.asarray(sigma_points)
+    means = sigma_points @ mean_weights[:, np.newaxis]
+
+    points_diff = sigma_points - means
+    covars = (points_diff * covar_weights) @ np.swapaxes(points_diff, -1, -2)
+    if covar_noise is not None:
+        covars = covars + covar_noise
+    return means, covars
+
+
+def gauss2sigma_state(state, alpha=1.0, beta=2.0, kappa=None):
+    """
+    Approximate a given distribution to a Gaussian, using a
+    deterministically selected set of sigma points, held in a single state.
+
+    As :func:`gauss2sigma`, but rather than a list of states, a single state
+    is returned with a :class:`~.StateVectors` of all sigma points, which can
+    be passed to :func:`unscented_transform` such that functions are
+    evaluated once for all sigma points.
+
+    Parameters
+    ----------
+    state : :class:`~State`
+        A state object capable of returning a :class:`~.StateVector` of
+        shape `(Ns, 1)` representing the Gaussian mean and a
+        :class:`~.CovarianceMatrix` of shape `(Ns, Ns)` which is the
+        covariance of the distribution
+    alpha : float, optional
+        Spread of the sigma points. Typically `1e-3`.
+        (default is 1)
+    beta : float, optional
+        Used to incorporate prior knowledge of the distribution
+        2 is optimal if the state is normally distributed.
+        (default is 2)
+    kappa : float, optional
+        Secondary spread scaling parameter
+        (default is calculated as `3-Ns`)
+
+    Returns
+    -------
+    : :class:`~.State`
+        A copy of `state`, with :attr:`state_vector` a :class:`~.StateVectors`
+        of shape `(Ns, 2*Ns+1)` of the sigma points.
+    : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
+        An array containing the sigma point mean weights
+    : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
+        An array containing the sigma point covariance weights
+    """
+    sigma_points, mean_weights, covar_weights = gauss2sigma_batch(
+        state.state_vector[np.newaxis], state.covar[np.newaxis], alpha, beta, kappa)
+
+    sigma_points_state = copy.copy(state)
+    sigma_points_state.state_vector = sigma_points[0].view(StateVectors)
+
+    return sigma_points_state, mean_weights, covar_weights
+
+
 def gauss2sigma(state, alpha=1.0, beta=2.0, kappa=None):
     """
     Approximate a given distribution to a Gaussian, using a
@@ -142,47 +358,16 @@ def gauss2sigma(state, alpha=1.0, beta=2.0, kappa=None):
     : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
         An array containing the sigma point covariance weights
     """
-
-    ndim_state = np.shape(state.state_vector)[0]
-
-    if kappa is None:
-        kappa = 3.0 - ndim_state
-
-    # Compute Square Root matrix via Colesky decomp.
-    sqrt_sigma = np.linalg.cholesky(state.covar)
-
-    # Calculate scaling factor for all off-center points
-    alpha2 = np.power(alpha, 2)
-    lamda = alpha2 * (ndim_state + kappa) - ndim_state
-    c = ndim_state + lamda
-
-    # Calculate sigma point locations
-    sigma_points = StateVectors([state.state_vector for _ in range(2 * ndim_state + 1)])
-
-    # Cast dtype from int to float to avoid rounding errors
-    if np.issubdtype(sigma_points.dtype, np.integer):
-        sigma_points = sigma_points.astype(float)
-
-    # Can't use in place addition/subtraction as casting issues may arise when mixing float/int
-    sigma_points[:, 1:(ndim_state + 1)] = \
-        sigma_points[:, 1:(ndim_state + 1)] + sqrt_sigma*np.sqrt(c)
-    sigma_points[:, (ndim_state + 1):] = \
-        sigma_points[:, (ndim_state + 1):] - sqrt_sigma*np.sqrt(c)
+    sigma_points_state, mean_weights, covar_weights = gauss2sigma_state(
+        state, alpha, beta, kappa)
 
     # Put these sigma points into s State object list
     sigma_points_states = []
-    for sigma_point in sigma_points:
+    for sigma_point in sigma_points_state.state_vector:
         state_copy = copy.copy(state)
         state_copy.state_vector = StateVector(sigma_point)
         sigma_points_states.append(state_copy)
 
-    # Calculate weights
-    mean_weights = np.ones(2 * ndim_state + 1)
-    mean_weights[0] = lamda / c
-    mean_weights[1:] = 0.5 / c
-    covar_weights = np.copy(mean_weights)
-    covar_weights[0] = lamda / c + (1 - alpha2 + beta)
-
     return sigma_points_states, mean_weights, covar_weights
 
 
@@ -213,7 +398,7 @@ def sigma2gauss(sigma_points, mean_weights, covar_weights, covar_noise=None):
 
     points_diff = sigma_points - mean
 
-    covar = points_diff@(np.diag(covar_weights))@(points_diff.T)
+    covar = (points_diff*covar_weights)@(points_diff.T)
     if covar_noise is not None:
         covar = covar + covar_noise
     return mean.view(StateVector), covar.view(CovarianceMatrix)
@@ -230,8 +415,12 @@ def unscented_transform(sigma_points_states, mean_weights, covar_weights,
 
     Parameters
     ----------
-    sigma_points : :class:`~.StateVectors` of shape `(Ns, 2*Ns+1)`
-        An array containing the locations of the sigma points
+    sigma_points_states : :class:`list` of :class:`~.State` or :class:`~.State`
+        The sigma points, either as a list of states (as returned by
+        :func:`gauss2sigma`), or as a single state with a
+        :class:`~.StateVectors` of shape `(Ns, 2*Ns+1)` (as returned by
+        :func:`gauss2sigma_state`). For the latter, `fun` is called once with
+        all sigma points, so must support :class:`~.StateVectors`.
     mean_weights : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
         An array containing the sigma point mean weights
     covar_weights : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
@@ -262,25 +451,37 @@ def unscented_transform(sigma_points_states, mean_weights, covar_weights,
     : :class:`numpy.ndarray` of shape `(2*Ns+1,)`
         An array containing the transformed sigma point covariance weights
     """
-    # Reconstruct the sigma_points matrix
-    sigma_points = StateVectors([
-        sigma_points_state.state_vector for sigma_points_state in sigma_points_states])
-
-    # Transform points through f
-    if points_noise is None:
-        sigma_points_t = StateVectors([
-            fun(sigma_points_state) for sigma_points_state in sigma_points_states])
+    if hasattr(sigma_points_states, 'state_vector'):
+        sigma_points = sigma_points_states.state_vector
+
+        # Transform all points through f at once
+        if points_noise is None:
+            sigma_points_t = fun(sigma_points_states)
+        else:
+            sigma_points_t = fun(sigma_points_states, points_noise)
+        if not isinstance(sigma_points_t, StateVectors):
+            sigma_points_t = StateVectors(sigma_points_t)
     else:
-        sigma_points_t = StateVectors([
-            fun(sigma_points_state, points_noise)
-            for sigma_points_state, point_noise in zip(sigma_points_states, points_noise.T)])
+        # Reconstruct the sigma_points matrix
+        sigma_points = StateVectors([
+            sigma_points_state.state_vector for sigma_points_state in sigma_points_states])
+
+        # Transform points through f
+        if points_noise is None:
+            sigma_points_t = StateVectors([
+                fun(sigma_points_state) for sigma_points_state in sigma_points_states])
+        else:
+            sigma_points_t = StateVectors([
+                fun(sigma_points_state, points_noise)
+                for sigma_points_state, point_noise in zip(sigma_points_states,
+                                                           points_noise.T)])
 
     # Calculate mean and covariance approximation
     mean, covar = sigma2gauss(sigma_points_t, mean_weights, covar_weights, covar_noise)
 
     # Calculate cross-covariance
     cross_covar = (
-        (sigma_points-sigma_points[:, 0:1]) @ np.diag(mean_weights) @ (sigma_points_t-mean).T
+        ((sigma_points-sigma_points[:, 0:1])*mean_weights) @ (sigma_points_t-mean).T
     ).view(CovarianceMatrix)
 
     return mean, covar, cross_covar, sigma_points_t, mean_weights, covar_weights
@@ -544,6 +745,71 @@ def gm_reduce_single(means, covars, weights):
     return mean.view(StateVector), covar.view(CovarianceMatrix)
 
 
+def gaussian_logpdf(residuals, covar, cholesky_inverse=None):
+    """Log pdf of zero mean multi-variate Gaussian
+
+    This is evaluated via Cholesky factorisation of the covariance, with a single
+    triangular solve for all residuals, and without the input validation of
+    :func:`scipy.stats.multivariate_normal.logpdf`.
+
+    Parameters
+    ----------
+    residuals : :class:`numpy.ndarray` of shape (num_dims, ) or (num_dims, num_residuals)
+        Residuals (e.g. difference of state vectors from mean), as columns
+    covar : :class:`numpy.ndarray` of shape (num_dims, num_dims)
+        The covariance matrix, which must be positive definite
+    cholesky_inverse : :class:`numpy.ndarray` of shape (num_dims, num_dims), optional
+        Inverse of the lower Cholesky factor of `covar`, if already computed (e.g. cached),
+        in which case residuals are whitened by multiplication rather than a triangular
+        solve. Default `None`, where `covar` is factorised.
+
+    Returns
+    -------
+    : float or :class:`numpy.ndarray` of shape (num_residuals, )
+        Log pdf of each residual
+    """
+    residuals = np.asarray(residuals, dtype=np.float_)
+    if cholesky_inverse is None:
+        cholesky_factor = np.linalg.cholesky(np.asarray(covar, dtype=np.float_))
+        whitened = solve_triangular(cholesky_factor, residuals, lower=True, check_finite=False)
+        log_det = 2 * np.sum(np.log(np.diag(cholesky_factor)))
+    else:
+        whitened = cholesky_inverse @ residuals
+        log_det = -2 * np.sum(np.log(np.diag(cholesky_inverse)))
+
+    mahalanobis = np.einsum('i...,i...->...', whitened, whitened)
+    return -0.5 * (residuals.shape[0]*np.log(2*np.pi) + log_det + mahalanobis)
+
+
+def segmented_logsumexp(values, offsets):
+    """Log of the sum of exponentials, for each contiguous segment of an array
+
+    This is used, for example, to normalise the log weights of many particle
+    states, where all particles are held in a single array.
+
+    Parameters
+    ----------
+    values : :class:`numpy.ndarray` of shape (n, )
+        Values of all segments, concatenated
+    offsets : :class:`numpy.ndarray` of shape (m, )
+        Start index of each segment, in increasing order. Segments must not be empty.
+
+    Returns
+    -------
+    : :class:`numpy.ndarray` of shape (m, )
+        Log of the sum of exponentials of each segment
+    """
+    values = np.asarray(values, dtype=np.float_)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    lengths = np.diff(np.append(offsets, len(values)))
+    maxes = np.maximum.reduceat(values, offsets)
+    # Avoid NaN for segments of all -inf values
+    maxes[~np.isfinite(maxes)] = 0
+    sums = np.add.reduceat(np.exp(values - np.repeat(maxes, lengths)), offsets)
+    with np.errstate(divide='ignore'):
+        return np.log(sums) + maxes
+
+
 def mod_bearing(x):
     r"""Calculates the modulus of a bearing. Bearing angles are within the \
     range :math:`-\pi` to :math:`\pi`.
@@ -670,3 +936,58 @@ def sde_euler_maruyama_integration(fun, t_values, state_x0):
         a, b = fun(state_x, t)
         state_x.state_vector = state_x.state_vector + a*delta_t + b@delta_w
     return state_x.state_vector
+
+
+class _GlobalRandomState:
+    """NumPy's global random state, drawing via the :mod:`numpy.random` module functions
+
+    Unlike the module, this can be copied and pickled (as a reference to the global state).
+    """
+
+    def __getattr__(self, name):
+        return getattr(np.random, name)
+
+    def __reduce__(self):
+        return '_GLOBAL_RANDOM_STATE'
+
+    def __repr__(self):
+        return f'{type(self).__name__}()'
+
+
+_GLOBAL_RANDOM_STATE = _GlobalRandomState()
+
+
+def random_generator(seed=None):
+    """Random number generator for a component's `seed`
+
+    Components with a `seed` property use this to create their random number generator,
+    such that each can have its own independent stream. Parallel workers can be given
+    independent streams by using children of a :class:`numpy.random.SeedSequence` as seeds
+    (see :meth:`numpy.random.SeedSequence.spawn`).
+
+    Draws made with the generator should only use methods common to both
+    :class:`numpy.random.Generator` and :class:`numpy.random.RandomState` (e.g.
+    :meth:`~numpy.random.Generator.random`, :meth:`~numpy.random.Generator.standard_normal`,
+    :meth:`~numpy.random.Generator.uniform`, :meth:`~numpy.random.Generator.choice` and
+    :meth:`~numpy.random.Generator.multinomial`).
+
+    Parameters
+    ----------
+    seed : None, int, :class:`numpy.random.SeedSequence`, :class:`numpy.random.Generator` or \
+    :class:`numpy.random.RandomState`
+        If `None`, NumPy's global random state is used (via the :mod:`numpy.random` module
+        functions), such that results are controlled by :func:`numpy.random.seed`. If an
+        integer or :class:`~numpy.random.SeedSequence`, a new
+        :class:`~numpy.random.Generator` is created. Otherwise, the generator is used as is.
+
+    Returns
+    -------
+    : :class:`numpy.random.Generator`, :class:`numpy.random.RandomState` or global state
+        Random number generator
+    """
+    if seed is None:
+        return _GLOBAL_RANDOM_STATE
+    elif isinstance(seed, (np.random.Generator, np.random.RandomState, _GlobalRandomState)):
+        return seed
+    else:
+        return np.random.default_rng(seed)
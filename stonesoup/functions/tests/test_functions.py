@@ -1,12 +1,18 @@
+import copy
+import pickle
+
 import pytest
 import numpy as np
 from numpy import deg2rad
 from scipy.linalg import cholesky, LinAlgError
 from pytest import approx, raises
 
+from ... import functions
 from .. import (
     cholesky_eps, jacobian, gm_reduce_single, mod_bearing, mod_elevation, gauss2sigma,
-    rotx, roty, rotz, cart2sphere, cart2angles, pol2cart, sphere2cart, dotproduct)
+    rotx, roty, rotz, cart2sphere, cart2angles, pol2cart, sphere2cart, dotproduct,
+    segmented_logsumexp, gauss2sigma_batch, sigma2gauss_batch, gauss2sigma_state,
+    sigma2gauss, unscented_transform, gaussian_logpdf, tria, random_generator)
 from ...types.array import StateVector, StateVectors, Matrix
 from ...types.state import State, GaussianState
 
@@ -137,6 +143,21 @@ def test_gm_reduce_single():
                                         [3.2, 3.3375]]))
 
 
+def test_segmented_logsumexp():
+    from scipy.special import logsumexp
+    values = np.log(np.array([0.1, 0.2, 0.3, 1., 2., 0.5, 0.5, 4.]))
+    offsets = np.array([0, 3, 5, 7])
+    result = segmented_logsumexp(values, offsets)
+    expected = [logsumexp(segment) for segment in np.split(values, offsets[1:])]
+    assert np.allclose(result, expected)
+
+    # Segment with all zero weight
+    values[3:5] = -np.inf
+    result = segmented_logsumexp(values, offsets)
+    assert result[1] == -np.inf
+    assert np.all(np.isfinite(result[[0, 2, 3]]))
+
+
 def test_bearing():
     bearing_in = [10., 170., 190., 260., 280., 350., 705]
     rad_in = deg2rad(bearing_in)
@@ -176,6 +197,54 @@ def test_gauss2sigma(mean):
         assert sigma_point_state.state_vector[0, 0] == approx(mean + n*covar**0.5)
 
 
+def test_gauss2sigma_batch():
+    means = np.random.randn(5, 3, 1)
+    sqrt_covars = np.random.randn(5, 3, 3)
+    covars = sqrt_covars @ np.swapaxes(sqrt_covars, 1, 2) + np.eye(3)
+
+    sigma_points, mean_weights, covar_weights = gauss2sigma_batch(
+        means, covars, alpha=0.5, kappa=1)
+    assert sigma_points.shape == (5, 3, 7)
+
+    for mean, covar, points in zip(means, covars, sigma_points):
+        sigma_points_states, eval_mean_weights, eval_covar_weights = gauss2sigma(
+            GaussianState(mean, covar), alpha=0.5, kappa=1)
+        assert np.allclose(
+            points, np.hstack([state.state_vector for state in sigma_points_states]))
+        assert np.allclose(mean_weights, eval_mean_weights)
+        assert np.allclose(covar_weights, eval_covar_weights)
+
+        eval_mean, eval_covar = sigma2gauss(
+            StateVectors(points), mean_weights, covar_weights, np.eye(3))
+
+    new_means, new_covars = sigma2gauss_batch(
+        sigma_points, mean_weights, covar_weights, np.eye(3))
+    assert np.allclose(new_means, means)
+    assert np.allclose(new_covars, covars + np.eye(3))
+    assert np.allclose(new_means[-1], eval_mean)
+    assert np.allclose(new_covars[-1], eval_covar)
+
+
+def test_unscented_transform_state():
+    state = GaussianState([[1.], [2.], [0.5]], np.diag([0.1, 0.2, 0.3]))
+
+    def fun(state):
+        return StateVectors(np.vstack((
+            np.hypot(state.state_vector[0, :], state.state_vector[1, :]),
+            state.state_vector[2, :] ** 2)))
+
+    sigma_points_state, mean_weights, covar_weights = gauss2sigma_state(state)
+    assert sigma_points_state.state_vector.shape == (3, 7)
+    assert sigma_points_state.covar is state.covar
+
+    sigma_points_states, _, _ = gauss2sigma(state)
+
+    for result, eval_result in zip(
+            unscented_transform(sigma_points_state, mean_weights, covar_weights, fun),
+            unscented_transform(sigma_points_states, mean_weights, covar_weights, fun)):
+        assert np.allclose(result, eval_result)
+
+
 @pytest.mark.parametrize(
     "angle",
     [
@@ -271,3 +340,72 @@ def test_dotproduct(state_vector1, state_vector2):
 
             assert np.allclose(dotproduct(state_vector1, state_vector2),
                                np.reshape(out, np.shape(dotproduct(state_vector1, state_vector2))))
+
+
+def test_gaussian_logpdf():
+    from scipy.stats import multivariate_normal
+
+    covar = np.array([[4., 1., 0.5], [1., 2., 0.2], [0.5, 0.2, 1.]])
+    residuals = np.random.randn(3, 10)
+    expected = multivariate_normal.logpdf(residuals.T, cov=covar)
+
+    assert np.allclose(gaussian_logpdf(residuals, covar), expected)
+    assert np.allclose(
+        gaussian_logpdf(residuals, covar, np.linalg.inv(np.linalg.cholesky(covar))), expected)
+    assert gaussian_logpdf(residuals[:, 0], covar) == approx(expected[0])
+
+    with pytest.raises(LinAlgError):
+        gaussian_logpdf(residuals, np.zeros((3, 3)))
+
+
+def test_tria():
+    rng = np.random.default_rng(1)
+    matrix = rng.normal(size=(4, 6))
+    lower = tria(matrix)
+    assert lower.shape == (4, 4)
+    assert np.allclose(lower, np.tril(lower))
+    assert np.all(np.diag(lower) > 0)
+    assert np.allclose(lower @ lower.T, matrix @ matrix.T)
+    # Unique, so matches Cholesky factor
+    assert np.allclose(lower, np.linalg.cholesky(matrix @ matrix.T))
+
+    matrices = rng.normal(size=(5, 4, 6))
+    lowers = tria(matrices)
+    assert lowers.shape == (5, 4, 4)
+    for matrix, lower in zip(matrices, lowers):
+        assert np.allclose(lower, tria(matrix))
+
+
+def test_tria_loop(monkeypatch):
+    # As with NumPy versions without stacked QR decomposition
+    matrices = np.random.default_rng(1).normal(size=(2, 3, 4, 6))
+    lowers = tria(matrices)
+    monkeypatch.setattr(functions, '_STACKED_QR', False)
+    loop_lowers = tria(matrices)
+    assert loop_lowers.shape == lowers.shape == (2, 3, 4, 4)
+    assert np.allclose(loop_lowers, lowers)
+
+
+def test_random_generator():
+    # Global random state, controlled by numpy.random.seed, and shared when copied/pickled
+    generator = random_generator()
+    assert random_generator(generator) is generator
+    assert copy.deepcopy(generator) is generator
+    assert pickle.loads(pickle.dumps(generator)) is generator
+    np.random.seed(1990)
+    samples = generator.standard_normal(5)
+    np.random.seed(1990)
+    assert np.array_equal(samples, np.random.standard_normal(5))
+
+    # Independent generators from seeds
+    generator = random_generator(1990)
+    assert isinstance(generator, np.random.Generator)
+    assert np.array_equal(generator.random(5), np.random.default_rng(1990).random(5))
+    assert random_generator(generator) is generator
+    random_state = np.random.RandomState(1990)
+    assert random_generator(random_state) is random_state
+
+    children = np.random.SeedSequence(1990).spawn(2)
+    samples = [random_generator(child).random(5) for child in children]
+    assert not np.array_equal(*samples)
+    assert np.array_equal(random_generator(children[0]).random(5), samples[0])
@@ -1,12 +1,12 @@
 from functools import lru_cache
 
-from scipy.stats import multivariate_normal, chi2
 from scipy.linalg import det
 from scipy.special import gamma
 import numpy as np
 
 from .base import Hypothesiser
 from ..base import Property
+from ..functions import gaussian_logpdf
 from ..measures import SquaredMahalanobis
 from ..types.detection import MissedDetection
 from ..types.hypothesis import SingleProbabilityHypothesis
@@ -147,9 +147,9 @@ class PDAHypothesiser(Hypothesiser):
                 prediction, detection.measurement_model, **kwargs)
             # Calculate difference before to handle custom types (mean defaults to zero)
             # This is required as log pdf coverts arrays to floats
-            log_pdf = multivariate_normal.logpdf(
-                (detection.state_vector - measurement_prediction.state_vector).ravel(),
-                cov=measurement_prediction.covar)
+            log_pdf = gaussian_logpdf(
+                detection.state_vector - measurement_prediction.state_vector,
+                measurement_prediction.covar)[0]
             pdf = Probability(log_pdf, log_value=True)
 
             if measure(measurement_prediction, detection) \
@@ -191,4 +191,5 @@ class PDAHypothesiser(Hypothesiser):
     @staticmethod
     @lru_cache()
     def _gate_threshold(prob_gate, n):
+        from scipy.stats import chi2
         return chi2.ppf(float(prob_gate), n)
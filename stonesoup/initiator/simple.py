@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.stats import multivariate_normal
 
 from .base import GaussianInitiator, ParticleInitiator, Initiator
 from ..base import Property
@@ -9,7 +8,7 @@ from ..models.base import LinearModel, ReversibleModel
 from ..models.measurement import MeasurementModel
 from ..types.hypothesis import SingleHypothesis
 from ..types.numeric import Probability
-from ..types.particle import Particle
+from ..types.array import StateVectors
 from ..types.state import State, GaussianState, ParticleState
 from ..types.track import Track
 from ..types.update import GaussianStateUpdate, ParticleStateUpdate, Update
@@ -243,18 +242,16 @@ class GaussianParticleInitiator(ParticleInitiator):
         super().__init__(*args, **kwargs)
 
         # Create prior particle state
+        from scipy.stats import multivariate_normal
         try:
             samples = multivariate_normal.rvs(self.initiator.prior_state.state_vector.ravel(),
                                               self.initiator.prior_state.covar,
                                               size=self.number_particles)
         except AttributeError:
             raise AttributeError("No prior state")
-        particles = [
-            Particle(sample.reshape(-1, 1), weight=self.weight)
-            for sample in samples]
-
         self.prior_state = ParticleState(
-            particles,
+            self._state_vectors(samples),
+            log_weight=self._log_weight(),
             fixed_covar=self.initiator.prior_state.covar if self.use_fixed_covar else None
         )
 
@@ -262,6 +259,12 @@ class GaussianParticleInitiator(ParticleInitiator):
     def weight(self):
         return Probability(1 / self.number_particles)
 
+    def _log_weight(self):
+        return np.full(self.number_particles, np.log(1 / self.number_particles))
+
+    def _state_vectors(self, samples):
+        return StateVectors(np.reshape(samples, (self.number_particles, -1)).T)
+
     def initiate(self, detections, timestamp, **kwargs):
         """Initiates tracks given unassociated measurements
 
@@ -279,17 +282,15 @@ class GaussianParticleInitiator(ParticleInitiator):
         """
         tracks = self.initiator.initiate(detections, timestamp, **kwargs)
 
+        from scipy.stats import multivariate_normal
         for track in tracks:
             samples = multivariate_normal.rvs(track.state_vector.ravel(),
                                               track.covar,
                                               size=self.number_particles)
-            particles = [
-                Particle(sample.reshape(-1, 1), weight=self.weight)
-                for sample in samples]
             track[-1] = ParticleStateUpdate(
-                None,
+                self._state_vectors(samples),
                 track.hypothesis,
-                particle_list=particles,
+                log_weight=self._log_weight(),
                 fixed_covar=track.covar if self.use_fixed_covar else None,
                 timestamp=track.timestamp)
 
@@ -12,7 +12,8 @@ from ...types.hypothesis import SingleHypothesis
 from ...types.state import GaussianState
 from ...predictor.kalman import KalmanPredictor
 from ..simple import SinglePointInitiator
-from ..wrapper import StatesLengthLimiter
+from ..wrapper import StatesLengthLimiter, TrackHistoryLimiter
+from ...types.history import StateHistory, TrackHistoryPolicy
 
 
 @pytest.mark.parametrize("max_len", (1, 5, 9))
@@ -62,3 +63,29 @@ def test_states_length_limiter(max_len):
 
     assert len(track) == max_len
     assert len(track.metadatas) == max_len
+
+
+def test_track_history_limiter():
+    start_time = datetime.now()
+    measurement_model = LinearGaussian(2, [0], np.array([[1]]))
+    prior = GaussianState(
+        np.array([[0], [0]]),
+        np.array([[100, 0], [0, 1]]), timestamp=start_time)
+    policy = TrackHistoryPolicy(max_length=3)
+    initiator = TrackHistoryLimiter(SinglePointInitiator(prior, measurement_model), policy)
+    updater = KalmanUpdater(measurement_model)
+
+    track = initiator.initiate(
+        {Detection(np.array([[0.]]), timestamp=start_time)}, start_time).pop()
+    assert isinstance(track.states, StateHistory)
+    assert track.states.policy is policy
+    for i in range(1, 10):
+        measurement = Detection(np.array([[i*2.0]]),
+                                timestamp=start_time+timedelta(seconds=i))
+        track.append(updater.update(SingleHypothesis(track.state, measurement)))
+
+    # All history retained, with only recent states in full
+    assert len(track) == 10
+    assert track.states.num_archived == 7
+    assert isinstance(track[-1].hypothesis, SingleHypothesis)
+    assert track[start_time].timestamp == start_time
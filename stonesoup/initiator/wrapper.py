@@ -1,6 +1,7 @@
 import collections
 from .base import Initiator
 from ..base import Property
+from ..types.history import TrackHistoryPolicy
 
 
 class StatesLengthLimiter(Initiator):
@@ -11,7 +12,8 @@ class StatesLengthLimiter(Initiator):
     the process terminated - often by the operating system.
 
     This wrapper converts the states space list to a collections.deque data type
-    with the maximum length specified.
+    with the maximum length specified, such that older states are discarded. To keep older
+    states in compact form or on disk instead, see :class:`TrackHistoryLimiter`.
 
     .. code-block:: python
 
@@ -29,3 +31,28 @@ class StatesLengthLimiter(Initiator):
             track.states = collections.deque(track.states, self.max_length)
             track.metadatas = collections.deque(track.metadatas, self.max_length)
         return tracks
+
+
+class TrackHistoryLimiter(Initiator):
+    """Wrapper that applies a :class:`~.TrackHistoryPolicy` to initiated tracks
+
+    This keeps only the most recent states of each track in memory as full objects, with
+    older states compacted or spilled to disk by the policy's store, such that memory use
+    of long running trackers is bounded, whilst retaining the track history.
+
+    .. code-block:: python
+
+        from stonesoup.initiator.wrapper import TrackHistoryLimiter
+        from stonesoup.types.history import TrackHistoryPolicy
+
+        initiator = TrackHistoryLimiter(<initiator model>, TrackHistoryPolicy(max_length=100))
+
+    """
+    initiator: Initiator = Property(doc="Stone Soup Initiator")
+    policy: TrackHistoryPolicy = Property(doc="Policy applied to each initiated track")
+
+    def initiate(self, *args, **kwargs):
+        tracks = self.initiator.initiate(*args, **kwargs)
+        for track in tracks:
+            self.policy.apply(track)
+        return tracks
@@ -0,0 +1,386 @@
+"""Profiling and instrumentation of trackers.
+
+Trackers accept a :class:`ScanProfiler` as their ``profiler`` property, which
+records for each scan the time spent in each stage of the tracker (e.g.
+reading, hypothesis generation, assignment, update, deletion and initiation),
+along with counts of tracks, detections, hypotheses and cache hits. Each scan's
+record is passed to one or more sinks, such as :class:`RingBufferSink`,
+:class:`JSONLinesSink`, :class:`CSVSink` or :class:`CallbackSink`.
+
+An example would be:
+
+.. code-block:: python
+
+    profiler = ScanProfiler(sinks=[RingBufferSink(maxlen=100)], deadline=1.)
+    tracker = MultiTargetTracker(..., profiler=profiler)
+    for time, tracks in tracker:
+        ...
+    profiler.sinks[0].records[-1]  # e.g. {'timestamp': ..., 'read': 0.001, ...}
+
+Where no profiler is set, trackers use a record which does nothing, such that
+the overhead is a few no-op method calls per scan.
+"""
+import csv
+import datetime
+import json
+import threading
+import time
+import weakref
+from abc import abstractmethod
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Sequence
+
+from .base import Base, Property
+from .models.base import ModelCache
+
+_local = threading.local()
+
+
+def active_record():
+    """Return the :class:`ScanRecord` active in the current thread, or `None`."""
+    return getattr(_local, 'record', None)
+
+
+class ScanRecord:
+    """Timings and counts for a single scan of a tracker.
+
+    Stage timings are taken between successive calls to :meth:`mark`, less any
+    time recorded with :meth:`add` in the meantime (e.g. by components called
+    within that stage, via :func:`profile_hypotheses`).
+
+    Attributes
+    ----------
+    timestamp : datetime.datetime
+        Time of the scan, as set by :meth:`finish`.
+    stage_times : dict of str: float
+        Time spent in each stage, in seconds.
+    counts : dict of str: int
+        Counts of items, such as tracks and detections.
+    """
+
+    def __init__(self):
+        self.timestamp = None
+        self.stage_times = {}
+        self.counts = {}
+        self._last = None
+        self._nested = 0.
+        self._associating = 0
+
+    @contextmanager
+    def activate(self):
+        """Context manager making this the active record in the current thread, such that
+        components can add timings to it (see :func:`active_record`)."""
+        previous = active_record()
+        _local.record = self
+        if self._last is None:
+            self._last = time.perf_counter()
+        try:
+            yield self
+        finally:
+            _local.record = previous
+
+    @contextmanager
+    def associating(self):
+        """Context manager around a tracker's own data association, such that only hypotheses
+        generated for it are recorded by :func:`profile_hypotheses`, and not those of other
+        components (e.g. an initiator sharing the hypothesiser)."""
+        self._associating += 1
+        try:
+            yield self
+        finally:
+            self._associating -= 1
+
+    @property
+    def is_associating(self):
+        """Whether within :meth:`associating`."""
+        return self._associating > 0
+
+    def mark(self, stage):
+        """Record time since the last mark against `stage`."""
+        now = time.perf_counter()
+        self.stage_times[stage] = \
+            self.stage_times.get(stage, 0.) + now - self._last - self._nested
+        self._last = now
+        self._nested = 0.
+
+    def add(self, stage, duration):
+        """Add `duration` seconds to `stage`, which is excluded from the stage next marked."""
+        self.stage_times[stage] = self.stage_times.get(stage, 0.) + duration
+        self._nested += duration
+
+    def count(self, name, value=1):
+        """Add `value` to count `name`."""
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def merge(self, other):
+        """Add timings and counts from another record, e.g. from another thread."""
+        for stage, duration in other.stage_times.items():
+            self.stage_times[stage] = self.stage_times.get(stage, 0.) + duration
+        for name, value in other.counts.items():
+            self.count(name, value)
+
+    def finish(self, timestamp, **counts):
+        """Set the scan `timestamp` and final counts (e.g. number of tracks)."""
+        self.timestamp = timestamp
+        for name, value in counts.items():
+            self.count(name, value)
+
+
+class NullScanRecord:
+    """A :class:`ScanRecord` which does nothing, used where profiling is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def activate(self):
+        return nullcontext(self)
+
+    def associating(self):
+        return nullcontext(self)
+
+    is_associating = False
+
+    def mark(self, stage):
+        pass
+
+    def add(self, stage, duration):
+        pass
+
+    def count(self, name, value=1):
+        pass
+
+    def merge(self, other):
+        pass
+
+    def finish(self, timestamp, **counts):
+        pass
+
+
+NULL_RECORD = NullScanRecord()
+
+
+def profile_hypotheses(method):
+    """Decorator for hypotheses generation methods, returning a mapping of track to
+    :class:`~.MultipleHypothesis`, which adds time taken to the ``'hypothesise'`` stage, and
+    number of hypotheses to the ``'hypotheses'`` count of the active :class:`ScanRecord`.
+
+    Only calls within :meth:`ScanRecord.associating` are recorded."""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        record = active_record()
+        if record is None or not record.is_associating \
+                or getattr(_local, 'profiling_hypotheses', False):
+            return method(*args, **kwargs)
+        _local.profiling_hypotheses = True  # Avoid double counting nested calls
+        try:
+            start = time.perf_counter()
+            hypotheses = method(*args, **kwargs)
+            record.add('hypothesise', time.perf_counter() - start)
+        finally:
+            _local.profiling_hypotheses = False
+        record.count('hypotheses', sum(len(hypothesis) for hypothesis in hypotheses.values()))
+        return hypotheses
+    return wrapper
+
+
+class ProfileSink(Base):
+    """Profile sink base class
+
+    Receives the record of each scan from a :class:`ScanProfiler`."""
+
+    @abstractmethod
+    def write(self, record):
+        """Write a scan record.
+
+        Parameters
+        ----------
+        record : dict
+            Flat mapping of field name (e.g. ``'timestamp'``, stage name or count name) to value.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the sink."""
+
+
+class RingBufferSink(ProfileSink):
+    """Keeps the most recent records in memory."""
+    maxlen: int = Property(default=1000, doc="Maximum number of records to keep. Default 1000.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.records = deque(maxlen=self.maxlen)
+
+    def write(self, record):
+        self.records.append(record)
+
+
+class CallbackSink(ProfileSink):
+    """Calls a function with each record, e.g. to publish to a monitoring system."""
+    callback: Callable = Property(doc="Function called with each record.")
+
+    def write(self, record):
+        self.callback(record)
+
+
+class _FileSink(ProfileSink):
+    path: Path = Property(doc="File to write records to. Str will be converted to Path.")
+
+    def __init__(self, path, *args, **kwargs):
+        if not isinstance(path, Path):
+            path = Path(path)  # Ensure Path
+        super().__init__(path, *args, **kwargs)
+        self._file = self.path.open('w', newline='')
+
+    @staticmethod
+    def _format(value):
+        if isinstance(value, datetime.datetime):
+            return value.isoformat()
+        return value
+
+    def close(self):
+        if getattr(self, '_file', None):
+            self._file.close()
+
+    def __del__(self):
+        self.close()
+
+
+class JSONLinesSink(_FileSink):
+    """Writes each record as a line of JSON."""
+
+    def write(self, record):
+        self._file.write(json.dumps(
+            {key: self._format(value) for key, value in record.items()}, default=str) + '\n')
+        self._file.flush()
+
+
+class CSVSink(_FileSink):
+    """Writes each record as a row of CSV.
+
+    The columns are those of the first record, such that any fields not present in later records
+    are left empty, and any new fields are ignored."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._writer = None
+
+    def write(self, record):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(record),
+                                          extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerow({key: self._format(value) for key, value in record.items()})
+        self._file.flush()
+
+
+class ScanProfiler(Base):
+    """Records time spent in each stage of a tracker, and counts, for each scan.
+
+    Each scan produces a flat record (:class:`dict`) containing the scan ``'timestamp'``, time
+    in seconds for each stage of the tracker, the ``'total'`` time, counts (e.g. of
+    ``'tracks'``, ``'detections'`` and ``'hypotheses'``), the number of ``'cache_hits'`` in the
+    tracker's components, and the ``'slowest_stage'``. If :attr:`deadline` is set, whether it
+    was exceeded is recorded as ``'overrun'``. This is then written to each of the
+    :attr:`sinks`.
+
+    Cache hits are those of :func:`functools.lru_cache` methods of the tracker's components
+    (which are shared between instances of the same class), and of any :class:`~.ModelCache` of
+    the components.
+    """
+    sinks: Sequence[ProfileSink] = Property(
+        default=None,
+        doc="Sinks to write records to. Default `None`, where a :class:`RingBufferSink` is "
+            "used.")
+    deadline: float = Property(
+        default=None,
+        doc="Time budget for each scan, in seconds. Default `None`, where not checked.")
+    count_cache_hits: bool = Property(
+        default=True, doc="Whether to count cache hits. Default `True`.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.sinks is None:
+            self.sinks = [RingBufferSink()]
+        self._cache_sources = weakref.WeakKeyDictionary()
+
+    @contextmanager
+    def scan(self, tracker):
+        """Context manager providing the :class:`ScanRecord` for a scan of `tracker`.
+
+        The record is written to the sinks on exit, provided no exception was raised (e.g.
+        :class:`StopIteration` at the end of the detections) and :meth:`ScanRecord.finish`
+        was called.
+        """
+        record = ScanRecord()
+        cache_hits = self._cache_hits(tracker) if self.count_cache_hits else None
+        start = time.perf_counter()
+        with record.activate():
+            yield record
+        total = time.perf_counter() - start
+
+        if record.timestamp is None:
+            return
+        output = {'timestamp': record.timestamp, **record.stage_times, 'total': total,
+                  **record.counts}
+        if cache_hits is not None:
+            output['cache_hits'] = self._cache_hits(tracker) - cache_hits
+        output['slowest_stage'] = max(record.stage_times, key=record.stage_times.get) \
+            if record.stage_times else None
+        if self.deadline is not None:
+            output['overrun'] = total > self.deadline
+        for sink in self.sinks:
+            sink.write(output)
+
+    def _cache_hits(self, tracker):
+        try:
+            lru_functions, components = self._cache_sources[tracker]
+        except KeyError:
+            lru_functions, components = self._cache_sources[tracker] = \
+                self._find_cache_sources(tracker)
+        # Model caches are created lazily and replaced when properties change, so found each time
+        model_caches = {id(value): value
+                        for component in components
+                        for value in vars(component).values()
+                        if isinstance(value, ModelCache)}
+        return sum(function.cache_info().hits for function in lru_functions) \
+            + sum(model_cache.hits for model_cache in model_caches.values())
+
+    @staticmethod
+    def _find_cache_sources(component):
+        """Find cached methods of component and its (sub)components, and the components."""
+        lru_functions = {}
+        found = {}
+        components = [component]
+        while components:
+            component = components.pop()
+            if id(component) in found:
+                continue
+            found[id(component)] = component
+            for class_ in type(component).__mro__:
+                for attribute in vars(class_).values():
+                    if hasattr(attribute, 'cache_info'):
+                        lru_functions[id(attribute)] = attribute
+            for value in vars(component).values():
+                if isinstance(value, Base):
+                    components.append(value)
+                elif isinstance(value, (list, tuple)):
+                    components.extend(item for item in value if isinstance(item, Base))
+        return list(lru_functions.values()), list(found.values())
+
+    def close(self):
+        """Close all sinks."""
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -2,8 +2,6 @@ from operator import attrgetter
 from typing import Collection
 
 import numpy as np
-import matplotlib
-from matplotlib import pyplot as plt
 
 from .base import MetricTableGenerator, MetricGenerator
 from ..base import Property
@@ -31,6 +29,8 @@ class RedGreenTableGenerator(MetricTableGenerator):
         Returns a matplotlib Table of metrics with their descriptions, target
         values and a coloured value cell to represent how well the tracker has
         performed in relation to each specific metric (red=bad, green=good)"""
+        import matplotlib
+        from matplotlib import pyplot as plt
 
         white = (1, 1, 1)
         cellText = [["Metric", "Description", "Target", "Value"]]
@@ -1,11 +1,17 @@
+import functools
+import threading
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Union, Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Hashable, Optional, Sequence, Union
 
 import numpy as np
-from scipy.stats import multivariate_normal
+from scipy.linalg import block_diag, solve_triangular
 
 from ..base import Base, Property
-from ..functions import jacobian as compute_jac
+from ..functions import (
+    gaussian_logpdf, jacobian as compute_jac, jacobian_batch as compute_jac_batch,
+    random_generator)
 from ..types.array import StateVector, StateVectors, CovarianceMatrix
 from ..types.numeric import Probability
 from ..types.state import State
@@ -14,6 +20,27 @@ if TYPE_CHECKING:
     from ..types.detection import Detection
 
 
+def time_intervals_to_seconds(time_intervals) -> np.ndarray:
+    """Convert time intervals to an array of float seconds
+
+    Parameters
+    ----------
+    time_intervals : sequence of :class:`datetime.timedelta` or :class:`numpy.ndarray`
+        Time intervals, or array of :class:`numpy.timedelta64`
+
+    Returns
+    -------
+    : :class:`numpy.ndarray` of shape (`N`,)
+        Time intervals in seconds
+    """
+    return np.asarray(time_intervals, dtype='timedelta64[us]') / np.timedelta64(1, 's')
+
+
+def _time_intervals_to_timedeltas(time_intervals) -> np.ndarray:
+    """Convert time intervals to an object array of :class:`datetime.timedelta`"""
+    return np.asarray(time_intervals, dtype='timedelta64[us]').astype(object)
+
+
 class Model(Base):
     """Model type
 
@@ -63,6 +90,83 @@ class Model(Base):
 
         return compute_jac(self.function, state, **kwargs)
 
+    def jacobian_batch(self, state, **kwargs):
+        """Model jacobian matrices for many states
+
+        By default, these are computed by finite differences, evaluating
+        :meth:`function` once for all states.
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state, with :class:`~.StateVectors` of `N` state vectors
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (`N`, :py:attr:`~ndim_meas`, \
+        :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around each state vector.
+        """
+
+        return compute_jac_batch(self.function, state, **kwargs)
+
+    def function_batch(self, state: State, time_intervals, noise: Union[bool, np.ndarray] = False,
+                       **kwargs) -> StateVectors:
+        """Model function for many states, each over its own time interval
+
+        By default, this simply calls :meth:`function` for each state vector, but
+        subclasses may override this to process all states at once.
+
+        Parameters
+        ----------
+        state: State
+            An input state, with :class:`~.StateVectors` of `N` state vectors
+        time_intervals : sequence of :class:`datetime.timedelta`
+            Time interval for each of the `N` state vectors
+        noise: :class:`numpy.ndarray` or bool
+            An externally generated random process noise sample (the default is
+            `False`, in which case no noise will be added
+            if 'True', the output of :meth:`~.Model.rvs_batch` is used)
+
+        Returns
+        -------
+        : :class:`StateVectors`
+            The state vectors with the model function evaluated.
+        """
+        time_intervals = _time_intervals_to_timedeltas(time_intervals)
+        if not isinstance(noise, bool) and noise is not None:
+            noise = StateVectors(noise)
+        state_vectors = []
+        for index, time_interval in enumerate(time_intervals):
+            if isinstance(noise, StateVectors):
+                column_noise = noise[:, index:index+1]
+            else:
+                column_noise = noise
+            state_vectors.append(self.function(
+                State(state.state_vector[:, index:index+1]), noise=column_noise,
+                time_interval=time_interval, **kwargs))
+        return StateVectors(np.hstack(state_vectors))
+
+    def rvs_batch(self, time_intervals, **kwargs) -> StateVectors:
+        """Model noise samples for many time intervals
+
+        By default, this simply calls :meth:`rvs` for each time interval, but
+        subclasses may override this to generate all samples at once.
+
+        Parameters
+        ----------
+        time_intervals : sequence of :class:`datetime.timedelta`
+            `N` time intervals
+
+        Returns
+        -------
+        noise : :class:`StateVectors` of shape (:attr:`ndim`, `N`)
+            A sample for each time interval.
+        """
+        return StateVectors(np.hstack([
+            self.rvs(time_interval=time_interval, **kwargs)
+            for time_interval in _time_intervals_to_timedeltas(time_intervals)]))
+
     @abstractmethod
     def rvs(self, num_samples: int = 1, **kwargs) -> Union[StateVector, StateVectors]:
         r"""Model noise/sample generation function
@@ -173,6 +277,73 @@ class LinearModel(Model):
         """
         return self.matrix(**kwargs)
 
+    def jacobian_batch(self, state: State, **kwargs) -> np.ndarray:
+        """Model jacobian matrices for many states
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state, with :class:`~.StateVectors` of `N` state vectors
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (`N`, :py:attr:`~ndim_meas`, \
+        :py:attr:`~ndim_state`)
+            The model matrix, repeated for each state vector.
+        """
+        matrix = np.asarray(self.matrix(**kwargs))
+        return np.repeat(matrix[np.newaxis], state.state_vector.shape[1], axis=0)
+
+    def matrix_batch(self, time_intervals, **kwargs) -> np.ndarray:
+        """Model matrices for many time intervals
+
+        By default, this simply calls :meth:`matrix` for each time interval, but
+        subclasses may override this to construct all matrices at once.
+
+        Parameters
+        ----------
+        time_intervals : sequence of :class:`datetime.timedelta`
+            `N` time intervals
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (`N`, :py:attr:`~ndim`, :py:attr:`~ndim_state`)
+            The model matrix for each time interval.
+        """
+        return np.stack([
+            self.matrix(time_interval=time_interval, **kwargs)
+            for time_interval in _time_intervals_to_timedeltas(time_intervals)])
+
+    def function_batch(self, state: State, time_intervals, noise: Union[bool, np.ndarray] = False,
+                       **kwargs) -> StateVectors:
+        """Model linear function for many states, each over its own time interval
+
+        Parameters
+        ----------
+        state: State
+            An input state, with :class:`~.StateVectors` of `N` state vectors
+        time_intervals : sequence of :class:`datetime.timedelta`
+            Time interval for each of the `N` state vectors
+        noise: :class:`numpy.ndarray` or bool
+            An externally generated random process noise sample (the default is
+            `False`, in which case no noise will be added
+            if 'True', the output of :meth:`~.Model.rvs_batch` is added)
+
+        Returns
+        -------
+        : :class:`StateVectors`
+            The state vectors with the model function evaluated.
+        """
+        if isinstance(noise, bool) or noise is None:
+            if noise:
+                noise = self.rvs_batch(time_intervals, **kwargs)
+            else:
+                noise = 0
+
+        matrices = self.matrix_batch(time_intervals, **kwargs)
+        state_vectors = np.asarray(state.state_vector).T[:, :, np.newaxis]
+        return StateVectors((matrices @ state_vectors)[:, :, 0].T) + noise
+
 
 class ReversibleModel(Model):
     """Non-linear model containing sufficient co-ordinate
@@ -207,6 +378,126 @@ class TimeVariantModel(Model):
     Base/Abstract class for all time-variant models"""
 
 
+class ModelCache:
+    """Bounded least recently used cache for model results
+
+    Used by models to memoise results such as transition matrices and noise covariances, which
+    are typically requested repeatedly for the same time interval. Models should hold this as a
+    :func:`~.clearable_cached_property`, such that it is discarded when any properties that the
+    results depend on are changed.
+
+    Cached arrays are read-only, as they are shared, so public methods should return them via
+    :meth:`result`, which returns a copy unless within :meth:`shared` (e.g. where a model
+    combines results of other models).
+
+    Attributes
+    ----------
+    hits : int
+        Number of times a result was found in the cache.
+    misses : int
+        Number of times a result had to be created.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __getstate__(self):
+        # Results can be recomputed, so copies and pickles start empty
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def get(self, key: Hashable, func: Callable[[], np.ndarray]) -> np.ndarray:
+        """Get result for `key`, calling `func` to create it if not in the cache
+
+        Arrays are made read-only, as they are shared between callers.
+        """
+        with self._lock:
+            try:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            except KeyError:
+                self.misses += 1
+        value = self._read_only(func())
+        with self._lock:
+            self._cache[key] = value
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return value
+
+    def combine(self, key: Hashable, matrices: Sequence[np.ndarray],
+                func: Callable[..., np.ndarray] = block_diag) -> np.ndarray:
+        """Get combination of `matrices` (by default block diagonal) created by `func`, cached
+        on the identity of `matrices`
+
+        This is suitable for combining results of other models' cached methods, obtained within
+        :meth:`shared`. References to `matrices` are held by the cache, such that their
+        identities can't be reused whilst cached. The combination is returned via
+        :meth:`result`.
+        """
+        matrices = tuple(matrices)
+        _, value = self.get(
+            (key, *map(id, matrices)),
+            lambda: (matrices, self._read_only(func(*matrices))))
+        return self.result(value)
+
+    @classmethod
+    @contextmanager
+    def shared(cls):
+        """Context manager within which :meth:`result` returns cached arrays themselves, rather
+        than copies, in the current thread."""
+        previous = getattr(cls._local, 'shared', False)
+        cls._local.shared = True
+        try:
+            yield
+        finally:
+            cls._local.shared = previous
+
+    @classmethod
+    def result(cls, value):
+        """Return a copy of cached `value` (or tuple of arrays), such that callers may modify
+        it, unless within :meth:`shared`."""
+        if getattr(cls._local, 'shared', False):
+            return value
+        elif isinstance(value, tuple):
+            return tuple(map(cls.result, value))
+        elif isinstance(value, np.ndarray):
+            return value.copy()
+        return value
+
+    @staticmethod
+    def _read_only(value):
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        return value
+
+
+def time_interval_cached(method):
+    """Decorator to memoise a model method on time interval
+
+    Results are stored in the model's :class:`ModelCache`, accessed as :attr:`_cache`, and
+    returned via :meth:`ModelCache.result`. Other keyword arguments are not part of the key, so
+    must not affect the result.
+    """
+    @functools.wraps(method)
+    def wrapper(self, time_interval, **kwargs):
+        return ModelCache.result(self._cache.get(
+            (method.__qualname__, time_interval),
+            lambda: method(self, time_interval, **kwargs)))
+    return wrapper
+
+
 class TimeInvariantModel(Model):
     """TimeInvariantModel class
 
@@ -217,11 +508,26 @@ class GaussianModel(Model):
     """GaussianModel class
 
     Base/Abstract class for all Gaussian models"""
-    seed: Optional[int] = Property(default=None, doc="Seed for random number generation")
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = Property(
+        default=None,
+        doc="Seed for random number generation, used to create the model's own "
+            ":class:`numpy.random.Generator` (see :func:`~.random_generator`). Default `None` "
+            "where NumPy's global random state is used.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.random_state = np.random.RandomState(self.seed) if self.seed is not None else None
+        self.random_state = random_generator(self.seed)
+        self._cholesky_cache = ModelCache(maxsize=16)
+        self._covar_sqrt_cache = ModelCache(maxsize=16)
+
+    def _cholesky_inverse(self, covar):
+        """Inverse of lower Cholesky factor of covariance, cached on its value, such that
+        repeated likelihood evaluations with the same covariance only factorise it once"""
+        covar = np.ascontiguousarray(covar, dtype=np.float64)
+        return self._cholesky_cache.get(
+            (covar.shape, covar.tobytes()),
+            lambda: solve_triangular(
+                np.linalg.cholesky(covar), np.eye(covar.shape[0]), lower=True))
 
     def rvs(self, num_samples: int = 1, random_state=None, **kwargs) ->\
             Union[StateVector, StateVectors]:
@@ -241,6 +547,9 @@ class GaussianModel(Model):
         ----------
         num_samples: scalar, optional
             The number of samples to be generated (the default is 1)
+        random_state: :class:`numpy.random.Generator` or :class:`numpy.random.RandomState`, \
+        optional
+            Random number generator to use. Default `None` where the model's own is used.
 
         Returns
         -------
@@ -257,19 +566,57 @@ class GaussianModel(Model):
 
         random_state = random_state if random_state is not None else self.random_state
 
-        noise = multivariate_normal.rvs(
-            np.zeros(self.ndim), covar, num_samples, random_state=random_state)
-
-        noise = np.atleast_2d(noise)
-
-        if self.ndim > 1:
-            noise = noise.T  # numpy.rvs method squeezes 1-dimensional matrices to integers
+        # All samples drawn at once, and transformed by the covariance's square root
+        samples = random_state.standard_normal((self.ndim, num_samples))
+        noise = self._covar_sqrt(covar) @ samples
 
         if num_samples == 1:
             return noise.view(StateVector)
         else:
             return noise.view(StateVectors)
 
+    def rvs_batch(self, time_intervals, random_state=None, **kwargs) -> StateVectors:
+        r"""Model noise samples for many time intervals
+
+        Generates a noise sample for each time interval, from the model's
+        noise covariance for that interval, :meth:`covar_batch`.
+
+        Parameters
+        ----------
+        time_intervals : sequence of :class:`datetime.timedelta`
+            `N` time intervals
+        random_state: :class:`numpy.random.Generator` or :class:`numpy.random.RandomState`, \
+        optional
+            Random number generator to use. Default `None` where the model's own is used.
+
+        Returns
+        -------
+        noise : :class:`StateVectors` of shape (:attr:`ndim`, `N`)
+            A sample for each time interval.
+        """
+        covars = self.covar_batch(time_intervals, **kwargs)
+        random_state = random_state if random_state is not None else self.random_state
+
+        samples = random_state.standard_normal((covars.shape[0], self.ndim, 1))
+        return StateVectors((self._covar_sqrt_batch(covars) @ samples)[:, :, 0].T)
+
+    def _covar_sqrt(self, covar):
+        """Lower triangular square root of covariance, cached on its value"""
+        covar = np.ascontiguousarray(covar, dtype=np.float64)
+        return self._covar_sqrt_cache.get(
+            (covar.shape, covar.tobytes()),
+            lambda: self._covar_sqrt_batch(covar[np.newaxis])[0])
+
+    @staticmethod
+    def _covar_sqrt_batch(covars):
+        """Lower triangular square roots of covariances, falling back to eigen decomposition
+        where covariances are only positive semi-definite"""
+        try:
+            return np.linalg.cholesky(covars)
+        except np.linalg.LinAlgError:
+            eigvals, eigvecs = np.linalg.eigh(covars)
+            return eigvecs * np.sqrt(np.clip(eigvals, 0, None))[:, np.newaxis, :]
+
     def pdf(self, state1: State, state2: State, **kwargs) -> Union[Probability, np.ndarray]:
         r"""Model pdf/likelihood evaluation function
 
@@ -330,15 +677,66 @@ class GaussianModel(Model):
 
         # Calculate difference before to handle custom types (mean defaults to zero)
         # This is required as log pdf coverts arrays to floats
-        likelihood = np.atleast_1d(
-            multivariate_normal.logpdf((state1.state_vector - self.function(state2, **kwargs)).T,
-                                       cov=covar))
+        likelihood = np.atleast_1d(gaussian_logpdf(
+            state1.state_vector - self.function(state2, **kwargs),
+            covar, self._cholesky_inverse(covar)))
 
         if len(likelihood) == 1:
             likelihood = likelihood[0]
 
         return likelihood
 
+    def logpdf_batch(self, state1: State, state2: State, time_intervals, **kwargs) -> np.ndarray:
+        r"""Model log pdf/likelihood evaluation function for many time intervals
+
+        As :meth:`logpdf`, but with each state vector of ``state2`` passed to
+        :meth:`function_batch()` with its own time interval, and evaluated with
+        the corresponding noise covariance from :meth:`covar_batch`.
+
+        Parameters
+        ----------
+        state1 : State
+            State with `N` state vectors
+        state2 : State
+            State with `N` state vectors
+        time_intervals : sequence of :class:`datetime.timedelta`
+            `N` time intervals
+
+        Returns
+        -------
+        : :class:`~.numpy.ndarray` of shape (`N`,)
+            The log likelihood of each state vector of ``state1``, given ``state2``
+        """
+        covars = self.covar_batch(time_intervals, **kwargs)
+
+        # Calculate difference before to handle custom types
+        diffs = state1.state_vector - self.function_batch(state2, time_intervals, **kwargs)
+        diffs = np.asarray(diffs, dtype=np.float64).T[:, :, np.newaxis]
+
+        _, logdets = np.linalg.slogdet(covars)
+        mahalanobis = (np.swapaxes(diffs, 1, 2) @ np.linalg.solve(covars, diffs))[:, 0, 0]
+        return -0.5 * (self.ndim*np.log(2*np.pi) + logdets + mahalanobis)
+
     @abstractmethod
     def covar(self, **kwargs) -> CovarianceMatrix:
         """Model covariance"""
+
+    def covar_batch(self, time_intervals, **kwargs) -> np.ndarray:
+        """Model covariances for many time intervals
+
+        By default, this simply calls :meth:`covar` for each time interval, but
+        subclasses may override this to construct all covariances at once.
+
+        Parameters
+        ----------
+        time_intervals : sequence of :class:`datetime.timedelta`
+            `N` time intervals
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (`N`, :py:attr:`~ndim`, :py:attr:`~ndim`)
+            The model covariance for each time interval.
+        """
+        return np.stack([
+            np.asarray(self.covar(time_interval=time_interval, **kwargs), dtype=np.float64)
+            for time_interval in _time_intervals_to_timedeltas(time_intervals)])
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.stats import poisson
 from typing import Set, Union, Callable, Tuple, Optional
 from abc import ABC
 
@@ -82,6 +81,7 @@ class ClutterModel(Model, ABC):
 
         # Generate the clutter for this time step
         clutter = set()
+        from scipy.stats import poisson
         for _ in range(poisson.rvs(self.clutter_rate, random_state=self.random_state)):
             # Call the distribution function to generate a random vector in the space
             random_vector = np.array([self.distribution(*arg) for arg in self.dist_params])
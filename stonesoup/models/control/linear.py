@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.stats import multivariate_normal
 
 from .base import ControlModel
 from ..base import LinearModel
@@ -65,6 +64,7 @@ class LinearControlModel(ControlModel, LinearModel):
             a sample from :math:`\mathcal{N}(B_k \mathbf{u}_k, \Gamma_k)`
 
         """
+        from scipy.stats import multivariate_normal
         return multivariate_normal.rvs(self.control_input(),
                                        self.control_noise).reshape(-1, 1)
 
@@ -82,6 +82,7 @@ class LinearControlModel(ControlModel, LinearModel):
             The value of the pdf at :obj:`control_vec`
 
         """
+        from scipy.stats import multivariate_normal
         return multivariate_normal.pdf(control_vec,
                                        mean=self.control_input(),
                                        cov=self.control_noise).reshape(-1, 1)
@@ -2,17 +2,15 @@ from abc import ABC
 import copy
 from typing import Sequence, Tuple, Union
 
-from math import sqrt
 import numpy as np
 from scipy.linalg import inv, pinv, block_diag
-from scipy.stats import multivariate_normal
 
 from ...base import Property, clearable_cached_property
 from ...types.numeric import Probability
 
 from ...functions import cart2pol, pol2cart, \
     cart2sphere, sphere2cart, cart2angles, \
-    build_rotation_matrix
+    build_rotation_matrix, jacobian_batch as compute_jac_batch
 from ...types.array import StateVector, CovarianceMatrix, StateVectors
 from ...types.angle import Bearing, Elevation
 from ..base import LinearModel, GaussianModel, ReversibleModel
@@ -57,6 +55,13 @@ class CombinedReversibleGaussianMeasurementModel(ReversibleModel, GaussianModel,
         return np.vstack([model.function(state, **kwargs)
                           for model in self.model_list]).view(StateVector)
 
+    def jacobian(self, state, **kwargs):
+        return np.vstack([model.jacobian(state, **kwargs) for model in self.model_list])
+
+    def jacobian_batch(self, state, **kwargs):
+        return np.concatenate([model.jacobian_batch(state, **kwargs)
+                               for model in self.model_list], axis=1)
+
     @staticmethod
     def _linear_inverse_function(model, state, **kwargs):
         model_matrix = model.matrix(**kwargs)
@@ -138,6 +143,95 @@ class NonLinearGaussianMeasurement(MeasurementModel, GaussianModel, ABC):
         """3D axis rotation matrix"""
         return build_rotation_matrix(self.rotation_offset)
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`H_{jac}`
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, \
+        :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector.
+        """
+        return self.jacobian_batch(state, **kwargs)[0]
+
+    def jacobian_batch(self, state, **kwargs):
+        """Model jacobian matrices :math:`H_{jac}` for many states
+
+        Closed form where available, with finite difference approximation used where the
+        Jacobian is undefined (e.g. at zero range).
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state, with `N` state vectors
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (`N`, :py:attr:`~ndim_meas`, :py:attr:`~ndim_state`)
+            The model jacobian matrices evaluated around each of the state vectors.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            jac = self._analytic_jacobian_batch(state, **kwargs)
+        singular = ~np.all(np.isfinite(jac), axis=(1, 2))
+        if np.any(singular):
+            singular_state = copy.copy(state)
+            singular_state.state_vector = state.state_vector[:, singular]
+            jac[singular] = compute_jac_batch(self.function, singular_state, **kwargs)
+        return jac
+
+    def _analytic_jacobian_batch(self, state, **kwargs):
+        return compute_jac_batch(self.function, state, **kwargs)
+
+    def _rotated_position(self, state):
+        """Positions relative to sensor, and rotated into sensor frame, as float arrays of
+        shape (3, N)"""
+        xyz = np.asfarray(state.state_vector[self.mapping, :] - self.translation_offset)
+        return xyz, self.rotation_matrix @ xyz
+
+    def _position_jacobian(self, rows, state):
+        """Jacobians of shape (N, ndim_meas, ndim_state), with rows of derivatives with respect
+        to rotated position mapped to state space"""
+        jac = np.zeros((state.state_vector.shape[1], self.ndim_meas, self.ndim_state))
+        jac[:, :, self.mapping] = rows @ self.rotation_matrix
+        return jac
+
+    @staticmethod
+    def _spherical_jacobian(xyz):
+        """Derivatives of elevation, bearing and range with respect to Cartesian position,
+        with shape (N, 3, 3)"""
+        x, y, z = xyz
+        rho2 = x**2 + y**2
+        rho = np.sqrt(rho2)
+        r2 = rho2 + z**2
+        r = np.sqrt(r2)
+
+        jac = np.zeros((xyz.shape[1], 3, 3))
+        # Elevation
+        jac[:, 0, 0] = -x*z / (rho*r2)
+        jac[:, 0, 1] = -y*z / (rho*r2)
+        jac[:, 0, 2] = rho / r2
+        # Bearing
+        jac[:, 1, 0] = -y / rho2
+        jac[:, 1, 1] = x / rho2
+        # Range
+        jac[:, 2, :] = (xyz / r).T
+        return jac
+
+    def _range_rate_jacobian(self, jac, xyz, state):
+        """Set last row of Jacobians to derivatives of range rate, for unrotated positions
+        relative to sensor"""
+        xyz_vel = np.asfarray(state.state_vector[self.velocity_mapping, :] - self.velocity)
+        r = np.linalg.norm(xyz, axis=0)
+        range_rate = np.einsum('ij,ij->j', xyz, xyz_vel) / r
+        jac[:, -1, self.mapping] = ((xyz_vel - range_rate*xyz/r) / r).T
+        jac[:, -1, self.velocity_mapping] = (xyz / r).T
+        return jac
+
 
 class CartesianToElevationBearingRange(NonLinearGaussianMeasurement, ReversibleModel):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -280,6 +374,10 @@ class CartesianToElevationBearingRange(NonLinearGaussianMeasurement, ReversibleM
         out = np.array([[Elevation(0.)], [Bearing(0.)], [0.]]) + out
         return out
 
+    def _analytic_jacobian_batch(self, state, **kwargs):
+        _, xyz_rot = self._rotated_position(state)
+        return self._position_jacobian(self._spherical_jacobian(xyz_rot), state)
+
 
 class CartesianToBearingRange(NonLinearGaussianMeasurement, ReversibleModel):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -424,6 +522,26 @@ class CartesianToBearingRange(NonLinearGaussianMeasurement, ReversibleModel):
         out = np.array([[Bearing(0)], [0.]]) + out
         return out
 
+    def _analytic_jacobian_batch(self, state, **kwargs):
+        xy = np.asfarray(state.state_vector[self.mapping[:2], :]
+                         - self.translation_offset[:2, :])
+        rotation_matrix = self.rotation_matrix[:2, :2]
+        x, y = rotation_matrix @ xy
+        rho2 = x**2 + y**2
+        rho = np.sqrt(rho2)
+
+        rows = np.empty((xy.shape[1], 2, 2))
+        # Bearing
+        rows[:, 0, 0] = -y / rho2
+        rows[:, 0, 1] = x / rho2
+        # Range
+        rows[:, 1, 0] = x / rho
+        rows[:, 1, 1] = y / rho
+
+        jac = np.zeros((xy.shape[1], self.ndim_meas, self.ndim_state))
+        jac[:, :, self.mapping[:2]] = rows @ rotation_matrix
+        return jac
+
 
 class CartesianToElevationBearing(NonLinearGaussianMeasurement):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -549,6 +667,10 @@ class CartesianToElevationBearing(NonLinearGaussianMeasurement):
         out = np.array([[Elevation(0.)], [Bearing(0.)]]) + out
         return out
 
+    def _analytic_jacobian_batch(self, state, **kwargs):
+        _, xyz_rot = self._rotated_position(state)
+        return self._position_jacobian(self._spherical_jacobian(xyz_rot)[:, :2], state)
+
 
 class Cartesian2DToBearing(NonLinearGaussianMeasurement):
     r"""This is a class implementation of a time-invariant measurement model, where measurements \
@@ -646,6 +768,21 @@ class Cartesian2DToBearing(NonLinearGaussianMeasurement):
         out = np.array([[Bearing(0.)]]) + out
         return out
 
+    def _analytic_jacobian_batch(self, state, **kwargs):
+        xy = np.asfarray(state.state_vector[self.mapping[:2], :]
+                         - self.translation_offset[:2, :])
+        rotation_matrix = self.rotation_matrix[:2, :2]
+        x, y = rotation_matrix @ xy
+        rho2 = x**2 + y**2
+
+        rows = np.empty((xy.shape[1], 1, 2))
+        rows[:, 0, 0] = -y / rho2
+        rows[:, 0, 1] = x / rho2
+
+        jac = np.zeros((xy.shape[1], self.ndim_meas, self.ndim_state))
+        jac[:, :, self.mapping[:2]] = rows @ rotation_matrix
+        return jac
+
 
 class CartesianToBearingRangeRate(NonLinearGaussianMeasurement):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -792,6 +929,13 @@ class CartesianToBearingRangeRate(NonLinearGaussianMeasurement):
         out = np.array([[Bearing(0)], [0.], [0.]]) + out
         return out
 
+    def _analytic_jacobian_batch(self, state, **kwargs):
+        xyz, xyz_rot = self._rotated_position(state)
+        jac = np.zeros((xyz.shape[1], self.ndim_meas, self.ndim_state))
+        # Bearing and range
+        jac[:, :2, self.mapping] = self._spherical_jacobian(xyz_rot)[:, 1:] @ self.rotation_matrix
+        return self._range_rate_jacobian(jac, xyz, state)
+
 
 class CartesianToElevationBearingRangeRate(NonLinearGaussianMeasurement, ReversibleModel):
     r"""This is a class implementation of a time-invariant measurement model, \
@@ -966,92 +1110,12 @@ class CartesianToElevationBearingRangeRate(NonLinearGaussianMeasurement, Reversi
         out = np.array([[Elevation(0)], [Bearing(0)], [0.], [0.]]) + out
         return out
 
-    def jacobian(self, state, **kwargs):
-        """Model jacobian matrix :math:`H_{jac}`
-
-        Parameters
-        ----------
-        state : :class:`~.State`
-            An input state
-
-        Returns
-        -------
-        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_meas`, \
-        :py:attr:`~ndim_state`)
-            The model jacobian matrix evaluated around the given state vector.
-        """
-        # Account for origin offset in position to enable range and angles to be determined
-        xyz_pos = state.state_vector[self.mapping, :] - self.translation_offset
-
-        # Determine the net velocity component in the engagement
-        xyz_vel = state.state_vector[self.velocity_mapping, :] - self.velocity
-
-        # Rotate into RADAR coordinate system to linearize around the correct
-        # state
-        xyz_pos = self.rotation_matrix @ xyz_pos
-        xyz_vel = self.rotation_matrix @ xyz_vel
-
-        jac = np.zeros((4, 6), dtype=np.float_)
-
-        x, y, z = xyz_pos
-        vx, vy, vz = xyz_vel
-        x2, y2, z2 = x**2, y**2, z**2
-        x2y2 = x2 + y2
-        r2 = x2y2 + z2
-        r = sqrt(r2)
-        sqrt_x2_y2 = sqrt(x2y2)
-        r32 = r2*r
-
-        # Jacobian encodes partial derivatives of measurement vector components
-        # Y = <theta, phi, r, rdot> against state vector
-        # X = <x, vx, y, vy, z, vz>.
-
-        # dtheta/dx
-        sqrt_x2_y2r2 = sqrt_x2_y2*r2
-        jac[0, 0] = -(x*z)/(sqrt_x2_y2r2)
-
-        # dtheta/dy
-        jac[0, 2] = -(y*z)/(sqrt_x2_y2r2)
-
-        # dthtea/dz
-        jac[0, 4] = sqrt_x2_y2/r2
-
-        # dphi/dx
-        jac[1, 0] = - y/(x2y2)
-
-        # dphi/dy
-        jac[1, 2] = x/(x2y2)
-
-        # dphi/dz = 0
-
-        # dr/dx and drdot/dvx
-        jac[2, 0] = jac[3, 1] = x/r
-
-        # dr/dx and drdot/dvy
-        jac[2, 2] = jac[3, 3] = y/r
-
-        # dr/dx and drdot/dvz
-        jac[2, 4] = jac[3, 5] = z/r
-
-        vx_x, vy_y, vz_z = vx*x, vy*y, vz*z
-
-        # drdot/dx
-        jac[3, 0] = (-x*(vy_y + vz_z) + vx*(y2 + z2))/r32
-
-        # drdot/dy
-        jac[3, 2] = (vy*(x2 + z2) - y*(vx_x + vz_z))/r32
-
-        # drdot/dz
-        jac[3, 4] = (vz*(x2y2) - (vx_x + vy_y)*z)/r32
-
-        # Up to this point, the Jacobian has been with respect to the state
-        # vector after rotating into the RADAR coordinate system. However, we
-        # want the Jacobian with respect to world state vector, so we must post
-        # multiply Jacobian by the RADAR rotation matrix.
-        jac[:, self.mapping] = jac[:, self.mapping] @ self.rotation_matrix
-        jac[:, self.velocity_mapping] = jac[:, self.velocity_mapping] @ self.rotation_matrix
-
-        return jac
+    def _analytic_jacobian_batch(self, state, **kwargs):
+        xyz, xyz_rot = self._rotated_position(state)
+        jac = np.zeros((xyz.shape[1], self.ndim_meas, self.ndim_state))
+        # Elevation, bearing and range
+        jac[:, :3, self.mapping] = self._spherical_jacobian(xyz_rot) @ self.rotation_matrix
+        return self._range_rate_jacobian(jac, xyz, state)
 
 
 class RangeRangeRateBinning(CartesianToElevationBearingRangeRate):
@@ -1175,6 +1239,7 @@ class RangeRangeRateBinning(CartesianToElevationBearingRangeRate):
     @classmethod
     def _gaussian_integral(cls, a, b, mean, cov):
         # this function is the cumulative probability ranging from a to b for a normal distribution
+        from scipy.stats import multivariate_normal
         return (multivariate_normal.cdf(a, mean=mean, cov=cov)
                 - multivariate_normal.cdf(b, mean=mean, cov=cov))
 
@@ -1226,6 +1291,7 @@ class RangeRangeRateBinning(CartesianToElevationBearingRangeRate):
                      self.range_rate_res).is_integer()):
             mean_vector = self.function(state2, noise=False, **kwargs)
             # pdf for the angles
+            from scipy.stats import multivariate_normal
             az_el_pdf = multivariate_normal.pdf(
                 state1.state_vector[:2, 0],
                 mean=mean_vector[:2, 0],
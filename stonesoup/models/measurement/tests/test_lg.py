@@ -106,3 +106,23 @@ def test_lgmodel(H, R, ndim_state, mapping):
     # Check first values produced by seed match
     for _ in range(3):
         assert all(lg1.rvs() == lg2.rvs())
+
+
+def test_lgmodel_cholesky_cache():
+    model_obj = LinearGaussian(ndim_state=2, mapping=[0], noise_covar=np.array([[0.1]]))
+    state = State(np.array([[1.], [2.]]))
+    meas = State(np.array([[1.5]]))
+
+    assert model_obj.logpdf(meas, state) == approx(
+        multivariate_normal.logpdf(0.5, cov=0.1))
+    assert model_obj.logpdf(meas, state) == approx(
+        multivariate_normal.logpdf(0.5, cov=0.1))
+    assert len(model_obj._cholesky_cache) == 1
+
+    # Covariance changes (in place or replaced) are detected
+    model_obj.noise_covar[0, 0] = 0.2
+    assert model_obj.logpdf(meas, state) == approx(
+        multivariate_normal.logpdf(0.5, cov=0.2))
+    model_obj.noise_covar = np.array([[0.3]])
+    assert model_obj.logpdf(meas, state) == approx(
+        multivariate_normal.logpdf(0.5, cov=0.3))
@@ -8,8 +8,10 @@ from ..nonlinear import (
     CartesianToElevationBearing, Cartesian2DToBearing, CartesianToBearingRangeRate,
     CartesianToElevationBearingRangeRate, RangeRangeRateBinning)
 
+from ..nonlinear import CombinedReversibleGaussianMeasurementModel
 from ...base import ReversibleModel
 from ...measurement.linear import LinearGaussian
+from ...testing import assert_jacobian_close
 from ....functions import jacobian as compute_jac
 from ....functions import pol2cart
 from ....functions import rotz, rotx, roty, cart2sphere
@@ -241,7 +243,7 @@ def test_models(h, ModelClass, state_vec, R,
     def fun(x):
         return model.function(x)
     H = compute_jac(fun, state)
-    assert np.array_equal(H, model.jacobian(state))
+    assert np.allclose(H, model.jacobian(state), atol=5e-4, rtol=1e-5)
 
     # Check Jacobian has proper dimensions
     assert H.shape == (model.ndim_meas, ndim_state)
@@ -974,6 +976,52 @@ def test_rangeratemodel_analytic_jacobian():
             assert np.allclose(jac, jac0, atol=5e-4, rtol=1e-5)
 
 
+@pytest.mark.parametrize('model', [
+    CartesianToElevationBearingRange(
+        ndim_state=6, mapping=[0, 2, 4], noise_covar=np.eye(3),
+        translation_offset=StateVector([10, -5, 3]),
+        rotation_offset=StateVector([0.1, -0.2, 0.3])),
+    CartesianToBearingRange(
+        ndim_state=4, mapping=[0, 2], noise_covar=np.eye(2),
+        translation_offset=StateVector([10, -5]), rotation_offset=StateVector([0, 0, 0.3])),
+    CartesianToElevationBearing(
+        ndim_state=6, mapping=[0, 2, 4], noise_covar=np.eye(2),
+        translation_offset=StateVector([10, -5, 3]),
+        rotation_offset=StateVector([0.1, -0.2, 0.3])),
+    Cartesian2DToBearing(
+        ndim_state=4, mapping=[0, 2], noise_covar=np.eye(1),
+        translation_offset=StateVector([10, -5]), rotation_offset=StateVector([0, 0, -0.7])),
+    CartesianToBearingRangeRate(
+        ndim_state=6, mapping=[0, 2, 4], velocity_mapping=[1, 3, 5], noise_covar=np.eye(3),
+        translation_offset=StateVector([10, -5, 3]),
+        rotation_offset=StateVector([0.1, -0.2, 0.3]),
+        velocity=StateVector([1, 2, -1])),
+    CartesianToElevationBearingRangeRate(
+        ndim_state=7, mapping=[0, 2, 4], velocity_mapping=[1, 3, 5], noise_covar=np.eye(4),
+        translation_offset=StateVector([10, -5, 3]),
+        rotation_offset=StateVector([0.1, -0.2, 0.3]),
+        velocity=StateVector([1, 2, -1])),
+    CombinedReversibleGaussianMeasurementModel([
+        CartesianToBearingRange(ndim_state=4, mapping=[0, 2], noise_covar=np.eye(2)),
+        LinearGaussian(ndim_state=4, mapping=[1, 3], noise_covar=np.eye(2))]),
+], ids=lambda model: type(model).__name__)
+def test_analytic_jacobian(model):
+    state = State(StateVectors(np.random.uniform(-100, 100, size=(model.ndim_state, 20))))
+    assert_jacobian_close(model, state)
+
+    jacobians = model.jacobian_batch(state)
+    assert jacobians.shape == (20, model.ndim_meas, model.ndim_state)
+
+
+def test_analytic_jacobian_singular():
+    model = CartesianToBearingRange(ndim_state=2, mapping=[0, 1], noise_covar=np.eye(2))
+    state = State(StateVectors([[0., 3.], [0., 4.]]))
+    jacobians = model.jacobian_batch(state)
+    # Undefined at zero range, so finite difference approximation used
+    assert np.all(np.isfinite(jacobians))
+    assert np.allclose(jacobians[1], [[-0.16, 0.12], [0.6, 0.8]])
+
+
 def test_inverse_function():
     measure_model = CartesianToElevationBearingRangeRate(
         ndim_state=6,
@@ -0,0 +1,42 @@
+"""Utilities for verifying models"""
+import numpy as np
+
+from ..functions import jacobian_batch as compute_jac_batch
+
+
+def assert_jacobian_close(model, state, rtol=1e-5, atol=5e-4, **kwargs):
+    """Check a model's Jacobians against finite difference approximations
+
+    The model's :meth:`~.Model.jacobian_batch` is compared with Jacobians
+    computed by finite differences of :meth:`~.Model.function` for all state
+    vectors, and :meth:`~.Model.jacobian` with the first of these. This is
+    useful for verifying closed form Jacobians.
+
+    Parameters
+    ----------
+    model : :class:`~.Model`
+        Model to check
+    state : :class:`~.State`
+        State with one or more state vectors, to evaluate Jacobians at
+    rtol : float, optional
+        Relative tolerance. Default `1e-5`.
+    atol : float, optional
+        Absolute tolerance. Default `5e-4`, as finite differences are approximate.
+    \\*\\*kwargs
+        Passed to model methods (e.g. `time_interval`)
+
+    Raises
+    ------
+    AssertionError
+        If Jacobians aren't within tolerance.
+    """
+    expected = compute_jac_batch(model.function, state, **kwargs)
+
+    jacobians = model.jacobian_batch(state, **kwargs)
+    np.testing.assert_allclose(
+        jacobians, expected, rtol=rtol, atol=atol, err_msg="jacobian_batch mismatch")
+
+    first_state = state.from_state(state, state_vector=state.state_vector[:, :1])
+    np.testing.assert_allclose(
+        model.jacobian(first_state, **kwargs), expected[0], rtol=rtol, atol=atol,
+        err_msg="jacobian mismatch")
@@ -5,11 +5,27 @@ from typing import Sequence
 from scipy.linalg import block_diag
 import numpy as np
 
-from ..base import Model, GaussianModel
-from ...base import Property
+from ..base import Model, GaussianModel, ModelCache
+from ...base import Property, clearable_cached_property
+from ...types.array import StateVectors
 from ...types.state import StateVector
 
 
+def _block_diag_batch(*matrices):
+    """Block diagonal of stacks of matrices, each of shape (N, n_i, m_i), giving shape
+    (N, sum(n_i), sum(m_i))"""
+    nrows = sum(matrix.shape[1] for matrix in matrices)
+    ncols = sum(matrix.shape[2] for matrix in matrices)
+    out = np.zeros((matrices[0].shape[0], nrows, ncols),
+                   dtype=np.result_type(*matrices))
+    row = col = 0
+    for matrix in matrices:
+        out[:, row:row+matrix.shape[1], col:col+matrix.shape[2]] = matrix
+        row += matrix.shape[1]
+        col += matrix.shape[2]
+    return out
+
+
 class TransitionModel(Model):
     """Transition Model base class"""
 
@@ -72,6 +88,32 @@ class CombinedGaussianTransitionModel(TransitionModel, GaussianModel):
             noise = 0
         return state_vector + noise
 
+    def function_batch(self, state, time_intervals, noise=False, **kwargs) -> StateVectors:
+        """Applies each transition model in :py:attr:`~model_list` in turn to the state's
+        corresponding state vector components, with each state vector over its own time
+        interval.
+
+        See :meth:`function` and :meth:`~.Model.function_batch`.
+        """
+        temp_state = copy.copy(state)
+        ndim_count = 0
+        state_vectors = []
+        if noise is None:
+            noise = False
+        if isinstance(noise, bool):
+            noise_loop = noise
+        else:
+            noise_loop = False
+        for model in self.model_list:
+            temp_state.state_vector = \
+                state.state_vector[ndim_count:model.ndim_state + ndim_count, :]
+            state_vectors.append(
+                model.function_batch(temp_state, time_intervals, noise=noise_loop, **kwargs))
+            ndim_count += model.ndim_state
+        if isinstance(noise, bool):
+            noise = 0
+        return StateVectors(np.vstack(state_vectors)) + noise
+
     def jacobian(self, state, **kwargs):
         """Model jacobian matrix :math:`H_{jac}`
 
@@ -98,6 +140,17 @@ class CombinedGaussianTransitionModel(TransitionModel, GaussianModel):
         out = block_diag(*J_list)
         return out
 
+    def jacobian_batch(self, state, **kwargs):
+        temp_state = copy.copy(state)
+        ndim_count = 0
+        out = np.zeros((state.state_vector.shape[1], self.ndim_state, self.ndim_state))
+        for model in self.model_list:
+            indices = slice(ndim_count, model.ndim_state + ndim_count)
+            temp_state.state_vector = state.state_vector[indices, :]
+            out[:, indices, indices] = model.jacobian_batch(temp_state, **kwargs)
+            ndim_count += model.ndim_state
+        return out
+
     @property
     def ndim_state(self):
         """ndim_state getter method
@@ -109,6 +162,10 @@ class CombinedGaussianTransitionModel(TransitionModel, GaussianModel):
         """
         return sum(model.ndim_state for model in self.model_list)
 
+    @clearable_cached_property('model_list')
+    def _cache(self):
+        return ModelCache()
+
     def covar(self, **kwargs):
         """Returns the transition model noise covariance matrix.
 
@@ -119,5 +176,10 @@ class CombinedGaussianTransitionModel(TransitionModel, GaussianModel):
             The process noise covariance.
         """
 
-        covar_list = [model.covar(**kwargs) for model in self.model_list]
-        return block_diag(*covar_list)
+        with ModelCache.shared():
+            covar_list = [model.covar(**kwargs) for model in self.model_list]
+        return self._cache.combine('covar', covar_list)
+
+    def covar_batch(self, time_intervals, **kwargs):
+        return _block_diag_batch(*(
+            model.covar_batch(time_intervals, **kwargs) for model in self.model_list))
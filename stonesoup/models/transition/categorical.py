@@ -1,7 +1,6 @@
 from datetime import timedelta
 
 import numpy as np
-from scipy.stats import multinomial
 
 from .base import Property
 from ...models.transition import TransitionModel
@@ -71,6 +70,7 @@ class MarkovianTransitionModel(TransitionModel):
         new_vector = new_vector / np.sum(new_vector)  # normalise
 
         if noise:
+            from scipy.stats import multinomial
             rv = multinomial(n=1, p=new_vector.flatten())
             return StateVector(rv.rvs(size=1, random_state=None))
         else:
@@ -1,17 +1,20 @@
-import math
 from typing import Sequence
-from functools import lru_cache
 
 import numpy as np
-from scipy.integrate import quad
-from scipy.linalg import block_diag
+import scipy
+from scipy.linalg import block_diag, expm
+from scipy.special import factorial
 
-from .base import TransitionModel, CombinedGaussianTransitionModel
+from .base import TransitionModel, CombinedGaussianTransitionModel, _block_diag_batch
 from ..base import (LinearModel, GaussianModel, TimeVariantModel,
-                    TimeInvariantModel)
-from ...base import Property
+                    TimeInvariantModel, ModelCache, time_interval_cached,
+                    time_intervals_to_seconds)
+from ...base import Property, clearable_cached_property
 from ...types.array import CovarianceMatrix
 
+# Stacked matrix exponential requires SciPy 1.9 or later
+_STACKED_EXPM = np.lib.NumpyVersion(scipy.__version__) >= '1.9.0'
+
 
 class LinearGaussianTransitionModel(
         TransitionModel, LinearModel, GaussianModel):
@@ -47,9 +50,14 @@ class CombinedLinearGaussianTransitionModel(LinearModel, CombinedGaussianTransit
         (:py:attr:`~ndim_state`, :py:attr:`~ndim_state`)
         """
 
-        transition_matrices = [
-            model.matrix(**kwargs) for model in self.model_list]
-        return block_diag(*transition_matrices)
+        with ModelCache.shared():
+            transition_matrices = [
+                model.matrix(**kwargs) for model in self.model_list]
+        return self._cache.combine('matrix', transition_matrices)
+
+    def matrix_batch(self, time_intervals, **kwargs):
+        return _block_diag_batch(*(
+            model.matrix_batch(time_intervals, **kwargs) for model in self.model_list))
 
 
 class LinearGaussianTimeInvariantTransitionModel(LinearGaussianTransitionModel,
@@ -121,35 +129,45 @@ class ConstantNthDerivative(LinearGaussianTransitionModel, TimeVariantModel):
     def ndim_state(self):
         return self.constant_derivative + 1
 
-    def matrix(self, time_interval, **kwargs):
-        time_interval_sec = time_interval.total_seconds()
-        N = self.constant_derivative
-        Fmat = np.zeros((N + 1, N + 1))
-        dt = time_interval_sec
-        for i in range(0, N + 1):
-            for j in range(i, N + 1):
-                Fmat[i, j] = (dt ** (j - i)) / math.factorial(j - i)
+    @clearable_cached_property('constant_derivative', 'noise_diff_coeff')
+    def _cache(self):
+        return ModelCache()
 
-        return Fmat
+    @time_interval_cached
+    def matrix(self, time_interval, **kwargs):
+        return self._matrices(time_interval.total_seconds())
 
+    @time_interval_cached
     def covar(self, time_interval, **kwargs):
-        time_interval_sec = time_interval.total_seconds()
-        dt = time_interval_sec
+        return CovarianceMatrix(self._covars(time_interval.total_seconds()))
+
+    def matrix_batch(self, time_intervals, **kwargs):
+        return self._matrices(time_intervals_to_seconds(time_intervals))
+
+    def covar_batch(self, time_intervals, **kwargs):
+        return self._covars(time_intervals_to_seconds(time_intervals))
+
+    def _matrices(self, dt):
+        """Transition matrices for time interval(s) `dt` in seconds, of shape
+        (..., N+1, N+1)"""
+        dt = np.asarray(dt, dtype=np.float64)[..., np.newaxis, np.newaxis]
         N = self.constant_derivative
-        if N == 1:
-            covar = np.array([[dt**3 / 3, dt**2 / 2],
-                              [dt**2 / 2, dt]])
-        else:
-            Fmat = self.matrix(time_interval, **kwargs)
-            Q = np.zeros((N + 1, N + 1))
-            Q[N, N] = 1
-            igrand = Fmat @ Q @ Fmat.T
-            covar = np.zeros((N + 1, N + 1))
-            for l in range(0, N + 1):  # noqa: E741
-                for k in range(0, N + 1):
-                    covar[l, k] = (igrand[l, k]*dt / (1 + N*2 - l - k))
-        covar *= self.noise_diff_coeff
-        return CovarianceMatrix(covar)
+        # Terms of the Taylor expansion, dt^(j-i)/(j-i)! for j >= i
+        power = np.subtract.outer(np.arange(N + 1), np.arange(N + 1)).T
+        power[power < 0] = 0
+        return np.triu(dt ** power / factorial(power))
+
+    def _covars(self, dt):
+        """Noise covariances for time interval(s) `dt` in seconds, of shape
+        (..., N+1, N+1)"""
+        Fmat = self._matrices(dt)
+        dt = np.asarray(dt, dtype=np.float64)[..., np.newaxis, np.newaxis]
+        N = self.constant_derivative
+        # Integral of F Q F^T, with noise only on the Nth derivative
+        index = np.arange(N + 1)
+        covar = Fmat[..., :, N:] * Fmat[..., np.newaxis, :, N] * dt \
+            / (1 + 2*N - np.add.outer(index, index))
+        return covar * self.noise_diff_coeff
 
 
 class RandomWalk(ConstantNthDerivative):
@@ -309,49 +327,49 @@ class NthDerivativeDecay(LinearGaussianTransitionModel, TimeVariantModel):
     def ndim_state(self):
         return self.decay_derivative + 1
 
-    @staticmethod
-    @lru_cache()
-    def _continoustransitionmatrix(t, N, K):
-        FCont = np.zeros((N + 1, N + 1))
-        for i in range(0, N + 1):
-            FCont[i, N] = np.exp(-K * t) * (-1) ** (N - i) / K ** (N - i)
-            for n in range(1, N - i + 1):
-                FCont[i, N] -= (-1) ** n * t ** (N - i - n) /\
-                               (math.factorial(N - i - n) * K ** n)
-            for j in range(i, N):
-                FCont[i, j] = (t ** (j - i)) / math.factorial(j - i)
-        return FCont
+    @clearable_cached_property('decay_derivative', 'noise_diff_coeff', 'damping_coeff')
+    def _cache(self):
+        return ModelCache()
 
-    def matrix(self, time_interval, **kwargs):
-        dt = time_interval.total_seconds()
-        N = self.decay_derivative
-        K = self.damping_coeff
-        return self._continoustransitionmatrix(dt, N, K)
+    @time_interval_cached
+    def _discretise(self, time_interval):
+        Fmat, covar = self._discretise_batch(time_interval.total_seconds())
+        Fmat.flags.writeable = covar.flags.writeable = False
+        return Fmat, covar
 
-    @classmethod
-    def _continouscovar(cls, t, N, K, k, l):  # noqa: E741
-        FcCont = cls._continoustransitionmatrix(t, N, K)
+    def _discretise_batch(self, dt):
+        """Transition matrices and noise covariances for time interval(s) `dt` in seconds,
+        using Van Loan's method"""
+        dt = np.asarray(dt, dtype=np.float64)[..., np.newaxis, np.newaxis]
+        N = self.decay_derivative
+        A = np.diag(np.ones(N), 1)
+        A[N, N] = -self.damping_coeff
         Q = np.zeros((N + 1, N + 1))
-        Q[N, N] = 1
-        CovarCont = FcCont @ Q @ FcCont.T
-        return CovarCont[k, l]
-
-    @classmethod
-    @lru_cache()
-    def _covardiscrete(cls, N, q, K, dt):
-        covar = np.zeros((N + 1, N + 1))
-        for k in range(0, N + 1):
-            for l in range(0, N + 1):  # noqa: E741
-                covar[k, l] = quad(cls._continouscovar, 0,
-                                   dt, args=(N, K, k, l))[0]
-        return covar * q
+        Q[N, N] = self.noise_diff_coeff
+
+        M = np.block([[-A, Q], [np.zeros_like(A), A.T]]) * dt
+        if _STACKED_EXPM or M.ndim == 2:
+            G = expm(M)
+        else:
+            G = np.stack([expm(matrix) for matrix in M.reshape(-1, *M.shape[-2:])])
+            G = G.reshape(M.shape)
+        Fmat = np.swapaxes(G[..., N+1:, N+1:], -1, -2)
+        covar = Fmat @ G[..., :N+1, N+1:]
+        # Ensure symmetric, removing round off error
+        covar = (covar + np.swapaxes(covar, -1, -2)) / 2
+        return Fmat, covar
+
+    def matrix(self, time_interval, **kwargs):
+        return self._discretise(time_interval)[0]
 
     def covar(self, time_interval, **kwargs):
-        N = self.decay_derivative
-        q = self.noise_diff_coeff
-        K = self.damping_coeff
-        dt = time_interval.total_seconds()
-        return self._covardiscrete(N, q, K, dt)
+        return self._discretise(time_interval)[1]
+
+    def matrix_batch(self, time_intervals, **kwargs):
+        return self._discretise_batch(time_intervals_to_seconds(time_intervals))[0]
+
+    def covar_batch(self, time_intervals, **kwargs):
+        return self._discretise_batch(time_intervals_to_seconds(time_intervals))[1]
 
 
 class OrnsteinUhlenbeck(NthDerivativeDecay):
@@ -542,6 +560,7 @@ class SingerApproximate(Singer):
                         \frac{dt^3}{6} & \frac{dt^2}{2} & dt
                         \end{bmatrix}
     """
+    @time_interval_cached
     def covar(self, time_interval, **kwargs):
         """Returns the transition model noise covariance matrix.
 
@@ -557,23 +576,22 @@ class SingerApproximate(Singer):
             The process noise covariance.
         """
 
-        # time_interval_threshold is currently set arbitrarily.
-        time_interval_sec = time_interval.total_seconds()
+        return CovarianceMatrix(self._approximate_covars(time_interval.total_seconds()))
 
-        # Only leading terms get calculated for speed.
-        covar = np.array(
-            [[time_interval_sec**5 / 20,
-              time_interval_sec**4 / 8,
-              time_interval_sec**3 / 6],
-             [time_interval_sec**4 / 8,
-              time_interval_sec**3 / 3,
-              time_interval_sec**2 / 2],
-             [time_interval_sec**3 / 6,
-              time_interval_sec**2 / 2,
-              time_interval_sec]]
-        ) * self.noise_diff_coeff
+    def covar_batch(self, time_intervals, **kwargs):
+        return self._approximate_covars(time_intervals_to_seconds(time_intervals))
 
-        return CovarianceMatrix(covar)
+    def _approximate_covars(self, dt):
+        """Noise covariances for time interval(s) `dt` in seconds, of shape (..., 3, 3)"""
+        dt = np.asarray(dt, dtype=np.float64)[..., np.newaxis, np.newaxis]
+        # Only leading terms get calculated for speed.
+        power = np.array([[5, 4, 3],
+                          [4, 3, 2],
+                          [3, 2, 1]])
+        denominator = np.array([[20, 8, 6],
+                                [8, 3, 2],
+                                [6, 2, 1]])
+        return dt ** power / denominator * self.noise_diff_coeff
 
 
 class KnownTurnRateSandwich(LinearGaussianTransitionModel, TimeVariantModel):
@@ -608,6 +626,10 @@ class KnownTurnRateSandwich(LinearGaussianTransitionModel, TimeVariantModel):
         """
         return sum(model.ndim_state for model in self.model_list)+4
 
+    @clearable_cached_property('turn_noise_diff_coeffs', 'turn_rate', 'model_list')
+    def _cache(self):
+        return ModelCache()
+
     def matrix(self, time_interval, **kwargs):
         """Model matrix :math:`F`
 
@@ -616,11 +638,17 @@ class KnownTurnRateSandwich(LinearGaussianTransitionModel, TimeVariantModel):
         : :class:`numpy.ndarray` of shape\
         (:py:attr:`~ndim_state`, :py:attr:`~ndim_state`)
         """
+        with ModelCache.shared():
+            transition_matrices = [
+                model.matrix(time_interval) for model in self.model_list]
+        return self._cache.combine(
+            ('matrix', time_interval), transition_matrices,
+            lambda *matrices: self._sandwich_matrix(time_interval, matrices))
+
+    def _sandwich_matrix(self, time_interval, transition_matrices):
         time_interval_sec = time_interval.total_seconds()
         turn_ratedt = self.turn_rate * time_interval_sec
         z = np.zeros([2, 2])
-        transition_matrices = [
-            model.matrix(time_interval) for model in self.model_list]
         sandwich = block_diag(z, *transition_matrices, z)
         sandwich[0:2, 0:2] = np.array([[1, np.sin(turn_ratedt)/self.turn_rate],
                                       [0, np.cos(turn_ratedt)]])
@@ -643,9 +671,15 @@ class KnownTurnRateSandwich(LinearGaussianTransitionModel, TimeVariantModel):
         (:py:attr:`~ndim_state`, :py:attr:`~ndim_state`)
             The process noise covariance.
         """
+        with ModelCache.shared():
+            covar_list = [model.covar(time_interval) for model in self.model_list]
+        return self._cache.combine(
+            ('covar', time_interval), covar_list,
+            lambda *covars: self._sandwich_covar(time_interval, covars))
+
+    def _sandwich_covar(self, time_interval, covar_list):
         q1, q2 = self.turn_noise_diff_coeffs
         dt = time_interval.total_seconds()
-        covar_list = [model.covar(time_interval) for model in self.model_list]
         ctc1 = np.array([[q1*dt**3/3, q1*dt**2/2],
                          [q1*dt**2/2, q1*dt]])
         ctc2 = np.array([[q1*dt**3/3, q1*dt**2/2],
@@ -4,9 +4,10 @@ import numpy as np
 from scipy.linalg import block_diag
 
 from ...types.array import StateVector, StateVectors
-from .base import TransitionModel
-from ..base import GaussianModel, TimeVariantModel
-from ...base import Property
+from .base import TransitionModel, _block_diag_batch
+from ..base import (GaussianModel, TimeVariantModel, ModelCache, time_interval_cached,
+                    time_intervals_to_seconds)
+from ...base import Property, clearable_cached_property
 from ...types.array import CovarianceMatrix
 
 
@@ -96,15 +97,35 @@ class ConstantTurn(GaussianTransitionModel, TimeVariantModel):
         return 5
 
     def function(self, state, noise=False, **kwargs) -> StateVector:
-        time_interval_sec = kwargs['time_interval'].total_seconds()
-        sv1 = state.state_vector
+        sv2 = self._turn_function(state.state_vector, kwargs['time_interval'].total_seconds())
+        if isinstance(noise, bool) or noise is None:
+            if noise:
+                noise = self.rvs(num_samples=state.state_vector.shape[1], **kwargs)
+            else:
+                noise = 0
+        return sv2 + noise
+
+    def function_batch(self, state, time_intervals, noise=False, **kwargs) -> StateVectors:
+        sv2 = self._turn_function(
+            state.state_vector, time_intervals_to_seconds(time_intervals))
+        if isinstance(noise, bool) or noise is None:
+            if noise:
+                noise = self.rvs_batch(time_intervals, **kwargs)
+            else:
+                noise = 0
+        return sv2 + noise
+
+    @staticmethod
+    def _turn_function(sv1, time_interval_sec):
+        """Constant turn of states of form :math:`[x, v_x, y, v_y, \\omega]`, over time
+        interval(s) in seconds"""
         turn_rate = sv1[4, :]
         # Avoid divide by zero in the function evaluation
         turn_rate[turn_rate == 0.] = np.finfo(float).eps
         dAngle = turn_rate * time_interval_sec
         cos_dAngle = np.cos(dAngle)
         sin_dAngle = np.sin(dAngle)
-        sv2 = StateVectors(
+        return StateVectors(
             [sv1[0, :] + sin_dAngle/turn_rate * sv1[1, :] - sv1[3, :] / turn_rate *
              (1. - cos_dAngle),
              sv1[1, :] * cos_dAngle - sv1[3, :] * sin_dAngle,
@@ -112,13 +133,68 @@ class ConstantTurn(GaussianTransitionModel, TimeVariantModel):
              / turn_rate,
              sv1[1, :] * sin_dAngle + sv1[3, :] * cos_dAngle,
              turn_rate])
-        if isinstance(noise, bool) or noise is None:
-            if noise:
-                noise = self.rvs(num_samples=state.state_vector.shape[1], **kwargs)
-            else:
-                noise = 0
-        return sv2 + noise
 
+    def jacobian(self, state, **kwargs):
+        """Model jacobian matrix :math:`F_{jac}`
+
+        Parameters
+        ----------
+        state : :class:`~.State`
+            An input state
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of shape (:py:attr:`~ndim_state`, \
+        :py:attr:`~ndim_state`)
+            The model jacobian matrix evaluated around the given state vector.
+        """
+        return self.jacobian_batch(state, **kwargs)[0]
+
+    def jacobian_batch(self, state, **kwargs):
+        return self._turn_jacobian(
+            state.state_vector, kwargs['time_interval'].total_seconds())
+
+    @staticmethod
+    def _turn_jacobian(state_vectors, dt):
+        """Jacobians of constant turn, for states of form :math:`[x, v_x, y, v_y, \\omega]`,
+        over time interval(s) `dt` in seconds"""
+        _, vx, _, vy, turn_rate = np.asfarray(state_vectors)
+        # Avoid divide by zero, as in function evaluation
+        turn_rate = np.where(turn_rate == 0., np.finfo(float).eps, turn_rate)
+        dAngle = turn_rate * dt
+        cos_dAngle = np.cos(dAngle)
+        sin_dAngle = np.sin(dAngle)
+
+        # Derivatives of sin(w*dt)/w and (1-cos(w*dt))/w with respect to w, using series
+        # expansion where small to avoid loss of precision
+        small = np.abs(dAngle) < 1e-4
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dsin = np.where(
+                small, -dAngle/3 + dAngle**3/30,
+                (dAngle*cos_dAngle - sin_dAngle) / dAngle**2) * dt**2
+            dcos = np.where(
+                small, 0.5 - dAngle**2/8,
+                (dAngle*sin_dAngle - (1. - cos_dAngle)) / dAngle**2) * dt**2
+
+        jac = np.zeros((len(turn_rate), 5, 5))
+        jac[:, 0, 0] = jac[:, 2, 2] = jac[:, 4, 4] = 1.
+        jac[:, 0, 1] = jac[:, 2, 3] = sin_dAngle / turn_rate
+        jac[:, 0, 3] = -(1. - cos_dAngle) / turn_rate
+        jac[:, 2, 1] = (1. - cos_dAngle) / turn_rate
+        jac[:, 1, 1] = jac[:, 3, 3] = cos_dAngle
+        jac[:, 1, 3] = -sin_dAngle
+        jac[:, 3, 1] = sin_dAngle
+        jac[:, 0, 4] = vx*dsin - vy*dcos
+        jac[:, 1, 4] = -(vx*sin_dAngle + vy*cos_dAngle) * dt
+        jac[:, 2, 4] = vx*dcos + vy*dsin
+        jac[:, 3, 4] = (vx*cos_dAngle - vy*sin_dAngle) * dt
+        return jac
+
+    @clearable_cached_property('linear_noise_coeffs', 'turn_noise_coeff')
+    def _cache(self):
+        return ModelCache()
+
+    @time_interval_cached
     def covar(self, time_interval, **kwargs):
         """Returns the transition model noise covariance matrix.
 
@@ -128,15 +204,26 @@ class ConstantTurn(GaussianTransitionModel, TimeVariantModel):
         (:py:attr:`~ndim_state`, :py:attr:`~ndim_state`)
             The process noise covariance.
         """
+        return CovarianceMatrix(self._turn_covars(time_interval.total_seconds()))
+
+    def covar_batch(self, time_intervals, **kwargs):
+        return self._turn_covars(time_intervals_to_seconds(time_intervals))
+
+    def _turn_covars(self, dt):
+        """Noise covariances for time interval(s) `dt` in seconds, of shape (..., 5, 5)"""
         q_x, q_y = self.linear_noise_coeffs
         q = self.turn_noise_coeff
-        dt = time_interval.total_seconds()
+        dt = np.asarray(dt, dtype=np.float64)
 
-        Q = np.array([[dt**3 / 3., dt**2 / 2.],
-                      [dt**2 / 2., dt]])
-        C = block_diag(Q*q_x**2, Q*q_y**2, q**2/dt)
-
-        return CovarianceMatrix(C)
+        C = np.zeros(dt.shape + (5, 5))
+        C[..., 0, 0] = q_x**2 * dt**3 / 3.
+        C[..., 0, 1] = C[..., 1, 0] = q_x**2 * dt**2 / 2.
+        C[..., 1, 1] = q_x**2 * dt
+        C[..., 2, 2] = q_y**2 * dt**3 / 3.
+        C[..., 2, 3] = C[..., 3, 2] = q_y**2 * dt**2 / 2.
+        C[..., 3, 3] = q_y**2 * dt
+        C[..., 4, 4] = q**2 / dt
+        return C
 
 
 class ConstantTurnSandwich(ConstantTurn):
@@ -166,6 +253,10 @@ class ConstantTurnSandwich(ConstantTurn):
         """
         return sum(model.ndim_state for model in self.model_list) + 5
 
+    @clearable_cached_property('linear_noise_coeffs', 'turn_noise_coeff', 'model_list')
+    def _cache(self):
+        return ModelCache()
+
     def function(self, state, noise=False, **kwargs) -> StateVector:
         state_tmp = copy.copy(state)
         sv_in = state.state_vector
@@ -191,6 +282,48 @@ class ConstantTurnSandwich(ConstantTurn):
                 noise = 0
         return sv_out + noise
 
+    def function_batch(self, state, time_intervals, noise=False, **kwargs) -> StateVectors:
+        state_tmp = copy.copy(state)
+        sv_in = state.state_vector
+        # Calculate state vectors for CT model
+        sv_ct = self._turn_function(
+            np.concatenate((sv_in[0:2, :], sv_in[-3:, :])),
+            time_intervals_to_seconds(time_intervals))
+
+        # Calculate state vectors for model list
+        idx1 = 2
+        sv_list = [sv_ct[0:2, :]]
+        for model in self.model_list:
+            idx2 = idx1 + model.ndim
+            state_tmp.state_vector = sv_in[idx1:idx2, :]
+            sv_list.append(
+                model.function_batch(state_tmp, time_intervals, noise=False, **kwargs))
+            idx1 = idx2
+        sv_list.append(sv_ct[-3:, :])
+        sv_out = StateVectors(np.concatenate(sv_list))
+        if isinstance(noise, bool) or noise is None:
+            if noise:
+                noise = self.rvs_batch(time_intervals, **kwargs)
+            else:
+                noise = 0
+        return sv_out + noise
+
+    def jacobian_batch(self, state, **kwargs):
+        sv_in = state.state_vector
+        ct_indices = np.array([0, 1, -3, -2, -1]) % self.ndim_state
+        jac = np.zeros((sv_in.shape[1], self.ndim_state, self.ndim_state))
+        jac[:, ct_indices[:, np.newaxis], ct_indices] = self._turn_jacobian(
+            sv_in[ct_indices, :], kwargs['time_interval'].total_seconds())
+
+        state_tmp = copy.copy(state)
+        idx1 = 2
+        for model in self.model_list:
+            idx2 = idx1 + model.ndim
+            state_tmp.state_vector = sv_in[idx1:idx2, :]
+            jac[:, idx1:idx2, idx1:idx2] = model.jacobian_batch(state_tmp, **kwargs)
+            idx1 = idx2
+        return jac
+
     def covar(self, time_interval, **kwargs):
         """Returns the transition model noise covariance matrix.
 
@@ -200,16 +333,31 @@ class ConstantTurnSandwich(ConstantTurn):
         (:py:attr:`~ndim_state`, :py:attr:`~ndim_state`)
             The process noise covariance.
         """
-        C_t = np.zeros([self.ndim, self.ndim])
-        C_ct = super().covar(time_interval, **kwargs)
-        covar_list = [model.covar(time_interval) for model in self.model_list]
+        with ModelCache.shared():
+            C_ct = super().covar(time_interval, **kwargs)
+            covar_list = [model.covar(time_interval) for model in self.model_list]
+        return self._cache.combine(
+            ('covar', time_interval), [C_ct, *covar_list],
+            lambda *covars: CovarianceMatrix(self._sandwich_covar(*covars)))
+
+    def covar_batch(self, time_intervals, **kwargs):
+        C_ct = self._turn_covars(time_intervals_to_seconds(time_intervals))
+        covar_list = [model.covar_batch(time_intervals) for model in self.model_list]
+        return self._sandwich_covar(C_ct, *covar_list)
+
+    def _sandwich_covar(self, C_ct, *covar_list):
+        """Assemble covariance(s), with leading dimensions of CT covariance `C_ct`"""
+        C_t = np.zeros(C_ct.shape[:-2] + (self.ndim, self.ndim))
 
         # Assemble diag block components
-        C_t[2:-3, 2:-3] = block_diag(*covar_list)
-        C_t[0:2, 0:2] = C_ct[0:2, 0:2]
-        C_t[-3:, -3:] = C_ct[-3:, -3:]
+        if C_ct.ndim > 2 and covar_list:
+            C_t[..., 2:-3, 2:-3] = _block_diag_batch(*covar_list)
+        else:
+            C_t[..., 2:-3, 2:-3] = block_diag(*covar_list)
+        C_t[..., 0:2, 0:2] = C_ct[..., 0:2, 0:2]
+        C_t[..., -3:, -3:] = C_ct[..., -3:, -3:]
         # Reorder offdiagonal elements
-        C_t[0:2:, -3:] = C_ct[0:2, -3:]
-        C_t[-3:, 0:2] = C_ct[-3:, 0:2]
+        C_t[..., 0:2:, -3:] = C_ct[..., 0:2, -3:]
+        C_t[..., -3:, 0:2] = C_ct[..., -3:, 0:2]
 
-        return CovarianceMatrix(C_t)
+        return C_t
@@ -0,0 +1,125 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from .. import linear
+from ..base import CombinedGaussianTransitionModel
+from ..linear import (
+    CombinedLinearGaussianTransitionModel, ConstantVelocity, ConstantAcceleration, RandomWalk,
+    Singer, SingerApproximate, OrnsteinUhlenbeck, KnownTurnRate)
+from ..nonlinear import ConstantTurn, ConstantTurnSandwich
+from ...base import time_intervals_to_seconds
+from ....types.array import StateVectors
+from ....types.state import State
+
+TIME_INTERVALS = [datetime.timedelta(seconds=seconds) for seconds in (0.5, 1, 3.25, 1)]
+
+
+@pytest.mark.parametrize('model', [
+    RandomWalk(0.1),
+    ConstantVelocity(0.1),
+    ConstantAcceleration(0.2),
+    Singer(noise_diff_coeff=1, damping_coeff=0.3),
+    SingerApproximate(noise_diff_coeff=1, damping_coeff=0.3),
+    OrnsteinUhlenbeck(noise_diff_coeff=1, damping_coeff=0.3),
+    KnownTurnRate(turn_noise_diff_coeffs=np.array([0.1, 0.1]), turn_rate=0.2),
+    ConstantTurn(linear_noise_coeffs=np.array([0.1, 0.2]), turn_noise_coeff=0.01),
+    ConstantTurnSandwich(
+        linear_noise_coeffs=np.array([0.1, 0.2]), turn_noise_coeff=0.01,
+        model_list=[ConstantVelocity(0.1), ConstantAcceleration(0.2)]),
+    CombinedLinearGaussianTransitionModel([ConstantVelocity(0.1), Singer(1, 0.3)]),
+    CombinedGaussianTransitionModel([
+        ConstantVelocity(0.1),
+        ConstantTurn(linear_noise_coeffs=np.array([0.1, 0.2]), turn_noise_coeff=0.01)]),
+], ids=lambda model: type(model).__name__)
+def test_batch(model):
+    state_vectors = StateVectors(np.random.randn(model.ndim_state, len(TIME_INTERVALS)))
+    state_vectors[-1, :] *= 0.1  # Keep turn rates reasonable
+
+    # Also as array of numpy timedelta64
+    for time_intervals in (TIME_INTERVALS, np.array(TIME_INTERVALS, dtype='timedelta64[us]')):
+        covars = model.covar_batch(time_intervals)
+        assert covars.shape == (len(TIME_INTERVALS), model.ndim_state, model.ndim_state)
+        new_state_vectors = model.function_batch(State(state_vectors.copy()), time_intervals)
+        assert isinstance(new_state_vectors, StateVectors)
+        log_likelihoods = model.logpdf_batch(
+            State(new_state_vectors + 0.1), State(state_vectors.copy()), time_intervals)
+        assert log_likelihoods.shape == (len(TIME_INTERVALS), )
+
+        for index, time_interval in enumerate(TIME_INTERVALS):
+            state = State(state_vectors[:, index:index+1].copy())
+            assert np.allclose(covars[index], model.covar(time_interval=time_interval))
+            if hasattr(model, 'matrix_batch'):
+                assert np.allclose(model.matrix_batch(time_intervals)[index],
+                                   model.matrix(time_interval=time_interval))
+            assert np.allclose(new_state_vectors[:, index:index+1],
+                               model.function(state, time_interval=time_interval))
+            assert log_likelihoods[index] == pytest.approx(model.logpdf(
+                State(new_state_vectors[:, index:index+1] + 0.1), state,
+                time_interval=time_interval))
+
+    noise = model.rvs_batch(TIME_INTERVALS)
+    assert noise.shape == (model.ndim_state, len(TIME_INTERVALS))
+    assert model.function_batch(
+        State(state_vectors.copy()), TIME_INTERVALS, noise=True).shape == state_vectors.shape
+
+
+def test_singer_batch_loop(monkeypatch):
+    # As with SciPy versions without stacked matrix exponential
+    model = Singer(noise_diff_coeff=1, damping_coeff=0.3)
+    time_intervals = np.array([[0.5, 1], [3.25, 1]])
+    Fmats, covars = model._discretise_batch(time_intervals)
+    monkeypatch.setattr(linear, '_STACKED_EXPM', False)
+    loop_Fmats, loop_covars = model._discretise_batch(time_intervals)
+    assert loop_Fmats.shape == Fmats.shape == (2, 2, 3, 3)
+    assert np.allclose(loop_Fmats, Fmats)
+    assert np.allclose(loop_covars, covars)
+
+
+def test_rvs_batch():
+    model = ConstantVelocity(0.1, seed=1)
+    time_intervals = [datetime.timedelta(seconds=1)]*5000 + [datetime.timedelta(seconds=3)]*5000
+    noise = model.rvs_batch(time_intervals)
+    for samples, time_interval in ((noise[:, :5000], time_intervals[0]),
+                                   (noise[:, 5000:], time_intervals[-1])):
+        assert np.allclose(np.cov(samples), model.covar(time_interval=time_interval),
+                           rtol=0.1, atol=0.01)
+
+
+def test_time_intervals_to_seconds():
+    assert np.array_equal(
+        time_intervals_to_seconds(
+            [datetime.timedelta(seconds=1.5), datetime.timedelta(microseconds=2)]),
+        [1.5, 2e-6])
+
+
+def test_rvs_random_state():
+    model = ConstantVelocity(0.1, seed=1990)
+    assert isinstance(model.random_state, np.random.Generator)
+    time_interval = datetime.timedelta(seconds=2)
+    noise = model.rvs(10000, time_interval=time_interval)
+    assert isinstance(noise, StateVectors)
+    assert noise.shape == (2, 10000)
+    assert np.allclose(np.cov(noise), model.covar(time_interval=time_interval),
+                       rtol=0.1, atol=0.01)
+    assert model.rvs(time_interval=time_interval).shape == (2, 1)
+
+    # Same seed, same samples; independent of global random state
+    np.random.seed(1)
+    assert np.array_equal(
+        ConstantVelocity(0.1, seed=1990).rvs(10000, time_interval=time_interval), noise)
+    assert np.array_equal(
+        ConstantVelocity(0.1, seed=1990).rvs_batch([time_interval]*3),
+        ConstantVelocity(0.1, seed=np.random.default_rng(1990)).rvs_batch([time_interval]*3))
+
+    # Unseeded models use global random state
+    model = ConstantVelocity(0.1)
+    np.random.seed(1990)
+    noise = model.rvs(3, time_interval=time_interval)
+    np.random.seed(1990)
+    assert np.array_equal(model.rvs(3, time_interval=time_interval), noise)
+    np.random.seed(1990)
+    assert np.array_equal(
+        model.rvs(3, time_interval=time_interval, random_state=np.random.default_rng(1)),
+        ConstantVelocity(0.1, seed=1).rvs(3, time_interval=time_interval))
@@ -9,6 +9,7 @@ from ..linear import (LinearGaussianTimeInvariantTransitionModel,
                       ConstantVelocity)
 from ..nonlinear import ConstantTurn
 from ..base import CombinedGaussianTransitionModel
+from ...base import ModelCache
 from ....types.state import State
 from ....types.array import StateVectors
 
@@ -99,3 +100,47 @@ def test_nonlinear_combined(model_4):
     assert isinstance(
         combined_model.pdf(State(x_post), State(x_prior),
                            time_interval=t_delta), Real)
+
+
+def test_combined_jacobian_batch():
+    model = CombinedGaussianTransitionModel([
+        ConstantVelocity(noise_diff_coeff=1),
+        ConstantTurn(linear_noise_coeffs=np.array([0.1, 0.1]), turn_noise_coeff=0.01)])
+    state = State(StateVectors(np.random.uniform(-1, 1, size=(model.ndim_state, 4))))
+    t_delta = datetime.timedelta(seconds=3)
+
+    jacobians = model.jacobian_batch(state, time_interval=t_delta)
+    assert jacobians.shape == (4, 7, 7)
+    assert np.allclose(jacobians[:, :2, :2], ConstantVelocity(1).matrix(time_interval=t_delta))
+    assert np.all(jacobians[:, :2, 2:] == 0)
+    assert np.all(jacobians[:, 2:, :2] == 0)
+    for jacobian, column in zip(jacobians, state.state_vector):
+        assert np.allclose(
+            jacobian, model.jacobian(State(column), time_interval=t_delta), atol=1e-6)
+
+
+def test_combined_cache():
+    model_1 = ConstantVelocity(noise_diff_coeff=1)
+    model_2 = ConstantVelocity(noise_diff_coeff=2)
+    combined_model = CombinedLinearGaussianTransitionModel([model_1, model_2])
+    t_delta = datetime.timedelta(seconds=3)
+
+    with ModelCache.shared():
+        F = combined_model.matrix(time_interval=t_delta)
+        Q = combined_model.covar(time_interval=t_delta)
+        assert combined_model.matrix(time_interval=t_delta) is F
+        assert combined_model.covar(time_interval=t_delta) is Q
+    # Copies returned, which can be modified
+    F_copy = combined_model.matrix(time_interval=t_delta)
+    F_copy[0, 0] = 10
+    assert np.array_equal(combined_model.matrix(time_interval=t_delta), F)
+
+    # Changes to models in model list are reflected
+    model_2.noise_diff_coeff = 4
+    Q2 = combined_model.covar(time_interval=t_delta)
+    assert np.allclose(Q2[:2, :2], Q[:2, :2])
+    assert np.allclose(Q2[2:, 2:], 2*Q[2:, 2:])
+    assert np.allclose(combined_model.matrix(time_interval=t_delta), F)
+
+    combined_model.model_list = [model_1]
+    assert combined_model.matrix(time_interval=t_delta).shape == (2, 2)
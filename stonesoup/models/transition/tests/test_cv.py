@@ -5,6 +5,8 @@ import numpy as np
 from scipy.stats import multivariate_normal
 
 from ..linear import ConstantVelocity
+from ...base import ModelCache
+from ....types.array import CovarianceMatrix
 from ....types.state import State
 
 
@@ -94,3 +96,48 @@ def test_cvmodel():
         new_state_vec_w_enoise.T,
         mean=np.array(F@state.state_vector).ravel(),
         cov=Q)
+
+
+def test_cvmodel_cache():
+    model_obj = ConstantVelocity(noise_diff_coeff=0.1)
+    time_interval = datetime.timedelta(seconds=2)
+
+    with ModelCache.shared():
+        F = model_obj.matrix(time_interval=time_interval)
+        Q = model_obj.covar(time_interval=time_interval)
+        assert model_obj.matrix(time_interval=time_interval) is F
+        assert model_obj.covar(time_interval) is Q
+        assert model_obj.covar(time_interval=datetime.timedelta(seconds=1)) is not Q
+    # Shared, so mustn't be modified
+    assert not F.flags.writeable
+    assert not Q.flags.writeable
+
+    # Copies returned outside of shared context, which can be modified
+    Q_copy = model_obj.covar(time_interval)
+    assert Q_copy is not Q
+    assert isinstance(Q_copy, CovarianceMatrix)
+    assert np.array_equal(Q_copy, Q)
+    Q_copy[0, 0] = 10
+    assert Q[0, 0] != 10
+    assert model_obj.covar(time_interval)[0, 0] != 10
+
+    # Cleared on property change
+    model_obj.noise_diff_coeff = 0.2
+    with ModelCache.shared():
+        Q2 = model_obj.covar(time_interval=time_interval)
+        assert Q2 is not Q
+        assert np.allclose(Q2, 2*Q)
+        assert model_obj.matrix(time_interval=time_interval) is not F
+
+
+def test_cvmodel_cache_copy():
+    import copy
+    import pickle
+
+    model_obj = ConstantVelocity(noise_diff_coeff=0.1)
+    time_interval = datetime.timedelta(seconds=2)
+    Q = model_obj.covar(time_interval=time_interval)
+
+    for model_copy in (copy.deepcopy(model_obj), pickle.loads(pickle.dumps(model_obj))):
+        assert len(model_copy._cache) == 0
+        assert np.array_equal(model_copy.covar(time_interval=time_interval), Q)
@@ -2,6 +2,8 @@ import datetime
 
 import numpy as np
 from ..nonlinear import ConstantTurn
+from ...testing import assert_jacobian_close
+from ....types.array import StateVectors
 from ....types.state import State
 
 
@@ -65,3 +67,23 @@ def base(CT_model, model, state, linear_noise_coeffs, turn_noise_coeff):
         time_interval=time_interval,
         noise=noise)
     assert np.array_equal(new_state_vec_w_enoise, F + noise)
+
+
+def test_ctmodel_jacobian():
+    model_obj = ConstantTurn(linear_noise_coeffs=np.array([0.1, 0.1]), turn_noise_coeff=0.01)
+    time_interval = datetime.timedelta(seconds=2)
+    state_vectors = np.random.uniform(-10, 10, size=(5, 20))
+    state_vectors[4, :] = np.random.uniform(0.01, 0.5, size=20) * np.random.choice([-1, 1], 20)
+    assert_jacobian_close(
+        model_obj, State(StateVectors(state_vectors)), time_interval=time_interval)
+
+    # Finite differences lose precision as turn rate tends to zero, so check against limit
+    state_vectors[4, :2] = [0, 1e-9]
+    jacobians = model_obj.jacobian_batch(
+        State(StateVectors(state_vectors[:, :2])), time_interval=time_interval)
+    dt = time_interval.total_seconds()
+    for jacobian, (_, vx, _, vy, _) in zip(jacobians, state_vectors[:, :2].T):
+        assert np.allclose(jacobian[:4, :4], np.array(
+            [[1, dt, 0, 0], [0, 1, 0, 0], [0, 0, 1, dt], [0, 0, 0, 1]]))
+        assert np.allclose(
+            jacobian[:, 4], [-vy*dt**2/2, -vy*dt, vx*dt**2/2, vx*dt, 1], atol=1e-6)
@@ -6,6 +6,8 @@ import numpy as np
 from stonesoup.models.transition.nonlinear import ConstantTurnSandwich
 from stonesoup.models.transition.base import CombinedGaussianTransitionModel
 from stonesoup.models.transition.linear import ConstantVelocity, ConstantAcceleration
+from stonesoup.models.testing import assert_jacobian_close
+from stonesoup.types.array import StateVectors
 from stonesoup.types.state import State
 
 
@@ -85,3 +87,15 @@ def base(ct_model, model, state, linear_noise_coeffs, turn_noise_coeff):
         time_interval=time_interval,
         noise=noise)
     assert np.array_equal(new_state_vec_w_enoise, model_out + noise)
+
+
+def test_ctsmodel_jacobian():
+    model_obj = ConstantTurnSandwich(
+        linear_noise_coeffs=np.array([0.1, 0.1]), turn_noise_coeff=0.01,
+        model_list=[ConstantVelocity(1.1), ConstantAcceleration(0.4)])
+    state_vectors = np.random.uniform(-10, 10, size=(10, 20))
+    state_vectors[-1, :] = np.random.uniform(0.01, 0.5, size=20) \
+        * np.random.choice([-1, 1], 20)
+    state = State(StateVectors(state_vectors))
+    assert_jacobian_close(
+        model_obj, state, time_interval=datetime.timedelta(seconds=2))
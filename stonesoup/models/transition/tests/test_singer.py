@@ -177,3 +177,24 @@ def base(state, noise_diff_coeffs, damping_coeffs, timediff=1.0):
         new_state_vec_w_enoise.T,
         mean=np.array(F@state_vec).ravel(),
         cov=Q)
+
+
+def test_nth_derivative_decay_covar():
+    from scipy.integrate import quad
+    from scipy.linalg import expm
+    from ..linear import NthDerivativeDecay
+
+    N, K, q, dt = 3, 0.4, 0.7, 2.5
+    model_obj = NthDerivativeDecay(decay_derivative=N, noise_diff_coeff=q, damping_coeff=K)
+    time_interval = datetime.timedelta(seconds=dt)
+
+    A = np.diag(np.ones(N), 1)
+    A[N, N] = -K
+    assert np.allclose(model_obj.matrix(time_interval=time_interval), expm(A*dt))
+
+    def integrand(t, k, l):  # noqa: E741
+        F = expm(A*t)
+        return q * F[k, N] * F[l, N]
+    Q = np.array([[quad(integrand, 0, dt, args=(k, l))[0] for l in range(N + 1)]  # noqa: E741
+                  for k in range(N + 1)])
+    assert np.allclose(model_obj.covar(time_interval=time_interval), Q)
@@ -0,0 +1,269 @@
+"""Monte Carlo runs of a tracker configuration.
+
+A :class:`MonteCarloRunner` takes a configuration of components, serialised
+with :class:`~.stonesoup.serialise.YAML`, and a range of seeds, and runs a
+replicate of the configuration for each seed, in worker processes. The
+configuration is a mapping, with keys:
+
+``tracker``
+    :class:`~.Tracker` to run (e.g. with a detection simulator as its detector).
+``metric_manager``
+    :class:`~.MetricManager` to generate metrics for each replicate, from the
+    tracks and ground truth paths.
+``groundtruth`` (optional)
+    :class:`~.GroundTruthReader` (e.g. ground truth simulator used by the
+    detector), from which ground truth paths are collected each step.
+
+Each replicate loads a fresh copy of the components, and seeds these from a
+:class:`numpy.random.SeedSequence` of the replicate's seed, such that each has
+an independent random stream, and results depend only on the seed (not on the
+worker or order replicates are run in). Scalar metric values of each replicate
+are streamed back as they complete, which can then be aggregated, giving the
+mean and confidence interval of each metric.
+
+An example would be:
+
+.. code-block:: python
+
+    runner = MonteCarloRunner(
+        {'tracker': tracker, 'groundtruth': groundtruth_sim, 'metric_manager': metric_manager},
+        seeds=range(100), cache_path='results')
+    results = []
+    for result in runner.run():
+        results.append(result)  # e.g. result.metrics['Number of tracks']
+    summaries = runner.aggregate(results)
+
+Where a :attr:`~.MonteCarloRunner.cache_path` is set, results of each replicate
+are stored as completed, and reused on later runs with the same configuration,
+such that an interrupted run can be resumed, or more seeds added.
+"""
+import hashlib
+import json
+import math
+import os
+from collections import abc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from numbers import Real
+from pathlib import Path
+from typing import Mapping, Sequence, Union
+
+import numpy as np
+
+from .base import Base, Property
+
+
+class MonteCarloResult(Base):
+    """Result of a single Monte Carlo replicate."""
+    seed: int = Property(doc="Seed of the replicate.")
+    metrics: Mapping[str, float] = Property(doc="Scalar metric values, keyed by metric title.")
+    cached: bool = Property(default=False, doc="Whether the result was loaded from cache.")
+
+
+class MetricSummary(Base):
+    """Summary of a metric over Monte Carlo replicates."""
+    title: str = Property(doc="Title of the metric.")
+    mean: float = Property(doc="Mean value of the metric.")
+    std: float = Property(doc="Sample standard deviation of the metric.")
+    lower: float = Property(doc="Lower bound of confidence interval of the mean.")
+    upper: float = Property(doc="Upper bound of confidence interval of the mean.")
+    num_runs: int = Property(doc="Number of replicates the metric is summarised over.")
+
+
+class MonteCarloRunner(Base):
+    """Monte Carlo runner
+
+    Runs a replicate of a configuration for each seed, in parallel worker processes. See
+    :mod:`stonesoup.montecarlo` for details of the configuration.
+    """
+    configuration: Union[str, Mapping] = Property(
+        doc="Configuration, as YAML string, or mapping of components which is then serialised "
+            "to YAML.")
+    seeds: Sequence[int] = Property(
+        doc="Seeds, one for each replicate, e.g. ``range(100)``. Each must be a non-negative "
+            "integer.")
+    processes: int = Property(
+        default=None,
+        doc="Number of worker processes. Default `None`, which uses the number of processors. "
+            "If 0, replicates are run in the current process.")
+    cache_path: Path = Property(
+        default=None,
+        doc="Directory in which results of each replicate are stored, and reused if present. "
+            "Default `None`, where results aren't stored.")
+    confidence: float = Property(
+        default=0.95, doc="Confidence level of the interval of the mean. Default 0.95.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        from .serialise import YAML
+        if not isinstance(self.configuration, str):
+            self.configuration = YAML().dumps(self.configuration)
+        components = YAML().load(self.configuration)
+        if not isinstance(components, abc.Mapping) \
+                or not {'tracker', 'metric_manager'} <= components.keys():
+            raise ValueError(
+                "configuration must be a mapping with 'tracker' and 'metric_manager'")
+        if any(seed < 0 for seed in self.seeds):
+            raise ValueError("seeds must be non-negative")
+        if self.cache_path is not None:
+            self.cache_path = Path(self.cache_path)
+
+    @property
+    def configuration_hash(self):
+        """Hash of the :attr:`configuration`, used to identify cached results."""
+        return hashlib.sha256(self.configuration.encode()).hexdigest()[:16]
+
+    def _cache_file(self, seed):
+        return self.cache_path / f"{self.configuration_hash}-{seed}.json"
+
+    def _load_cached(self, seed):
+        if self.cache_path is None:
+            return None
+        try:
+            with self._cache_file(seed).open() as file:
+                metrics = json.load(file)['metrics']
+        except FileNotFoundError:
+            return None
+        return MonteCarloResult(seed, metrics, cached=True)
+
+    def _store(self, seed, metrics):
+        if self.cache_path is not None:
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+            # Written to temporary file first, so interrupted runs don't leave partial results
+            path = self._cache_file(seed)
+            temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            with temp_path.open('w') as file:
+                json.dump({'seed': seed, 'metrics': metrics}, file)
+            os.replace(temp_path, path)
+        return MonteCarloResult(seed, metrics)
+
+    def run(self):
+        """Run replicates, for those seeds without a cached result.
+
+        Cached results are yielded first, followed by results of each replicate as it is
+        completed (so not necessarily in order of seed). Should a replicate fail, the exception
+        is raised, but completed results remain cached, such that the run can be resumed.
+
+        Yields
+        ------
+        : :class:`MonteCarloResult`
+            Result of each replicate.
+        """
+        pending = []
+        for seed in self.seeds:
+            result = self._load_cached(seed)
+            if result is not None:
+                yield result
+            else:
+                pending.append(seed)
+        if not pending:
+            return
+
+        if self.processes == 0:
+            for seed in pending:
+                yield self._store(seed, _run_replicate(self.configuration, seed))
+            return
+
+        executor = ProcessPoolExecutor(self.processes)
+        futures = {
+            executor.submit(_run_replicate, self.configuration, seed): seed
+            for seed in pending}
+        try:
+            for future in as_completed(futures):
+                yield self._store(futures[future], future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+
+    def aggregate(self, results):
+        """Summarise metrics over results of replicates.
+
+        The confidence interval of the mean uses the Student's t-distribution, at
+        :attr:`confidence` level. Metrics only present in some results are summarised over
+        those results.
+
+        Parameters
+        ----------
+        results : iterable of :class:`MonteCarloResult`
+            Results of replicates, e.g. from :meth:`run`.
+
+        Returns
+        -------
+        : dict of str to :class:`MetricSummary`
+            Summary of each metric, keyed by metric title.
+        """
+        from scipy.stats import t
+
+        values = {}
+        for result in results:
+            for title, value in result.metrics.items():
+                values.setdefault(title, []).append(value)
+
+        summaries = {}
+        for title, metric_values in values.items():
+            num_runs = len(metric_values)
+            mean = float(np.mean(metric_values))
+            if num_runs > 1:
+                std = float(np.std(metric_values, ddof=1))
+                half_width = t.ppf((1 + self.confidence) / 2, num_runs - 1) \
+                    * std / math.sqrt(num_runs)
+            else:
+                std = half_width = math.nan
+            summaries[title] = MetricSummary(
+                title, mean, std, mean - half_width, mean + half_width, num_runs)
+        return summaries
+
+
+def _components(obj, seen):
+    """Stone Soup components in `obj`, depth first in property order, each only once.
+
+    Unordered collections (e.g. sets) aren't searched, as their order, and so the seeds
+    assigned, could differ between runs."""
+    if isinstance(obj, Base):
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+        yield obj
+        for name in type(obj).properties:
+            yield from _components(getattr(obj, name, None), seen)
+    elif isinstance(obj, abc.Mapping):
+        for value in obj.values():
+            yield from _components(value, seen)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            yield from _components(value, seen)
+
+
+def _seed_components(components, seed_sequence):
+    """Seed the global random state, and set the seed of each component with a `seed`
+    property, from independent children of `seed_sequence`."""
+    np.random.seed(seed_sequence.spawn(1)[0].generate_state(1))
+    for component in _components(components, set()):
+        if 'seed' in type(component).properties:
+            component.seed = int(seed_sequence.spawn(1)[0].generate_state(1)[0])
+
+
+def _run_replicate(configuration, seed):
+    """Run replicate of `configuration` with `seed`, returning scalar metric values."""
+    from .serialise import YAML
+    yaml = YAML()
+    components = yaml.load(configuration)
+    _seed_components(components, np.random.SeedSequence(seed))
+    # Reloaded, such that components create their random number generators from new seeds
+    components = yaml.load(yaml.dumps(components))
+
+    tracker = components['tracker']
+    groundtruth = components.get('groundtruth')
+    metric_manager = components['metric_manager']
+    tracks = set()
+    groundtruth_paths = set()
+    for _, current_tracks in tracker:
+        tracks.update(current_tracks)
+        if groundtruth is not None:
+            groundtruth_paths.update(groundtruth.groundtruth_paths)
+
+    metric_manager.add_data(groundtruth_paths=groundtruth_paths, tracks=tracks)
+    return {
+        title: float(metric.value)
+        for title, metric in metric_manager.generate_metrics().items()
+        if isinstance(metric.value, Real)}
@@ -10,9 +10,6 @@ from matplotlib import pyplot as plt
 from matplotlib.legend_handler import HandlerPatch
 from matplotlib.lines import Line2D
 from matplotlib.patches import Ellipse
-from scipy.integrate import quad
-from scipy.optimize import brentq
-from scipy.stats import kde
 
 try:
     import plotly.graph_objects as go
@@ -573,6 +570,7 @@ class Plotter(_Plotter):
             raise ValueError("Skipping plotting density due to x and y values are the same. "
                              "This leads to a singular matrix in the kde function.")
         # Evaluate a gaussian kde on a regular grid of n_bins x n_bins over data extents
+        from scipy.stats import kde
         k = kde.gaussian_kde([x, y])
         xi, yi = np.mgrid[x.min():x.max():n_bins * 1j, y.min():y.max():n_bins * 1j]
         zi = k(np.vstack([xi.flatten(), yi.flatten()]))
@@ -907,6 +905,9 @@ class Plotterly(_Plotter):
     @staticmethod
     def _generate_ellipse_points(state, mapping, n_points=30):
         """Generate error ellipse points for given state and mapping"""
+        from scipy.integrate import quad
+        from scipy.optimize import brentq
+
         HH = np.eye(state.ndim)[mapping, :]  # Get position mapping matrix
         w, v = np.linalg.eig(HH @ state.covar @ HH.T)
         max_ind = np.argmax(w)
@@ -23,19 +23,61 @@ can be loaded using:
 
     from stonesoup.plugins.my_plugin import MyClass
 
+Plugins are discovered, and loaded, on first use (e.g. on import as above, or attribute access
+of :mod:`stonesoup.plugins`), so installed plugins add no cost to importing Stone Soup.
+
 .. note::
     When developing plugins for Stone Soup, :attr:`entry_points` must be associated with
     the :attr:`stonesoup.plugins` key in the :attr:`entry_points` dictionary.
 """
+import importlib.abc
+import importlib.util
 import sys
-import pkg_resources
-import warnings
+from functools import lru_cache
+
+from ._metadata import entry_points
+
+# Empty path makes this a package, with plugins (only) found by the finder below
+__path__ = []
+
+
+@lru_cache(None)
+def _plugin_entry_points():
+    return {entry_point.name: entry_point for entry_point in entry_points('stonesoup.plugins')}
+
+
+class _PluginLoader(importlib.abc.Loader):
+    def __init__(self, entry_point):
+        self.entry_point = entry_point
+
+    def create_module(self, spec):
+        return None  # Default module, replaced in exec_module
+
+    def exec_module(self, module):
+        # Import system picks up plugin module from sys.modules in place of placeholder
+        sys.modules[module.__name__] = self.entry_point.load()
+
+
+class _PluginFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        parent, _, name = fullname.rpartition('.')
+        if parent != __name__:
+            return None
+        entry_point = _plugin_entry_points().get(name)
+        if entry_point is None:
+            return None
+        return importlib.util.spec_from_loader(fullname, _PluginLoader(entry_point))
+
+
+if not any(isinstance(finder, _PluginFinder) for finder in sys.meta_path):
+    sys.meta_path.append(_PluginFinder())
+
+
+def __getattr__(name):
+    if name in _plugin_entry_points():
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-for entry_point in pkg_resources.iter_entry_points('stonesoup.plugins'):
-    try:
-        name = entry_point.name
-        plugin_module = f'{__name__}.{name}'
-        sys.modules[plugin_module] = entry_point.load()
 
-    except (ImportError, ModuleNotFoundError) as e:
-        warnings.warn(f'Failed to load module. {e}')
+def __dir__():
+    return sorted(set(globals()) | set(_plugin_entry_points()))
@@ -47,3 +47,24 @@ class Predictor(Base):
             State prediction
         """
         raise NotImplementedError
+
+    def predict_batch(self, priors, timestamp=None, **kwargs):
+        """Predict many prior states to the same time
+
+        By default, this simply calls :meth:`predict` for each prior, but
+        subclasses may override this to process all priors at once.
+
+        Parameters
+        ----------
+        priors : sequence of :class:`~.State`
+            The prior states
+        timestamp : :class:`datetime.datetime`, optional
+            Time at which the prediction is made (used by the transition
+            model)
+
+        Returns
+        -------
+        : list of :class:`~.StatePrediction`
+            State predictions, in same order as `priors`
+        """
+        return [self.predict(prior, timestamp=timestamp, **kwargs) for prior in priors]
@@ -6,13 +6,15 @@ import scipy.linalg as la
 from .base import Predictor
 from ._utils import predict_lru_cache
 from ..base import Property
+from ..types.array import CovarianceMatrix, StateVector
 from ..types.prediction import Prediction, SqrtGaussianStatePrediction
+from ..types.state import StateMutableSequence
 from ..models.base import LinearModel
 from ..models.transition import TransitionModel
 from ..models.transition.linear import LinearGaussianTransitionModel
 from ..models.control import ControlModel
 from ..models.control.linear import LinearControlModel
-from ..functions import gauss2sigma, unscented_transform
+from ..functions import gauss2sigma_state, unscented_transform
 
 
 class KalmanPredictor(Predictor):
@@ -194,6 +196,62 @@ class KalmanPredictor(Predictor):
         return Prediction.from_state(prior, x_pred, p_pred, timestamp=timestamp,
                                      transition_model=self.transition_model)
 
+    def predict_batch(self, priors, timestamp=None, **kwargs):
+        r"""Kalman Filter prediction step for many priors at once
+
+        Priors may each have a different time interval to `timestamp`. Transition
+        matrices and noise covariances are evaluated once for the distinct time
+        intervals, via :meth:`~.LinearModel.matrix_batch` and
+        :meth:`~.GaussianModel.covar_batch`, and the means and covariances of all
+        priors are then predicted together.
+
+        Where the transition model isn't linear, any prior has no time interval, or
+        a subclass changes how predictions are made, this falls back to calling
+        :meth:`predict` for each prior. Unlike :meth:`predict`, results are not
+        cached.
+
+        Parameters
+        ----------
+        priors : sequence of :class:`~.GaussianState`
+            Prior states, :math:`\mathbf{x}_{k-1}`
+        timestamp : :class:`datetime.datetime`, optional
+            :math:`k`
+
+        Returns
+        -------
+        : list of :class:`~.GaussianStatePrediction`
+            The predicted states, in same order as `priors`
+        """
+        priors = [prior.state if isinstance(prior, StateMutableSequence) else prior
+                  for prior in priors]
+        time_intervals = [self._predict_over_interval(prior, timestamp) for prior in priors]
+        if not priors \
+                or kwargs \
+                or not isinstance(self.transition_model, LinearModel) \
+                or any(time_interval is None for time_interval in time_intervals) \
+                or type(self).predict is not KalmanPredictor.predict \
+                or type(self)._predicted_covariance is not KalmanPredictor._predicted_covariance:
+            return super().predict_batch(priors, timestamp=timestamp, **kwargs)
+
+        unique_intervals, inverse = np.unique(
+            np.asarray(time_intervals, dtype='timedelta64[us]'), return_inverse=True)
+        trans_ms = self.transition_model.matrix_batch(unique_intervals)[inverse]
+        trans_covs = self.transition_model.covar_batch(unique_intervals)[inverse]
+
+        ctrl_mat = self._control_matrix
+        ctrl_input = self.control_model.control_input()
+        ctrl_cov = ctrl_mat @ self.control_model.control_noise @ ctrl_mat.T
+
+        means = np.stack([prior.state_vector for prior in priors])
+        covars = np.stack([prior.covar for prior in priors])
+        x_preds = trans_ms @ means + ctrl_input
+        p_preds = trans_ms @ covars @ np.swapaxes(trans_ms, 1, 2) + trans_covs + ctrl_cov
+
+        return [Prediction.from_state(prior, x_pred.view(StateVector),
+                                      p_pred.view(CovarianceMatrix), timestamp=timestamp,
+                                      transition_model=self.transition_model)
+                for prior, x_pred, p_pred in zip(priors, x_preds, p_preds)]
+
 
 class ExtendedKalmanPredictor(KalmanPredictor):
     """ExtendedKalmanPredictor class
@@ -363,7 +421,7 @@ class UnscentedKalmanPredictor(KalmanPredictor):
             + self.control_model.control_noise
 
         # Get the sigma points from the prior mean and covariance.
-        sigma_point_states, mean_weights, covar_weights = gauss2sigma(
+        sigma_points_state, mean_weights, covar_weights = gauss2sigma_state(
             prior, self.alpha, self.beta, self.kappa)
 
         # This ensures that function passed to unscented transform has the
@@ -375,7 +433,7 @@ class UnscentedKalmanPredictor(KalmanPredictor):
         # Put these through the unscented transform, together with the total
         # covariance to get the parameters of the Gaussian
         x_pred, p_pred, _, _, _, _ = unscented_transform(
-            sigma_point_states, mean_weights, covar_weights,
+            sigma_points_state, mean_weights, covar_weights,
             transition_and_control_function, covar_noise=total_noise_covar
         )
 
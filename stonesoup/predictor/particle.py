@@ -1,15 +1,16 @@
-import copy
-from typing import Sequence
+from typing import Optional, Sequence, Union
 
 import numpy as np
 
 from .base import Predictor
 from ._utils import predict_lru_cache
 from .kalman import KalmanPredictor, ExtendedKalmanPredictor
-from ..base import Property
+from ..base import Property, clearable_cached_property
+from ..functions import random_generator
 from ..models.transition import TransitionModel
+from ..types.array import StateVectors
 from ..types.prediction import Prediction
-from ..types.state import GaussianState
+from ..types.state import GaussianState, State, StateMutableSequence
 
 
 class ParticlePredictor(Predictor):
@@ -53,6 +54,64 @@ class ParticlePredictor(Predictor):
                                      timestamp=timestamp,
                                      transition_model=self.transition_model)
 
+    def predict_batch(self, priors, timestamp=None, **kwargs):
+        """Particle Filter prediction step for many priors at once
+
+        The particles of all priors with the same time interval are
+        concatenated, such that the transition model is applied once to a single
+        array of all particles. Each prediction's state vector is then a view of
+        its part of this array.
+
+        Unlike :meth:`predict`, results are not cached.
+
+        Parameters
+        ----------
+        priors : sequence of :class:`~.ParticleState`
+            Prior state objects
+        timestamp: :class:`datetime.datetime`, optional
+            A timestamp signifying when the prediction is performed
+            (the default is `None`)
+
+        Returns
+        -------
+        : list of :class:`~.ParticleStatePrediction`
+            The predicted states, in same order as `priors`
+        """
+        priors = [prior.state if isinstance(prior, StateMutableSequence) else prior
+                  for prior in priors]
+
+        # Group priors by time interval, such that each can use single transition
+        interval_indices = {}
+        for index, prior in enumerate(priors):
+            try:
+                time_interval = timestamp - prior.timestamp
+            except TypeError:
+                # TypeError: (timestamp or prior.timestamp) is None
+                time_interval = None
+            interval_indices.setdefault(time_interval, []).append(index)
+
+        predictions = [None] * len(priors)
+        for time_interval, indices in interval_indices.items():
+            lengths = [len(priors[index]) for index in indices]
+            offsets = np.cumsum([0] + lengths)
+            state_vectors = StateVectors(
+                np.hstack([priors[index].state_vector for index in indices]))
+
+            new_state_vectors = self.transition_model.function(
+                State(state_vectors),
+                noise=True,
+                time_interval=time_interval,
+                **kwargs)
+
+            for index, start, stop in zip(indices, offsets[:-1], offsets[1:]):
+                predictions[index] = Prediction.from_state(
+                    priors[index],
+                    state_vector=new_state_vectors[:, start:stop],
+                    timestamp=timestamp,
+                    transition_model=self.transition_model)
+
+        return predictions
+
 
 class ParticleFlowKalmanPredictor(ParticlePredictor):
     """Gromov Flow Parallel Kalman Particle Predictor
@@ -100,6 +159,8 @@ class ParticleFlowKalmanPredictor(ParticlePredictor):
                                      fixed_covar=kalman_prediction.covar,
                                      transition_model=self.transition_model)
 
+    predict_batch = Predictor.predict_batch
+
 
 class MultiModelPredictor(Predictor):
     """MultiModelPredictor class
@@ -120,11 +181,25 @@ class MultiModelPredictor(Predictor):
             "between model and state space, enabling use of models that may have different "
             "dimensions (e.g. velocity or acceleration). Parts of the state that aren't mapped "
             "are set to zero.")
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = Property(
+        default=None,
+        doc="Seed for random number generation, used in selecting each particle's model. "
+            "Default `None` where NumPy's global random state is used. Transition noise is "
+            "drawn by each of the :attr:`transition_models`.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.random_state = random_generator(self.seed)
 
-    @property
+    @clearable_cached_property('transition_matrix')
     def probabilities(self):
+        """Cumulative model transition probabilities, for each current model"""
         return np.cumsum(self.transition_matrix, axis=1)
 
+    @clearable_cached_property('model_mappings')
+    def _mapping_indices(self):
+        return [np.asarray(model_mapping, dtype=np.intp) for model_mapping in self.model_mappings]
+
     @predict_lru_cache()
     def predict(self, prior, timestamp=None, **kwargs):
         """Particle Filter prediction step
@@ -141,49 +216,49 @@ class MultiModelPredictor(Predictor):
         : :class:`~.ParticleStatePrediction`
             The predicted state
         """
+        # Change the value of the dynamic model randomly according to the defined
+        # transition matrix
+        new_dynamic_models = self._sample_models(self.probabilities[prior.dynamic_model])
+
+        new_state_vector = self._transition_particles(
+            prior, prior.dynamic_model, timestamp, noise=True, **kwargs)
 
-        new_particle_state = Prediction.from_state(
+        return Prediction.from_state(
             prior,
-            state_vector=copy.copy(prior.state_vector),
+            state_vector=new_state_vector,
             parent=prior,
-            dynamic_model=copy.copy(prior.dynamic_model),
+            dynamic_model=new_dynamic_models,
             timestamp=timestamp)
 
-        for model_index, transition_model in enumerate(self.transition_models):
-            # Change the value of the dynamic value randomly according to the defined
-            # transition matrix
-            current_model_indices = prior.dynamic_model == model_index
-            current_model_count = np.count_nonzero(current_model_indices)
-            if current_model_count == 0:
+    def _sample_models(self, cdfs):
+        """Sample model index for each particle, from rows of cumulative probabilities"""
+        samples = self.random_state.random(size=(cdfs.shape[0], 1))
+        return np.minimum(np.count_nonzero(cdfs < samples, axis=1), cdfs.shape[1] - 1)
+
+    def _transition_particles(self, prior, dynamic_models, timestamp, **kwargs):
+        """Apply each transition model to its particles, with each model's particles gathered
+        and scattered back in one operation. Parts of the state not mapped are set to zero."""
+        new_state_vector = np.zeros_like(prior.state_vector)
+        time_interval = timestamp - prior.timestamp
+        for model_index, (transition_model, model_mapping) in enumerate(
+                zip(self.transition_models, self._mapping_indices)):
+            particle_indices = np.flatnonzero(dynamic_models == model_index)
+            if not particle_indices.size:
                 continue
-            new_dynamic_models = np.searchsorted(
-                self.probabilities[model_index],
-                np.random.random(size=current_model_count))
-
-            new_state_vector = self.apply_model(
-                prior[current_model_indices], transition_model, timestamp,
-                self.model_mappings[model_index], noise=True, **kwargs)
-
-            new_particle_state.state_vector[:, current_model_indices] = new_state_vector
-            new_particle_state.dynamic_model[current_model_indices] = new_dynamic_models
-
-        return new_particle_state
+            indices = np.ix_(model_mapping, particle_indices)
+            new_state_vector[indices] = transition_model.function(
+                State(prior.state_vector[indices]), time_interval=time_interval, **kwargs)
+        return new_state_vector
 
     @staticmethod
     def apply_model(prior, transition_model, timestamp, model_mapping, **kwargs):
         # Based on given position mapping create a new state vector that contains only the
-        # required states
-        orig_ndim = prior.ndim
-        prior.state_vector = prior.state_vector[model_mapping, :]
-        new_state_vector = transition_model.function(
-            prior, time_interval=timestamp - prior.timestamp, **kwargs)
-
-        # Calculate the indices removed from the state vector to become compatible with the
-        # dynamic model
-        for j in range(orig_ndim):
-            if j not in model_mapping:
-                new_state_vector = np.insert(new_state_vector, j, 0, axis=0)
-
+        # required states, and then set parts of state not mapped to zero
+        model_mapping = np.asarray(model_mapping, dtype=np.intp)
+        new_state_vector = np.zeros_like(prior.state_vector)
+        new_state_vector[model_mapping, :] = transition_model.function(
+            State(prior.state_vector[model_mapping, :]),
+            time_interval=timestamp - prior.timestamp, **kwargs)
         return new_state_vector
 
 
@@ -211,28 +286,15 @@ class RaoBlackwellisedMultiModelPredictor(MultiModelPredictor):
             The predicted state
         """
 
-        new_particle_state = Prediction.from_state(
+        # Change the value of the dynamic model randomly according to the model probabilities
+        new_dynamic_models = self._sample_models(
+            np.cumsum(np.asfarray(prior.model_probabilities), axis=0).T)
+
+        new_state_vector = self._transition_particles(
+            prior, new_dynamic_models, timestamp, noise=True, **kwargs)
+
+        return Prediction.from_state(
             prior,
-            state_vector=copy.copy(prior.state_vector),
+            state_vector=new_state_vector,
             parent=prior,
             timestamp=timestamp)
-
-        # Change the value of the dynamic value randomly according to the
-        # matrix
-        new_dynamic_models = np.argmax(
-            prior.model_probabilities.astype(float).cumsum(0) > np.random.rand(len(prior)),
-            axis=0)
-
-        for model_index, transition_model in enumerate(self.transition_models):
-
-            new_model_indices = new_dynamic_models == model_index
-            if np.count_nonzero(new_model_indices) == 0:
-                continue
-
-            new_state_vector = self.apply_model(
-                prior[new_model_indices], transition_model, timestamp,
-                self.model_mappings[model_index], noise=True, **kwargs)
-
-            new_particle_state.state_vector[:, new_model_indices] = new_state_vector
-
-        return new_particle_state
@@ -2,7 +2,7 @@ import datetime
 import pytest
 import numpy as np
 
-from ...models.transition.linear import ConstantVelocity
+from ...models.transition.linear import ConstantVelocity, CombinedLinearGaussianTransitionModel
 from ...predictor.kalman import (
     KalmanPredictor, ExtendedKalmanPredictor, UnscentedKalmanPredictor,
     SqrtKalmanPredictor)
@@ -136,3 +136,30 @@ def test_sqrt_kalman():
                        atol=1.e-14)
     assert np.allclose(prediction.covar, sqrt_prediction.covar, 0, atol=1.e-14)
     assert prediction.timestamp == sqrt_prediction.timestamp
+
+
+@pytest.mark.parametrize(
+    "PredictorClass",
+    [KalmanPredictor, ExtendedKalmanPredictor, UnscentedKalmanPredictor],
+    ids=["standard", "extended", "unscented"])
+def test_kalman_predict_batch(PredictorClass):
+    transition_model = CombinedLinearGaussianTransitionModel(
+        [ConstantVelocity(noise_diff_coeff=0.1), ConstantVelocity(noise_diff_coeff=0.2)])
+    predictor = PredictorClass(transition_model=transition_model)
+
+    timestamp = datetime.datetime.now()
+    # Asynchronous priors, with some sharing time interval
+    priors = [
+        GaussianState(np.random.randn(4, 1), np.diag(np.random.uniform(1, 2, 4)),
+                      timestamp=timestamp - datetime.timedelta(seconds=seconds))
+        for seconds in (0.5, 1, 2.25, 1, 0.5)]
+    priors.append(Track([priors[0]]))
+
+    predictions = predictor.predict_batch(priors, timestamp=timestamp)
+    assert len(predictions) == len(priors)
+    for prior, prediction in zip(priors, predictions):
+        expected = predictor.predict(prior, timestamp=timestamp)
+        assert prediction.timestamp == timestamp
+        assert np.allclose(prediction.state_vector, expected.state_vector)
+        assert np.allclose(prediction.covar, expected.covar)
+        assert isinstance(prediction, GaussianStatePrediction)
@@ -90,3 +90,68 @@ def test_multi_model():
     assert prediction.timestamp == new_timestamp
     assert np.all([prediction.particles[i].weight == 1/10 for i in range(9)])
     assert len(dynamic_model_proportions) == len(transition)
+
+
+def test_multi_model_mapping():
+    timestamp = datetime.datetime.now()
+    new_timestamp = timestamp + datetime.timedelta(seconds=2)
+
+    prior_vectors = StateVectors(np.random.randn(3, 20))
+    model = np.tile([0, 1], 10)
+    prior = MultiModelParticleState(
+        prior_vectors, log_weight=np.full(20, np.log(1/20)), dynamic_model=model,
+        timestamp=timestamp)
+
+    model_list = [ConstantVelocity(0), ConstantAcceleration(0)]
+    model_mappings = [[0, 1], [0, 1, 2]]
+    predictor = MultiModelPredictor(model_mappings=model_mappings,
+                                    transition_matrix=np.eye(2),
+                                    transition_models=model_list)
+
+    prediction = predictor.predict(prior, timestamp=new_timestamp)
+
+    # Identity transition matrix, so no change of model
+    assert np.array_equal(prediction.dynamic_model, model)
+    assert prediction.parent is prior
+
+    cv_matrix = model_list[0].matrix(time_interval=datetime.timedelta(seconds=2))
+    ca_matrix = model_list[1].matrix(time_interval=datetime.timedelta(seconds=2))
+    assert np.allclose(prediction.state_vector[:2, ::2], cv_matrix @ prior_vectors[:2, ::2])
+    assert np.all(prediction.state_vector[2, ::2] == 0)  # Not mapped
+    assert np.allclose(prediction.state_vector[:, 1::2], ca_matrix @ prior_vectors[:, 1::2])
+
+    # Model switching sampled according to transition matrix
+    np.random.seed(1990)
+    prior = MultiModelParticleState(
+        StateVectors(np.zeros((3, 10000))), log_weight=np.full(10000, np.log(1/10000)),
+        dynamic_model=np.zeros(10000, dtype=int), timestamp=timestamp)
+    predictor = MultiModelPredictor(model_mappings=model_mappings,
+                                    transition_matrix=[[0.7, 0.3], [0.2, 0.8]],
+                                    transition_models=model_list)
+    prediction = predictor.predict(prior, timestamp=new_timestamp)
+    assert np.isclose(np.mean(prediction.dynamic_model), 0.3, atol=0.02)
+
+
+def test_multi_model_seed():
+    timestamp = datetime.datetime(2020, 1, 1)
+    new_timestamp = timestamp + datetime.timedelta(seconds=2)
+    prior = MultiModelParticleState(
+        StateVectors(np.zeros((3, 1000))), log_weight=np.full(1000, np.log(1/1000)),
+        dynamic_model=np.zeros(1000, dtype=int), timestamp=timestamp)
+
+    def prediction(seed):
+        predictor = MultiModelPredictor(
+            model_mappings=[[0, 1], [0, 1, 2]],
+            transition_matrix=[[0.7, 0.3], [0.2, 0.8]],
+            transition_models=[ConstantVelocity(1, seed=seed), ConstantAcceleration(1, seed=seed)],
+            seed=seed)
+        return predictor.predict(prior, timestamp=new_timestamp)
+
+    # Independent of global random state
+    prediction1 = prediction(1990)
+    np.random.seed(1)
+    prediction2 = prediction(1990)
+    assert np.array_equal(prediction1.dynamic_model, prediction2.dynamic_model)
+    assert np.array_equal(prediction1.state_vector, prediction2.state_vector)
+    assert np.isclose(np.mean(prediction1.dynamic_model), 0.3, atol=0.05)
+    assert not np.array_equal(prediction(1991).dynamic_model, prediction1.dynamic_model)
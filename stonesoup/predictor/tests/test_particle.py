@@ -6,6 +6,7 @@ import pytest
 from ...models.transition.linear import ConstantVelocity
 from ...predictor.particle import (
     ParticlePredictor, ParticleFlowKalmanPredictor)
+from ...types.array import StateVectors
 from ...types.particle import Particle
 from ...types.prediction import ParticleStatePrediction
 from ...types.state import ParticleState
@@ -65,3 +66,30 @@ def test_particle(predictor_class):
     assert np.all([eval_prediction.state_vector[:, i] ==
                    prediction.state_vector[:, i] for i in range(9)])
     assert np.all([prediction.weight[i] == 1 / 9 for i in range(9)])
+
+
+@pytest.mark.parametrize(
+    "predictor_class",
+    (ParticlePredictor, ParticleFlowKalmanPredictor))
+def test_particle_batch(predictor_class):
+    cv = ConstantVelocity(noise_diff_coeff=0)
+    timestamp = datetime.datetime.now()
+    new_timestamp = timestamp + datetime.timedelta(seconds=5)
+    priors = [
+        ParticleState(StateVectors(np.random.randn(2, 9) + offset),
+                      log_weight=np.full(9, np.log(1/9)),
+                      timestamp=timestamp - datetime.timedelta(seconds=offset % 2))
+        for offset in range(4)]
+
+    predictor = predictor_class(transition_model=cv)
+
+    predictions = predictor.predict_batch(priors, timestamp=new_timestamp)
+    assert len(predictions) == len(priors)
+    for prior, prediction in zip(priors, predictions):
+        eval_prediction = predictor.predict(prior, timestamp=new_timestamp)
+        assert isinstance(prediction, ParticleStatePrediction)
+        assert prediction.timestamp == new_timestamp
+        assert np.allclose(prediction.state_vector, eval_prediction.state_vector)
+        assert np.array_equal(prediction.log_weight, prior.log_weight)
+
+    assert predictor.predict_batch([], timestamp=new_timestamp) == []
@@ -1,5 +1,4 @@
 import datetime
-import matplotlib.image as mpimg
 
 from ..base import Property
 from ..buffered_generator import BufferedGenerator
@@ -18,6 +17,7 @@ class SingleImageFileReader(FileReader, FrameReader):
 
     @BufferedGenerator.generator_method
     def frames_gen(self):
+        import matplotlib.image as mpimg
         img = mpimg.imread(self.path)*255
         frame = ImageFrame(img, self.timestamp)
         yield self.timestamp, frame
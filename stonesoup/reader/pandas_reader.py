@@ -30,17 +30,55 @@ class _DataFrameReader(Reader):
     metadata_fields: Collection[str] = Property(
         default=None, doc='List of columns to be saved as metadata, default all')
 
-    def _get_metadata(self, row):
+    def _get_state_vectors(self):
+        """Array of all state vectors, of shape (rows, ndim, 1).
+
+        This is created in a single conversion of the frame, with the state vector for each row
+        being a view into this array."""
+        return self.dataframe[list(self.state_vector_fields)] \
+            .to_numpy(dtype=np.float_)[:, :, np.newaxis]
+
+    def _get_metadata_columns(self):
+        """Metadata field names, and list of values for each field.
+
+        Metadata dictionaries are only created when each row is reached, from these column-wise
+        values, rather than all rows being converted up front."""
         if self.metadata_fields is None:
-            local_metadata = dict(row)
-            for key in list(local_metadata):
-                if key == self.time_field or key in self.state_vector_fields:
-                    del local_metadata[key]
+            excluded_fields = {self.time_field, *self.state_vector_fields}
+            fields = [field for field in self.dataframe.columns
+                      if field not in excluded_fields]
         else:
-            local_metadata = {field: row[field]
-                              for field in self.metadata_fields
-                              if field in row}
-        return local_metadata
+            fields = [field for field in self.metadata_fields
+                      if field in self.dataframe.columns]
+        return fields, [self.dataframe[field].tolist() for field in fields]
+
+    @staticmethod
+    def _get_metadata(index, fields, columns):
+        return {field: column[index] for field, column in zip(fields, columns)}
+
+    def _time_groups(self):
+        """Generator yielding time, and start and stop row index, for each group of consecutive
+        rows with the same time.
+
+        The time is only parsed once for each run of identical time field values."""
+        time_values = self.dataframe[self.time_field]
+        raw_times = time_values.to_numpy()
+        if not len(raw_times):
+            yield None, 0, 0
+            return
+        starts = np.flatnonzero(raw_times[1:] != raw_times[:-1]) + 1
+        stops = np.append(starts, len(raw_times))
+        starts = np.insert(starts, 0, 0)
+
+        previous_time = None
+        previous_start = 0
+        for start in starts:
+            time = self._get_time({self.time_field: time_values.iloc[start]})
+            if previous_time is not None and previous_time != time:
+                yield previous_time, previous_start, start
+                previous_start = start
+            previous_time = time
+        yield previous_time, previous_start, stops[-1]
 
     def _get_time(self, row):
         if self.time_field_format is not None:
@@ -76,30 +114,22 @@ class DataFrameGroundTruthReader(GroundTruthReader, _DataFrameReader):
     def groundtruth_paths_gen(self):
         """ Generator method for providing each row of ground truth data. """
         groundtruth_dict = {}
-        updated_paths = set()
-        previous_time = None
-        for row in self.dataframe.to_dict(orient="records"):
-
-            time = self._get_time(row)
-            if previous_time is not None and previous_time != time:
-                yield previous_time, updated_paths
-                updated_paths = set()
-            previous_time = time
-
-            state = GroundTruthState(np.array([[row[col_name]] for col_name
-                                              in self.state_vector_fields],
-                                              dtype=np.float_), timestamp=time,
-                                     metadata=self._get_metadata(row))
-
-            id_ = row[self.path_id_field]
-            if id_ not in groundtruth_dict:
-                groundtruth_dict[id_] = GroundTruthPath(id=id_)
-            groundtruth_path = groundtruth_dict[id_]
-            groundtruth_path.append(state)
-            updated_paths.add(groundtruth_path)
-
-            # Yield remaining
-        yield previous_time, updated_paths
+        state_vectors = self._get_state_vectors()
+        metadata_columns = self._get_metadata_columns()
+        ids = self.dataframe[self.path_id_field].tolist()
+        for time, start, stop in self._time_groups():
+            updated_paths = set()
+            for index in range(start, stop):
+                state = GroundTruthState(state_vectors[index], timestamp=time,
+                                         metadata=self._get_metadata(index, *metadata_columns))
+
+                id_ = ids[index]
+                if id_ not in groundtruth_dict:
+                    groundtruth_dict[id_] = GroundTruthPath(id=id_)
+                groundtruth_path = groundtruth_dict[id_]
+                groundtruth_path.append(state)
+                updated_paths.add(groundtruth_path)
+            yield time, updated_paths
 
 
 class DataFrameDetectionReader(DetectionReader, _DataFrameReader):
@@ -116,21 +146,10 @@ class DataFrameDetectionReader(DetectionReader, _DataFrameReader):
 
     @BufferedGenerator.generator_method
     def detections_gen(self):
-        detections = set()
-        previous_time = None
-        for row in self.dataframe.to_dict(orient="records"):
-
-            time = self._get_time(row)
-            if previous_time is not None and previous_time != time:
-                yield previous_time, detections
-                detections = set()
-            previous_time = time
-
-            detections.add(Detection(
-                np.array([[row[col_name]] for col_name in self.state_vector_fields],
-                         dtype=np.float_),
-                timestamp=time,
-                metadata=self._get_metadata(row)))
-
-        # Yield remaining
-        yield previous_time, detections
+        state_vectors = self._get_state_vectors()
+        metadata_columns = self._get_metadata_columns()
+        for time, start, stop in self._time_groups():
+            yield time, {
+                Detection(state_vectors[index], timestamp=time,
+                          metadata=self._get_metadata(index, *metadata_columns))
+                for index in range(start, stop)}
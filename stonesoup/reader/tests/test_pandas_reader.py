@@ -309,3 +309,47 @@ def test_detections_df_multi_per_timestep():
             assert len(detections) == 2
         else:
             assert len(detections) == 1
+
+
+def test_detections_df_non_consecutive_times():
+    # Times not in order should be yielded separately, as per rows
+    det_test_df = pd.read_table(
+                    StringIO("""x,y,z,identifier,t
+                    10,20,30,22018332,1514815200
+                    11,21,31,22018332,1514815200
+                    12,22,32,22018332,1514815260
+                    13,23,33,32018332,1514815200
+                    14,24,34,32018332,1514815200.0
+                    """),
+                    sep=',', dtype={'t': str})
+
+    df_reader = DataFrameDetectionReader(
+        dataframe=det_test_df,
+        state_vector_fields=["x", "y"],
+        time_field="t",
+        timestamp=True)
+
+    scans = [(time, sorted(detections, key=lambda detection: detection.state_vector[0]))
+             for time, detections in df_reader]
+    # Last two rows have different time value, but same time, so should be grouped
+    assert [len(detections) for _, detections in scans] == [2, 1, 2]
+    assert [time.minute for time, _ in scans] == [0, 1, 0]
+
+    state_vectors = [detection.state_vector
+                     for _, detections in scans for detection in detections]
+    for n, state_vector in enumerate(state_vectors):
+        assert state_vector.shape == (2, 1)
+        assert np.array_equal(state_vector, np.array([[10 + n], [20 + n]]))
+    assert all(
+        detection.metadata == {'z': 30 + n, 'identifier': detection.metadata['identifier']}
+        for n, detection in enumerate(
+            detection for _, detections in scans for detection in detections))
+
+
+def test_detections_df_empty():
+    df_reader = DataFrameDetectionReader(
+        dataframe=pd.DataFrame(columns=['x', 'y', 't']),
+        state_vector_fields=["x", "y"],
+        time_field="t")
+
+    assert list(df_reader) == [(None, set())]
@@ -1,9 +1,11 @@
 import copy
+from typing import Optional, Union
+
 import numpy as np
-from scipy.stats import multivariate_normal, uniform
 
 from .base import Regulariser
-from ..functions import cholesky_eps
+from ..base import Property
+from ..functions import cholesky_eps, gaussian_logpdf, random_generator
 from ..types.state import ParticleState
 
 
@@ -26,6 +28,14 @@ class MCMCRegulariser(Regulariser):
 
     .. [2] Ristic, Branco & Arulampalam, Sanjeev & Gordon, Neil, Beyond the Kalman Filter:
         Particle Filters for Target Tracking Applications, Artech House, 2004. """
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = Property(
+        default=None,
+        doc="Seed for random number generation. Default `None` where NumPy's global random "
+            "state is used.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.random_state = random_generator(self.seed)
 
     def regularise(self, prior, posterior, detections):
         """Regularise the particles
@@ -66,18 +76,17 @@ class MCMCRegulariser(Regulariser):
             covar_est = posterior.covar
 
             # move particles
+            samples = self.random_state.standard_normal((ndim, nparticles))
             moved_particles.state_vector = moved_particles.state_vector + \
-                hopt * cholesky_eps(covar_est) @ np.random.randn(ndim, nparticles)
+                hopt * cholesky_eps(covar_est) @ samples
 
             # Evaluate likelihoods
             part_diff = moved_particles.state_vector - prior.state_vector
             part_diff_mean = np.average(part_diff, axis=1)
-            move_likelihood = multivariate_normal.logpdf((part_diff - part_diff_mean).T,
-                                                         cov=covar_est)
+            move_likelihood = gaussian_logpdf(part_diff - part_diff_mean, covar_est)
             post_part_diff = posterior.state_vector - prior.state_vector
             post_part_diff_mean = np.average(post_part_diff, axis=1)
-            post_likelihood = multivariate_normal.logpdf((post_part_diff - post_part_diff_mean).T,
-                                                         cov=covar_est)
+            post_likelihood = gaussian_logpdf(post_part_diff - post_part_diff_mean, covar_est)
 
             # Evaluate measurement likelihoods
             move_meas_likelihood = []
@@ -96,7 +105,7 @@ class MCMCRegulariser(Regulariser):
 
             # All 'jittered' particles that are above the alpha threshold are kept, the rest are
             # rejected and the original posterior used
-            selector = uniform.rvs(size=nparticles)
+            selector = self.random_state.uniform(size=nparticles)
             index = alpha > selector
 
             regularised_particles.state_vector[:, index] = moved_particles.state_vector[:, index]
@@ -1,6 +1,7 @@
 import numpy as np
 import datetime
 
+from ...types.array import StateVectors
 from ...types.state import ParticleState
 from ...types.particle import Particle
 from ...types.hypothesis import SingleHypothesis
@@ -100,3 +101,33 @@ def test_no_measurement():
     assert any(new_particles.weight == state_update.weight)
     # Check that the timestamp is the same
     assert new_particles.timestamp == state_update.timestamp
+
+
+def test_regulariser_seed():
+    timestamp = datetime.datetime(2020, 1, 1)
+    state_vector = StateVectors([[10., 10, 10, 20, 20, 20, 30, 30, 30],
+                                 [10., 20, 30, 10, 20, 30, 10, 20, 30]])
+    measurement_model = LinearGaussian(
+        ndim_state=2, mapping=(0, 1), noise_covar=np.eye(2)*100)
+    measurement = [Detection(state_vector=np.array([[20], [20]]),
+                             timestamp=timestamp, measurement_model=measurement_model)]
+
+    def regularise(seed):
+        particles = ParticleState(
+            state_vector.copy(), weight=np.full(9, 1/9), timestamp=timestamp)
+        prediction = ParticleStatePrediction(
+            state_vector.copy(), weight=np.full(9, 1/9), timestamp=timestamp)
+        state_update = ParticleStateUpdate(
+            state_vector.copy(),
+            SingleHypothesis(prediction=prediction, measurement=measurement[0]),
+            weight=np.full(9, 1/9), timestamp=timestamp)
+        return MCMCRegulariser(seed=seed).regularise(
+            particles, state_update, measurement).state_vector
+
+    new_state_vector = regularise(1990)
+    # Some particles moved
+    assert np.any(new_state_vector != state_vector)
+    # Independent of global random state
+    np.random.seed(1)
+    assert np.array_equal(regularise(1990), new_state_vector)
+    assert not np.array_equal(regularise(1991), new_state_vector)
@@ -1,11 +1,29 @@
+from abc import abstractmethod
+from typing import Optional, Union
+
 import numpy as np
 
 from .base import Resampler
 from ..base import Property
+from ..functions import random_generator, segmented_logsumexp
 from ..types.state import ParticleState
 
 
-class SystematicResampler(Resampler):
+class ParticleResampler(Resampler):
+    """Particle resampler base class
+
+    Resamplers derived from this implement :meth:`resample_indices`, which selects the
+    particles from their log weights alone. This can be used directly where only the indices
+    are required, avoiding creating a new :class:`~.ParticleState`.
+
+    Random draws are made with :attr:`random_state`, created from the resampler's `seed`
+    property (see :func:`~.random_generator`).
+    """
+    seed = None  # Resamplers declare seed property last, after their own properties
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.random_state = random_generator(self.seed)
 
     def resample(self, particles, nparts=None):
         """Resample the particles
@@ -28,25 +46,138 @@ class SystematicResampler(Resampler):
         if nparts is None:
             nparts = len(particles)
 
-        log_weights = particles.log_weight
-        weight_order = np.argsort(log_weights, kind='stable')
-        max_log_value = log_weights[weight_order[-1]]
-        with np.errstate(divide='ignore'):
-            cdf = np.log(np.cumsum(np.exp(log_weights[weight_order] - max_log_value)))
-        cdf += max_log_value
-
-        # Pick random starting point
-        u_i = np.random.uniform(0, 1 / nparts)
-
-        # Cycle through the cumulative distribution and copy the particle
-        # that pushed the score over the current value
-        u_j = u_i + (1 / nparts) * np.arange(nparts)
-        index = weight_order[np.searchsorted(cdf, np.log(u_j))]
+        index = self.resample_indices(particles.log_weight, nparts)
 
         new_particles = particles[index]
         new_particles.log_weight = np.full((nparts, ), np.log(1/nparts))
         return new_particles
 
+    @abstractmethod
+    def resample_indices(self, log_weights, nparts=None):
+        """Select particles to resample
+
+        Parameters
+        ----------
+        log_weights : :class:`numpy.ndarray` of shape (n, )
+            Log weights of the particles, which needn't be normalised
+        nparts : int
+            The number of particles to be selected. Default `None` where same as number of
+            weights.
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (nparts, )
+            Index of the particle selected for each new particle
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _weights(log_weights):
+        """Normalised weights, computed relative to the maximum log weight"""
+        log_weights = np.asarray(log_weights, dtype=np.float_)
+        weights = np.exp(log_weights - np.max(log_weights))
+        return weights / np.sum(weights)
+
+    @staticmethod
+    def _indices_from_uniforms(log_weights, uniforms):
+        """Indices from one uniform (0, 1] sample per stratum of the cumulative distribution
+
+        The :math:`j` th point :math:`(j + u_j)/n` lies in the :math:`j` th of :math:`n` equal
+        strata. The number of points at or below each value of the cumulative distribution can
+        therefore be calculated directly, such that neither the weights nor the points need
+        sorting or searching.
+        """
+        nparts = len(uniforms)
+        cdf = np.cumsum(ParticleResampler._weights(log_weights))
+        cdf /= cdf[-1]
+        scaled_cdf = nparts * cdf
+        strata = np.floor(scaled_cdf).astype(np.intp)
+        counts = np.where(
+            strata >= nparts,
+            nparts,
+            strata + (uniforms[np.minimum(strata, nparts - 1)] <= scaled_cdf - strata))
+        return np.repeat(np.arange(len(cdf)), np.diff(counts, prepend=0))
+
+    @staticmethod
+    def _indices_from_counts(counts):
+        return np.repeat(np.arange(len(counts)), counts)
+
+
+class SystematicResampler(ParticleResampler):
+    """Systematic resampler
+
+    Selects particles using evenly spaced points through the cumulative distribution of the
+    weights, with a single random offset. This is computed in :math:`O(N)` time.
+    """
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = Property(
+        default=None,
+        doc="Seed for random number generation. Default `None` where NumPy's global random "
+            "state is used.")
+
+    def resample_indices(self, log_weights, nparts=None):
+        if nparts is None:
+            nparts = len(log_weights)
+        # Pick random starting point, shared by all strata
+        u_i = 1 - self.random_state.uniform(0, 1)
+        return self._indices_from_uniforms(log_weights, np.full(nparts, u_i))
+
+    @staticmethod
+    def resample_segments(log_weights, offsets, random_state=None):
+        """Resample many particle sets at once
+
+        The particle sets are held in a single array, with each set being a
+        contiguous segment starting at the given offset. Each set is
+        resampled independently, with the same number of particles.
+
+        Parameters
+        ----------
+        log_weights : :class:`numpy.ndarray` of shape (n, )
+            Log weights of all particles
+        offsets : :class:`numpy.ndarray` of shape (m, )
+            Start index of each particle set, in increasing order
+        random_state : :class:`numpy.random.Generator` or :class:`numpy.random.RandomState`, \
+        optional
+            Random number generator to use, e.g. a resampler's :attr:`random_state`. Default
+            `None` where NumPy's global random state is used.
+
+        Returns
+        -------
+        indices : :class:`numpy.ndarray` of shape (n, )
+            Index of the particle selected for each new particle
+        log_weights : :class:`numpy.ndarray` of shape (n, )
+            Log weights of new particles
+        """
+        log_weights = np.asarray(log_weights, dtype=np.float_)
+        offsets = np.asarray(offsets, dtype=np.intp)
+        if random_state is None:
+            random_state = random_generator()
+        nparts = len(log_weights)
+        lengths = np.diff(np.append(offsets, nparts))
+        segments = np.repeat(np.arange(len(offsets)), lengths)
+        starts = offsets[segments]
+        segment_lengths = lengths[segments]
+
+        # Cumulative distribution of each segment, scaled by number of particles in segment
+        weights = np.exp(
+            log_weights - np.repeat(segmented_logsumexp(log_weights, offsets), lengths))
+        cdf = np.cumsum(weights)
+        cdf -= np.append(0, cdf)[starts]
+        cdf /= cdf[offsets + lengths - 1][segments]
+        scaled_cdf = segment_lengths * cdf
+
+        # Pick random starting point for each segment, shared by all strata in that segment.
+        # As in resample_indices, number of points at or below each value of cumulative
+        # distribution is calculated directly, rather than searching.
+        u_i = 1 - random_state.uniform(0, 1, size=len(offsets))
+        counts = np.clip(
+            np.floor(scaled_cdf - u_i[segments]).astype(np.intp) + 1, 0, segment_lengths)
+        previous_counts = np.empty_like(counts)
+        previous_counts[1:] = counts[:-1]
+        previous_counts[offsets] = 0
+        index = ParticleResampler._indices_from_counts(counts - previous_counts)
+
+        return index, -np.log(segment_lengths)
+
 
 class ESSResampler(Resampler):
     """ This wrapper uses a :class:`~.Resampler` to resample the particles inside
@@ -65,9 +196,15 @@ class ESSResampler(Resampler):
                                 doc='Threshold compared with ESS to decide whether to resample. \
                                     Default is number of particles divided by 2, \
                                         set in resample method')
-    resampler: Resampler = Property(default=SystematicResampler,
+    resampler: Resampler = Property(default=None,
                                     doc='Resampler to wrap, which is called \
-                                        when ESS below threshold')
+                                        when ESS below threshold. Default `None` \
+                                        where :class:`~.SystematicResampler` is used.')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.resampler is None:
+            self.resampler = SystematicResampler()
 
     def resample(self, particles):
         """
@@ -87,6 +224,163 @@ class ESSResampler(Resampler):
             self.threshold = len(particles) / 2
         # If ESS too small, resample
         if 1 / np.sum(np.exp(2*particles.log_weight)) < self.threshold:
-            return self.resampler.resample(self.resampler, particles)
+            return self.resampler.resample(particles)
         else:
             return particles
+
+
+class StratifiedResampler(ParticleResampler):
+    """Stratified resampler
+
+    Selects particles using points through the cumulative distribution of the weights, with
+    an independent random point within each of equally sized strata. This is computed in
+    :math:`O(N)` time.
+    """
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = Property(
+        default=None,
+        doc="Seed for random number generation. Default `None` where NumPy's global random "
+            "state is used.")
+
+    def resample_indices(self, log_weights, nparts=None):
+        if nparts is None:
+            nparts = len(log_weights)
+        return self._indices_from_uniforms(
+            log_weights, 1 - self.random_state.uniform(0, 1, size=nparts))
+
+
+class MultinomialResampler(ParticleResampler):
+    """Multinomial resampler
+
+    Selects particles independently according to their weights. The number of copies of each
+    particle is drawn from a multinomial distribution, computed in :math:`O(N)` time.
+    """
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = Property(
+        default=None,
+        doc="Seed for random number generation. Default `None` where NumPy's global random "
+            "state is used.")
+
+    def resample_indices(self, log_weights, nparts=None):
+        if nparts is None:
+            nparts = len(log_weights)
+        return self._indices_from_counts(
+            self.random_state.multinomial(nparts, self._weights(log_weights)))
+
+
+class ResidualResampler(ParticleResampler):
+    """Residual resampler
+
+    Deterministically selects :math:`\\lfloor n w_i \\rfloor` copies of each particle, with
+    the remaining particles selected using the residual weights, with the :attr:`resampler`.
+    This is computed in :math:`O(N)` time.
+    """
+    resampler: ParticleResampler = Property(
+        default=None,
+        doc="Resampler used for residual weights. Default `None` where "
+            ":class:`~.MultinomialResampler` is used, with the same random number generator.")
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = Property(
+        default=None,
+        doc="Seed for random number generation. Default `None` where NumPy's global random "
+            "state is used.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.resampler is None:
+            # Shares random number generator
+            self.resampler = MultinomialResampler(seed=self.random_state)
+
+    def resample_indices(self, log_weights, nparts=None):
+        if nparts is None:
+            nparts = len(log_weights)
+        scaled_weights = nparts * self._weights(log_weights)
+        counts = np.floor(scaled_weights).astype(np.intp)
+        nresidual = nparts - np.sum(counts)
+        if nresidual > 0:
+            residuals = scaled_weights - counts
+            with np.errstate(divide='ignore'):
+                counts += np.bincount(
+                    self.resampler.resample_indices(np.log(residuals), nresidual),
+                    minlength=len(counts))
+        return self._indices_from_counts(counts)
+
+
+class MetropolisResampler(ParticleResampler):
+    """Metropolis resampler
+
+    Selects each particle by running an independent Metropolis chain over the particles, as
+    proposed in [1]_. This only uses ratios of weights, so requires no normalisation,
+    cumulative sum or other collective operation over all particles. Each new particle can
+    therefore be selected independently (e.g. over chunks of particles in parallel), at cost
+    :math:`O(NB)` for :math:`B` :attr:`iterations`.
+
+    The result is biased, with bias reducing as :attr:`iterations` increases, which should be
+    greater where weights vary more.
+
+    References
+    ----------
+    .. [1] Murray L.M., Lee A., Jacob P.E., 2016, Parallel Resampling in the Particle Filter,
+       Journal of Computational and Graphical Statistics, 25(3), 789-805.
+    """
+    iterations: int = Property(default=32, doc="Number of iterations of each chain. Default 32.")
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = Property(
+        default=None,
+        doc="Seed for random number generation. Default `None` where NumPy's global random "
+            "state is used.")
+
+    def resample_indices(self, log_weights, nparts=None):
+        log_weights = np.asarray(log_weights, dtype=np.float_)
+        if nparts is None:
+            nparts = len(log_weights)
+        index = np.arange(nparts) % len(log_weights)
+        with np.errstate(invalid='ignore'):
+            for _ in range(self.iterations):
+                proposal = self.random_state.choice(len(log_weights), size=nparts)
+                accept = np.log(self.random_state.uniform(0, 1, size=nparts)) \
+                    <= log_weights[proposal] - log_weights[index]
+                index[accept] = proposal[accept]
+        return index
+
+
+class RejectionResampler(ParticleResampler):
+    """Rejection resampler
+
+    Selects each particle by rejection sampling, as proposed in [1]_. Other than the maximum
+    log weight (which can be provided as :attr:`max_log_weight` if a bound is known), this
+    requires no collective operation over all particles, so each new particle can be selected
+    independently (e.g. over chunks of particles in parallel).
+
+    Unlike :class:`~.MetropolisResampler` this is unbiased, but the expected number of
+    iterations grows with the ratio of maximum to mean weight, so it is only suitable where
+    weights are not degenerate.
+
+    References
+    ----------
+    .. [1] Murray L.M., Lee A., Jacob P.E., 2016, Parallel Resampling in the Particle Filter,
+       Journal of Computational and Graphical Statistics, 25(3), 789-805.
+    """
+    max_log_weight: float = Property(
+        default=None,
+        doc="Upper bound on log weights. Default `None` where maximum log weight is used.")
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = Property(
+        default=None,
+        doc="Seed for random number generation. Default `None` where NumPy's global random "
+            "state is used.")
+
+    def resample_indices(self, log_weights, nparts=None):
+        log_weights = np.asarray(log_weights, dtype=np.float_)
+        if nparts is None:
+            nparts = len(log_weights)
+        if self.max_log_weight is None:
+            max_log_weight = np.max(log_weights)
+        else:
+            max_log_weight = self.max_log_weight
+        if not np.isfinite(max_log_weight):
+            # No particle could ever be accepted
+            raise ValueError("Maximum log weight must be finite")
+        index = np.arange(nparts) % len(log_weights)
+        rejected = np.arange(nparts)
+        while len(rejected):
+            accept = np.log(self.random_state.uniform(0, 1, size=len(rejected))) \
+                <= log_weights[index[rejected]] - max_log_weight
+            rejected = rejected[~accept]
+            index[rejected] = self.random_state.choice(len(log_weights), size=len(rejected))
+        return index
@@ -1,8 +1,11 @@
 import numpy as np
+import pytest
 
 from ...types.particle import Particle
 from ...types.state import ParticleState
-from ..particle import SystematicResampler
+from ..particle import (
+    SystematicResampler, StratifiedResampler, MultinomialResampler, ResidualResampler,
+    MetropolisResampler, RejectionResampler)
 from ..particle import ESSResampler
 
 
@@ -110,3 +113,128 @@ def test_ess_empty_threshold():
     resampler = ESSResampler()
     resampler.resample(particles)
     assert resampler.threshold == 5
+
+
+def test_systematic_segments():
+    log_weights = np.log(np.concatenate([
+        np.full(20, 1/20),  # Equal weights
+        [0, 0, 1, 0, 0],  # All weight on single particle
+        np.full(3, 1),  # Unnormalised weights
+    ]))
+    offsets = np.array([0, 20, 25])
+
+    index, new_log_weights = SystematicResampler.resample_segments(log_weights, offsets)
+
+    assert np.array_equal(index[:20], np.arange(20))
+    assert np.all(index[20:25] == 22)
+    assert np.array_equal(index[25:], np.arange(25, 28))
+    assert np.allclose(new_log_weights[:20], np.log(1/20))
+    assert np.allclose(new_log_weights[20:25], np.log(1/5))
+    assert np.allclose(new_log_weights[25:], np.log(1/3))
+
+    # Each particle should get copies within one of expected number, in its own segment
+    weights = np.concatenate([np.random.dirichlet(np.ones(n)) for n in (100, 50, 1)])
+    offsets = np.array([0, 100, 150])
+    index, _ = SystematicResampler.resample_segments(np.log(weights), offsets)
+    counts = np.bincount(index, minlength=151)
+    for start, stop in zip(offsets, (100, 150, 151)):
+        assert np.all((start <= index[start:stop]) & (index[start:stop] < stop))
+        assert np.all(np.abs(counts[start:stop] - (stop - start) * weights[start:stop]) < 1)
+
+
+def test_ess_resampler_instance():
+    particles = ParticleState(
+        None, particle_list=[Particle(np.array([[i]]), weight=1 if i == 3 else 0)
+                             for i in range(10)])
+    resampler = ESSResampler(resampler=StratifiedResampler())
+    new_particles = resampler.resample(particles)
+    assert np.all(new_particles.state_vector == 3)
+
+
+@pytest.fixture(params=[
+    SystematicResampler, StratifiedResampler, MultinomialResampler, ResidualResampler,
+    MetropolisResampler, RejectionResampler])
+def resampler(request):
+    return request.param()
+
+
+def test_resampler_single(resampler):
+    if isinstance(resampler, MetropolisResampler):
+        # Chains must be long enough to find the single particle
+        resampler.iterations = 1000
+    log_weights = np.full(20, -np.inf)
+    log_weights[10] = 0
+    for nparts in (None, 10, 40):
+        index = resampler.resample_indices(log_weights, nparts)
+        assert len(index) == (nparts or 20)
+        assert np.all(index == 10)
+
+
+def test_resampler_even(resampler):
+    particles = ParticleState(
+        None, particle_list=[Particle(np.array([[i]]), weight=1/10 if i % 2 == 0 else 0)
+                             for i in range(20)])
+    new_particles = resampler.resample(particles)
+    assert len(new_particles) == 20
+    assert np.all(new_particles.state_vector % 2 == 0)
+    assert np.allclose(new_particles.log_weight, np.log(1/20))
+
+
+def test_resampler_distribution(resampler):
+    np.random.seed(1990)
+    weights = np.array([0.1, 0.2, 0.3, 0.4])
+    index = resampler.resample_indices(np.log(weights), 100000)
+    assert np.allclose(np.bincount(index, minlength=4) / 100000, weights, atol=0.01)
+
+
+@pytest.mark.parametrize('resampler_class', [
+    SystematicResampler, StratifiedResampler, MultinomialResampler, ResidualResampler,
+    MetropolisResampler, RejectionResampler])
+def test_resampler_seed(resampler_class):
+    log_weights = np.log(np.random.dirichlet(np.ones(100)))
+    resampler = resampler_class(seed=1990)
+    assert isinstance(resampler.random_state, np.random.Generator)
+    index = resampler.resample_indices(log_weights)
+    # Independent of global random state
+    np.random.seed(1)
+    assert np.array_equal(resampler_class(seed=1990).resample_indices(log_weights), index)
+    assert np.array_equal(
+        resampler_class(seed=np.random.default_rng(1990)).resample_indices(log_weights), index)
+    # Stream continues, rather than repeats
+    assert any(
+        not np.array_equal(resampler.resample_indices(log_weights), index) for _ in range(5))
+
+
+def test_resample_segments_random_state():
+    log_weights = np.log(np.random.dirichlet(np.ones(30)))
+    offsets = [0, 10, 25]
+    resampler = SystematicResampler(seed=1990)
+    index, _ = resampler.resample_segments(
+        log_weights, offsets, random_state=resampler.random_state)
+    np.random.seed(1)
+    index2, _ = SystematicResampler.resample_segments(
+        log_weights, offsets, random_state=np.random.default_rng(1990))
+    assert np.array_equal(index, index2)
+
+
+@pytest.mark.parametrize('resampler_class', [
+    SystematicResampler, StratifiedResampler, ResidualResampler])
+def test_resampler_low_variance(resampler_class):
+    # Each particle should get copies within one of expected number
+    weights = np.random.dirichlet(np.ones(100))
+    counts = np.bincount(
+        resampler_class().resample_indices(np.log(weights)), minlength=100)
+    assert np.sum(counts) == 100
+    if resampler_class is SystematicResampler:
+        assert np.all(np.abs(counts - 100 * weights) < 1)
+    else:
+        assert np.all(counts >= np.floor(100 * weights)
+                      - (resampler_class is StratifiedResampler))
+
+
+@pytest.mark.parametrize('max_log_weight', [None, np.nan, np.inf, -np.inf])
+def test_rejection_resampler_invalid(max_log_weight):
+    resampler = RejectionResampler(max_log_weight=max_log_weight)
+    log_weights = np.full(10, -np.inf) if max_log_weight is None else np.zeros(10)
+    with pytest.raises(ValueError, match="must be finite"):
+        resampler.resample_indices(log_weights)
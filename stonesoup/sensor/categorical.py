@@ -1,5 +1,3 @@
-from scipy.stats import multinomial
-
 from ..base import Property
 from ..models.measurement.categorical import MarkovianMeasurementModel
 from ..sensor.sensor import Sensor
@@ -49,6 +47,7 @@ class HMMSensor(Sensor):
             calculated from. Each measurement stores the ground truth path that it was produced
             from.
         """
+        from scipy.stats import multinomial
 
         detections = set()
 
@@ -28,6 +28,20 @@ For example:
     )
 
 
+For large data volumes, such as long tracks or big arrays, a compact
+encoding can be enabled with the `compact_arrays` and `compact_states`
+arguments of :class:`~.stonesoup.serialise.YAML`. Arrays are then stored as
+base64 encoded binary blocks (along with their dtype and shape), and
+sequences of states of the same type within a :class:`~.StateMutableSequence`
+are stored column-wise, with state vectors and covariances stacked into
+single arrays. Files written with either encoding can be loaded by any
+:class:`~.stonesoup.serialise.YAML` instance, regardless of options.
+
+.. code-block:: python
+
+    yaml = YAML(compact_arrays=True, compact_states=True)
+    yaml.dump(track, file)
+
 .. _YAML: http://yaml.org/
 .. _ruamel.yaml: https://yaml.readthedocs.io/
 """
@@ -40,14 +54,17 @@ from pathlib import Path
 from importlib import import_module
 
 import numpy as np
-import pkg_resources
 import ruamel.yaml
 from ruamel.yaml.constructor import ConstructorError
+from ruamel.yaml.nodes import MappingNode
 
+from ._metadata import entry_points
 from .base import Base, Property
 from .types.angle import Angle
 from .types.array import Matrix, StateVector
 from .types.numeric import Probability
+from .types.history import StateHistory
+from .types.state import StateMutableSequence
 from .sensor.sensor import Sensor
 
 __all__ = ['YAML']
@@ -56,7 +73,7 @@ typ = 'stonesoup'
 
 def init_typ(yaml):
     # Load additional custom serialisation
-    for entry_point in pkg_resources.iter_entry_points('stonesoup.serialise.yaml'):
+    for entry_point in entry_points('stonesoup.serialise.yaml'):
         try:
             entry_point.load()(yaml)
         except (ImportError, ModuleNotFoundError) as e:
@@ -79,6 +96,8 @@ def init_typ(yaml):
     # deque
     yaml.representer.add_representer(deque, deque_to_yaml)
     yaml.constructor.add_constructor("!collections.deque", deque_from_yaml)
+    # State history, stored as list of all states
+    yaml.representer.add_representer(StateHistory, state_history_to_yaml)
     # Probability
     yaml.representer.add_representer(Probability, probability_to_yaml)
     yaml.constructor.add_constructor(yaml_tag(Probability), probability_from_yaml)
@@ -91,15 +110,40 @@ def init_typ(yaml):
     yaml.representer.add_multi_representer(Matrix, ndarray_to_yaml)
     yaml.constructor.add_multi_constructor('!stonesoup.types.array.', array_from_yaml)
 
+    # Compact state sequence
+    yaml.representer.add_representer(_BinaryArray, binary_array_to_yaml)
+    yaml.representer.add_representer(_StateColumns, states_to_yaml)
+    yaml.constructor.add_constructor(_StateColumns.yaml_tag, states_from_yaml)
+
     # Declarative classes
     yaml.representer.add_multi_representer(Base, declarative_to_yaml)
     yaml.constructor.add_multi_constructor('!stonesoup.', declarative_from_yaml)
 
 
 class YAML(ruamel.yaml.YAML):
-    """Class for YAML serialisation in Stone Soup."""
-
-    def __init__(self, **kwargs):
+    """Class for YAML serialisation in Stone Soup.
+
+    Parameters
+    ----------
+    compact_arrays : bool, optional
+        If `True`, arrays with at least :attr:`compact_array_min_size` elements
+        are stored as base64 encoded binary, rather than nested lists. Default
+        `False`.
+    compact_states : bool, optional
+        If `True`, states in a :class:`~.StateMutableSequence` which are all of
+        the same type are stored column-wise, with array properties stacked and
+        stored as binary. Note that this means references (anchors) to these
+        individual states will not be maintained. Default `False`.
+    \\*\\*kwargs
+        Keyword arguments passed to :class:`ruamel.yaml.YAML`.
+    """
+    compact_array_min_size = 16
+    """Minimum number of elements in an array for it to be stored as binary, when
+    :attr:`compact_arrays` is enabled."""
+
+    def __init__(self, *, compact_arrays=False, compact_states=False, **kwargs):
+        self.compact_arrays = compact_arrays
+        self.compact_states = compact_states
         typ = kwargs.pop('typ', ['rt'])
         if isinstance(typ, str):
             typ = [typ]
@@ -131,16 +175,22 @@ def declarative_to_yaml(representer, node):
 
     Store as mapping of declared properties, skipping any which are the
     default value."""
-    node_properties = OrderedDict(type(node).properties)
+    node_properties = type(node).properties
     # Special case of a sensor with a default platform
     if isinstance(node, Sensor) and node._has_internal_controller:
+        node_properties = OrderedDict(node_properties)
         node_properties['position'] = Property(StateVector)
         node_properties['orientation'] = Property(StateVector)
-    return representer.represent_omap(
-        yaml_tag(type(node)),
-        OrderedDict((name, getattr(node, name))
-                    for name, property_ in node_properties.items()
-                    if getattr(node, name) is not property_.default))
+    data = OrderedDict()
+    for name, property_ in node_properties.items():
+        value = getattr(node, name)
+        if value is not property_.default:
+            data[name] = value
+    if isinstance(node, StateMutableSequence) and _compact_option(representer, 'compact_states'):
+        states = data.get('states')
+        if _StateColumns.is_compactable(states):
+            data['states'] = _StateColumns(states)
+    return representer.represent_omap(yaml_tag(type(node)), data)
 
 
 def declarative_from_yaml(constructor, tag_suffix, node):
@@ -202,8 +252,49 @@ def angle_from_yaml(constructor, tag_suffix, node):
     return class_(float(constructor.construct_scalar(node)))
 
 
+def _compact_option(representer, name):
+    return getattr(representer.dumper, name, False)
+
+
+def _construct_mapping(constructor, node):
+    # Generic across constructor types, as round trip constructor's
+    # `construct_mapping` has a different signature
+    return {
+        constructor.construct_object(key_node, deep=True):
+            constructor.construct_object(value_node, deep=True)
+        for key_node, value_node in node.value}
+
+
+def _is_binary_compatible(array):
+    return array.dtype.kind in 'biufc'
+
+
+def _binary_ndarray_to_yaml(representer, tag, node):
+    shape = list(node.shape)
+    if 'rt' in representer.dumper.typ:
+        shape = representer.dumper.seq(shape)
+        shape.fa.set_flow_style()
+    return representer.represent_mapping(tag, {
+        'dtype': node.dtype.str,
+        'shape': shape,
+        'data': np.ascontiguousarray(node).tobytes()})
+
+
+def _binary_ndarray_from_yaml(constructor, node):
+    mapping = _construct_mapping(constructor, node)
+    return np.frombuffer(mapping['data'], dtype=np.dtype(mapping['dtype'])) \
+        .reshape(mapping['shape']).copy()
+
+
 def ndarray_to_yaml(representer, node):
-    """Convert numpy.ndarray to YAML."""
+    """Convert numpy.ndarray to YAML.
+
+    If :attr:`YAML.compact_arrays` is enabled, large numeric arrays will be
+    stored as binary, along with dtype and shape."""
+    if _compact_option(representer, 'compact_arrays') \
+            and node.size >= representer.dumper.compact_array_min_size \
+            and _is_binary_compatible(node):
+        return _binary_ndarray_to_yaml(representer, yaml_tag(type(node)), node)
 
     # If using "round trip" type, change flow style to make more readable
     if node.ndim > 1 and 'rt' in representer.dumper.typ:
@@ -216,15 +307,104 @@ def ndarray_to_yaml(representer, node):
 
 def ndarray_from_yaml(constructor, node):
     """Convert YAML to numpy.ndarray."""
+    if isinstance(node, MappingNode):
+        return _binary_ndarray_from_yaml(constructor, node)
     return np.array(constructor.construct_sequence(node, deep=True))
 
 
 def array_from_yaml(constructor, tag_suffix, node):
     """Convert YAML to numpy.ndarray."""
     class_ = get_class(f'!stonesoup.types.array.{tag_suffix}')
+    if isinstance(node, MappingNode):
+        return class_(_binary_ndarray_from_yaml(constructor, node))
     return class_(constructor.construct_sequence(node, deep=True))
 
 
+class _BinaryArray:
+    """Array which is always stored as binary, irrespective of options."""
+
+    def __init__(self, array):
+        self.array = array
+
+
+def binary_array_to_yaml(representer, node):
+    return _binary_ndarray_to_yaml(representer, "!numpy.ndarray", node.array)
+
+
+class _StateColumns:
+    """Column-wise representation of a homogeneous sequence of states.
+
+    Array properties with consistent shape and numeric dtype are stacked
+    (first axis being the state index), properties which are default for all
+    states are omitted, and any other properties are stored as lists."""
+    yaml_tag = "!stonesoup.serialise.states"
+
+    def __init__(self, states):
+        self.states = states
+
+    @staticmethod
+    def is_compactable(states):
+        if not isinstance(states, list) or not states:
+            return False
+        state_type = type(states[0])
+        return isinstance(states[0], Base) and all(
+            type(state) is state_type for state in states)
+
+
+def states_to_yaml(representer, node):
+    """Convert a homogeneous list of states to YAML, stored column-wise."""
+    states = node.states
+    state_type = type(states[0])
+    array_types = {}
+    arrays = {}
+    values = {}
+    for name, property_ in state_type.properties.items():
+        column = [getattr(state, name) for state in states]
+        if all(value is property_.default for value in column):
+            continue
+        first = column[0]
+        if isinstance(first, np.ndarray) and _is_binary_compatible(first) and all(
+                type(value) is type(first)
+                and value.shape == first.shape
+                and value.dtype == first.dtype
+                for value in column):
+            if isinstance(first, Matrix):
+                array_types[name] = yaml_tag(type(first))[1:]
+            arrays[name] = np.stack(column).view(np.ndarray)
+        else:
+            values[name] = column
+    data = {'type': yaml_tag(state_type)[1:], 'length': len(states)}
+    if array_types:
+        data['array_types'] = array_types
+    if arrays:
+        data['arrays'] = {name: _BinaryArray(array) for name, array in arrays.items()}
+    if values:
+        data['values'] = values
+    return representer.represent_mapping(_StateColumns.yaml_tag, data)
+
+
+def states_from_yaml(constructor, node):
+    """Convert YAML to list of states, from column-wise storage."""
+    data = _construct_mapping(constructor, node)
+    try:
+        state_type = get_class(f"!{data['type']}")
+    except ImportError:
+        raise ConstructorError(
+            "while constructing Stone Soup states", node.start_mark,
+            f"unable to import component {data['type']!r}", node.start_mark)
+    columns = {}
+    array_types = data.get('array_types', {})
+    for name, array in data.get('arrays', {}).items():
+        if name in array_types:
+            array_class = get_class(f"!{array_types[name]}")
+            columns[name] = [array_class(element) for element in array]
+        else:
+            columns[name] = list(array)
+    columns.update(data.get('values', {}))
+    return [state_type(**{name: column[index] for name, column in columns.items()})
+            for index in range(data['length'])]
+
+
 def timedelta_to_yaml(representer, node):
     """Convert datetime.timedelta to YAML.
 
@@ -262,3 +442,8 @@ def deque_from_yaml(constructor, node):
     """Convert YAML to collections.deque"""
     iterable, maxlen = constructor.construct_sequence(node, deep=True)
     return deque(iterable, maxlen)
+
+
+def state_history_to_yaml(representer, node):
+    """Convert StateHistory to YAML, as a list of all states"""
+    return representer.represent_list(list(node))
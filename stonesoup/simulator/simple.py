@@ -235,7 +235,7 @@ class SimpleDetectionSimulator(DetectionSimulator):
         """
         Checks if a measurement is in the state space
         """
-        for dim in range(self.meas_range.ndim):
+        for dim in range(len(self.meas_range)):
             if not self.meas_range[dim][0] <= detection.state_vector[dim] \
                                             <= self.meas_range[dim][-1]:
                 return False
@@ -3,6 +3,7 @@ import datetime
 import pytest
 import numpy as np
 
+from ...models.measurement.linear import LinearGaussian
 from ...types.state import State
 from ..simple import SimpleDetectionSimulator, SwitchDetectionSimulator,\
     SingleTargetGroundTruthSimulator, SwitchOneTargetGroundTruthSimulator
@@ -57,6 +58,21 @@ def test_simple_detection_simulator(
             assert sv in state_vectors2
 
 
+def test_simple_detection_simulator_1d(transition_model1, timestep):
+    initial_state = State(
+        np.array([[0], [0], [0], [0]]), timestamp=datetime.datetime.now())
+    groundtruth = SingleTargetGroundTruthSimulator(
+        transition_model1, initial_state, timestep)
+    measurement_model = LinearGaussian(4, [0], np.array([[1]]))
+    meas_range = np.array([[-1, 1]]) * 5000
+    simulate_detections = SimpleDetectionSimulator(
+        groundtruth, measurement_model, meas_range, clutter_rate=3)
+
+    for _, detections in simulate_detections:
+        for detection in simulate_detections.clutter_detections:
+            assert meas_range[0, 0] <= detection.state_vector[0] <= meas_range[0, 1]
+
+
 def test_switch_detection_simulator(
         transition_model1, transition_model2, measurement_model, timestep):
     initial_state = State(
@@ -11,7 +11,7 @@ from ..types.update import Update, GaussianStateUpdate
 from ..models.base import LinearModel
 from ..models.transition.base import TransitionModel
 from ..models.transition.linear import LinearGaussianTransitionModel
-from ..functions import gauss2sigma, unscented_transform
+from ..functions import gauss2sigma_state, unscented_transform
 
 
 class KalmanSmoother(Smoother):
@@ -285,12 +285,12 @@ class UnscentedKalmanSmoother(KalmanSmoother):
             time_interval=time_interval)
 
         # Get the sigma points from the mean and covariance.
-        sigma_point_states, mean_weights, covar_weights = gauss2sigma(
+        sigma_points_state, mean_weights, covar_weights = gauss2sigma_state(
             state, self.alpha, self.beta, self.kappa)
 
         # Use the unscented transform to return the cross-covariance
         _, _, cross_covar, _, _, _ = unscented_transform(
-            sigma_point_states, mean_weights, covar_weights,
+            sigma_points_state, mean_weights, covar_weights,
             transition_function)
 
         return cross_covar @ np.linalg.inv(prediction.covar)
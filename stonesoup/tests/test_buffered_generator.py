@@ -1,3 +1,5 @@
+import pytest
+
 from stonesoup.buffered_generator import BufferedGenerator
 
 
@@ -18,3 +20,19 @@ def test_buffering():
     test = TestBuffer()
     for expected, actual in zip(range(10), (test.current for _ in test)):
         assert expected == actual
+
+
+def test_generator_method_resolved_per_class():
+    class TestSubBuffer(TestBuffer):
+        @BufferedGenerator.generator_method
+        def create_more_numbers(self):
+            yield from range(10, 20)
+
+    assert list(TestBuffer()) == list(range(10))
+    assert list(TestSubBuffer()) == list(range(10, 20))
+    assert list(TestBuffer()) == list(range(10))
+
+
+def test_generator_method_undefined():
+    with pytest.raises(AttributeError, match="Generator method undefined"):
+        iter(BufferedGenerator()).__next__()
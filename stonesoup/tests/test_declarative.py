@@ -1,8 +1,9 @@
+from collections import OrderedDict
 from typing import List, Any
 
 import pytest
 
-from ..base import Property, Base
+from ..base import Property, Base, clearable_cached_property
 
 
 def test_properties(base):
@@ -257,6 +258,53 @@ def test_readonly_subclass():
         test_object_default.readonly_property_default = 20
 
 
+def test_initialiser():
+    class TestInitialiser(Base):
+        property_a: int = Property()
+        property_b: int = Property(default=2)
+        property_c: int = Property(default=3, readonly=True)
+
+        @property_b.setter
+        def property_b(self, value):
+            if value < 0:
+                raise TypeError("property_b must be positive")
+            self._property_property_b = value * 10
+
+    assert TestInitialiser._initialiser is None
+    test_object = TestInitialiser(1, property_c=4)
+    assert TestInitialiser._initialiser
+    assert test_object.property_a == 1
+    assert test_object.property_b == 20  # Custom setter still used
+    assert test_object.property_c == 4
+    with pytest.raises(AttributeError):
+        test_object.property_c = 5
+
+    # Errors from setters are raised unaltered
+    with pytest.raises(TypeError, match="property_b must be positive"):
+        TestInitialiser(1, -1)
+
+    class TestReadonlySetEarly(TestInitialiser):
+        def __init__(self, *args, **kwargs):
+            self._property_property_c = 5
+            super().__init__(*args, **kwargs)
+
+    # Falls back to standard property handling, so readonly respected
+    with pytest.raises(AttributeError, match="property_c is readonly"):
+        TestReadonlySetEarly(1)
+
+
+@pytest.mark.parametrize('name', ['class', 'lambda', '_base_dict', 'not-identifier'])
+def test_initialiser_invalid_names(monkeypatch, name):
+    class TestInitialiserNames(Base):
+        property_a: int = Property()
+
+    # Not valid parameter names of generated function, so initialiser not generated
+    properties = OrderedDict(TestInitialiserNames._properties)
+    properties[name] = Property(default=None)
+    monkeypatch.setattr(TestInitialiserNames, '_properties', properties)
+    assert TestInitialiserNames._generate_initialiser() is False
+
+
 def test_readonly_with_getter():
 
     class TestReadonly(Base):
@@ -362,3 +410,20 @@ def test_type_hint_checking():
     class TestClass(Base):
         i = Property(Any, doc='Test')
     _ = TestClass(i=1)
+
+
+def test_clearable_cached_property_redefined():
+    class TestClass(Base):
+        a: int = Property()
+
+        @clearable_cached_property('a')
+        def double(self):
+            return self.a * 2
+
+    class TestSubClass(TestClass):
+        a: int = Property(doc="Redefined")
+
+    test_object = TestSubClass(1)
+    assert test_object.double == 2
+    test_object.a = 2
+    assert test_object.double == 4
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+# Modules for a typical tracking pipeline, which shouldn't require the heavy optional
+# dependencies to be imported
+PIPELINE_MODULES = [
+    'stonesoup.dataassociator.neighbour',
+    'stonesoup.dataassociator.tree',
+    'stonesoup.deleter.time',
+    'stonesoup.feeder.time',
+    'stonesoup.hypothesiser.distance',
+    'stonesoup.hypothesiser.probability',
+    'stonesoup.initiator.simple',
+    'stonesoup.models.measurement.nonlinear',
+    'stonesoup.models.transition.linear',
+    'stonesoup.plugins',
+    'stonesoup.predictor.kalman',
+    'stonesoup.simulator.simple',
+    'stonesoup.tracker.simple',
+    'stonesoup.updater.kalman',
+]
+DEFERRED_MODULES = ['matplotlib', 'pkg_resources', 'rtree', 'ruamel.yaml', 'scipy.stats']
+
+
+def test_deferred_imports():
+    # Run in new interpreter, as modules likely already imported by other tests
+    code = "import sys\n" \
+        + "".join(f"import {module}\n" for module in PIPELINE_MODULES) \
+        + f"print(*(module for module in {DEFERRED_MODULES!r} if module in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, '-c', code], check=True, stdout=subprocess.PIPE, universal_newlines=True)
+    assert result.stdout.split() == []
@@ -0,0 +1,171 @@
+import csv
+import datetime
+import json
+from functools import lru_cache
+
+import pytest
+
+from ..base import Base, Property
+from ..dataassociator.neighbour import NearestNeighbour
+from ..hypothesiser import Hypothesiser
+from ..instrumentation import (
+    ScanRecord, NULL_RECORD, active_record, ScanProfiler, RingBufferSink, CallbackSink,
+    JSONLinesSink, CSVSink)
+from ..models.base import ModelCache
+from ..types.detection import Detection, MissedDetection
+from ..types.hypothesis import SingleDistanceHypothesis
+from ..types.multihypothesis import MultipleHypothesis
+from ..types.prediction import StatePrediction
+from ..types.state import State
+from ..types.track import Track
+
+
+def test_scan_record():
+    record = ScanRecord()
+    assert active_record() is None
+    with record.activate():
+        assert active_record() is record
+        inner_record = ScanRecord()
+        with inner_record.activate():
+            assert active_record() is inner_record
+        assert active_record() is record
+
+        record.mark('read')
+        record.add('hypothesise', 10.)
+        record.mark('assign')
+        record.count('hypotheses', 3)
+        record.count('hypotheses')
+    assert active_record() is None
+
+    assert set(record.stage_times) == {'read', 'hypothesise', 'assign'}
+    assert record.stage_times['hypothesise'] == 10.
+    # Nested time excluded from stage marked
+    assert record.stage_times['assign'] < 0
+    assert record.counts == {'hypotheses': 4}
+
+    other_record = ScanRecord()
+    other_record.stage_times['read'] = 1.
+    other_record.count('hypotheses', 2)
+    record.merge(other_record)
+    assert record.stage_times['read'] >= 1.
+    assert record.counts == {'hypotheses': 6}
+
+    record.finish(datetime.datetime(2020, 1, 1), tracks=5)
+    assert record.timestamp == datetime.datetime(2020, 1, 1)
+    assert record.counts['tracks'] == 5
+
+
+def test_null_scan_record():
+    with NULL_RECORD as record:
+        with record.activate():
+            assert active_record() is None
+        record.mark('read')
+        record.add('hypothesise', 1.)
+        record.count('tracks', 1)
+        record.merge(ScanRecord())
+        record.finish(datetime.datetime(2020, 1, 1), tracks=1)
+
+
+class _CachedComponent(Base):
+    sub_components: list = Property(default=None)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._model_cache = ModelCache()
+
+    @lru_cache()
+    def cached(self, value):
+        return value
+
+
+def test_scan_profiler():
+    records = []
+    sub_component = _CachedComponent()
+    component = _CachedComponent([sub_component])
+    profiler = ScanProfiler(
+        sinks=[RingBufferSink(maxlen=2), CallbackSink(records.append)], deadline=10.)
+
+    for n in range(3):
+        with profiler.scan(component) as record:
+            assert active_record() is record
+            record.mark('read')
+            component.cached(n)
+            component.cached(n)  # Hit
+            sub_component._model_cache.get(n, lambda: None)
+            sub_component._model_cache.get(n, lambda: None)  # Hit
+            record.mark('update')
+            record.finish(datetime.datetime(2020, 1, 1, 0, 0, n), tracks=n)
+
+    assert len(records) == 3
+    assert list(profiler.sinks[0].records) == records[1:]
+    record = records[-1]
+    assert record['timestamp'] == datetime.datetime(2020, 1, 1, 0, 0, 2)
+    assert record['tracks'] == 2
+    assert record['cache_hits'] == 2
+    assert record['overrun'] is False
+    assert record['slowest_stage'] in {'read', 'update'}
+    assert record['total'] >= record['read'] + record['update']
+
+    # Not written if exception (e.g. end of detections) or not finished
+    with pytest.raises(StopIteration):
+        with profiler.scan(component) as record:
+            raise StopIteration
+    with profiler.scan(component) as record:
+        record.mark('read')
+    assert len(records) == 3
+
+    # Default sink
+    assert isinstance(ScanProfiler().sinks[0], RingBufferSink)
+
+
+def test_file_sinks(tmpdir):
+    records = [
+        {'timestamp': datetime.datetime(2020, 1, 1), 'read': 0.5, 'tracks': 1},
+        {'timestamp': datetime.datetime(2020, 1, 1, 0, 0, 1), 'read': 0.25, 'tracks': 2,
+         'new': 1}]
+
+    with ScanProfiler(sinks=[JSONLinesSink(tmpdir.join('profile.jsonl')),
+                             CSVSink(str(tmpdir.join('profile.csv')))]) as profiler:
+        for record in records:
+            for sink in profiler.sinks:
+                sink.write(record)
+
+    with open(tmpdir.join('profile.jsonl')) as file:
+        lines = [json.loads(line) for line in file]
+    assert lines[0] == {'timestamp': '2020-01-01T00:00:00', 'read': 0.5, 'tracks': 1}
+    assert lines[1]['new'] == 1
+
+    with open(tmpdir.join('profile.csv'), newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0] == {'timestamp': '2020-01-01T00:00:00', 'read': '0.5', 'tracks': '1'}
+    assert rows[1] == {'timestamp': '2020-01-01T00:00:01', 'read': '0.25', 'tracks': '2'}
+
+
+def test_profile_hypotheses():
+    class TestHypothesiser(Hypothesiser):
+        def hypothesise(self, track, detections, timestamp):
+            prediction = StatePrediction(track.state_vector, timestamp=timestamp)
+            return MultipleHypothesis(
+                [SingleDistanceHypothesis(prediction, MissedDetection(timestamp=timestamp), 10)]
+                + [SingleDistanceHypothesis(prediction, detection, 1)
+                   for detection in detections])
+
+    timestamp = datetime.datetime(2020, 1, 1)
+    tracks = {Track([State([[0]], timestamp)]) for _ in range(3)}
+    detections = {Detection([[0]], timestamp) for _ in range(2)}
+    associator = NearestNeighbour(TestHypothesiser())
+
+    record = ScanRecord()
+    with record.activate():
+        with record.associating():
+            assert record.is_associating
+            associator.associate(tracks, detections, timestamp)
+        assert not record.is_associating
+        record.mark('assign')
+        # Other uses (e.g. by an initiator) not recorded
+        associator.associate(tracks, detections, timestamp)
+    assert record.counts['hypotheses'] == 9
+    assert record.stage_times['hypothesise'] > 0
+
+    # No record active
+    assert len(associator.associate(tracks, detections, timestamp)) == 3
@@ -0,0 +1,132 @@
+import datetime
+import math
+
+import numpy as np
+import pytest
+
+from ..dataassociator.neighbour import GNNWith2DAssignment
+from ..deleter.time import UpdateTimeStepsDeleter
+from ..hypothesiser.distance import DistanceHypothesiser
+from ..initiator.simple import SimpleMeasurementInitiator
+from ..measures import Mahalanobis
+from ..metricgenerator.basicmetrics import BasicMetrics
+from ..metricgenerator.manager import SimpleManager
+from ..models.measurement.linear import LinearGaussian
+from ..models.transition.linear import (
+    CombinedLinearGaussianTransitionModel, ConstantVelocity)
+from ..montecarlo import MonteCarloResult, MonteCarloRunner
+from ..predictor.kalman import KalmanPredictor
+from ..serialise import YAML
+from ..simulator.simple import MultiTargetGroundTruthSimulator, SimpleDetectionSimulator
+from ..tracker.simple import MultiTargetTracker
+from ..types.state import GaussianState
+from ..updater.kalman import KalmanUpdater
+
+
+@pytest.fixture
+def configuration():
+    transition_model = CombinedLinearGaussianTransitionModel(
+        [ConstantVelocity(0.05), ConstantVelocity(0.05)])
+    measurement_model = LinearGaussian(4, (0, 2), np.diag([0.5, 0.5]))
+    groundtruth_sim = MultiTargetGroundTruthSimulator(
+        transition_model=transition_model,
+        initial_state=GaussianState(
+            [[0], [0], [0], [0]], np.diag([100, 1, 100, 1]),
+            timestamp=datetime.datetime(2020, 1, 1)),
+        timestep=datetime.timedelta(seconds=1),
+        number_steps=10,
+        birth_rate=0.3,
+        death_probability=0.05,
+        seed=1)
+    detection_sim = SimpleDetectionSimulator(
+        groundtruth=groundtruth_sim,
+        measurement_model=measurement_model,
+        meas_range=np.array([[-50, 50], [-50, 50]]),
+        detection_probability=0.9,
+        clutter_rate=2,
+        seed=1)
+    predictor = KalmanPredictor(transition_model)
+    updater = KalmanUpdater(measurement_model)
+    hypothesiser = DistanceHypothesiser(predictor, updater, Mahalanobis(), missed_distance=3)
+    tracker = MultiTargetTracker(
+        initiator=SimpleMeasurementInitiator(
+            GaussianState([[0], [0], [0], [0]], np.diag([0, 1, 0, 1])), measurement_model),
+        deleter=UpdateTimeStepsDeleter(2),
+        detector=detection_sim,
+        data_associator=GNNWith2DAssignment(hypothesiser),
+        updater=updater)
+    return {
+        'tracker': tracker,
+        'groundtruth': groundtruth_sim,
+        'metric_manager': SimpleManager([BasicMetrics()])}
+
+
+def test_montecarlo_runner(configuration):
+    runner = MonteCarloRunner(configuration, seeds=range(4), processes=0)
+    # Configuration serialised
+    assert isinstance(runner.configuration, str)
+    assert YAML().load(runner.configuration).keys() == configuration.keys()
+
+    results = list(runner.run())
+    assert [result.seed for result in results] == [0, 1, 2, 3]
+    assert all(not result.cached for result in results)
+    assert results[0].metrics.keys() == {
+        'Number of targets', 'Number of tracks', 'Track-to-target ratio'}
+    # Independent random streams for each seed, despite fixed seeds in configuration
+    assert len({result.metrics['Number of tracks'] for result in results}) > 1
+
+    # Same results regardless of process, or order run in
+    runner = MonteCarloRunner(configuration, seeds=[3, 1], processes=2)
+    parallel_results = {result.seed: result.metrics for result in runner.run()}
+    assert parallel_results == {1: results[1].metrics, 3: results[3].metrics}
+
+
+def test_montecarlo_runner_cache(configuration, tmpdir):
+    cache_path = tmpdir.join('results')
+    runner = MonteCarloRunner(configuration, seeds=range(3), processes=0, cache_path=cache_path)
+    results = {result.seed: result for result in runner.run()}
+    assert len(cache_path.listdir()) == 3
+    assert all(
+        path.basename.startswith(runner.configuration_hash) for path in cache_path.listdir())
+
+    # Resume, with one result missing, and additional seed
+    cache_path.join(f'{runner.configuration_hash}-1.json').remove()
+    runner = MonteCarloRunner(configuration, seeds=range(4), processes=0, cache_path=cache_path)
+    resumed_results = {result.seed: result for result in runner.run()}
+    assert {seed for seed, result in resumed_results.items() if result.cached} == {0, 2}
+    assert {seed: result.metrics for seed, result in resumed_results.items() if seed < 3} \
+        == {seed: result.metrics for seed, result in results.items()}
+
+    # Different configuration doesn't use cached results
+    configuration['tracker'].deleter.time_steps_since_update = 3
+    runner = MonteCarloRunner(configuration, seeds=range(4), processes=0, cache_path=cache_path)
+    assert not any(result.cached for result in runner.run())
+
+
+def test_montecarlo_aggregate(configuration):
+    runner = MonteCarloRunner(configuration, seeds=[], confidence=0.9)
+    summaries = runner.aggregate([
+        MonteCarloResult(0, {'a': 1., 'b': 2.}),
+        MonteCarloResult(1, {'a': 2.}),
+        MonteCarloResult(2, {'a': 6.}),
+    ])
+    summary = summaries['a']
+    assert summary.num_runs == 3
+    assert summary.mean == pytest.approx(3)
+    assert summary.std == pytest.approx(math.sqrt(7))
+    # t-distribution 0.95 quantile, 2 degrees of freedom
+    half_width = 2.919986 * math.sqrt(7) / math.sqrt(3)
+    assert summary.lower == pytest.approx(3 - half_width)
+    assert summary.upper == pytest.approx(3 + half_width)
+
+    summary = summaries['b']
+    assert summary.num_runs == 1
+    assert summary.mean == 2
+    assert math.isnan(summary.lower) and math.isnan(summary.upper)
+
+
+def test_montecarlo_runner_errors(configuration):
+    with pytest.raises(ValueError, match="must be a mapping with 'tracker' and 'metric_manager'"):
+        MonteCarloRunner({'tracker': configuration['tracker']}, seeds=range(2))
+    with pytest.raises(ValueError, match="seeds must be non-negative"):
+        MonteCarloRunner(configuration, seeds=[-1])
@@ -0,0 +1,49 @@
+import sys
+import types
+
+import pytest
+
+try:
+    from importlib.metadata import EntryPoint
+except ImportError:  # Python 3.7
+    from importlib_metadata import EntryPoint
+
+from .. import _metadata, plugins
+
+
+@pytest.fixture
+def plugin_module(monkeypatch):
+    module = types.ModuleType('my_package')
+    module.value = 1
+    monkeypatch.setitem(sys.modules, 'my_package', module)
+    entry_point = EntryPoint(name='my_plugin', value='my_package', group='stonesoup.plugins')
+    monkeypatch.setattr(plugins, '_plugin_entry_points', lambda: {'my_plugin': entry_point})
+    yield module
+    sys.modules.pop('stonesoup.plugins.my_plugin', None)
+    plugins.__dict__.pop('my_plugin', None)
+
+
+def test_plugin_import(plugin_module):
+    assert 'stonesoup.plugins.my_plugin' not in sys.modules
+
+    from stonesoup.plugins.my_plugin import value
+    assert value == 1
+    assert sys.modules['stonesoup.plugins.my_plugin'] is plugin_module
+    assert plugins.my_plugin is plugin_module
+    assert plugin_module.__name__ == 'my_package'
+
+
+def test_plugin_attribute(plugin_module):
+    assert 'my_plugin' in dir(plugins)
+    assert plugins.my_plugin is plugin_module
+
+    with pytest.raises(AttributeError):
+        plugins.not_a_plugin
+    with pytest.raises(ModuleNotFoundError):
+        import stonesoup.plugins.not_a_plugin  # noqa: F401
+
+
+def test_metadata():
+    assert isinstance(_metadata.entry_points('stonesoup.not_a_group'), tuple)
+    assert _metadata.version('not-a-stonesoup-distribution') is None
+    assert getattr(sys.modules['stonesoup'], '__version__', None) == _metadata.version('stonesoup')
@@ -171,6 +171,22 @@ def test_deque(base, serialised_file):
     assert new_instance == instance
 
 
+def test_state_history(serialised_file):
+    import datetime
+    from ..types.history import TrackHistoryPolicy
+    from ..types.state import GaussianState
+    from ..types.track import Track
+
+    timestamp = datetime.datetime(2023, 1, 1)
+    track = TrackHistoryPolicy(max_length=2).apply(Track([
+        GaussianState([[i]], [[1]], timestamp + datetime.timedelta(seconds=i))
+        for i in range(5)]))
+
+    new_track = serialised_file.load(serialised_file.dumps(track))
+    assert isinstance(new_track.states, list)
+    assert [state.timestamp for state in new_track] == [state.timestamp for state in track]
+
+
 def test_path(serialised_file):
     import pathlib
     import tempfile
@@ -302,3 +318,75 @@ def test_dump_all(tmpdir, serialised_file):
 
         for read_document, document in zip(read_documents, documents):
             assert read_document == document
+
+
+@pytest.mark.parametrize(
+    'instance',
+    [np.arange(20.).reshape(4, 5),
+     np.arange(32, dtype=np.int32),
+     Matrix(np.arange(20.).reshape(4, 5)),
+     StateVector(np.arange(20.)),
+     CovarianceMatrix(np.eye(4))],
+    ids=('ndarray', 'ndarray_int', 'Matrix', 'StateVector', 'CovarianceMatrix')
+)
+def test_compact_arrays(instance):
+    serialised_file = YAML(compact_arrays=True)
+    serialised_str = serialised_file.dumps(instance)
+    assert '!!binary' in serialised_str
+
+    # Should load with any instance
+    new_instance = YAML().load(serialised_str)
+    assert type(new_instance) is type(instance)
+    assert new_instance.dtype == instance.dtype
+    assert np.array_equal(instance, new_instance)
+    new_instance[0] = 1  # Writable
+
+
+def test_compact_arrays_small():
+    instance = StateVector([1, 2, 3])
+    serialised_str = YAML(compact_arrays=True).dumps(instance)
+    assert '!!binary' not in serialised_str
+    assert serialised_str == YAML().dumps(instance)
+
+
+def test_compact_states(serialised_file):
+    import datetime
+    from ..types.groundtruth import GroundTruthPath, GroundTruthState
+    from ..types.state import GaussianState
+    from ..types.track import Track
+
+    timestamp = datetime.datetime(2023, 1, 1)
+    track = Track([
+        GaussianState([[i], [i + 1]], np.diag([i + 1, 2.]),
+                      timestamp + datetime.timedelta(seconds=i))
+        for i in range(20)])
+    path = GroundTruthPath([
+        GroundTruthState([[i], [i + 1]], timestamp, metadata={'i': i})
+        for i in range(3)])
+
+    compact_file = YAML(typ=serialised_file.typ, compact_states=True)
+    for sequence in (track, path):
+        serialised_str = compact_file.dumps(sequence)
+        assert '!stonesoup.serialise.states' in serialised_str
+
+        new_sequence = serialised_file.load(serialised_str)
+        assert type(new_sequence) is type(sequence)
+        assert len(new_sequence) == len(sequence)
+        for state, new_state in zip(sequence, new_sequence):
+            assert type(new_state) is type(state)
+            assert isinstance(new_state.state_vector, StateVector)
+            assert np.array_equal(state.state_vector, new_state.state_vector)
+            assert state.timestamp == new_state.timestamp
+        if isinstance(sequence, Track):
+            assert all(isinstance(state.covar, CovarianceMatrix) for state in new_sequence)
+            assert all(np.array_equal(state.covar, new_state.covar)
+                       for state, new_state in zip(sequence, new_sequence))
+        else:
+            assert [dict(state.metadata) for state in new_sequence] \
+                == [state.metadata for state in sequence]
+
+    # Mixed state types fall back to standard representation
+    track.append(GroundTruthState([[1], [2]], timestamp))
+    serialised_str = compact_file.dumps(track)
+    assert '!stonesoup.serialise.states' not in serialised_str
+    assert len(serialised_file.load(serialised_str)) == len(track)
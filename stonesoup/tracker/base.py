@@ -1,6 +1,7 @@
 from abc import abstractmethod
 
 from ..base import Base
+from ..instrumentation import NULL_RECORD
 
 
 class Tracker(Base):
@@ -14,6 +15,14 @@ class Tracker(Base):
     def __iter__(self):
         return self
 
+    def _profile_scan(self):
+        """Context manager providing the :class:`~.ScanRecord` for a scan, from the tracker's
+        ``profiler`` if it has one, or otherwise a record which does nothing."""
+        profiler = getattr(self, 'profiler', None)
+        if profiler is None:
+            return NULL_RECORD
+        return profiler.scan(self)
+
     @abstractmethod
     def __next__(self):
         """
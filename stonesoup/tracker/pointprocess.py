@@ -7,6 +7,7 @@ from ..types.numeric import Probability
 from ..types.track import Track
 from ..updater import Updater
 from ..hypothesiser.gaussianmixture import GaussianMixtureHypothesiser
+from ..instrumentation import ScanProfiler
 from ..mixturereducer.gaussianmixture import GaussianMixtureReducer
 
 
@@ -33,6 +34,10 @@ class PointProcessMultiTargetTracker(Tracker):
             "births per timestep (Poission distributed). "
             "The tag should be "
             ":attr:`TaggedWeightedGaussianState.BIRTH`")
+    profiler: ScanProfiler = Property(
+        default=None,
+        doc="Profiler recording time spent in each stage, and counts, for each scan. Default "
+            "`None`, where no profiling is done.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -78,24 +83,33 @@ class PointProcessMultiTargetTracker(Tracker):
                         self.target_tracks[tag] = Track([component], id=tag)
 
     def __next__(self):
-        time, detections = next(self.detector_iter)
-        # Add birth component
-        self.birth_component.timestamp = time
-        self.gaussian_mixture.append(self.birth_component)
-        # Perform GM Prediction and generate hypotheses
-        hypotheses = self.hypothesiser.hypothesise(
-                    self.gaussian_mixture.components,
-                    detections,
-                    time
-                    )
-        # Perform GM Update
-        self.gaussian_mixture = self.updater.update(hypotheses)
-        # Reduce mixture - Pruning and Merging
-        self.gaussian_mixture.components = \
-            self.reducer.reduce(self.gaussian_mixture.components)
-        # Update the tracks
-        self.update_tracks()
-        self.end_tracks()
+        with self._profile_scan() as record:
+            time, detections = next(self.detector_iter)
+            record.mark('read')
+            # Add birth component
+            self.birth_component.timestamp = time
+            self.gaussian_mixture.append(self.birth_component)
+            # Perform GM Prediction and generate hypotheses
+            hypotheses = self.hypothesiser.hypothesise(
+                        self.gaussian_mixture.components,
+                        detections,
+                        time
+                        )
+            record.mark('hypothesise')
+            record.count('hypotheses', sum(len(hypothesis) for hypothesis in hypotheses))
+            # Perform GM Update
+            self.gaussian_mixture = self.updater.update(hypotheses)
+            record.mark('update')
+            # Reduce mixture - Pruning and Merging
+            self.gaussian_mixture.components = \
+                self.reducer.reduce(self.gaussian_mixture.components)
+            record.mark('reduce')
+            # Update the tracks
+            self.update_tracks()
+            self.end_tracks()
+            record.mark('extract')
+            record.finish(time, tracks=len(self.tracks), detections=len(detections),
+                          components=len(self.gaussian_mixture))
         return time, self.tracks
 
     def end_tracks(self):
@@ -1,9 +1,14 @@
+import time as time_
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from .base import Tracker
 from ..base import Property
 from ..dataassociator import DataAssociator
 from ..deleter import Deleter
+from ..feeder.prefetch import PrefetchFeeder
+from ..instrumentation import ScanProfiler, ScanRecord, NULL_RECORD
 from ..reader import DetectionReader
 from ..initiator import Initiator
 from ..updater import Updater
@@ -40,6 +45,10 @@ class SingleTargetTracker(Tracker):
     data_associator: DataAssociator = Property(
         doc="Association algorithm to pair predictions to detections")
     updater: Updater = Property(doc="Updater used to update the track object to the new state.")
+    profiler: ScanProfiler = Property(
+        default=None,
+        doc="Profiler recording time spent in each stage, and counts, for each scan. Default "
+            "`None`, where no profiling is done.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -54,23 +63,34 @@ class SingleTargetTracker(Tracker):
         return super().__iter__()
 
     def __next__(self):
-        time, detections = next(self.detector_iter)
-        if self._track is not None:
-            associations = self.data_associator.associate(
-                self.tracks, detections, time)
-            if associations[self._track]:
-                state_post = self.updater.update(associations[self._track])
-                self._track.append(state_post)
-            else:
-                self._track.append(
-                    associations[self._track].prediction)
-
-        if self._track is None or self.deleter.delete_tracks(self.tracks):
-            new_tracks = self.initiator.initiate(detections, time)
-            if new_tracks:
-                self._track = new_tracks.pop()
-            else:
-                self._track = None
+        with self._profile_scan() as record:
+            time, detections = next(self.detector_iter)
+            record.mark('read')
+            associations = None
+            if self._track is not None:
+                with record.associating():
+                    associations = self.data_associator.associate(
+                        self.tracks, detections, time)
+            record.mark('assign')
+            if associations is not None:
+                if associations[self._track]:
+                    state_post = self.updater.update(associations[self._track])
+                    self._track.append(state_post)
+                else:
+                    self._track.append(
+                        associations[self._track].prediction)
+            record.mark('update')
+
+            deleted = self._track is None or self.deleter.delete_tracks(self.tracks)
+            record.mark('delete')
+            if deleted:
+                new_tracks = self.initiator.initiate(detections, time)
+                if new_tracks:
+                    self._track = new_tracks.pop()
+                else:
+                    self._track = None
+            record.mark('initiate')
+            record.finish(time, tracks=len(self.tracks), detections=len(detections))
 
         return time, self.tracks
 
@@ -95,6 +115,10 @@ class MultiTargetTracker(Tracker):
     data_associator: DataAssociator = Property(
         doc="Association algorithm to pair predictions to detections")
     updater: Updater = Property(doc="Updater used to update the track object to the new state.")
+    profiler: ScanProfiler = Property(
+        default=None,
+        doc="Profiler recording time spent in each stage, and counts, for each scan. Default "
+            "`None`, where no profiling is done.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -109,26 +133,234 @@ class MultiTargetTracker(Tracker):
         return super().__iter__()
 
     def __next__(self):
-        time, detections = next(self.detector_iter)
-
-        associations = self.data_associator.associate(
-            self.tracks, detections, time)
-        associated_detections = set()
-        for track, hypothesis in associations.items():
-            if hypothesis:
-                state_post = self.updater.update(hypothesis)
-                track.append(state_post)
-                associated_detections.add(hypothesis.measurement)
-            else:
-                track.append(hypothesis.prediction)
+        with self._profile_scan() as record:
+            time, detections = next(self.detector_iter)
+            record.mark('read')
+
+            with record.associating():
+                associations = self.data_associator.associate(
+                    self.tracks, detections, time)
+            record.mark('assign')
+            associated_detections = set()
+            for track, hypothesis in associations.items():
+                if hypothesis:
+                    state_post = self.updater.update(hypothesis)
+                    track.append(state_post)
+                    associated_detections.add(hypothesis.measurement)
+                else:
+                    track.append(hypothesis.prediction)
+            record.mark('update')
 
-        self._tracks -= self.deleter.delete_tracks(self.tracks)
-        self._tracks |= self.initiator.initiate(
-            detections - associated_detections, time)
+            self._tracks -= self.deleter.delete_tracks(self.tracks)
+            record.mark('delete')
+            self._tracks |= self.initiator.initiate(
+                detections - associated_detections, time)
+            record.mark('initiate')
+            record.finish(time, tracks=len(self.tracks), detections=len(detections))
 
         return time, self.tracks
 
 
+class PipelinedMultiTargetTracker(MultiTargetTracker):
+    """A multi target tracker, with stages of each scan run concurrently.
+
+    This produces the same tracks as :class:`~.MultiTargetTracker`, but stages
+    are run concurrently where causality allows:
+
+    - Detections are read ahead in a background thread (see
+      :class:`~.PrefetchFeeder`), overlapping with processing of prior scans.
+    - Associated tracks are updated in batches of :attr:`batch_size` on a thread
+      pool, with :meth:`~.Updater.update_batch`, such that batched updaters can
+      process each batch with stacked operations, and NumPy operations which
+      release the GIL run in parallel.
+    - Initiation from the unassociated detections runs on the thread pool at
+      the same time as the track updates.
+    - If :attr:`associate_ahead` is enabled, reading and association of the
+      next scan starts as soon as the current scan's tracks are returned,
+      overlapping with processing by the consumer.
+
+    As the :attr:`initiator` runs at the same time as the :attr:`updater`, they
+    must not share state which isn't thread-safe.
+
+    The time spent in each stage (``'read'``, ``'associate'``, ``'update'``,
+    ``'delete'`` and ``'initiate'``) is available in :attr:`stage_times` for the
+    last scan, and :attr:`total_stage_times` summed over all scans. As stages
+    overlap, these may sum to more than the elapsed time.
+
+    Threads are stopped once iteration completes. If iteration may stop early,
+    :meth:`close` should be called, or the tracker used as a context manager:
+
+    .. code-block:: python
+
+        with PipelinedMultiTargetTracker(...) as tracker:
+            for time, tracks in tracker:
+                ...
+
+    Parameters
+    ----------
+    """
+    max_workers: int = Property(
+        default=None,
+        doc="Maximum number of threads used for update and initiation. Default `None`, where "
+            "the :class:`concurrent.futures.ThreadPoolExecutor` default is used.")
+    batch_size: int = Property(
+        default=1000, doc="Maximum number of tracks updated in each batch. Default 1000.")
+    prefetch: int = Property(
+        default=1,
+        doc="Number of scans of detections to read ahead in a background thread. Zero to read "
+            "only when required. Default 1.")
+    associate_ahead: bool = Property(
+        default=False,
+        doc="Whether to read and associate the next scan in the background, once the current "
+            "scan's tracks have been returned. The consumer must then not modify the tracks. "
+            "Default `False`.")
+
+    stages = ('read', 'associate', 'update', 'delete', 'initiate')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if self.prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        self._executor = None
+        self._next_association = None
+        self.stage_times = dict.fromkeys(self.stages, 0.)
+        self.total_stage_times = dict.fromkeys(self.stages, 0.)
+
+    def __iter__(self):
+        self.close()
+        if self.prefetch:
+            self.detector_iter = iter(
+                PrefetchFeeder(self.detector, max_queue_size=self.prefetch))
+        else:
+            self.detector_iter = iter(self.detector)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=type(self).__name__)
+        self.stage_times = dict.fromkeys(self.stages, 0.)
+        self.total_stage_times = dict.fromkeys(self.stages, 0.)
+        return self
+
+    def close(self):
+        """Stop any background work and shut down the threads used by the tracker.
+
+        This is called when iteration completes, but should be called (or the tracker used as
+        a context manager) if iteration is stopped early."""
+        if self._next_association is not None:
+            self._next_association.cancel()
+            self._next_association = None
+        if self._executor is not None:
+            # Waits for any running association, before detector iterator is closed
+            self._executor.shutdown()
+            self._executor = None
+        detector_iter = getattr(self, 'detector_iter', None)
+        if hasattr(detector_iter, 'close'):
+            # Stops prefetch thread
+            detector_iter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, '_executor', None) is not None:
+            self.close()
+
+    def _read_and_associate(self, tracks):
+        start = time_.perf_counter()
+        try:
+            timestamp, detections = next(self.detector_iter)
+        except StopIteration:
+            return None
+        read_end = time_.perf_counter()
+        # Separate record, as may be in different thread to the scan's record
+        record = ScanRecord() if self.profiler is not None else NULL_RECORD
+        with record.activate(), record.associating():
+            associations = self.data_associator.associate(tracks, detections, timestamp)
+        return timestamp, detections, associations, record, {
+            'read': read_end - start, 'associate': time_.perf_counter() - read_end}
+
+    def _update_tracks(self, track_hypotheses):
+        hypotheses = [hypothesis for _, hypothesis in track_hypotheses]
+        try:
+            update_batch = self.updater.update_batch
+        except AttributeError:
+            state_posts = [self.updater.update(hypothesis) for hypothesis in hypotheses]
+        else:
+            state_posts = update_batch(hypotheses)
+        for (track, _), state_post in zip(track_hypotheses, state_posts):
+            track.append(state_post)
+
+    def _initiate(self, detections, timestamp):
+        start = time_.perf_counter()
+        tracks = self.initiator.initiate(detections, timestamp)
+        return tracks, time_.perf_counter() - start
+
+    def __next__(self):
+        with self._profile_scan() as record:
+            if self._next_association is not None:
+                future, self._next_association = self._next_association, None
+                result = future.result()
+            else:
+                result = self._read_and_associate(self.tracks)
+            if result is None:
+                self.close()
+                raise StopIteration
+            timestamp, detections, associations, association_record, stage_times = result
+
+            track_hypotheses = []
+            associated_detections = set()
+            for track, hypothesis in associations.items():
+                if hypothesis:
+                    track_hypotheses.append((track, hypothesis))
+                    associated_detections.add(hypothesis.measurement)
+                else:
+                    track.append(hypothesis.prediction)
+
+            initiate_future = self._executor.submit(
+                self._initiate, detections - associated_detections, timestamp)
+
+            start = time_.perf_counter()
+            batches = [track_hypotheses[index:index + self.batch_size]
+                       for index in range(0, len(track_hypotheses), self.batch_size)]
+            update_futures = [self._executor.submit(self._update_tracks, batch)
+                              for batch in batches[1:]]
+            if batches:
+                # Use this thread for first batch, rather than waiting idle
+                self._update_tracks(batches[0])
+            for future in update_futures:
+                future.result()
+            update_end = time_.perf_counter()
+            stage_times['update'] = update_end - start
+
+            self._tracks -= self.deleter.delete_tracks(self.tracks)
+            stage_times['delete'] = time_.perf_counter() - update_end
+
+            new_tracks, stage_times['initiate'] = initiate_future.result()
+            self._tracks |= new_tracks
+
+            self.stage_times = stage_times
+            for stage, stage_time in stage_times.items():
+                self.total_stage_times[stage] += stage_time
+
+            if self.profiler is not None:
+                record.add('read', stage_times['read'])
+                record.merge(association_record)
+                record.add('assign', stage_times['associate']
+                           - association_record.stage_times.get('hypothesise', 0.))
+                for stage in ('update', 'delete', 'initiate'):
+                    record.add(stage, stage_times[stage])
+                record.finish(timestamp, tracks=len(self.tracks), detections=len(detections))
+
+            if self.associate_ahead:
+                self._next_association = self._executor.submit(
+                    self._read_and_associate, self.tracks)
+
+        return timestamp, self.tracks
+
+
 class MultiTargetMixtureTracker(Tracker):
     """A simple multi target tracker that receives associations from a
     (Gaussian) Mixture associator.
@@ -151,6 +383,10 @@ class MultiTargetMixtureTracker(Tracker):
     data_associator: DataAssociator = Property(
         doc="Association algorithm to pair predictions to detections")
     updater: Updater = Property(doc="Updater used to update the track object to the new state.")
+    profiler: ScanProfiler = Property(
+        default=None,
+        doc="Profiler recording time spent in each stage, and counts, for each scan. Default "
+            "`None`, where no profiling is done.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -165,60 +401,68 @@ class MultiTargetMixtureTracker(Tracker):
         return super().__iter__()
 
     def __next__(self):
-        time, detections = next(self.detector_iter)
-
-        associations = self.data_associator.associate(
-            self.tracks, detections, time)
-        unassociated_detections = set(detections)
-        for track, multihypothesis in associations.items():
-
-            # calculate each Track's state as a Gaussian Mixture of
-            # its possible associations with each detection, then
-            # reduce the Mixture to a single Gaussian State
-            posterior_states = []
-            posterior_state_weights = []
-            for hypothesis in multihypothesis:
-                if not hypothesis:
-                    posterior_states.append(hypothesis.prediction)
+        with self._profile_scan() as record:
+            time, detections = next(self.detector_iter)
+            record.mark('read')
+
+            with record.associating():
+                associations = self.data_associator.associate(
+                    self.tracks, detections, time)
+            record.mark('assign')
+            unassociated_detections = set(detections)
+            for track, multihypothesis in associations.items():
+
+                # calculate each Track's state as a Gaussian Mixture of
+                # its possible associations with each detection, then
+                # reduce the Mixture to a single Gaussian State
+                posterior_states = []
+                posterior_state_weights = []
+                for hypothesis in multihypothesis:
+                    if not hypothesis:
+                        posterior_states.append(hypothesis.prediction)
+                    else:
+                        posterior_states.append(
+                            self.updater.update(hypothesis))
+                    posterior_state_weights.append(
+                        hypothesis.probability)
+
+                means = StateVectors([state.state_vector for state in posterior_states])
+                covars = np.stack([state.covar for state in posterior_states], axis=2)
+                weights = np.asarray(posterior_state_weights)
+
+                post_mean, post_covar = gm_reduce_single(means, covars, weights)
+
+                missed_detection_weight = next(hyp.weight for hyp in multihypothesis if not hyp)
+
+                # Check if at least one reasonable measurement...
+                if any(hypothesis.weight > missed_detection_weight
+                       for hypothesis in multihypothesis):
+                    # ...and if so use update type
+                    track.append(GaussianStateUpdate(
+                        post_mean, post_covar,
+                        multihypothesis,
+                        multihypothesis[0].measurement.timestamp))
                 else:
-                    posterior_states.append(
-                        self.updater.update(hypothesis))
-                posterior_state_weights.append(
-                    hypothesis.probability)
-
-            means = StateVectors([state.state_vector for state in posterior_states])
-            covars = np.stack([state.covar for state in posterior_states], axis=2)
-            weights = np.asarray(posterior_state_weights)
-
-            post_mean, post_covar = gm_reduce_single(means, covars, weights)
-
-            missed_detection_weight = next(hyp.weight for hyp in multihypothesis if not hyp)
-
-            # Check if at least one reasonable measurement...
-            if any(hypothesis.weight > missed_detection_weight
-                   for hypothesis in multihypothesis):
-                # ...and if so use update type
-                track.append(GaussianStateUpdate(
-                    post_mean, post_covar,
-                    multihypothesis,
-                    multihypothesis[0].measurement.timestamp))
-            else:
-                # ...and if not, treat as a prediction
-                track.append(GaussianStatePrediction(
-                    post_mean, post_covar,
-                    multihypothesis[0].prediction.timestamp))
-
-            # any detections in multihypothesis that had an
-            # association score (weight) lower than or equal to the
-            # association score of "MissedDetection" is considered
-            # unassociated - candidate for initiating a new Track
-            for hyp in multihypothesis:
-                if hyp.weight > missed_detection_weight:
-                    if hyp.measurement in unassociated_detections:
-                        unassociated_detections.remove(hyp.measurement)
-
-        self._tracks -= self.deleter.delete_tracks(self.tracks)
-        self._tracks |= self.initiator.initiate(
-            unassociated_detections, time)
+                    # ...and if not, treat as a prediction
+                    track.append(GaussianStatePrediction(
+                        post_mean, post_covar,
+                        multihypothesis[0].prediction.timestamp))
+
+                # any detections in multihypothesis that had an
+                # association score (weight) lower than or equal to the
+                # association score of "MissedDetection" is considered
+                # unassociated - candidate for initiating a new Track
+                for hyp in multihypothesis:
+                    if hyp.weight > missed_detection_weight:
+                        if hyp.measurement in unassociated_detections:
+                            unassociated_detections.remove(hyp.measurement)
+            record.mark('update')
+
+            self._tracks -= self.deleter.delete_tracks(self.tracks)
+            record.mark('delete')
+            self._tracks |= self.initiator.initiate(
+                unassociated_detections, time)
+            record.mark('initiate')
+            record.finish(time, tracks=len(self.tracks), detections=len(detections))
 
         return time, self.tracks
@@ -3,6 +3,7 @@ import datetime
 import numpy as np
 
 from ..pointprocess import PointProcessMultiTargetTracker
+from ...instrumentation import ScanProfiler
 from ...types.state import TaggedWeightedGaussianState
 from ...mixturereducer.gaussianmixture import GaussianMixtureReducer
 from ...updater.pointprocess import PHDUpdater
@@ -50,7 +51,8 @@ def test_point_process_multi_target_tracker_cycle(detector, predictor):
         updater=phd_updater,
         hypothesiser=hypothesiser,
         reducer=reducer,
-        birth_component=birth_component
+        birth_component=birth_component,
+        profiler=ScanProfiler()
         )
 
     for time, tracks in tracker:
@@ -62,3 +64,9 @@ def test_point_process_multi_target_tracker_cycle(detector, predictor):
         assert (len(tracks) >= 1) & (len(tracks) <= 3)
         # All tracks should have unique IDs
         assert len(tracker.gaussian_mixture.component_tags) == len(tracker.gaussian_mixture)
+
+    records = tracker.profiler.sinks[0].records
+    assert len(records) == 23
+    for record in records:
+        assert {'read', 'hypothesise', 'update', 'reduce', 'extract', 'total', 'tracks',
+                'detections', 'hypotheses', 'components', 'cache_hits'} <= record.keys()
@@ -1,6 +1,11 @@
 import datetime
+import threading
+
+import pytest
+
 from ..simple import SingleTargetTracker, MultiTargetTracker, \
-    MultiTargetMixtureTracker
+    MultiTargetMixtureTracker, PipelinedMultiTargetTracker
+from ...instrumentation import ScanProfiler, profile_hypotheses
 
 
 def test_single_target_tracker(
@@ -49,6 +54,79 @@ def test_multi_target_tracker(
     assert len(total_tracks) >= 6  # Should of had at least 6 over all steps
 
 
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'batch_size': 1, 'max_workers': 2},
+    {'prefetch': 0, 'associate_ahead': True},
+    {'batch_size': 2, 'prefetch': 3, 'associate_ahead': True}])
+def test_pipelined_multi_target_tracker(
+        initiator, deleter, detector, data_associator, updater, kwargs):
+    tracker = MultiTargetTracker(
+        initiator, deleter, detector, data_associator, updater)
+    pipelined_tracker = PipelinedMultiTargetTracker(
+        initiator, deleter, type(detector)(), data_associator, updater, **kwargs)
+
+    total_stage_times = dict.fromkeys(PipelinedMultiTargetTracker.stages, 0.)
+    for (time, tracks), (pipelined_time, pipelined_tracks) in zip(tracker, pipelined_tracker):
+        assert time == pipelined_time
+        assert sorted(track.state_vector for track in tracks) \
+            == sorted(track.state_vector for track in pipelined_tracks)
+        assert sorted(len(track) for track in tracks) \
+            == sorted(len(track) for track in pipelined_tracks)
+
+        assert set(pipelined_tracker.stage_times) == set(PipelinedMultiTargetTracker.stages)
+        for stage, stage_time in pipelined_tracker.stage_times.items():
+            assert stage_time >= 0
+            total_stage_times[stage] += stage_time
+
+    # Both exhausted at the same time
+    assert next(tracker, None) is None
+    assert next(pipelined_tracker, None) is None
+    assert pipelined_tracker.total_stage_times == pytest.approx(total_stage_times)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'prefetch': 0, 'associate_ahead': True},
+    {'prefetch': 3, 'associate_ahead': True}])
+def test_pipelined_multi_target_tracker_close(
+        initiator, deleter, detector, data_associator, updater, kwargs):
+    def tracker_threads():
+        return {thread for thread in threading.enumerate()
+                if thread.name.startswith(PipelinedMultiTargetTracker.__name__)}
+    initial_threads = set(threading.enumerate())
+
+    with PipelinedMultiTargetTracker(
+            initiator, deleter, detector, data_associator, updater, **kwargs) as tracker:
+        for step, (time, tracks) in enumerate(tracker):
+            if step == 2:
+                break
+        assert tracker._executor is not None
+        assert tracker_threads()
+
+    assert tracker._executor is None
+    assert tracker._next_association is None
+    assert not tracker_threads()
+    # Any prefetch thread stops shortly after
+    for thread in set(threading.enumerate()) - initial_threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    # Can be iterated again after closing
+    assert len(list(tracker)) > 2
+    assert tracker._executor is None
+
+
+def test_pipelined_multi_target_tracker_errors(
+        initiator, deleter, detector, data_associator, updater):
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        PipelinedMultiTargetTracker(
+            initiator, deleter, detector, data_associator, updater, batch_size=0)
+    with pytest.raises(ValueError, match="prefetch must not be negative"):
+        PipelinedMultiTargetTracker(
+            initiator, deleter, detector, data_associator, updater, prefetch=-1)
+
+
 def test_multi_target_mixture_tracker(
         initiator, deleter, detector, data_mixture_associator, updater):
     tracker = MultiTargetMixtureTracker(
@@ -74,3 +152,65 @@ def test_multi_target_mixture_tracker(
 
     assert max_tracks >= 3  # Should of had at least 3 tracks in single step
     assert len(total_tracks) >= 6  # Should of had at least 6 over all steps
+
+
+@pytest.mark.parametrize('tracker_class, kwargs', [
+    (SingleTargetTracker, {}),
+    (MultiTargetTracker, {}),
+    (PipelinedMultiTargetTracker, {}),
+    (PipelinedMultiTargetTracker, {'associate_ahead': True}),
+    (MultiTargetMixtureTracker, {})])
+def test_tracker_profiler(
+        initiator, deleter, detector, data_associator, data_mixture_associator, updater,
+        tracker_class, kwargs):
+    if tracker_class is MultiTargetMixtureTracker:
+        data_associator = data_mixture_associator
+    profiler = ScanProfiler()
+    tracker = tracker_class(
+        initiator, deleter, detector, data_associator, updater, profiler=profiler, **kwargs)
+
+    for time, tracks in tracker:
+        record = profiler.sinks[0].records[-1]
+        assert record['timestamp'] == time
+        assert record['tracks'] == len(tracks)
+        if tracker_class is not PipelinedMultiTargetTracker:  # Detector read ahead if pipelined
+            assert record['detections'] == len(detector.detections)
+        for stage in ('read', 'assign', 'update', 'delete', 'initiate'):
+            assert record[stage] >= 0
+        assert record['total'] >= 0
+        assert record['slowest_stage'] in {'read', 'assign', 'update', 'delete', 'initiate'}
+    assert len(profiler.sinks[0].records) == 23
+
+
+@pytest.mark.parametrize('tracker_class', [MultiTargetTracker, PipelinedMultiTargetTracker])
+def test_tracker_profiler_initiator_hypotheses(
+        initiator, deleter, detector, data_associator, updater, tracker_class):
+    class ProfiledDataAssociator:
+        @profile_hypotheses
+        def generate_hypotheses(self, tracks, detections, timestamp):
+            return {track: [hypothesis] for track, hypothesis
+                    in data_associator.associate(tracks, detections, timestamp).items()}
+
+        def associate(self, tracks, detections, timestamp):
+            return {track: hypotheses[0] for track, hypotheses
+                    in self.generate_hypotheses(tracks, detections, timestamp).items()}
+
+    associator = ProfiledDataAssociator()
+
+    class SharingInitiator:
+        def initiate(self, detections, timestamp):
+            tracks = initiator.initiate(detections, timestamp)
+            # Hypotheses generated by initiator shouldn't be counted as tracker's
+            associator.associate(tracks, detections, timestamp)
+            return tracks
+
+    profiler = ScanProfiler()
+    tracker = tracker_class(
+        SharingInitiator(), deleter, detector, associator, updater, profiler=profiler)
+
+    previous_tracks = set()
+    for time, tracks in tracker:
+        record = profiler.sinks[0].records[-1]
+        # One hypothesis per track existing prior to the scan
+        assert record.get('hypotheses', 0) == len(previous_tracks)
+        previous_tracks = set(tracks)
@@ -0,0 +1,423 @@
+"""Bounded history of states, for long running trackers.
+
+By default, a :class:`~.Track` keeps every state it's given in memory, including references
+to the hypotheses, predictions and detections used to create them. A
+:class:`TrackHistoryPolicy` instead keeps only the most recent states as full objects, and
+moves older states to a :class:`HistoryStore`, either compacted in memory to just the mean,
+covariance and timestamp (:class:`ArrayHistoryStore`), or spilled to disk
+(:class:`SQLiteHistoryStore`). The track remains usable as before, with recent states
+returned as they were added, and older states returned as a :class:`~.GaussianState` (or
+:class:`~.State` where there was no covariance).
+
+An example would be:
+
+.. code-block:: python
+
+    policy = TrackHistoryPolicy(max_length=100, store=SQLiteHistoryStore('history.db'))
+    initiator = TrackHistoryLimiter(initiator, policy)
+"""
+import datetime
+import sqlite3
+import threading
+import uuid
+import weakref
+from abc import abstractmethod
+from collections import abc
+from pathlib import Path
+
+import numpy as np
+
+from ..base import Base, Property
+from .state import State, GaussianState
+
+
+def _mean_and_covar(state):
+    mean = np.asarray(getattr(state, 'mean', state.state_vector), dtype=np.float64)
+    covar = getattr(state, 'covar', None)
+    if covar is not None:
+        covar = np.asarray(covar, dtype=np.float64)
+    return mean.ravel(), covar
+
+
+def _compact_state(mean, covar, timestamp):
+    if covar is None:
+        return State(mean.reshape(-1, 1), timestamp=timestamp)
+    return GaussianState(mean.reshape(-1, 1), covar, timestamp=timestamp)
+
+
+class StateArchive(abc.Sequence):
+    """Append only sequence of states, held in compact form by a :class:`HistoryStore`."""
+
+    @abstractmethod
+    def extend(self, states):
+        """Add `states` to the end of the archive."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def copy(self):
+        """Independent copy of the archive."""
+        raise NotImplementedError
+
+
+class HistoryStore(Base):
+    """History store base class
+
+    Holds states removed from memory by a :class:`TrackHistoryPolicy`."""
+
+    @abstractmethod
+    def archive(self):
+        """Create a new, empty archive for a sequence of states.
+
+        Returns
+        -------
+        : :class:`StateArchive`
+        """
+        raise NotImplementedError
+
+
+class _ArrayArchive(StateArchive):
+    def __init__(self):
+        self._timestamps = []
+        self._means = None
+        self._covars = None
+        self._has_covar = None
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('archive index out of range')
+        return _compact_state(
+            self._means[index].copy(),
+            self._covars[index].copy() if self._has_covar[index] else None,
+            self._timestamps[index])
+
+    def _reserve(self, length, ndim):
+        if self._means is None:
+            capacity = max(length, 16)
+            self._means = np.empty((capacity, ndim))
+            self._covars = np.empty((capacity, ndim, ndim))
+            self._has_covar = np.empty(capacity, dtype=bool)
+        elif length > self._means.shape[0]:
+            capacity = max(length, 2*self._means.shape[0])
+            for name in ('_means', '_covars', '_has_covar'):
+                array = getattr(self, name)
+                new_array = np.empty((capacity, *array.shape[1:]), dtype=array.dtype)
+                new_array[:len(self)] = array[:len(self)]
+                setattr(self, name, new_array)
+
+    def extend(self, states):
+        for state in states:
+            mean, covar = _mean_and_covar(state)
+            self._reserve(len(self) + 1, mean.shape[0])
+            if mean.shape[0] != self._means.shape[1]:
+                raise ValueError("archived states must all have the same dimension")
+            index = len(self)
+            self._means[index] = mean
+            self._has_covar[index] = covar is not None
+            if covar is not None:
+                self._covars[index] = covar
+            self._timestamps.append(state.timestamp)
+
+    def copy(self):
+        archive = type(self)()
+        archive._timestamps = self._timestamps.copy()
+        if self._means is not None:
+            archive._means = self._means.copy()
+            archive._covars = self._covars.copy()
+            archive._has_covar = self._has_covar.copy()
+        return archive
+
+
+class ArrayHistoryStore(HistoryStore):
+    """Keeps states in memory, compacted to arrays of the mean, covariance and timestamp.
+
+    All states of a track must have the same dimension."""
+
+    def archive(self):
+        return _ArrayArchive()
+
+
+class _SQLiteArchive(StateArchive):
+    def __init__(self, store):
+        self._store = store
+        self._key = uuid.uuid4().hex
+        self._length = 0
+        weakref.finalize(self, store._discard, self._key)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[position] for position in range(start, stop, step)]
+            return self._store._fetch(self._key, start, stop)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('archive index out of range')
+        return self._store._fetch(self._key, index, index + 1)[0]
+
+    def __iter__(self):
+        chunk_size = 1000
+        for start in range(0, len(self), chunk_size):
+            yield from self._store._fetch(self._key, start, min(start + chunk_size, len(self)))
+
+    def extend(self, states):
+        rows = []
+        for position, state in enumerate(states, self._length):
+            mean, covar = _mean_and_covar(state)
+            rows.append((
+                self._key, position,
+                None if state.timestamp is None else state.timestamp.isoformat(),
+                mean.shape[0], mean.tobytes(), None if covar is None else covar.tobytes()))
+        self._store._insert(rows)
+        self._length += len(rows)
+
+    def copy(self):
+        archive = type(self)(self._store)
+        self._store._copy(self._key, archive._key)
+        archive._length = self._length
+        return archive
+
+
+class SQLiteHistoryStore(HistoryStore):
+    """Spills states to disk, in an SQLite database.
+
+    States of all tracks share the database, and are removed once the track's states are no
+    longer referenced. The store should be closed with :meth:`close`, or used as a context
+    manager, once finished with."""
+    path: Path = Property(
+        default=None,
+        doc="Database file. Str will be converted to Path. Default `None`, where a temporary "
+            "file is used, which is deleted on close.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.path is not None and not isinstance(self.path, Path):
+            self.path = Path(self.path)  # Ensure Path
+        # Empty path is an SQLite temporary database, held on disk
+        self._connection = sqlite3.connect(
+            '' if self.path is None else str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            # Not for long term storage, so no need to wait for data to reach disk
+            self._connection.execute('PRAGMA synchronous = OFF')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS states ('
+                'key TEXT, position INTEGER, timestamp TEXT, ndim INTEGER, mean BLOB, '
+                'covar BLOB, PRIMARY KEY (key, position)) WITHOUT ROWID')
+
+    def archive(self):
+        return _SQLiteArchive(self)
+
+    def _insert(self, rows):
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT INTO states VALUES (?, ?, ?, ?, ?, ?)', rows)
+
+    def _fetch(self, key, start, stop):
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT timestamp, ndim, mean, covar FROM states '
+                'WHERE key = ? AND position >= ? AND position < ? ORDER BY position',
+                (key, start, stop)).fetchall()
+        return [
+            _compact_state(
+                np.frombuffer(mean, dtype=np.float64).copy(),
+                None if covar is None
+                else np.frombuffer(covar, dtype=np.float64).reshape(ndim, ndim).copy(),
+                None if timestamp is None else datetime.datetime.fromisoformat(timestamp))
+            for timestamp, ndim, mean, covar in rows]
+
+    def _copy(self, key, new_key):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT INTO states SELECT ?, position, timestamp, ndim, mean, covar '
+                'FROM states WHERE key = ?', (new_key, key))
+
+    def _discard(self, key):
+        try:
+            with self._lock, self._connection:
+                self._connection.execute('DELETE FROM states WHERE key = ?', (key, ))
+        except sqlite3.ProgrammingError:  # Already closed
+            pass
+
+    def close(self):
+        """Close the database."""
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class StateHistory(abc.MutableSequence):
+    """Sequence of states, where only the most recent are kept in memory as full objects.
+
+    Older states, as determined by the :class:`TrackHistoryPolicy`, are moved to an archive
+    from the policy's store. These are returned in compact form, unless the original state is
+    still referenced elsewhere, in which case that is returned. Archived states can't be
+    modified, so changes (e.g. :meth:`insert`) must be to the recent states.
+
+    This is usually created by :meth:`TrackHistoryPolicy.apply`.
+    """
+
+    def __init__(self, policy, states=None):
+        self.policy = policy
+        self._archive = policy.store.archive()
+        # Archived states which are still referenced elsewhere
+        self._archived = weakref.WeakValueDictionary()
+        self._recent = list(states) if states is not None else []
+        self._compact()
+
+    @property
+    def num_archived(self):
+        """Number of states moved to the archive."""
+        return len(self._archive)
+
+    def _compact(self):
+        recent = self._recent
+        count = 0
+        if self.policy.max_length is not None:
+            count = max(len(recent) - self.policy.max_length, 0)
+        if self.policy.max_age is not None and recent and recent[-1].timestamp is not None:
+            cutoff = recent[-1].timestamp - self.policy.max_age
+            # Always keeps latest state
+            while count < len(recent) - 1 and recent[count].timestamp is not None \
+                    and recent[count].timestamp < cutoff:
+                count += 1
+        if not count:
+            return
+        start = len(self._archive)
+        self._archive.extend(recent[:count])
+        for position, state in enumerate(recent[:count], start):
+            self._archived[position] = state
+        del recent[:count]
+
+    def _recent_index(self, index):
+        """Index of recent states, from index of all states."""
+        num_archived = len(self._archive)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("extended slices not supported")
+            if start < num_archived and start < stop:
+                raise IndexError("archived states can't be modified")
+            return slice(max(start - num_archived, 0), max(stop - num_archived, 0))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('state index out of range')
+        if index < num_archived:
+            raise IndexError("archived states can't be modified")
+        return index - num_archived
+
+    def _get_archived(self, position, state=None):
+        archived_state = self._archived.get(position)
+        if archived_state is None:
+            archived_state = self._archived[position] = \
+                self._archive[position] if state is None else state
+        return archived_state
+
+    def __len__(self):
+        return len(self._archive) + len(self._recent)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        num_archived = len(self._archive)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('state index out of range')
+        if index >= num_archived:
+            return self._recent[index - num_archived]
+        return self._get_archived(index)
+
+    def __iter__(self):
+        for position, state in enumerate(self._archive):
+            yield self._get_archived(position, state)
+        yield from self._recent
+
+    def __setitem__(self, index, value):
+        self._recent[self._recent_index(index)] = value
+        self._compact()
+
+    def __delitem__(self, index):
+        del self._recent[self._recent_index(index)]
+
+    def insert(self, index, value):
+        # Position as per list insert
+        if index < 0:
+            index = max(index + len(self), 0)
+        index = min(index, len(self))
+        if index < len(self._archive):
+            raise IndexError("archived states can't be modified")
+        self._recent.insert(index - len(self._archive), value)
+        self._compact()
+
+    def append(self, value):
+        self._recent.append(value)
+        self._compact()
+
+    def __copy__(self):
+        inst = self.__class__.__new__(self.__class__)
+        inst.policy = self.policy
+        inst._archive = self._archive.copy()
+        inst._archived = weakref.WeakValueDictionary(self._archived)
+        inst._recent = self._recent.copy()
+        return inst
+
+    def __repr__(self):
+        return f'{type(self).__name__}(<{self.num_archived} archived>, {self._recent!r})'
+
+
+class TrackHistoryPolicy(Base):
+    """Policy on which states of a track are kept in memory as full objects.
+
+    The most recent states, within :attr:`max_length` and/or :attr:`max_age`, are kept as
+    full objects, with older states moved to the :attr:`store`. Once moved, states can't be
+    modified, and only their mean, covariance and timestamp are available, so any component
+    requiring the full history (e.g. a smoother) can only be used on the recent states.
+    """
+    max_length: int = Property(
+        default=None, doc="Maximum number of most recent states kept in memory.")
+    max_age: datetime.timedelta = Property(
+        default=None,
+        doc="Maximum age of states kept in memory, relative to the latest state's timestamp. "
+            "The latest state is always kept.")
+    store: HistoryStore = Property(
+        default=None,
+        doc="Store for older states. Default `None`, where a new :class:`ArrayHistoryStore` "
+            "is used.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.max_length is None and self.max_age is None:
+            raise ValueError("max_length and/or max_age must be set")
+        if self.max_length is not None and self.max_length < 1:
+            raise ValueError("max_length must be positive")
+        if self.store is None:
+            self.store = ArrayHistoryStore()
+
+    def apply(self, track):
+        """Replace the states of `track` (or other :class:`~.StateMutableSequence`) with a
+        :class:`StateHistory` following this policy.
+
+        Returns
+        -------
+        : :class:`~.StateMutableSequence`
+            The same `track`.
+        """
+        track.states = StateHistory(self, track.states)
+        return track
@@ -1,7 +1,10 @@
 import copy
 import datetime
 import uuid
+from bisect import bisect_left, bisect_right
 from collections import abc
+from functools import lru_cache
+from itertools import islice
 from numbers import Integral
 from typing import MutableSequence, Any, Optional, Sequence, MutableMapping
 import typing
@@ -15,6 +18,18 @@ from .particle import Particle, MultiModelParticle, RaoBlackwellisedParticle
 from .numeric import Probability
 
 
+@lru_cache(maxsize=None)
+def _copy_plan(source_type, target_type):
+    """Properties to copy when creating `target_type` from an instance of `source_type`
+
+    Returns tuple of pairs of the index of the property in the target type's properties (such
+    that those given positionally can be skipped) and the property name."""
+    source_properties = source_type.properties
+    return tuple(
+        (index, name) for index, name in enumerate(target_type.properties)
+        if name in source_properties)
+
+
 class State(Type):
     """State type.
 
@@ -67,13 +82,11 @@ class State(Type):
         if target_type is None:
             target_type = type(state)
 
-        args_property_names = {
-            name for n, name in enumerate(target_type.properties) if n < len(args)}
-
+        n_args = len(args)
         new_kwargs = {
             name: getattr(state, name)
-            for name in type(state).properties.keys() & target_type.properties.keys()
-            if name not in args_property_names and name not in kwargs}
+            for index, name in _copy_plan(type(state), target_type)
+            if index >= n_args and name not in kwargs}
 
         new_kwargs.update(kwargs)
 
@@ -102,8 +115,19 @@ class CreatableFromState:
         if base_class not in CreatableFromState.class_mapping:
             CreatableFromState.class_mapping[base_class] = {}
         CreatableFromState.class_mapping[base_class][state_type] = cls
+        CreatableFromState._state_type.cache_clear()
         super().__init_subclass__(**kwargs)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _state_type(cls, input_type):
+        """Most specific type in :attr:`class_mapping` for `cls`, from the MRO of `input_type`"""
+        try:
+            return next(type_ for type_ in input_type.mro()
+                        if type_ in CreatableFromState.class_mapping[cls])
+        except StopIteration:
+            raise TypeError(f'{cls.__name__} type not defined for {input_type.__name__}')
+
     @classmethod
     def from_state(
             cls,
@@ -155,11 +179,7 @@ class CreatableFromState:
         # Handle being initialised with state sequence
         if isinstance(state, StateMutableSequence):
             state = state.state
-        try:
-            state_type = next(type_ for type_ in type(state).mro()
-                              if type_ in CreatableFromState.class_mapping[cls])
-        except StopIteration:
-            raise TypeError(f'{cls.__name__} type not defined for {type(state).__name__}')
+        state_type = CreatableFromState._state_type(cls, type(state))
         if target_type is None:
             target_type = CreatableFromState.class_mapping[cls][state_type]
 
@@ -233,6 +253,61 @@ class ASDState(Type):
 State.register(ASDState)
 
 
+class _TimestampIndex:
+    """Timestamps of a sequence of states, used to find states by time with a binary search.
+
+    The index is only usable where timestamps are in non-decreasing order, which is the case
+    where states are appended in time order.
+    """
+    __slots__ = ('states', 'timestamps', 'last_state', 'is_sorted')
+
+    def __init__(self, states):
+        self.states = states
+        self.timestamps = []
+        self.last_state = None
+        self.is_sorted = True
+        self.extend(states)
+
+    def extend(self, states):
+        timestamps = self.timestamps
+        for state in states:
+            timestamp = state.timestamp
+            if self.is_sorted and (
+                    timestamp is None
+                    or (timestamps and not self._in_order(timestamps[-1], timestamp))):
+                self.is_sorted = False
+            timestamps.append(timestamp)
+            self.last_state = state
+
+    def insert(self, position, state):
+        """Insert timestamp of `state`, inserted at `position` (non-negative) of the states."""
+        timestamps = self.timestamps
+        timestamp = state.timestamp
+        if self.is_sorted and (
+                timestamp is None
+                or (position > 0 and not self._in_order(timestamps[position - 1], timestamp))
+                or (position < len(timestamps)
+                    and not self._in_order(timestamp, timestamps[position]))):
+            self.is_sorted = False
+        timestamps.insert(position, timestamp)
+        if position == len(timestamps) - 1:
+            self.last_state = state
+
+    @staticmethod
+    def _in_order(first, second):
+        try:
+            return first <= second
+        except TypeError:  # e.g. mix of timezone aware and naive
+            return False
+
+    def is_current(self, states):
+        """Whether the index matches `states`, where states may have been appended since."""
+        length = len(self.timestamps)
+        return self.states is states \
+            and length <= len(states) \
+            and (length == 0 or states[length - 1] is self.last_state)
+
+
 class StateMutableSequence(Type, abc.MutableSequence):
     """A mutable sequence for :class:`~.State` instances
 
@@ -245,6 +320,13 @@ class StateMutableSequence(Type, abc.MutableSequence):
     If shallow copying, similar to a list, it is safe to add/remove states
     without affecting the original sequence.
 
+    On first indexing by time, an index of the state timestamps is built, which is
+    then kept up to date as states are added, such that where states are in time order,
+    lookups by time are :math:`O(\\log n)`. Where states are not in time order, a linear
+    search is used. States appended directly to :attr:`states` are accounted for, but other
+    modifications should be made via the sequence (e.g. ``sequence[index] = state``, rather than
+    ``sequence.states[index] = state``).
+
     Example
     -------
     >>> t0 = datetime.datetime(2018, 1, 1, 14, 00)
@@ -275,15 +357,69 @@ class StateMutableSequence(Type, abc.MutableSequence):
         return self.states.__len__()
 
     def __setitem__(self, index, value):
-        return self.states.__setitem__(index, value)
+        timestamp_index = self._current_timestamp_index()
+        self.states.__setitem__(index, value)
+        if timestamp_index is not None and isinstance(index, Integral):
+            position = index % len(self.states)
+            del timestamp_index.timestamps[position]
+            timestamp_index.insert(position, value)
+        else:
+            self._invalidate_timestamp_index()
 
     def __delitem__(self, index):
-        return self.states.__delitem__(index)
+        timestamp_index = self._current_timestamp_index()
+        self.states.__delitem__(index)
+        if timestamp_index is not None and isinstance(index, Integral):
+            # Removing a state leaves the rest in order
+            del timestamp_index.timestamps[index]
+            timestamp_index.last_state = self.states[-1] if self.states else None
+        else:
+            self._invalidate_timestamp_index()
+
+    def _current_timestamp_index(self):
+        """Timestamp index updated with any appended states, or `None` if there is no valid
+        index."""
+        states = self.states
+        timestamp_index = self.__dict__.get('_timestamp_index')
+        if timestamp_index is None or not timestamp_index.is_current(states):
+            return None
+        if len(timestamp_index.timestamps) < len(states):
+            # States appended, including any directly to `states`
+            timestamp_index.extend(islice(states, len(timestamp_index.timestamps), None))
+        return timestamp_index
+
+    def _invalidate_timestamp_index(self):
+        self.__dict__.pop('_timestamp_index', None)
+
+    def _get_timestamp_index(self):
+        """Index of timestamps, if states are sorted by time, or otherwise `None`."""
+        timestamp_index = self._current_timestamp_index()
+        if timestamp_index is None:
+            timestamp_index = self.__dict__['_timestamp_index'] = _TimestampIndex(self.states)
+        return timestamp_index if timestamp_index.is_sorted else None
+
+    def _states_slice(self, start, stop):
+        try:
+            return list(self.states[start:stop])
+        except TypeError:  # e.g. deque, which doesn't support slicing
+            return list(islice(self.states, start, stop))
 
     def __getitem__(self, index):
         if isinstance(index, slice) and (
                 isinstance(index.start, datetime.datetime)
                 or isinstance(index.stop, datetime.datetime)):
+            timestamp_index = self._get_timestamp_index()
+            if timestamp_index is not None:
+                timestamps = timestamp_index.timestamps
+                try:
+                    start = 0 if index.start is None else bisect_left(timestamps, index.start)
+                    stop = len(timestamps) if index.stop is None \
+                        else bisect_left(timestamps, index.stop)
+                except TypeError as exc:
+                    raise TypeError(
+                        'both indices must be `datetime.datetime` objects for'
+                        'time slice') from exc
+                return StateMutableSequence(self._states_slice(start, stop)[::index.step])
             items = []
             for state in self.states:
                 try:
@@ -298,6 +434,15 @@ class StateMutableSequence(Type, abc.MutableSequence):
                 items.append(state)
             return StateMutableSequence(items[::index.step])
         elif isinstance(index, datetime.datetime):
+            timestamp_index = self._get_timestamp_index()
+            if timestamp_index is not None:
+                try:
+                    position = bisect_right(timestamp_index.timestamps, index) - 1
+                except TypeError:
+                    position = -1
+                if position >= 0 and timestamp_index.timestamps[position] == index:
+                    return self.states[position]
+                raise IndexError('timestamp not found in states')
             for state in reversed(self.states):
                 if state.timestamp == index:
                     return state
@@ -339,10 +484,21 @@ class StateMutableSequence(Type, abc.MutableSequence):
         inst.__dict__.update(self.__dict__)
         property_name = self.__class__.states._property_name
         inst.__dict__[property_name] = copy.copy(self.__dict__[property_name])
+        inst.__dict__.pop('_timestamp_index', None)
         return inst
 
+    def append(self, value):
+        # Appended states are added to timestamp index on next use
+        self.states.append(value)
+
     def insert(self, index, value):
-        return self.states.insert(index, value)
+        timestamp_index = self._current_timestamp_index()
+        self.states.insert(index, value)
+        if timestamp_index is not None:
+            # Position as per list insert
+            position = min(max(index + len(timestamp_index.timestamps), 0), len(self.states) - 1) \
+                if index < 0 else min(index, len(self.states) - 1)
+            timestamp_index.insert(position, value)
 
     @property
     def state(self):
@@ -362,6 +518,15 @@ class StateMutableSequence(Type, abc.MutableSequence):
         State
             A state for each timestamp present in the sequence.
         """
+        timestamp_index = self._get_timestamp_index() if self.states else None
+        if timestamp_index is not None:
+            timestamps = timestamp_index.timestamps
+            for state, timestamp, next_timestamp in zip(
+                    self.states, timestamps, islice(timestamps, 1, None)):
+                if next_timestamp != timestamp:
+                    yield state
+            yield self.states[-1]
+            return
         state_iter = iter(self)
         current_state = next(state_iter)
         for next_state in state_iter:
@@ -613,6 +778,11 @@ class ParticleState(State):
 
     This is a particle state object which describes the state as a
     distribution of particles
+
+    Particles are stored as arrays: a :class:`~.StateVectors` of all particles, and a float
+    array of log weights. Individual :class:`~.Particle` objects and :class:`~.Probability`
+    weights are only created when accessed (e.g. via :attr:`particles` or :attr:`weight`), and
+    indexing with a slice returns a state which is a view of the same arrays.
     """
 
     state_vector: StateVectors = Property(doc='State vectors.')
@@ -637,7 +807,7 @@ class ParticleState(State):
         if weight is not None and log_weight is not None:
             raise ValueError("Cannot provide both weight and log weight")
         elif log_weight is None and weight is not None:
-            log_weight = np.log(np.asfarray(weight))
+            log_weight = np.log(np.asarray(weight, dtype=float))
             if idx is not None:
                 args[idx] = log_weight
             else:
@@ -652,8 +822,8 @@ class ParticleState(State):
         if self.particle_list and isinstance(self.particle_list, list):
             self.state_vector = \
                 StateVectors([particle.state_vector for particle in self.particle_list])
-            self.weight = \
-                np.array([Probability(particle.weight) for particle in self.particle_list])
+            self.log_weight = np.log(np.asarray(
+                [particle.weight for particle in self.particle_list], dtype=float))
             parent_list = [particle.parent for particle in self.particle_list]
 
             if parent_list.count(None) == 0:
@@ -667,6 +837,18 @@ class ParticleState(State):
 
         if self.state_vector is not None and not isinstance(self.state_vector, StateVectors):
             self.state_vector = StateVectors(self.state_vector)
+        if self.log_weight is not None and (not isinstance(self.log_weight, np.ndarray)
+                                            or self.log_weight.dtype != np.float_):
+            self.log_weight = np.asarray(self.log_weight, dtype=np.float_)
+
+    def _item_weight(self, item):
+        """Weight of single particle, without creating weights of all particles"""
+        try:
+            return self.__dict__['weight'][item]
+        except KeyError:
+            if self.log_weight is None:
+                return None
+            return Probability.from_log(self.log_weight[item])
 
     def __getitem__(self, item):
         if self.parent is not None:
@@ -681,7 +863,7 @@ class ParticleState(State):
 
         if isinstance(item, int):
             result = Particle(state_vector=self.state_vector[:, item],
-                              weight=self.weight[item] if self.weight is not None else None,
+                              weight=self._item_weight(item),
                               parent=parent)
         else:
             # Allow for Prediction/Update sub-types
@@ -747,7 +929,7 @@ class ParticleState(State):
         if value is None:
             self.log_weight = None
         else:
-            self.log_weight = np.log(np.asfarray(value))
+            self.log_weight = np.log(np.asarray(value, dtype=float))
             self.__dict__['weight'] = np.asanyarray(value)
 
     @weight.getter
@@ -803,7 +985,7 @@ class MultiModelParticleState(ParticleState):
         if isinstance(item, int):
             result = MultiModelParticle(
                 state_vector=self.state_vector[:, item],
-                weight=self.weight[item] if self.weight is not None else None,
+                weight=self._item_weight(item),
                 parent=parent,
                 dynamic_model=dynamic_model)
         else:
@@ -849,7 +1031,7 @@ class RaoBlackwellisedParticleState(ParticleState):
         if isinstance(item, int):
             result = RaoBlackwellisedParticle(
                 state_vector=self.state_vector[:, item],
-                weight=self.weight[item] if self.weight is not None else None,
+                weight=self._item_weight(item),
                 parent=parent,
                 model_probabilities=model_probabilities)
         else:
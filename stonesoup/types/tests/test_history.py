@@ -0,0 +1,155 @@
+import copy
+import datetime
+import gc
+
+import numpy as np
+import pytest
+
+from ..detection import Detection
+from ..history import (
+    ArrayHistoryStore, SQLiteHistoryStore, StateHistory, TrackHistoryPolicy)
+from ..hypothesis import SingleHypothesis
+from ..prediction import GaussianStatePrediction
+from ..state import State, GaussianState
+from ..track import Track
+from ..update import GaussianStateUpdate
+
+
+@pytest.fixture(params=['array', 'sqlite', 'sqlite_file'])
+def store(request, tmpdir):
+    if request.param == 'array':
+        yield ArrayHistoryStore()
+    else:
+        path = tmpdir.join('history.db') if request.param == 'sqlite_file' else None
+        with SQLiteHistoryStore(path) as store:
+            yield store
+
+
+def make_update(n, timestamp):
+    prediction = GaussianStatePrediction([[n], [1]], np.eye(2), timestamp=timestamp)
+    detection = Detection([[n]], timestamp=timestamp, metadata={'n': n})
+    return GaussianStateUpdate(
+        [[n], [1]], np.eye(2) * (n + 1), SingleHypothesis(prediction, detection),
+        timestamp=timestamp)
+
+
+def test_state_history(store):
+    start = datetime.datetime(2020, 1, 1)
+    delta = datetime.timedelta(seconds=1)
+    policy = TrackHistoryPolicy(max_length=5, store=store)
+    track = Track([make_update(n, start + delta*n) for n in range(3)])
+    policy.apply(track)
+    assert isinstance(track.states, StateHistory)
+
+    for n in range(3, 20):
+        track.append(make_update(n, start + delta*n))
+        assert track.states.num_archived == max(n + 1 - 5, 0)
+    assert len(track) == 20
+    assert track.metadata == {'n': 19}
+
+    # Recent states full objects
+    assert track[-5:][0].hypothesis.measurement.metadata == {'n': 15}
+    assert isinstance(track.state, GaussianStateUpdate)
+
+    del track
+    gc.collect()
+    track = Track([make_update(n, start + delta*n) for n in range(20)])
+    policy.apply(track)
+    gc.collect()
+    # Older states only mean, covariance and timestamp
+    for n, state in enumerate(track):
+        assert state.timestamp == start + delta*n
+        assert np.array_equal(state.mean, [[n], [1]])
+        assert np.array_equal(state.covar, np.eye(2) * (n + 1))
+        if n < 15:
+            assert type(state) is GaussianState
+        else:
+            assert isinstance(state, GaussianStateUpdate)
+    assert np.array_equal(track[3].mean, [[3], [1]])
+    assert [state.timestamp for state in track[-7:-3]] == [start + delta*n for n in range(13, 17)]
+
+    # Archived state is same object while referenced
+    state = track[2]
+    assert track[2] is state
+    assert track[start + delta*2] is state
+
+    # Time lookup and time slice
+    assert len(track[start + delta*10:start + delta*17]) == 7
+    assert track[start + delta*18].hypothesis.measurement.metadata == {'n': 18}
+
+    # Modifications to recent states
+    track.insert(-1, make_update(18.5, start + delta*18.5))
+    assert track[-2].timestamp == start + delta*18.5
+    assert len(track) == 21
+    assert track.metadatas[-2] == {'n': 18.5}
+    track[-1] = make_update(20, start + delta*20)
+    assert track.metadata == {'n': 20}
+    del track[-1]
+    assert track.timestamp == start + delta*18.5
+
+    # But not archived states
+    with pytest.raises(IndexError, match="archived states can't be modified"):
+        track.insert(0, make_update(-1, start - delta))
+    with pytest.raises(IndexError, match="archived states can't be modified"):
+        track[0] = make_update(0, start)
+    with pytest.raises(IndexError, match="archived states can't be modified"):
+        del track[:2]
+    with pytest.raises(IndexError):
+        track[21]
+
+    # Copies independent
+    track2 = copy.copy(track)
+    track2.append(make_update(21, start + delta*21))
+    track2.append(make_update(22, start + delta*22))
+    assert len(track2) == len(track) + 2
+    assert track2.states.num_archived == track.states.num_archived + 1
+    assert np.array_equal(track[-5].mean, [[15], [1]])
+    assert np.array_equal(track2[-5].mean, [[17], [1]])
+    assert [state.timestamp for state in track2][:-2] == [state.timestamp for state in track]
+
+
+def test_state_history_max_age(store):
+    start = datetime.datetime(2020, 1, 1)
+    delta = datetime.timedelta(seconds=1)
+    policy = TrackHistoryPolicy(max_age=delta*3, store=store)
+    states = StateHistory(policy)
+    for n in range(10):
+        states.append(State([[n]], timestamp=start + delta*n))
+        assert states.num_archived == max(n - 3, 0)
+    # Latest always kept
+    states.append(State([[10]], timestamp=start + delta*20))
+    assert states.num_archived == 10
+    assert len(states) == 11
+    # Without covariance
+    assert type(states[0]) is State
+    assert np.array_equal(states[5].state_vector, [[5]])
+    assert repr(states).startswith('StateHistory(<10 archived>, [State(')
+
+
+def test_state_history_discard():
+    store = SQLiteHistoryStore()
+    states = StateHistory(TrackHistoryPolicy(max_length=1, store=store))
+    for n in range(5):
+        states.append(State([[n]], timestamp=datetime.datetime(2020, 1, 1, 0, 0, n)))
+
+    def count():
+        return store._connection.execute('SELECT count(*) FROM states').fetchone()[0]
+    assert count() == 4
+    del states
+    gc.collect()
+    assert count() == 0
+    store.close()
+
+
+def test_track_history_policy_errors():
+    with pytest.raises(ValueError, match="max_length and/or max_age must be set"):
+        TrackHistoryPolicy()
+    with pytest.raises(ValueError, match="max_length must be positive"):
+        TrackHistoryPolicy(max_length=0)
+    assert isinstance(TrackHistoryPolicy(max_length=1).store, ArrayHistoryStore)
+
+    states = StateHistory(TrackHistoryPolicy(max_length=1))
+    states.append(State([[0]]))
+    states.append(State([[0, 1]]))
+    with pytest.raises(ValueError, match="same dimension"):
+        states.append(State([[0]]))
@@ -1,3 +1,4 @@
+import collections
 import copy
 import datetime
 
@@ -5,6 +6,7 @@ import numpy as np
 import pytest
 import scipy.linalg
 
+from ..base import Type
 from ..angle import Bearing
 from ..array import StateVector, StateVectors, CovarianceMatrix
 from ..groundtruth import GroundTruthState
@@ -322,6 +324,28 @@ def test_particlestate_angle():
     assert np.allclose(state.covar, CovarianceMatrix([[0.01, -1.5], [-1.5, 225]]))
 
 
+def test_particlestate_arrays():
+    particles = [Particle([[i]], weight=Probability((i + 1) / 55)) for i in range(10)]
+    state = ParticleState(None, particle_list=particles)
+
+    # Log weights stored as floats, without creating probability weights
+    assert state.log_weight.dtype == np.float_
+    assert np.allclose(state.log_weight, np.log(np.arange(1, 11) / 55))
+    assert 'weight' not in state.__dict__
+
+    particle = state[3]
+    assert particle.weight == Probability(4 / 55)
+    assert 'weight' not in state.__dict__
+
+    # Slices are views of the same arrays
+    sub_state = state[2:5]
+    assert np.shares_memory(sub_state.state_vector, state.state_vector)
+    assert np.shares_memory(sub_state.log_weight, state.log_weight)
+
+    state = ParticleState(StateVectors([[1, 2]]), log_weight=[0, 0])
+    assert state.log_weight.dtype == np.float_
+
+
 def test_particlestate_cache():
     num_particles = 10
     weight = Probability(1/num_particles)
@@ -473,6 +497,85 @@ def test_state_mutable_sequence_slice():
         sequence[timestamp-delta]
 
 
+def test_state_mutable_sequence_timestamp_index():
+    timestamp = datetime.datetime(2018, 1, 1, 14)
+    delta = datetime.timedelta(minutes=1)
+
+    def check(sequence):
+        # Compare with linear search of states
+        states = list(sequence.states)
+        for n in range(-1, 12):
+            time = timestamp + delta*n
+            matches = [state for state in states if state.timestamp == time]
+            if matches:
+                assert sequence[time] is matches[-1]
+            else:
+                with pytest.raises(IndexError):
+                    sequence[time]
+            assert sequence[time:].states \
+                == [state for state in states if state.timestamp >= time]
+            assert sequence[:time].states \
+                == [state for state in states if state.timestamp < time]
+            assert sequence[time:time + delta*3:2].states \
+                == [state for state in states if time <= state.timestamp < time + delta*3][::2]
+        last_states = [state for n, state in enumerate(states)
+                       if n == len(states) - 1 or states[n + 1].timestamp > state.timestamp]
+        assert list(sequence.last_timestamp_generator()) == last_states
+
+    sequence = StateMutableSequence(
+        [State([[n]], timestamp=timestamp + delta*n) for n in range(0, 10, 2)])
+    check(sequence)
+    timestamp_index = sequence._timestamp_index
+    assert timestamp_index.is_sorted
+
+    sequence.append(State([[10]], timestamp=timestamp + delta*10))
+    sequence.append(State([[11]], timestamp=timestamp + delta*10))  # Same time
+    sequence.insert(1, State([[1]], timestamp=timestamp + delta))
+    sequence.insert(-2, State([[9]], timestamp=timestamp + delta*9))
+    sequence.insert(-100, State([[-1]], timestamp=timestamp - delta))
+    sequence.insert(100, State([[11]], timestamp=timestamp + delta*11))
+    sequence[2] = State([[2]], timestamp=timestamp + delta*2)
+    sequence[-1] = State([[12]], timestamp=timestamp + delta*11)
+    del sequence[0]
+    del sequence[-2]
+    sequence.states.append(State([[13]], timestamp=timestamp + delta*11))  # Directly
+    check(sequence)
+    # Index maintained, rather than rebuilt
+    assert sequence._timestamp_index is timestamp_index
+    assert timestamp_index.is_sorted
+    assert len(timestamp_index.timestamps) == len(sequence)
+
+    # Out of order, falls back to linear search
+    sequence.insert(0, State([[4]], timestamp=timestamp + delta*4))
+    check(sequence)
+    assert not sequence._timestamp_index.is_sorted
+    del sequence[:1]
+    check(sequence)
+    assert sequence._timestamp_index.is_sorted
+
+    # States replaced, or bounded by deque
+    sequence.states = sequence.states[:3]
+    check(sequence)
+    sequence.states = collections.deque(sequence.states, maxlen=4)
+    for n in range(6, 10):
+        sequence.append(State([[n]], timestamp=timestamp + delta*n))
+        check(sequence)
+
+    # Copy has own index
+    sequence2 = copy.copy(sequence)
+    sequence2.append(State([[11]], timestamp=timestamp + delta*11))
+    check(sequence)
+    check(sequence2)
+
+    # Missing timestamp
+    sequence = StateMutableSequence([State([[0]], timestamp=None)])
+    with pytest.raises(TypeError):
+        sequence[timestamp:]
+    with pytest.raises(IndexError):
+        sequence[timestamp]
+    assert StateMutableSequence()[timestamp:].states == []
+
+
 def test_state_mutable_sequence_sequence_init():
     """Test initialising with an existing sequence"""
     state_vector = StateVector([[0]])
@@ -626,6 +729,38 @@ def test_from_state():
     assert new_state.metadata == new_metadata
 
 
+def test_from_state_target_type():
+    state = GaussianState([[1], [2]], np.eye(2), timestamp=datetime.datetime.now())
+
+    new_state = State.from_state(state, target_type=State)
+    assert type(new_state) is State
+    assert new_state.state_vector is state.state_vector
+    assert new_state.timestamp == state.timestamp
+
+    new_state = GaussianState.from_state(
+        State([[1], [2]]), timestamp=state.timestamp, covar=np.eye(2),
+        target_type=GaussianState)
+    assert type(new_state) is GaussianState
+    assert new_state.timestamp == state.timestamp
+
+
+def test_creatable_from_state_new_subclass():
+    class TestPrediction(Type, CreatableFromState):
+        pass
+
+    class TestStatePrediction(TestPrediction, State):
+        pass
+
+    assert type(TestPrediction.from_state(GaussianState([[1]], [[1]]))) is TestStatePrediction
+
+    # Newly defined subclass for more specific type must be used subsequently
+    class TestGaussianStatePrediction(TestPrediction, GaussianState):
+        pass
+
+    assert type(TestPrediction.from_state(GaussianState([[1]], [[1]]))) \
+        is TestGaussianStatePrediction
+
+
 # noinspection PyUnusedLocal
 def test_creatable_from_state_error():
     class SubclassCfs(CreatableFromState):
@@ -1,3 +1,4 @@
+import collections
 import copy
 import datetime
 
@@ -8,7 +9,7 @@ from ..detection import Detection
 from ..hypothesis import SingleHypothesis
 from ..numeric import Probability
 from ..state import State, GaussianState, ParticleState
-from ..track import Track
+from ..track import Track, TrackMetadatas
 from ..update import Update
 
 
@@ -212,3 +213,85 @@ def test_copy():
 
     assert len(track.metadatas) == 3
     assert len(copied_track.metadatas) == 4
+
+
+def test_track_metadatas_incremental():
+    def update(n):
+        metadata = {'n': n % 7} if n % 3 else {'n': n % 7, 'third': n}
+        return Update(hypothesis=SingleHypothesis(None, Detection([[n]], metadata=metadata)))
+
+    def expected_metadatas(track):
+        # Full recomputation from states
+        metadatas = []
+        metadata = track.init_metadata
+        for state in track.states:
+            metadata = metadata.copy()
+            if isinstance(state, Update):
+                metadata.update(state.hypothesis.measurement.metadata)
+            metadatas.append(metadata)
+        return metadatas
+
+    rng = np.random.RandomState(1990)
+    track = Track(init_metadata={'colour': 'red'})
+    for n in range(100):
+        if n % 4:
+            track.append(update(n))
+        else:
+            track.append(State([[n]]))
+    assert list(track.metadatas) == expected_metadatas(track)
+    # Only periodic snapshots and latest stored
+    assert len(track.metadatas._stored) <= 100 // TrackMetadatas.snapshot_interval + 2
+
+    for n in range(100, 200):
+        index = rng.randint(-len(track) - 2, len(track) + 2)
+        operation = rng.randint(3)
+        if operation == 0:
+            track.insert(index, update(n))
+        elif operation == 1:
+            track[index % len(track)] = update(n)
+        else:
+            track.append(update(n))
+        assert track.metadata == expected_metadatas(track)[-1]
+        position = rng.randint(len(track))
+        assert track.metadatas[position] == expected_metadatas(track)[position]
+    assert list(track.metadatas) == expected_metadatas(track)
+    assert track.metadatas[-3:] == expected_metadatas(track)[-3:]
+
+    # Manual modification of current metadata carried forward
+    track.metadata['manual'] = True
+    track.append(update(200))
+    track.append(State([[201]]))
+    assert track.metadata['manual'] is True
+    assert track.metadatas[-2]['manual'] is True
+
+    # Explicitly set metadata retained, without affecting others
+    expected = list(track.metadatas)
+    track.metadatas[50] = {'explicit': True}
+    expected[50] = {'explicit': True}
+    assert list(track.metadatas) == expected
+    del track.metadatas[49]
+    del expected[49]
+    assert list(track.metadatas) == expected
+    track.metadatas.insert(10, {'inserted': True})
+    expected.insert(10, {'inserted': True})
+    assert list(track.metadatas) == expected
+
+    # Copy independent
+    copied_track = copy.copy(track)
+    copied_track.append(update(202))
+    assert len(copied_track.metadatas) == len(track.metadatas) + 1
+    assert list(track.metadatas) == expected
+
+
+def test_track_metadatas_maxlen():
+    track = Track(
+        [Update(hypothesis=SingleHypothesis(None, Detection([[n]], metadata={'n': n})))
+         for n in range(5)])
+    track.metadatas = collections.deque(track.metadatas, 3)
+    assert isinstance(track.metadatas, TrackMetadatas)
+    assert list(track.metadatas) == [{'n': 2}, {'n': 3}, {'n': 4}]
+    for n in range(5, 10):
+        track.append(
+            Update(hypothesis=SingleHypothesis(None, Detection([[n]], metadata={'n': n}))))
+        assert len(track.metadatas) == 3
+    assert list(track.metadatas) == [{'n': 7}, {'n': 8}, {'n': 9}]
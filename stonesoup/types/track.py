@@ -1,5 +1,6 @@
 import copy
 import uuid
+from collections import abc
 from typing import MutableSequence, MutableMapping
 
 from .multihypothesis import MultipleHypothesis
@@ -8,6 +9,203 @@ from .update import Update
 from ..base import Property
 
 
+class TrackMetadatas(abc.MutableSequence):
+    """Sequence of the metadata of a track after each state.
+
+    Rather than a copy of the metadata for every state, this holds the changes made by each
+    state, with the full metadata stored only periodically (every :attr:`snapshot_interval`
+    states), and for the latest state. The metadata for any state is then found from the
+    nearest prior stored metadata and at most :attr:`snapshot_interval` changes, such that
+    appending is :math:`O(1)` in the number of states, and inserting or replacing a state
+    only discards stored metadata after that point, rather than recomputing it.
+
+    Metadata for the latest state (i.e. the track's current metadata), and any set explicitly
+    (e.g. ``metadatas[index] = {...}``) is stored as is, with the latest kept if modified in
+    place. Other entries are created on access, so changes made to these in place won't be
+    retained.
+
+    Parameters
+    ----------
+    init_metadata : dict
+        Metadata prior to the first state.
+    maxlen : int, optional
+        Maximum number of entries, after which the oldest entries are removed on append.
+        Default `None`, where unbounded.
+    """
+    #: Interval (in number of states) at which full metadata is stored.
+    snapshot_interval = 32
+
+    def __init__(self, init_metadata, maxlen=None):
+        self.init_metadata = init_metadata
+        self.maxlen = maxlen
+        self._changes = []  # Metadata changes for each state, or None if no change
+        self._stored = {}  # Index to full metadata
+        self._explicit = set()  # Indexes of metadata set explicitly
+        self._latest_copy = None  # Copy of latest metadata, to detect modifications
+
+    @classmethod
+    def from_sequence(cls, metadatas, init_metadata, changes=None, maxlen=None):
+        """Create from sequence of full metadata entries, with optional `changes` for each
+        entry, used if the sequence is later recomputed from a prior point."""
+        inst = cls(init_metadata, maxlen)
+        inst._stored = dict(enumerate(metadatas))
+        inst._explicit = set(inst._stored)
+        inst._changes = list(changes) if changes is not None else [None] * len(inst._stored)
+        return inst
+
+    def __len__(self):
+        return len(self._changes)
+
+    def _normalise_index(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('metadatas index out of range')
+        return index
+
+    def _build(self, index):
+        """Full metadata at index, from nearest prior stored metadata, storing snapshots
+        at interval along the way."""
+        start = index
+        while start >= 0 and start not in self._stored:
+            start -= 1
+        metadata = self._stored[start] if start >= 0 else self.init_metadata
+        for position in range(start + 1, index + 1):
+            changes = self._changes[position]
+            if changes or position == index or position % self.snapshot_interval == 0:
+                metadata = metadata.copy()
+                if changes:
+                    metadata.update(changes)
+            if position % self.snapshot_interval == 0:
+                self._stored[position] = metadata
+        return metadata
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        index = self._normalise_index(index)
+        try:
+            return self._stored[index]
+        except KeyError:
+            return self._build(index)
+
+    @property
+    def latest(self):
+        """Metadata of the latest state, which is stored, so may be modified in place."""
+        index = len(self) - 1
+        if index not in self._stored:
+            self._stored[index] = self._build(index)
+            self._latest_copy = self._stored[index].copy()
+        return self._stored[index]
+
+    def _latest_modified(self, index):
+        """Whether latest metadata, at index, has been modified in place."""
+        metadata = self._stored.get(index)
+        latest_copy = self._latest_copy
+        if metadata is None or latest_copy is None:
+            return False
+        return len(metadata) != len(latest_copy) or any(
+            metadata.get(key, latest_copy) is not value for key, value in latest_copy.items())
+
+    def _discard_from(self, index):
+        """Discard stored metadata from index onwards, as now out of date."""
+        for position in [position for position in self._stored if position >= index]:
+            del self._stored[position]
+        self._explicit = {position for position in self._explicit if position < index}
+
+    def _fix(self, index):
+        """Store metadata at index, so unaffected by changes prior to it."""
+        if 0 <= index < len(self) and index not in self._stored:
+            self._stored[index] = self._build(index)
+            self._explicit.add(index)
+
+    def _shift(self, index, offset):
+        """Shift stored metadata at or after index by offset."""
+        self._stored = {
+            position + offset if position >= index else position: metadata
+            for position, metadata in self._stored.items()}
+        self._explicit = {
+            position + offset if position >= index else position
+            for position in self._explicit}
+
+    def append_changes(self, changes):
+        """Add metadata of a new state, with `changes` (or `None`) to prior metadata."""
+        previous_index = len(self) - 1
+        metadata = (self.latest if previous_index >= 0 else self.init_metadata).copy()
+        if changes:
+            metadata.update(changes)
+        self._changes.append(changes)
+        if previous_index >= 0 and previous_index % self.snapshot_interval != 0 \
+                and previous_index not in self._explicit:
+            if self._latest_modified(previous_index):
+                # Keep, such that manual modifications are retained
+                self._explicit.add(previous_index)
+            else:
+                del self._stored[previous_index]
+        self._stored[previous_index + 1] = metadata
+        self._latest_copy = metadata.copy()
+        if self.maxlen is not None and len(self) > self.maxlen:
+            del self[0]
+
+    def insert_changes(self, index, changes):
+        """Insert metadata of a new state at `index` (non-negative), with `changes` (or
+        `None`). Metadata from `index` onwards is then recomputed as required."""
+        self._changes.insert(index, changes)
+        self._discard_from(index)
+
+    def set_changes(self, index, changes):
+        """Replace metadata changes at `index` (non-negative), with `changes` (or `None`).
+        Metadata from `index` onwards is then recomputed as required."""
+        self._changes[index] = changes
+        self._discard_from(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            raise TypeError('slice assignment not supported')
+        index = self._normalise_index(index)
+        self._fix(index + 1)
+        self._stored[index] = value
+        self._explicit.add(index)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for position in sorted(range(*index.indices(len(self))), reverse=True):
+                del self[position]
+            return
+        index = self._normalise_index(index)
+        self._fix(index + 1)
+        del self._changes[index]
+        self._stored.pop(index, None)
+        self._explicit.discard(index)
+        self._shift(index + 1, -1)
+
+    def insert(self, index, value):
+        if index < 0:
+            index = max(index + len(self), 0)
+        index = min(index, len(self))
+        self._fix(index)
+        self._shift(index, 1)
+        self._changes.insert(index, None)
+        self._stored[index] = value
+        self._explicit.add(index)
+
+    def __eq__(self, other):
+        if not isinstance(other, abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __copy__(self):
+        inst = self.__class__.__new__(self.__class__)
+        inst.__dict__.update(self.__dict__)
+        inst._changes = self._changes.copy()
+        inst._stored = self._stored.copy()
+        inst._explicit = self._explicit.copy()
+        return inst
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)!r})'
+
+
 class Track(StateMutableSequence):
     """Track type
 
@@ -19,6 +217,11 @@ class Track(StateMutableSequence):
         For example, inserting a state at the start of :attr:`states` will result in a
         :attr:`metadatas` update that will update all subsequent metadata values, resulting in
         manual metadata modifications being lost.
+
+        Metadata of states is held in a :class:`TrackMetadatas`, which only stores the changes
+        made by each state, and the full metadata periodically. Manual modifications should
+        therefore be to the current :attr:`metadata`, or by setting an entry of
+        :attr:`metadatas`, as in place changes to earlier entries may not be retained.
     """
 
     states: MutableSequence[State] = Property(
@@ -35,7 +238,7 @@ class Track(StateMutableSequence):
 
         super().__init__(*args, **kwargs)
 
-        self.metadatas = list()
+        self.__dict__['metadatas'] = TrackMetadatas(self.init_metadata)
 
         for state in self.states:
             self._update_metadata_from_state(state)
@@ -46,13 +249,31 @@ class Track(StateMutableSequence):
         super().__setitem__(index, value)
         if index < 0:
             index = len(self.states) + index
-        self._update_metadatas(index)
+        self.metadatas.set_changes(index, self._metadata_changes(value))
 
     def __copy__(self):
         inst = super().__copy__()
         inst.__dict__['metadatas'] = copy.copy(self.__dict__['metadatas'])
         return inst
 
+    @property
+    def metadatas(self):
+        """Metadata of the track after each state, as a :class:`TrackMetadatas`. This can be
+        set with a sequence of metadata dictionaries (e.g. a :class:`list`)."""
+        return self.__dict__['metadatas']
+
+    @metadatas.setter
+    def metadatas(self, value):
+        if not isinstance(value, TrackMetadatas):
+            value = list(value) if not isinstance(value, abc.Sequence) else value
+            # Changes from corresponding (last) states, should metadata be recomputed
+            states = list(self.states)[-len(value):] if value else []
+            changes = [self._metadata_changes(state) for state in states]
+            changes = [None] * (len(value) - len(changes)) + changes
+            value = TrackMetadatas.from_sequence(
+                value, self.init_metadata, changes, maxlen=getattr(value, 'maxlen', None))
+        self.__dict__['metadatas'] = value
+
     def insert(self, index, value):
         """Insert value at index of :attr:`states`.
 
@@ -72,7 +293,7 @@ class Track(StateMutableSequence):
                 index += len(self.states) - 1
         elif index >= len(self.states):
             index = len(self.states) - 1
-        self._update_metadatas(index)
+        self.metadatas.insert_changes(index, self._metadata_changes(value))
 
     def append(self, value):
         """Add value at end of :attr:`states`.
@@ -91,7 +312,7 @@ class Track(StateMutableSequence):
         """Current metadata dictionary of track. If track contains no states, this is the initial
         metadata dictionary :attr:`init_metadata`."""
         if self.metadatas:
-            return self.metadatas[-1]
+            return self.metadatas.latest
         else:
             return self.init_metadata
 
@@ -103,11 +324,8 @@ class Track(StateMutableSequence):
         index: Int
             Index of :attr:`metadatas` to update from.
         """
-        # Plus one for 0th initial track meta data
-        self.metadatas = self.metadatas[:index]
-
-        for future_state in self.states[index:]:
-            self._update_metadata_from_state(future_state)
+        for position, state in enumerate(self.states[index:], index):
+            self.metadatas.set_changes(position, self._metadata_changes(state))
 
     def _update_metadata_from_state(self, state):
         """Update :attr:`metadatas` with an updated metadata entry, accounting for extracted
@@ -120,20 +338,28 @@ class Track(StateMutableSequence):
             Update (or subclassed) objects. Calling this method with a non-Update (subclass) object
             will NOT raise an error, but will have no effect on the metadata.
         """
-        self.metadatas.append(self.metadata.copy())
-
-        if isinstance(state, Update):
-            if isinstance(state.hypothesis, MultipleHypothesis):
-                # Sort and iterate through multiple hypotheses such that most
-                # likely hypothesis comes last. This ensures that metadata
-                # from all hypotheses are retained, but more likely
-                # hypotheses will over-write the metadata set by less likely
-                # ones.
-                for hypothesis in sorted(state.hypothesis, reverse=True):
-                    if hypothesis \
-                            and hypothesis.measurement.metadata is not None:
-                        self.metadata.update(hypothesis.measurement.metadata)
-            else:
-                hypothesis = state.hypothesis
-                if hypothesis and hypothesis.measurement.metadata is not None:
-                    self.metadata.update(hypothesis.measurement.metadata)
+        self.metadatas.append_changes(self._metadata_changes(state))
+
+    @staticmethod
+    def _metadata_changes(state):
+        """Metadata changes from state, or `None` if no changes."""
+        if not isinstance(state, Update):
+            return None
+        if isinstance(state.hypothesis, MultipleHypothesis):
+            # Sort and iterate through multiple hypotheses such that most
+            # likely hypothesis comes last. This ensures that metadata
+            # from all hypotheses are retained, but more likely
+            # hypotheses will over-write the metadata set by less likely
+            # ones.
+            changes = {}
+            for hypothesis in sorted(state.hypothesis, reverse=True):
+                if hypothesis \
+                        and hypothesis.measurement.metadata is not None:
+                    changes.update(hypothesis.measurement.metadata)
+            return changes or None
+        else:
+            hypothesis = state.hypothesis
+            if hypothesis and hypothesis.measurement.metadata is not None:
+                # Shared with measurement, rather than copied
+                return hypothesis.measurement.metadata or None
+            return None
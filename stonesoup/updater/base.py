@@ -84,3 +84,22 @@ class Updater(Base):
             The state posterior
         """
         raise NotImplementedError
+
+    def update_batch(self, hypotheses, **kwargs):
+        """Update many states using their predictions and measurements
+
+        By default, this simply calls :meth:`update` for each hypothesis, but
+        subclasses may override this to process all hypotheses at once.
+
+        Parameters
+        ----------
+        hypotheses : sequence of :class:`~.Hypothesis`
+            Hypotheses with predicted state and associated detection used for
+            updating.
+
+        Returns
+        -------
+        : list of :class:`~.State`
+            The state posteriors, in same order as `hypotheses`
+        """
+        return [self.update(hypothesis, **kwargs) for hypothesis in hypotheses]
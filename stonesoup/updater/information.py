@@ -3,8 +3,10 @@ from functools import lru_cache
 import numpy as np
 
 from ..base import Property
+from ..types.array import PrecisionMatrix, StateVector
 from ..types.prediction import GaussianMeasurementPrediction
 from ..types.update import Update
+from ..models.base import LinearModel
 from ..models.measurement.linear import LinearGaussian
 from ..updater.kalman import KalmanUpdater
 
@@ -28,7 +30,8 @@ class InformationKalmanUpdater(KalmanUpdater):
     ----
     Analogously with the :class:`~.InformationKalmanPredictor`, the measurement model is queried
     for the existence of an :meth:`inverse_covar()` property. If absent, the :meth:`covar()` is
-    inverted.
+    inverted, unless it is diagonal, in which case the reciprocal of its diagonal is used (i.e.
+    the measurement elements are processed as independent scalar updates).
 
     """
     measurement_model: LinearGaussian = Property(
@@ -57,7 +60,14 @@ class InformationKalmanUpdater(KalmanUpdater):
         if hasattr(measurement_model, 'inverse_covar'):
             inv_measurement_covar = measurement_model.inverse_covar(**kwargs)
         else:
-            inv_measurement_covar = np.linalg.inv(measurement_model.covar(**kwargs))
+            measurement_covar = measurement_model.covar(**kwargs)
+            variances = np.diagonal(measurement_covar)
+            if np.count_nonzero(measurement_covar - np.diag(variances)) == 0 \
+                    and np.all(variances > 0):
+                # Diagonal, so no need to invert
+                inv_measurement_covar = np.diag(1 / variances)
+            else:
+                inv_measurement_covar = np.linalg.inv(measurement_covar)
 
         return inv_measurement_covar
 
@@ -140,3 +150,67 @@ class InformationKalmanUpdater(KalmanUpdater):
         return Update.from_state(hypothesis.prediction, posterior_information_mean,
                                  posterior_precision,
                                  timestamp=hypothesis.measurement.timestamp, hypothesis=hypothesis)
+
+    def update_batch(self, hypotheses, **kwargs):
+        r"""Information filter update for many hypotheses at once
+
+        Hypotheses are grouped by measurement model, such that :math:`H^{T}_k R^{-1}_k H_k` and
+        :math:`H^{T}_k R^{-1}_k` are computed once per model, and the precisions and information
+        states of each group are then updated together.
+
+        Where a measurement model isn't linear, or a subclass changes how updates are made, this
+        falls back to calling :meth:`update` for each hypothesis.
+
+        Parameters
+        ----------
+        hypotheses : sequence of :class:`~.SingleHypothesis`
+            Hypotheses with predicted information state and associated detection used for
+            updating.
+
+        Returns
+        -------
+        : list of :class:`~.InformationStateUpdate`
+            The posterior information states, in same order as `hypotheses`
+        """
+        hypotheses = list(hypotheses)
+        if not hypotheses:
+            return []
+
+        measurement_models = [
+            self._check_measurement_model(hypothesis.measurement.measurement_model)
+            for hypothesis in hypotheses]
+        if kwargs \
+                or not all(isinstance(model, LinearModel) for model in measurement_models) \
+                or type(self).update is not InformationKalmanUpdater.update \
+                or type(self)._inverse_measurement_covar \
+                is not InformationKalmanUpdater._inverse_measurement_covar:
+            return super().update_batch(hypotheses, **kwargs)
+
+        model_indices = {}
+        for index, measurement_model in enumerate(measurement_models):
+            model_indices.setdefault(measurement_model, []).append(index)
+
+        updates = [None] * len(hypotheses)
+        for measurement_model, indices in model_indices.items():
+            group = [hypotheses[index] for index in indices]
+            hh = measurement_model.matrix()
+            hh_invr = hh.T @ self._inverse_measurement_covar(measurement_model)
+
+            precisions = np.stack([hypothesis.prediction.precision for hypothesis in group])
+            info_means = np.stack([hypothesis.prediction.state_vector for hypothesis in group])
+            measurements = np.stack([hypothesis.measurement.state_vector for hypothesis in group])
+
+            post_precisions = precisions + hh_invr @ hh
+            post_info_means = info_means + hh_invr @ measurements
+
+            if self.force_symmetric_covariance:
+                post_precisions = (post_precisions + np.swapaxes(post_precisions, -1, -2))/2
+
+            for index, hypothesis, post_info_mean, post_precision in zip(
+                    indices, group, post_info_means, post_precisions):
+                updates[index] = Update.from_state(
+                    hypothesis.prediction,
+                    post_info_mean.view(StateVector), post_precision.view(PrecisionMatrix),
+                    timestamp=hypothesis.measurement.timestamp, hypothesis=hypothesis)
+
+        return updates
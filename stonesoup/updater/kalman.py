@@ -6,13 +6,13 @@ from functools import lru_cache
 
 from ..base import Property
 from .base import Updater
-from ..types.array import CovarianceMatrix
+from ..types.array import CovarianceMatrix, StateVector
 from ..types.prediction import MeasurementPrediction
 from ..types.update import Update
 from ..models.base import LinearModel
 from ..models.measurement.linear import LinearGaussian
 from ..models.measurement import MeasurementModel
-from ..functions import gauss2sigma, unscented_transform
+from ..functions import gauss2sigma_state, unscented_transform, tria
 from ..measures import Measure, Euclidean
 
 
@@ -363,12 +363,12 @@ class UnscentedKalmanUpdater(KalmanUpdater):
 
         measurement_model = self._check_measurement_model(measurement_model)
 
-        sigma_points, mean_weights, covar_weights = \
-            gauss2sigma(predicted_state,
-                        self.alpha, self.beta, self.kappa)
+        sigma_points_state, mean_weights, covar_weights = \
+            gauss2sigma_state(predicted_state,
+                              self.alpha, self.beta, self.kappa)
 
         meas_pred_mean, meas_pred_covar, cross_covar, _, _, _ = \
-            unscented_transform(sigma_points, mean_weights, covar_weights,
+            unscented_transform(sigma_points_state, mean_weights, covar_weights,
                                 measurement_model.function,
                                 covar_noise=measurement_model.covar())
 
@@ -395,12 +395,20 @@ class SqrtKalmanUpdater(KalmanUpdater):
        aerospace research and development, London 1970
     2. Andrews, A. 1968, A square root formulation of the Kalman covariance equations, AIAA
        Journal, 6:6, 1165-1166
+    3. Bierman, G.J. 1977, Factorization Methods for Discrete Sequential Estimation, Academic
+       Press, New York
 
     """
     qr_method: bool = Property(
         default=False,
         doc="A switch to do the update via a QR decomposition, rather than using the (vector form "
             "of) the Potter method.")
+    sequential: bool = Property(
+        default=False,
+        doc="A switch to process the measurement elements one at a time, as a sequence of scalar "
+            "(Potter) updates, where the measurement noise covariance is diagonal. This requires "
+            "no matrix inversion or decomposition. If the noise covariance isn't diagonal, this "
+            "is ignored. Default `False`.")
 
     def _measurement_cross_covariance(self, predicted_state, measurement_matrix):
         """
@@ -444,13 +452,124 @@ class SqrtKalmanUpdater(KalmanUpdater):
             The innovation covariance
 
         """
-        # If the measurement covariance matrix is square root then square it
+        return m_cross_cov.T @ m_cross_cov + self._measurement_noise_covariance(meas_mod)
+
+    @staticmethod
+    def _measurement_noise_covariance(measurement_model):
+        """Return the full measurement noise covariance, :math:`R`, squaring it if the
+        measurement model provides it in square root form via :attr:`sqrt_covar`."""
         try:
-            meas_cov = meas_mod.sqrt_covar @ meas_mod.sqrt_covar.T
+            return measurement_model.sqrt_covar @ measurement_model.sqrt_covar.T
         except AttributeError:
-            meas_cov = meas_mod.covar()
+            return measurement_model.covar()
+
+    @staticmethod
+    def _noise_variances(noise_covar):
+        """Return the diagonal of the measurement noise covariance, or `None` if it isn't
+        diagonal with positive elements, such that sequential processing isn't possible."""
+        variances = np.diagonal(noise_covar)
+        if np.count_nonzero(noise_covar - np.diag(variances)) or np.any(variances <= 0):
+            return None
+        return variances
+
+    @staticmethod
+    def _qr_update(sqrt_covars, measurement_matrix, sqrt_noise_covar):
+        r"""Square root update of a stack of predicted states via a QR decomposition
+
+        The lower triangular form of the pre-array
+
+        .. math::
+
+            \begin{bmatrix} R^{1/2} & H W_{k|k-1} \\ 0 & W_{k|k-1} \end{bmatrix}
+            \rightarrow
+            \begin{bmatrix} S^{1/2} & 0 \\ K S^{1/2} & W_{k|k} \end{bmatrix}
+
+        is found for all predicted states at once with :func:`~.tria`.
+
+        Parameters
+        ----------
+        sqrt_covars : numpy.ndarray
+            Predicted square root covariances, :math:`W_{k|k-1}`, of shape (N, n, n)
+        measurement_matrix : numpy.ndarray
+            The measurement matrix, :math:`H`, of shape (m, n)
+        sqrt_noise_covar : numpy.ndarray
+            Square root of the measurement noise covariance, :math:`R^{1/2}`
+
+        Returns
+        -------
+        : numpy.ndarray
+            Posterior square root covariances, :math:`W_{k|k}`, of shape (N, n, n)
+        : numpy.ndarray
+            Kalman gains, :math:`K`, of shape (N, n, m)
+        """
+        ndim_meas = measurement_matrix.shape[0]
+        ndim_state = measurement_matrix.shape[1]
+        pre_arrays = np.zeros((len(sqrt_covars), ndim_meas + ndim_state, ndim_meas + ndim_state))
+        pre_arrays[:, :ndim_meas, :ndim_meas] = sqrt_noise_covar
+        pre_arrays[:, :ndim_meas, ndim_meas:] = measurement_matrix @ sqrt_covars
+        pre_arrays[:, ndim_meas:, ndim_meas:] = sqrt_covars
+
+        post_arrays = tria(pre_arrays)
+        sqrt_innov_covars = post_arrays[:, :ndim_meas, :ndim_meas]
+        # Lower left block is K S^{1/2}, so solve for K
+        kalman_gains = np.swapaxes(np.linalg.solve(
+            np.swapaxes(sqrt_innov_covars, -1, -2),
+            np.swapaxes(post_arrays[:, ndim_meas:, :ndim_meas], -1, -2)), -1, -2)
+
+        return post_arrays[:, ndim_meas:, ndim_meas:], kalman_gains
+
+    @staticmethod
+    def _sequential_update(sqrt_covars, measurement_matrix, noise_variances):
+        r"""Square root update of a stack of predicted states, processing the measurement
+        elements one at a time
+
+        For each measurement element, with measurement matrix row :math:`h` and noise variance
+        :math:`r`, Potter's scalar update [3] is
+
+        .. math::
+
+            \phi = W^T h^T, \quad \alpha = \phi^T \phi + r, \quad
+            \gamma = \frac{1}{1 + \sqrt{r / \alpha}}
+
+            W \leftarrow W - \frac{\gamma}{\alpha} W \phi \phi^T
 
-        return m_cross_cov.T @ m_cross_cov + meas_cov
+        with gain :math:`k = W \phi / \alpha`, which requires no matrix inversion. The gains are
+        accumulated into an overall Kalman gain :math:`K`, such that the posterior mean is
+        :math:`\mathbf{x}_{k|k-1} + K (\mathbf{z}_k - H \mathbf{x}_{k|k-1})`, as with the
+        other methods.
+
+        Parameters
+        ----------
+        sqrt_covars : numpy.ndarray
+            Predicted square root covariances, :math:`W_{k|k-1}`, of shape (N, n, n)
+        measurement_matrix : numpy.ndarray
+            The measurement matrix, :math:`H`, of shape (m, n)
+        noise_variances : numpy.ndarray
+            The diagonal of the measurement noise covariance, of length m
+
+        Returns
+        -------
+        : numpy.ndarray
+            Posterior square root covariances, :math:`W_{k|k}`, of shape (N, n, n)
+        : numpy.ndarray
+            Kalman gains, :math:`K`, of shape (N, n, m)
+        """
+        sqrt_covars = np.array(sqrt_covars, dtype=np.float64)
+        ndim_meas, ndim_state = measurement_matrix.shape
+        kalman_gains = np.zeros((len(sqrt_covars), ndim_state, ndim_meas))
+        for index, (row, variance) in enumerate(zip(measurement_matrix, noise_variances)):
+            phi = np.swapaxes(sqrt_covars, -1, -2) @ row
+            alpha = np.einsum('...i,...i->...', phi, phi) + variance
+            gamma = 1 / (1 + np.sqrt(variance / alpha))
+            gains = (sqrt_covars @ phi[..., np.newaxis]) / alpha[:, np.newaxis, np.newaxis]
+            sqrt_covars -= gamma[:, np.newaxis, np.newaxis] * gains * phi[:, np.newaxis, :]
+
+            # Element's innovation, in terms of the original innovation, is (e_i - h G) nu
+            weights = -(row @ kalman_gains)
+            weights[:, index] += 1
+            kalman_gains += gains * weights[:, np.newaxis, :]
+
+        return sqrt_covars, kalman_gains
 
     def _posterior_covariance(self, hypothesis):
         """
@@ -469,9 +588,11 @@ class SqrtKalmanUpdater(KalmanUpdater):
 
         Method
         ------
-        If the :attr:`qr_method` flag is set to True then the update proceeds via a QR
-        decomposition which requires only one further matrix inversion (see [1]), rather than
-        three plus a Cholesky factorisation, for the method set out in [2].
+        If the :attr:`sequential` flag is set to True and the measurement noise covariance is
+        diagonal, the measurement elements are processed one at a time, requiring no matrix
+        inversion (see [3]). Otherwise, if the :attr:`qr_method` flag is set to True then the
+        update proceeds via a QR decomposition which requires only one further matrix inversion
+        (see [1]), rather than three plus a Cholesky factorisation, for the method set out in [2].
 
         Returns
         -------
@@ -485,6 +606,17 @@ class SqrtKalmanUpdater(KalmanUpdater):
         # Do we already have a measurement model?
         measurement_model = \
             self._check_measurement_model(hypothesis.measurement.measurement_model)
+
+        if self.sequential:
+            noise_variances = self._noise_variances(
+                self._measurement_noise_covariance(measurement_model))
+            if noise_variances is not None:
+                post_covs, kalman_gains = self._sequential_update(
+                    hypothesis.prediction.sqrt_covar[np.newaxis, ...],
+                    np.asarray(measurement_model.matrix(), dtype=np.float64),
+                    noise_variances)
+                return post_covs[0], kalman_gains[0]
+
         # Square root of the noise covariance, account for the fact that it may be supplied in one
         # of two ways
         try:
@@ -525,6 +657,98 @@ class SqrtKalmanUpdater(KalmanUpdater):
 
         return post_cov, kalman_gain
 
+    def update_batch(self, hypotheses, **kwargs):
+        r"""Square root Kalman update for many hypotheses at once
+
+        Hypotheses are grouped by measurement model, and the square root updates of each group
+        are carried out with stacked operations: a single stacked QR decomposition (see
+        :meth:`_qr_update`) or, if :attr:`sequential` is set and the measurement noise covariance
+        is diagonal, stacked scalar updates (see :meth:`_sequential_update`). The QR form is used
+        irrespective of :attr:`qr_method`, so the posterior square root covariances may differ
+        from those of :meth:`update` by an orthogonal transformation, but the full covariances
+        are equivalent.
+
+        Where a measurement model isn't linear, or a subclass changes how updates are made, this
+        falls back to calling :meth:`update` for each hypothesis.
+
+        Parameters
+        ----------
+        hypotheses : sequence of :class:`~.SingleHypothesis`
+            Hypotheses with predicted state and associated detection used for updating. Those
+            without a measurement prediction will have one attached.
+
+        Returns
+        -------
+        : list of :class:`~.SqrtGaussianStateUpdate`
+            The state posteriors, in same order as `hypotheses`
+        """
+        hypotheses = list(hypotheses)
+        if not hypotheses:
+            return []
+
+        measurement_models = [
+            self._check_measurement_model(hypothesis.measurement.measurement_model)
+            for hypothesis in hypotheses]
+        if kwargs \
+                or not all(isinstance(model, LinearModel) for model in measurement_models) \
+                or any(getattr(type(self), name) is not getattr(SqrtKalmanUpdater, name)
+                       for name in ('update', 'predict_measurement', '_measurement_matrix',
+                                    '_measurement_cross_covariance', '_innovation_covariance',
+                                    '_posterior_covariance')):
+            return super().update_batch(hypotheses, **kwargs)
+
+        model_indices = {}
+        for index, measurement_model in enumerate(measurement_models):
+            model_indices.setdefault(measurement_model, []).append(index)
+
+        updates = [None] * len(hypotheses)
+        for measurement_model, indices in model_indices.items():
+            group = [hypotheses[index] for index in indices]
+            meas_mat = np.asarray(measurement_model.matrix(), dtype=np.float64)
+            noise_cov = self._measurement_noise_covariance(measurement_model)
+            means = np.stack([hypothesis.prediction.state_vector for hypothesis in group])
+            sqrt_covars = np.stack([hypothesis.prediction.sqrt_covar for hypothesis in group])
+
+            # Attach measurement predictions, as :meth:`update` would
+            if any(hypothesis.measurement_prediction is None for hypothesis in group):
+                pred_meas = meas_mat @ means
+                cross_covs = np.swapaxes(sqrt_covars, -1, -2) @ meas_mat.T
+                innov_covs = np.swapaxes(cross_covs, -1, -2) @ cross_covs + noise_cov
+                for hypothesis, pred_mea, cross_cov, innov_cov in zip(
+                        group, pred_meas, cross_covs, innov_covs):
+                    if hypothesis.measurement_prediction is None:
+                        hypothesis.measurement_prediction = MeasurementPrediction.from_state(
+                            hypothesis.prediction, pred_mea.view(StateVector),
+                            innov_cov.view(CovarianceMatrix), cross_covar=cross_cov)
+
+            noise_variances = self._noise_variances(noise_cov) if self.sequential else None
+            if noise_variances is not None:
+                post_covs, kalman_gains = self._sequential_update(
+                    sqrt_covars, meas_mat, noise_variances)
+            else:
+                try:
+                    sqrt_noise_cov = measurement_model.sqrt_covar
+                except AttributeError:
+                    sqrt_noise_cov = np.linalg.cholesky(noise_cov)
+                post_covs, kalman_gains = self._qr_update(sqrt_covars, meas_mat, sqrt_noise_cov)
+
+            innovations = np.stack([
+                hypothesis.measurement.state_vector
+                - hypothesis.measurement_prediction.state_vector
+                for hypothesis in group])
+            post_means = means + kalman_gains @ innovations
+            if self.force_symmetric_covariance:
+                post_covs = (post_covs + np.swapaxes(post_covs, -1, -2))/2
+
+            for index, hypothesis, post_mean, post_cov in zip(
+                    indices, group, post_means, post_covs):
+                updates[index] = Update.from_state(
+                    hypothesis.prediction,
+                    post_mean.view(StateVector), post_cov.view(CovarianceMatrix),
+                    timestamp=hypothesis.measurement.timestamp, hypothesis=hypothesis)
+
+        return updates
+
 
 class IteratedKalmanUpdater(ExtendedKalmanUpdater):
     r"""This version of the Kalman updater runs an iteration over the linearisation of the
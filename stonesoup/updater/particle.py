@@ -8,11 +8,14 @@ from scipy.special import logsumexp
 from .base import Updater
 from .kalman import KalmanUpdater, ExtendedKalmanUpdater
 from ..base import Property
-from ..functions import cholesky_eps, sde_euler_maruyama_integration
+from ..functions import cholesky_eps, sde_euler_maruyama_integration, segmented_logsumexp
 from ..predictor.particle import MultiModelPredictor, RaoBlackwellisedMultiModelPredictor
 from ..resampler import Resampler
+from ..resampler.particle import ParticleResampler
+from ..types.array import StateVectors
 from ..types.prediction import (
     Prediction, ParticleMeasurementPrediction, GaussianStatePrediction, MeasurementPrediction)
+from ..types.state import State
 from ..types.update import ParticleStateUpdate, Update
 
 
@@ -43,7 +46,7 @@ class ParticleUpdater(Updater):
         : :class:`~.ParticleState`
             The state posterior
         """
-        predicted_state = copy.copy(hypothesis.prediction)
+        predicted_state = hypothesis.prediction
 
         if hypothesis.measurement.measurement_model is None:
             measurement_model = self.measurement_model
@@ -56,20 +59,113 @@ class ParticleUpdater(Updater):
         # Normalise the weights
         new_weight -= logsumexp(new_weight)
 
-        predicted_state.log_weight = new_weight
-
         # Resample
-        if self.resampler is not None:
+        if isinstance(self.resampler, ParticleResampler):
+            # Only indices required, avoiding copying intermediate particle state. Other
+            # per-particle attributes (e.g. parent) are selected along with particles.
+            index = self.resampler.resample_indices(new_weight)
+            predicted_state = predicted_state[index]
+            new_weight = np.full(len(index), -np.log(len(index)))
+        elif self.resampler is not None:
+            predicted_state = copy.copy(predicted_state)
+            predicted_state.log_weight = new_weight
             predicted_state = self.resampler.resample(predicted_state)
+            new_weight = predicted_state.log_weight
 
         return Update.from_state(
-            state=hypothesis.prediction,
-            state_vector=predicted_state.state_vector,
-            log_weight=predicted_state.log_weight,
+            state=predicted_state,
+            log_weight=new_weight,
             hypothesis=hypothesis,
             timestamp=hypothesis.measurement.timestamp,
             )
 
+    def update_batch(self, hypotheses, **kwargs):
+        """Particle Filter update step for many hypotheses at once
+
+        The particles of all predictions are concatenated into a single array,
+        such that likelihoods are evaluated once per measurement model, and
+        normalisation and resampling (if :attr:`resampler` supports
+        :meth:`~.SystematicResampler.resample_segments`) are vectorised over all
+        particles. Each update's state vector and log weight are then views of
+        their part of these arrays.
+
+        Parameters
+        ----------
+        hypotheses : sequence of :class:`~.Hypothesis`
+            Hypotheses with predicted state and associated detection used for
+            updating.
+
+        Returns
+        -------
+        : list of :class:`~.ParticleState`
+            The state posteriors, in same order as `hypotheses`
+        """
+        hypotheses = list(hypotheses)
+        if not hypotheses:
+            return []
+
+        lengths = np.array([len(hypothesis.prediction) for hypothesis in hypotheses])
+        offsets = np.cumsum(lengths) - lengths
+        state_vectors = StateVectors(
+            np.hstack([hypothesis.prediction.state_vector for hypothesis in hypotheses]))
+        log_weights = np.concatenate(
+            [hypothesis.prediction.log_weight for hypothesis in hypotheses]).astype(np.float_)
+
+        # Group by measurement model, such that likelihood evaluated once per model
+        model_indices = {}
+        for index, hypothesis in enumerate(hypotheses):
+            if hypothesis.measurement.measurement_model is None:
+                measurement_model = self.measurement_model
+            else:
+                measurement_model = hypothesis.measurement.measurement_model
+            model_indices.setdefault(measurement_model, []).append(index)
+
+        for measurement_model, indices in model_indices.items():
+            if len(indices) == len(hypotheses):
+                columns = slice(None)
+            else:
+                columns = np.concatenate([
+                    np.arange(offsets[index], offsets[index] + lengths[index])
+                    for index in indices])
+            measurement_vectors = StateVectors(np.repeat(
+                np.hstack([hypotheses[index].measurement.state_vector for index in indices]),
+                lengths[indices], axis=1))
+            log_weights[columns] += measurement_model.logpdf(
+                State(measurement_vectors), State(state_vectors[:, columns]), **kwargs)
+
+        # Normalise the weights
+        log_weights -= np.repeat(segmented_logsumexp(log_weights, offsets), lengths)
+
+        # Resample, with other per-particle attributes (e.g. parent) selected from prediction
+        states = [hypothesis.prediction for hypothesis in hypotheses]
+        if self.resampler is not None:
+            if hasattr(self.resampler, 'resample_segments'):
+                index, log_weights = self.resampler.resample_segments(
+                    log_weights, offsets, random_state=self.resampler.random_state)
+                state_vectors = state_vectors[:, index]
+                states = [state[index[start:stop] - start]
+                          for state, start, stop in zip(states, offsets, offsets + lengths)]
+            else:
+                for hypothesis_index, (start, stop) in enumerate(
+                        zip(offsets, offsets + lengths)):
+                    resampled_state = self.resampler.resample(Prediction.from_state(
+                        states[hypothesis_index],
+                        state_vector=state_vectors[:, start:stop],
+                        log_weight=log_weights[start:stop]))
+                    state_vectors[:, start:stop] = resampled_state.state_vector
+                    log_weights[start:stop] = resampled_state.log_weight
+                    states[hypothesis_index] = resampled_state
+
+        return [
+            Update.from_state(
+                state=state,
+                state_vector=state_vectors[:, start:stop],
+                log_weight=log_weights[start:stop],
+                hypothesis=hypothesis,
+                timestamp=hypothesis.measurement.timestamp)
+            for hypothesis, state, start, stop in zip(
+                hypotheses, states, offsets, offsets + lengths)]
+
     @lru_cache()
     def predict_measurement(self, state_prediction, measurement_model=None,
                             **kwargs):
@@ -199,7 +295,7 @@ class GromovFlowKalmanParticleUpdater(GromovFlowParticleUpdater):
         return ParticleStateUpdate(
             particle_update.state_vector,
             hypothesis,
-            weight=particle_update.weight,
+            log_weight=particle_update.log_weight,
             fixed_covar=kalman_update.covar,
             timestamp=particle_update.timestamp)
 
@@ -215,7 +311,7 @@ class GromovFlowKalmanParticleUpdater(GromovFlowParticleUpdater):
 
         return ParticleMeasurementPrediction(
             state_vector=particle_prediction.state_vector,
-            weight=state_prediction.weight,
+            log_weight=state_prediction.log_weight,
             fixed_covar=kalman_prediction.covar,
             timestamp=particle_prediction.timestamp)
 
@@ -264,6 +360,9 @@ class MultiModelParticleUpdater(ParticleUpdater):
             update = self.resampler.resample(update)
         return update
 
+    # Weights depend on model transitions, which aren't included in batched update
+    update_batch = Updater.update_batch
+
 
 class RaoBlackwellisedParticleUpdater(MultiModelParticleUpdater):
     """Particle Updater for the Raoblackwellised scheme"""
@@ -312,6 +411,9 @@ class RaoBlackwellisedParticleUpdater(MultiModelParticleUpdater):
             update = self.resampler.resample(update)
         return update
 
+    # Model probabilities need updating, which isn't included in batched update
+    update_batch = Updater.update_batch
+
     @staticmethod
     def calculate_model_probabilities(prediction, predictor):
         """Calculates the new model probabilities based
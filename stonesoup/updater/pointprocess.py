@@ -1,6 +1,5 @@
 from abc import abstractmethod
 
-from scipy.stats import multivariate_normal
 import numpy as np
 
 from ..base import Base, Property
@@ -53,6 +52,8 @@ class PointProcessUpdater(Base):
             GaussianMixtureMultiTargetTracker with updated \
             components at time :math:`k+1`
         """
+        from scipy.stats import multivariate_normal
+
         updated_components = list()
         weight_sum_list = list()
         # Loop over all measurements
@@ -88,3 +88,39 @@ def test_information(UpdaterClass, measurement_model, prediction, measurement):
 
     assert(np.allclose(posterior.precision - posterior.precision.T,
                        np.zeros(np.shape(posterior.precision)), 0, atol=1.e-14))
+
+
+def test_information_batch():
+    rng = np.random.default_rng(1)
+    diag_model = LinearGaussian(ndim_state=4, mapping=[0, 2],
+                                noise_covar=np.diag([0.5, 2.]))
+    full_model = LinearGaussian(ndim_state=4, mapping=[0, 1],
+                                noise_covar=np.array([[1., 0.2], [0.2, 1.]]))
+    updater = InformationKalmanUpdater(measurement_model=diag_model)
+
+    hypotheses = []
+    for n in range(10):
+        sqrt_precision = np.tril(rng.normal(size=(4, 4))) + 2*np.eye(4)
+        measurement = Detection(rng.normal(size=(2, 1)),
+                                measurement_model=full_model if n % 3 == 0 else None)
+        hypotheses.append(SingleHypothesis(
+            InformationStatePrediction(rng.normal(size=(4, 1)),
+                                       sqrt_precision @ sqrt_precision.T),
+            measurement))
+
+    posteriors = [updater.update(hypothesis) for hypothesis in hypotheses]
+    batch_posteriors = updater.update_batch(hypotheses)
+
+    assert len(batch_posteriors) == len(hypotheses)
+    for posterior, batch_posterior, hypothesis in zip(
+            posteriors, batch_posteriors, hypotheses):
+        assert type(batch_posterior) is type(posterior)
+        assert batch_posterior.hypothesis is hypothesis
+        assert np.allclose(batch_posterior.state_vector, posterior.state_vector)
+        assert np.allclose(batch_posterior.precision, posterior.precision)
+
+    # Diagonal noise isn't inverted, but matches
+    assert np.allclose(updater._inverse_measurement_covar(diag_model),
+                       np.linalg.inv(diag_model.covar()))
+
+    assert updater.update_batch([]) == []
@@ -7,8 +7,9 @@ from stonesoup.models.measurement.linear import LinearGaussian
 from stonesoup.types.detection import Detection
 from stonesoup.types.hypothesis import SingleHypothesis
 from stonesoup.types.prediction import (
-    GaussianStatePrediction, GaussianMeasurementPrediction)
+    GaussianStatePrediction, GaussianMeasurementPrediction, SqrtGaussianStatePrediction)
 from stonesoup.types.state import GaussianState, SqrtGaussianState
+from stonesoup.types.update import SqrtGaussianStateUpdate
 from stonesoup.updater.kalman import (KalmanUpdater,
                                       ExtendedKalmanUpdater,
                                       UnscentedKalmanUpdater,
@@ -205,3 +206,68 @@ def test_sqrt_kalman():
                        eval_posterior.covar, rtol=5.e-3)
     assert np.allclose(posterior_q.sqrt_covar@posterior_s.sqrt_covar.T,
                        eval_posterior.covar, rtol=5.e-3)
+
+
+@pytest.mark.parametrize('qr_method, sequential', [
+    (False, False), (True, False), (False, True), (True, True)])
+def test_sqrt_kalman_batch(qr_method, sequential):
+    rng = np.random.default_rng(1)
+    diag_model = LinearGaussian(ndim_state=4, mapping=[0, 2],
+                                noise_covar=np.diag([0.5, 2.]))
+    full_model = LinearGaussian(ndim_state=4, mapping=[0, 1, 2],
+                                noise_covar=np.array([[1., 0.2, 0.],
+                                                      [0.2, 1., 0.1],
+                                                      [0., 0.1, 3.]]))
+    updater = KalmanUpdater(measurement_model=diag_model)
+    sqrt_updater = SqrtKalmanUpdater(
+        measurement_model=diag_model, qr_method=qr_method, sequential=sequential)
+
+    hypotheses = []
+    sqrt_hypotheses = []
+    for n in range(10):
+        sqrt_covar = np.tril(rng.normal(size=(4, 4))) + 2*np.eye(4)
+        state_vector = rng.normal(size=(4, 1))
+        # Mix of updater's model, and a non-diagonal noise model on detections
+        measurement = Detection(rng.normal(size=(3, 1)), measurement_model=full_model) \
+            if n % 3 == 0 else Detection(rng.normal(size=(2, 1)))
+        hypotheses.append(SingleHypothesis(
+            GaussianStatePrediction(state_vector, sqrt_covar @ sqrt_covar.T), measurement))
+        sqrt_hypotheses.append(SingleHypothesis(
+            SqrtGaussianStatePrediction(state_vector, sqrt_covar), measurement))
+
+    posteriors = [updater.update(hypothesis) for hypothesis in hypotheses]
+    sqrt_posteriors = [sqrt_updater.update(hypothesis) for hypothesis in sqrt_hypotheses]
+    for hypothesis in sqrt_hypotheses:
+        hypothesis.measurement_prediction = None
+    batch_posteriors = sqrt_updater.update_batch(sqrt_hypotheses)
+
+    assert len(batch_posteriors) == len(hypotheses)
+    for posterior, sqrt_posterior, batch_posterior, hypothesis in zip(
+            posteriors, sqrt_posteriors, batch_posteriors, sqrt_hypotheses):
+        assert isinstance(batch_posterior, SqrtGaussianStateUpdate)
+        assert batch_posterior.hypothesis is hypothesis
+        assert hypothesis.measurement_prediction is not None
+        assert np.allclose(sqrt_posterior.mean, posterior.mean)
+        assert np.allclose(sqrt_posterior.covar, posterior.covar)
+        assert np.allclose(batch_posterior.mean, posterior.mean)
+        assert np.allclose(batch_posterior.covar, posterior.covar)
+
+    assert sqrt_updater.update_batch([]) == []
+
+
+def test_sqrt_kalman_sequential():
+    measurement_model = LinearGaussian(ndim_state=2, mapping=[0],
+                                       noise_covar=np.array([[0.04]]))
+    sqrt_updater = SqrtKalmanUpdater(measurement_model=measurement_model, sequential=True)
+    measurement = Detection(np.array([[-6.23]]))
+
+    # Covariance which causes problems for standard form
+    sqrt_prediction = SqrtGaussianStatePrediction(
+        np.array([[-6.45], [0.7]]), np.diag([1e12, 1e12]))
+    posterior = sqrt_updater.update(SingleHypothesis(sqrt_prediction, measurement))
+    batch_posterior, = sqrt_updater.update_batch(
+        [SingleHypothesis(sqrt_prediction, measurement)])
+    for post in posterior, batch_posterior:
+        assert np.allclose(post.sqrt_covar @ post.sqrt_covar.T,
+                           np.array([[0.04, 0], [0, 1e24]]), rtol=5.e-3)
+        assert np.allclose(post.mean, np.array([[-6.23], [0.7]]))
@@ -142,3 +142,39 @@ def test_rao_blackwellised(dynamic_model_list, position_mappings, transition_mat
         update.model_probabilities, weights=update.weight, axis=1)
     assert len(average_model_proabilities) == update.model_probabilities.shape[0]
     assert isinstance(dynamic_model_list[np.argmax(average_model_proabilities)], KnownTurnRate)
+
+
+@pytest.mark.parametrize('predictor_class, updater_class, state_class, particle_class', [
+    (MultiModelPredictor, MultiModelParticleUpdater,
+     MultiModelParticleState, MultiModelParticle),
+    (RaoBlackwellisedMultiModelPredictor, RaoBlackwellisedParticleUpdater,
+     RaoBlackwellisedParticleState, RaoBlackwellisedParticle)])
+def test_update_batch(dynamic_model_list, position_mappings, transition_matrix,
+                      predictor_class, updater_class, state_class, particle_class):
+    timestamp = datetime.datetime.now()
+    if particle_class is MultiModelParticle:
+        model_kwargs = [{'dynamic_model': model_index} for model_index in range(3)]
+    else:
+        model_kwargs = [{'model_probabilities': [0.2, 0.2, 0.6]}] * 3
+    particles = [
+        particle_class(state_vector=[1, 1, offset, 1, 1, offset], weight=1/300, **kwargs)
+        for offset, kwargs in zip((-0.5, 0.5, 0.5), model_kwargs)] * 100
+    particle_state = state_class(None, particle_list=particles, timestamp=timestamp)
+
+    predictor = predictor_class(dynamic_model_list, transition_matrix, position_mappings)
+    measurement_model = LinearGaussian(6, [0, 3], np.diag([1, 1]))
+    updater = updater_class(measurement_model, predictor)
+
+    timestamp += datetime.timedelta(seconds=5)
+    prediction = predictor.predict(particle_state, timestamp)
+    hypotheses = [SingleHypothesis(prediction, Detection([[x], [7.]], timestamp))
+                  for x in (0.5, 1.5)]
+
+    updates = updater.update_batch(hypotheses)
+    for hypothesis, update in zip(hypotheses, updates):
+        eval_update = updater.update(hypothesis)
+        assert type(update) is type(eval_update)
+        assert np.allclose(update.log_weight, eval_update.log_weight)
+        assert np.allclose(update.state_vector, eval_update.state_vector)
+        if particle_class is RaoBlackwellisedParticle:
+            assert np.allclose(update.model_probabilities, eval_update.model_probabilities)
@@ -11,6 +11,7 @@ from ...types.array import StateVectors
 from ...types.detection import Detection
 from ...types.hypothesis import SingleHypothesis
 from ...types.particle import Particle
+from ...types.state import ParticleState
 from ...types.prediction import (
     ParticleStatePrediction, ParticleMeasurementPrediction)
 from ...updater.particle import (
@@ -69,3 +70,63 @@ def test_particle(updater):
     assert updated_state.hypothesis.prediction == prediction
     assert updated_state.hypothesis.measurement == measurement
     assert np.allclose(updated_state.mean, StateVectors([[20.0], [20.0]]), rtol=2e-2)
+
+
+def test_particle_resample_per_particle_attributes():
+    timestamp = datetime.datetime.now()
+    measurement_model = LinearGaussian(
+        ndim_state=2, mapping=[0], noise_covar=np.array([[0.04]]))
+    updater = ParticleUpdater(measurement_model, resampler=SystematicResampler())
+    particles = [Particle([[x], [y]], 1 / 9) for x in (10, 20, 30) for y in (10, 20, 30)]
+    prediction = ParticleStatePrediction(None, particle_list=particles, timestamp=timestamp)
+    prediction.parent = ParticleState(
+        prediction.state_vector - 1, log_weight=prediction.log_weight)
+
+    update = updater.update(SingleHypothesis(prediction, Detection([[20.]], timestamp)))
+    assert np.allclose(update.state_vector[0], 20)
+    # Parent particles selected along with particles
+    assert np.allclose(update.state_vector - update.parent.state_vector, 1)
+
+
+@pytest.mark.parametrize('resampler', (None, SystematicResampler()))
+def test_particle_batch(resampler):
+    timestamp = datetime.datetime.now()
+    measurement_model = LinearGaussian(
+        ndim_state=2, mapping=[0], noise_covar=np.array([[0.04]]))
+    other_measurement_model = LinearGaussian(
+        ndim_state=2, mapping=[1], noise_covar=np.array([[0.04]]))
+    updater = ParticleUpdater(measurement_model, resampler=resampler)
+
+    hypotheses = []
+    for offset in range(3):
+        particles = [Particle([[x + offset], [y + offset]], 1 / 9)
+                     for x in (10, 20, 30) for y in (10, 20, 30)]
+        prediction = ParticleStatePrediction(
+            None, particle_list=particles, timestamp=timestamp)
+        prediction.parent = ParticleState(
+            prediction.state_vector - 1, log_weight=prediction.log_weight)
+        measurement = Detection(
+            [[20.0 + offset]], timestamp=timestamp,
+            measurement_model=other_measurement_model if offset == 2 else None)
+        hypotheses.append(SingleHypothesis(prediction, measurement))
+
+    updates = updater.update_batch(hypotheses)
+
+    assert len(updates) == len(hypotheses)
+    for hypothesis, update in zip(hypotheses, updates):
+        if resampler is None:
+            eval_update = updater.update(hypothesis)
+            assert np.allclose(update.log_weight, eval_update.log_weight)
+            assert np.allclose(update.state_vector, eval_update.state_vector)
+        else:
+            assert np.allclose(update.log_weight, np.log(1 / 9))
+        assert update.timestamp == timestamp
+        assert update.hypothesis is hypothesis
+        assert np.isclose(np.sum(np.exp(update.log_weight)), 1)
+        # Parent particles selected along with particles
+        assert np.allclose(update.state_vector - update.parent.state_vector, 1)
+        model = hypothesis.measurement.measurement_model or measurement_model
+        assert np.allclose(model.matrix() @ update.mean,
+                           hypothesis.measurement.state_vector)
+
+    assert updater.update_batch([]) == []
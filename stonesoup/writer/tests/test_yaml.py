@@ -3,6 +3,7 @@ from textwrap import dedent
 import pytest
 
 from ..yaml import YAMLWriter
+from ...serialise import YAML
 
 
 def test_detections_yaml(detection_reader, tmpdir):
@@ -119,3 +120,52 @@ def test_yaml_bad_init(tmpdir):
     filename = tmpdir.join("bad_init.yaml")
     with pytest.raises(ValueError, match="At least one source required"):
         YAMLWriter(filename.strpath)
+
+
+@pytest.mark.parametrize('batch_size', [1, 10])
+def test_tracks_yaml_background(tracker, tmpdir, batch_size):
+    filename = tmpdir.join("tracks.yaml")
+    background_filename = tmpdir.join("tracks_background.yaml")
+
+    with YAMLWriter(filename.strpath, tracks_source=tracker) as writer:
+        writer.write()
+
+    with YAMLWriter(background_filename.strpath, tracks_source=tracker,
+                    background=True, max_queue_size=1, batch_size=batch_size) as writer:
+        writer.write()
+        writer.flush()
+
+    assert background_filename.read() == filename.read()
+
+
+def test_tracks_yaml_background_snapshot(tracker, tmpdir):
+    filename = tmpdir.join("tracks.yaml")
+
+    with YAMLWriter(filename.strpath, tracks_source=tracker, background=True) as writer:
+        for time, tracks in tracker:
+            writer._queue.put(writer._snapshot({'time': time, 'tracks': tracks}))
+            # Modifying track after snapshot shouldn't affect output
+            for track in tracks:
+                track.append(track.state)
+
+    with filename.open('r') as yaml_file:
+        documents = list(YAML().load_all(yaml_file))
+
+    assert [len(track) for document in documents for track in document['tracks']] == [1]
+
+
+def test_yaml_background_error(tracker, tmpdir):
+    filename = tmpdir.join("tracks.yaml")
+
+    writer = YAMLWriter(filename.strpath, tracks_source=tracker, background=True)
+    writer._queue.put({'time': object()})  # Can't be serialised
+    with pytest.raises(RuntimeError, match="Background YAML writing failed"):
+        writer.flush()
+    with pytest.raises(RuntimeError, match="Background YAML writing failed"):
+        writer.__exit__()
+
+
+def test_yaml_bad_queue(tracker, tmpdir):
+    filename = tmpdir.join("bad_init.yaml")
+    with pytest.raises(ValueError, match="must be positive"):
+        YAMLWriter(filename.strpath, tracks_source=tracker, background=True, max_queue_size=0)
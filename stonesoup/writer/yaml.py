@@ -1,19 +1,52 @@
+import copy
+import queue
+import threading
 from pathlib import Path
 
 from ..base import Property
 from ..serialise import YAML
 from ..reader import DetectionReader, GroundTruthReader, SensorDataReader
 from ..tracker import Tracker
+from ..types.state import StateMutableSequence
 from .base import Writer
 
 
 class YAMLWriter(Writer):
-    """YAML Writer"""
+    """YAML Writer
+
+    By default, each time step is serialised and written to file synchronously within
+    :meth:`write`. If :attr:`background` is enabled, a snapshot of the data is instead placed on
+    a bounded queue, and serialisation and writing takes place on a background thread, such that
+    slow I/O doesn't add directly to the latency of the source (e.g. tracker). If the queue is
+    full, :meth:`write` will block until space is available (backpressure). Any queued snapshots
+    are written on exit.
+
+    Snapshots are shallow copies of the tracks, paths and sets, such that states subsequently
+    added by the source are not included, but states themselves are not copied.
+    """
     path: Path = Property(doc="File to save data to. Str will be converted to Path")
     groundtruth_source: GroundTruthReader = Property(default=None)
     sensor_data_source: SensorDataReader = Property(default=None)
     detections_source: DetectionReader = Property(default=None)
     tracks_source: Tracker = Property(default=None)
+    compact_arrays: bool = Property(
+        default=False,
+        doc="Store large arrays as binary. See :class:`~.stonesoup.serialise.YAML`.")
+    compact_states: bool = Property(
+        default=False,
+        doc="Store homogeneous sequences of states column-wise. See "
+            ":class:`~.stonesoup.serialise.YAML`.")
+    background: bool = Property(
+        default=False,
+        doc="Whether to serialise and write on a background thread. Default `False`.")
+    max_queue_size: int = Property(
+        default=10,
+        doc="Maximum number of snapshots queued for writing, when :attr:`background` is "
+            "enabled, after which :meth:`write` blocks. Default 10.")
+    batch_size: int = Property(
+        default=10,
+        doc="Maximum number of queued snapshots written before the file is flushed, when "
+            ":attr:`background` is enabled. Default 10.")
 
     def __init__(self, path, *args, **kwargs):
         if not isinstance(path, Path):
@@ -22,15 +55,25 @@ class YAMLWriter(Writer):
         if not any((self.groundtruth_source, self.sensor_data_source,
                    self.detections_source, self.tracks_source)):
             raise ValueError("At least one source required")
+        if self.max_queue_size < 1 or self.batch_size < 1:
+            raise ValueError("max_queue_size and batch_size must be positive")
 
         self._file = self.path.open('w')
 
-        yaml = YAML()
+        yaml = YAML(compact_arrays=self.compact_arrays, compact_states=self.compact_states)
         # Required as will be writing multiple documents to file
         yaml.explicit_start = True
         yaml.explicit_end = True
         self._yaml = yaml
 
+        self._queue = None
+        self._thread = None
+        self._error = None
+        if self.background:
+            self._queue = queue.Queue(maxsize=self.max_queue_size)
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
     def write(self):
         if self.tracks_source:
             gen = self.tracks_source
@@ -54,14 +97,70 @@ class YAMLWriter(Writer):
             if self.groundtruth_source:
                 data['groundtruth_paths'] = \
                     self.groundtruth_source.groundtruth_paths
-            self._yaml.dump(data, self._file)
+            if self._queue is None:
+                self._yaml.dump(data, self._file)
+            else:
+                self._check_error()
+                self._queue.put(self._snapshot(data))
+
+    @staticmethod
+    def _snapshot(data):
+        """Shallow copy data, such that it is unaffected by the source continuing."""
+        return {
+            key: {copy.copy(item) if isinstance(item, StateMutableSequence) else item
+                  for item in value}
+            if isinstance(value, (set, frozenset)) else value
+            for key, value in data.items()}
+
+    def _run(self):
+        finished = False
+        while not finished:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for data in batch:
+                    if data is None:
+                        finished = True
+                        break
+                    if self._error is None:
+                        self._yaml.dump(data, self._file)
+                if self._error is None:
+                    self._file.flush()
+            except Exception as err:
+                self._error = err
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _check_error(self):
+        if self._error is not None:
+            raise RuntimeError("Background YAML writing failed") from self._error
+
+    def flush(self):
+        """Block until all queued snapshots have been written, and flush the file."""
+        if self._queue is not None:
+            self._queue.join()
+            self._check_error()
+        elif getattr(self, '_file', None):
+            self._file.flush()
 
     def __enter__(self):
         return self
 
     def __exit__(self, *args):
+        thread = getattr(self, '_thread', None)
+        if thread is not None:
+            self._thread = None
+            self._queue.put(None)
+            thread.join()
         if getattr(self, '_file', None):
             self._file.close()
+        if thread is not None:
+            self._check_error()
 
     def __del__(self):
         self.__exit__()